@@ -0,0 +1,175 @@
+"""
+Benchmark of ExitManager.check_exits over many open positions.
+
+Open positions are saved to a real StateStore in a temporary directory and
+priced so that a share of them hit a stop, a target or a profit ladder level.
+Reported per position count:
+
+- mean/p50/p99 latency of one check_exits pass and positions evaluated/sec
+- state store reads per pass (get_positions calls)
+- the cost of the previous per-position metadata lookup (one get_positions
+  call and a linear scan per position) on the same store, for comparison
+
+    python benchmarks/bench_exit_checks.py --positions 1000
+    python benchmarks/bench_exit_checks.py --positions 100,1000,5000 --repeats 50
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+# Use the source tree when the package is not installed
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from bench_trading_cycle import DEFAULT_RESULTS_DIR, git_info  # noqa: E402
+
+from crypto_mvp.execution.exit_manager import ExitManager  # noqa: E402
+from crypto_mvp.state.store import StateStore  # noqa: E402
+
+SESSION_ID = "bench-exits"
+
+
+def open_positions(store: StateStore, count: int, seed: int) -> tuple[dict[str, dict[str, Any]], dict[str, float]]:
+    """Save count positions to the store and price them.
+
+    Returns:
+        (positions keyed by symbol, current prices keyed by symbol)
+    """
+    rng = np.random.default_rng(seed)
+    positions, prices = {}, {}
+    # Price moves from -3% to +5%: some stops, targets and ladder levels hit
+    moves = rng.uniform(-0.03, 0.05, count)
+    for i in range(count):
+        symbol = f"C{i:05d}/USDT"
+        quantity = float(rng.uniform(0.1, 5.0)) * (1 if i % 4 else -1)
+        entry_price = float(rng.uniform(1.0, 1000.0))
+        move = moves[i] if quantity > 0 else -moves[i]
+        prices[symbol] = entry_price * (1 + move)
+        positions[symbol] = {"quantity": quantity, "entry_price": entry_price}
+        store.save_position(symbol, quantity, entry_price, prices[symbol], "momentum", SESSION_ID)
+    return positions, prices
+
+
+def _legacy_metadata_lookup(store: StateStore, positions: dict[str, dict[str, Any]]) -> None:
+    # What check_exits used to do: one get_positions call and a scan per position
+    for symbol in positions:
+        for pos in store.get_positions(SESSION_ID):
+            if pos["symbol"] == symbol:
+                break
+
+
+def run_size(count: int, repeats: int, seed: int) -> dict[str, Any]:
+    """Benchmark check_exits for one position count.
+
+    Args:
+        count: Number of open positions
+        repeats: Measured check_exits passes
+        seed: Seed for position sizes and prices
+
+    Returns:
+        Result dictionary for this position count
+    """
+    with tempfile.TemporaryDirectory(prefix="bench_exits_") as work_dir:
+        store = StateStore(os.path.join(work_dir, "trading_state.db"))
+        store.initialize()
+        positions, prices = open_positions(store, count, seed)
+
+        reads = 0
+        get_positions = store.get_positions
+
+        def counted_get_positions(session_id):
+            nonlocal reads
+            reads += 1
+            return get_positions(session_id)
+
+        store.get_positions = counted_get_positions
+        manager = ExitManager({})
+        latencies = []
+        exits = 0
+        for _ in range(repeats):
+            # Ladder levels are remembered per manager; start every pass fresh
+            manager.ladder_exits_taken = {}
+            start = time.perf_counter()
+            exits = len(manager.check_exits(positions, prices, store, SESSION_ID))
+            latencies.append(time.perf_counter() - start)
+        reads_per_pass = reads / repeats
+        store.get_positions = get_positions
+
+        legacy_repeats = max(1, min(repeats, 5))
+        start = time.perf_counter()
+        for _ in range(legacy_repeats):
+            _legacy_metadata_lookup(store, positions)
+        legacy_ms = (time.perf_counter() - start) / legacy_repeats * 1000
+        store.close()
+
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        "positions": count,
+        "repeats": repeats,
+        "exits_per_pass": exits,
+        "latency_mean_ms": float(latencies_ms.mean()),
+        "latency_p50_ms": float(np.percentile(latencies_ms, 50)),
+        "latency_p99_ms": float(np.percentile(latencies_ms, 99)),
+        "positions_per_sec": count / (latencies_ms.mean() / 1000),
+        "state_reads_per_pass": reads_per_pass,
+        "legacy_metadata_lookup_ms": legacy_ms,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--positions", default="1000", help="Comma-separated open position counts")
+    parser.add_argument("--repeats", type=int, default=20, help="Measured check_exits passes per count")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for positions and prices")
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/exits_<time>_<commit>.json)")
+    args = parser.parse_args(argv)
+
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+    # Exit hits are logged at INFO; keep them out of the timings
+    logging.getLogger("crypto_mvp").setLevel(logging.WARNING)
+    logging.getLogger("crypto_mvp.execution.exit_manager").setLevel(logging.WARNING)
+
+    git = git_info()
+    report: dict[str, Any] = {
+        "benchmark": "exit_checks",
+        "created_at": datetime.now().isoformat(),
+        "git": git,
+        "params": {"repeats": args.repeats, "seed": args.seed},
+        "results": {},
+    }
+    for count in [int(size) for size in args.positions.split(",") if size.strip()]:
+        result = run_size(count, args.repeats, args.seed)
+        report["results"][str(count)] = result
+        print(
+            f"{count:>6} positions: p50 {result['latency_p50_ms']:8.2f}ms  "
+            f"p99 {result['latency_p99_ms']:8.2f}ms  "
+            f"{result['positions_per_sec']:10.0f} positions/s  "
+            f"{result['state_reads_per_pass']:.0f} state reads/pass  "
+            f"(per-position lookup alone: {result['legacy_metadata_lookup_ms']:.1f}ms)"
+        )
+
+    output = args.output
+    if not output:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = str(DEFAULT_RESULTS_DIR / f"exits_{stamp}_{(git['commit'] or 'nogit')[:10]}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Benchmark of the mean-variance portfolio solver versus universe size.
+
+Each universe gets a one-factor covariance matrix and seeded expected
+returns. Per universe size the solver runs once cold, then for a number of
+cycles whose expected returns drift slightly, warm-started from the previous
+cycle's weights. Reported per size:
+
+- cold solve time and iterations
+- mean/p50/p99 warm solve time, mean iterations and how often the time
+  budget cut a solve short
+- the time of the previous softmax heuristic on the same inputs
+
+    python benchmarks/bench_portfolio_optimizer.py --assets 10,50,200,500
+    python benchmarks/bench_portfolio_optimizer.py --assets 1000 --budget-ms 100 --cycles 50
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+# Use the source tree when the package is not installed
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from bench_trading_cycle import DEFAULT_RESULTS_DIR, git_info  # noqa: E402
+
+from crypto_mvp.risk.optimizer import MeanVarianceOptimizer  # noqa: E402
+from crypto_mvp.risk.portfolio import AdvancedPortfolioManager  # noqa: E402
+
+
+def make_universe(count: int, rng: np.random.Generator) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """Asset names, expected returns and an annualized one-factor covariance."""
+    loadings = rng.uniform(0.3, 0.9, count)
+    idiosyncratic = rng.uniform(0.2, 0.6, count)
+    covariance = np.outer(loadings, loadings) * 0.25 + np.diag(idiosyncratic**2)
+    expected_returns = rng.uniform(-0.1, 0.3, count)
+    return [f"A{i:05d}/USDT" for i in range(count)], expected_returns, covariance
+
+
+def run_size(count: int, cycles: int, budget_ms: float, seed: int) -> dict[str, Any]:
+    """Benchmark the solver for one universe size.
+
+    Args:
+        count: Number of assets
+        cycles: Warm-started cycles after the cold solve
+        budget_ms: Solver time budget per cycle
+        seed: Seed for the universe and the drift of expected returns
+
+    Returns:
+        Result dictionary for this universe size
+    """
+    rng = np.random.default_rng(seed)
+    assets, mu, covariance = make_universe(count, rng)
+    manager = AdvancedPortfolioManager({"max_positions": 10, "optimizer": {"time_budget_ms": budget_ms}})
+    optimizer = MeanVarianceOptimizer({"time_budget_ms": budget_ms})
+
+    def solve(expected_returns):
+        return optimizer.optimize(
+            assets, expected_returns, covariance, manager.risk_aversion,
+            max_weight=manager.max_position_weight,
+            min_weight=manager.min_position_weight,
+            max_positions=manager.max_positions,
+        )
+
+    cold = solve(mu)
+    warm_ms, warm_iterations, budget_hits = [], [], 0
+    for _ in range(cycles):
+        mu = mu + rng.normal(0, 0.002, count)
+        result = solve(mu)
+        warm_ms.append(result.solve_ms)
+        warm_iterations.append(result.iterations)
+        budget_hits += result.status == "budget_exhausted"
+
+    # The previous allocation: softmax over risk-adjusted scores, then constraints
+    signals = {asset: {"confidence": 1.0} for asset in assets}
+    start = time.perf_counter()
+    manager._heuristic_weights(mu, covariance, np.ones(count), assets, signals)
+    heuristic_ms = (time.perf_counter() - start) * 1000
+
+    warm_ms = np.array(warm_ms) if warm_ms else np.zeros(1)
+    return {
+        "assets": count,
+        "cycles": cycles,
+        "budget_ms": budget_ms,
+        "cold_ms": cold.solve_ms,
+        "cold_iterations": cold.iterations,
+        "cold_status": cold.status,
+        "warm_mean_ms": float(warm_ms.mean()),
+        "warm_p50_ms": float(np.percentile(warm_ms, 50)),
+        "warm_p99_ms": float(np.percentile(warm_ms, 99)),
+        "warm_mean_iterations": float(np.mean(warm_iterations)) if warm_iterations else 0.0,
+        "budget_exhausted": budget_hits,
+        "heuristic_ms": heuristic_ms,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", default="10,50,200,500", help="Comma-separated universe sizes")
+    parser.add_argument("--cycles", type=int, default=20, help="Warm-started cycles per size")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="Solver time budget per cycle")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for universes and return drift")
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/optimizer_<time>_<commit>.json)")
+    args = parser.parse_args(argv)
+
+    if args.cycles < 1:
+        parser.error("--cycles must be at least 1")
+    logging.getLogger("crypto_mvp").setLevel(logging.WARNING)
+
+    git = git_info()
+    report: dict[str, Any] = {
+        "benchmark": "portfolio_optimizer",
+        "created_at": datetime.now().isoformat(),
+        "git": git,
+        "params": {"cycles": args.cycles, "budget_ms": args.budget_ms, "seed": args.seed},
+        "results": {},
+    }
+    for count in [int(size) for size in args.assets.split(",") if size.strip()]:
+        result = run_size(count, args.cycles, args.budget_ms, args.seed)
+        report["results"][str(count)] = result
+        print(
+            f"{count:>6} assets: cold {result['cold_ms']:8.2f}ms ({result['cold_iterations']} it, "
+            f"{result['cold_status']})  warm p50 {result['warm_p50_ms']:8.2f}ms  "
+            f"p99 {result['warm_p99_ms']:8.2f}ms  ({result['warm_mean_iterations']:.0f} it)  "
+            f"budget hits {result['budget_exhausted']}/{args.cycles}  "
+            f"(heuristic: {result['heuristic_ms']:.2f}ms)"
+        )
+
+    output = args.output
+    if not output:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = str(DEFAULT_RESULTS_DIR / f"optimizer_{stamp}_{(git['commit'] or 'nogit')[:10]}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
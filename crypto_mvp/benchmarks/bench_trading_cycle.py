@@ -0,0 +1,365 @@
+"""
+Offline benchmark of ProfitMaximizingTradingSystem.run_trading_cycle.
+
+Each universe size runs in its own process against a deterministic replay
+fixture (see crypto_mvp.backtest.replay), so no network is touched and every
+run sees the same candles. Reported per universe:
+
+- cycles/sec and p50/p95/p99/max cycle latency over the measured cycles
+- peak RSS of the benchmark process
+- SQLite statements that write (INSERT/UPDATE/DELETE/REPLACE) and commits,
+  per database, counted with a trace callback on every connection opened
+- the slowest cycle phases from the system's CycleProfiler
+
+Results are written as JSON (tagged with the git commit) so runs can be
+compared across commits:
+
+    python benchmarks/bench_trading_cycle.py --universes 5,50,500
+    python benchmarks/bench_trading_cycle.py --compare benchmarks/results/<old>.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import resource
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+from unittest import mock
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+# Use the source tree when the package is not installed
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from crypto_mvp.backtest.replay import ReplayDataEngine, ReplayFixture, replay_symbols  # noqa: E402
+
+RESULTS_VERSION = 1
+DEFAULT_FIXTURE_DIR = PROJECT_ROOT / "benchmarks" / "fixtures"
+DEFAULT_RESULTS_DIR = PROJECT_ROOT / "benchmarks" / "results"
+
+# Metrics compared by --compare: (key, higher_is_better)
+COMPARED_METRICS = [
+    ("cycles_per_sec", True),
+    ("latency_p50_ms", False),
+    ("latency_p99_ms", False),
+    ("peak_rss_mb", False),
+    ("sqlite_writes_per_cycle", False),
+    ("sqlite_commits_per_cycle", False),
+]
+
+WRITE_VERBS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+class SQLiteWriteCounter:
+    """Counts writing statements and commits on every sqlite3 connection opened."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connect = sqlite3.connect
+        self._patch: Optional[Any] = None
+        self.by_database: dict[str, dict[str, int]] = {}
+
+    def __enter__(self) -> "SQLiteWriteCounter":
+        self._patch = mock.patch("sqlite3.connect", self._traced_connect)
+        self._patch.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._patch.stop()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.by_database = {}
+
+    def _traced_connect(self, database, *args, **kwargs):
+        connection = self._connect(database, *args, **kwargs)
+        name = os.path.basename(str(database)) or str(database)
+        connection.set_trace_callback(lambda statement: self._record(name, statement))
+        return connection
+
+    def _record(self, name: str, statement: str) -> None:
+        verb = statement.lstrip()[:7].upper()
+        is_write = verb.startswith(WRITE_VERBS)
+        is_commit = verb.startswith("COMMIT")
+        if not (is_write or is_commit):
+            return
+        with self._lock:
+            counts = self.by_database.setdefault(name, {"writes": 0, "commits": 0})
+            counts["writes" if is_write else "commits"] += 1
+
+    def totals(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "writes": sum(c["writes"] for c in self.by_database.values()),
+                "commits": sum(c["commits"] for c in self.by_database.values()),
+            }
+
+
+def fixture_for(num_symbols: int, num_candles: int, seed: int, fixture_dir: Path) -> ReplayFixture:
+    """Load the cached fixture for a universe, generating it on first use."""
+    path = fixture_dir / f"universe_{num_symbols}_c{num_candles}_s{seed}.npz"
+    if path.exists():
+        return ReplayFixture.load(str(path))
+    fixture = ReplayFixture.generate(replay_symbols(num_symbols), num_candles, seed=seed)
+    fixture.save(str(path))
+    return fixture
+
+
+def _benchmark_config(config_manager: Any, symbols: list[str], work_dir: str, log_level: str) -> dict[str, Any]:
+    config = config_manager.to_dict()
+    trading = config.setdefault("trading", {})
+    trading["symbols"] = list(symbols)
+    trading["symbol_whitelist"] = list(symbols)
+    trading["live_mode"] = False
+    config.setdefault("universe", {})["whitelist"] = list(symbols)
+    # No exchange connectors: nothing may reach the network
+    config["exchanges"] = {}
+    config.setdefault("state", {})["db_path"] = os.path.join(work_dir, "trading_state.db")
+    config.setdefault("analytics", {})["ledger_db_path"] = os.path.join(work_dir, "trade_ledger.db")
+    # Session profit logs, the segmented trade log and the journal stay in the work directory
+    config["analytics"]["log_dir"] = work_dir
+    config["analytics"].setdefault("event_journal", {})["directory"] = os.path.join(work_dir, "journal")
+    config["logging"] = {"level": log_level, "log_dir": work_dir}
+    # Benchmarks read phase timings from cycle results, not over HTTP
+    config.setdefault("monitoring", {})["metrics_server"] = {"enabled": False}
+    return config
+
+
+def run_universe(
+    num_symbols: int,
+    cycles: int,
+    warmup: int,
+    seed: int,
+    config_path: str,
+    fixture_dir: str,
+    log_level: str = "WARNING",
+) -> dict[str, Any]:
+    """Benchmark full trading cycles for one universe size.
+
+    Args:
+        num_symbols: Universe size
+        cycles: Measured cycles
+        warmup: Unmeasured cycles run first (fills caches and windows)
+        seed: Fixture seed
+        config_path: Base configuration file
+        fixture_dir: Directory holding cached fixtures
+        log_level: Log level for the trading system
+
+    Returns:
+        Result dictionary for this universe
+    """
+    from crypto_mvp import trading_system as trading_system_module
+    from crypto_mvp.core.config_manager import ConfigManager
+    from crypto_mvp.core.logging_utils import setup_logging
+
+    setup_logging(level=log_level)
+    logging.getLogger().setLevel(getattr(logging, log_level.upper(), logging.WARNING))
+
+    limit = 100
+    fixture = fixture_for(num_symbols, 2 * limit + warmup + cycles, seed, Path(fixture_dir))
+    # Replayed quotes stand in for live ones so orders take the paper execution path
+    engine = ReplayDataEngine(fixture, start=2 * limit - 1, provenance="live")
+
+    with tempfile.TemporaryDirectory(prefix="bench_cycle_") as work_dir, SQLiteWriteCounter() as sql:
+        system = trading_system_module.ProfitMaximizingTradingSystem(config_path)
+        # A preloaded config makes initialize() skip loading the file again
+        system.config_manager = ConfigManager(config_path)
+        system.config = _benchmark_config(system.config_manager, fixture.symbols, work_dir, log_level)
+
+        with mock.patch.object(trading_system_module, "ProfitOptimizedDataEngine", lambda: engine):
+            system.initialize(f"bench-{num_symbols}")
+
+        loop = asyncio.new_event_loop()
+        latencies = []
+        errors = 0
+        try:
+            for i in range(warmup + cycles):
+                if i == warmup:
+                    sql.reset()
+                    measured_start = time.perf_counter()
+                engine.advance()
+                start = time.perf_counter()
+                result = loop.run_until_complete(system.run_trading_cycle())
+                if i >= warmup:
+                    latencies.append(time.perf_counter() - start)
+                    errors += len(result.get("errors", []))
+            elapsed = time.perf_counter() - measured_start
+            sql_totals = sql.totals()
+            sql_by_database = dict(sql.by_database)
+        finally:
+            loop.close()
+            if system.state_store:
+                system.state_store.close()
+
+        summary = system.cycle_profiler.get_summary()
+
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        "symbols": num_symbols,
+        "cycles": cycles,
+        "warmup": warmup,
+        "cycles_per_sec": cycles / elapsed if elapsed > 0 else 0.0,
+        "latency_mean_ms": float(latencies_ms.mean()),
+        "latency_p50_ms": float(np.percentile(latencies_ms, 50)),
+        "latency_p95_ms": float(np.percentile(latencies_ms, 95)),
+        "latency_p99_ms": float(np.percentile(latencies_ms, 99)),
+        "latency_max_ms": float(latencies_ms.max()),
+        "peak_rss_mb": peak_rss_mb(),
+        "sqlite_writes": sql_totals["writes"],
+        "sqlite_commits": sql_totals["commits"],
+        "sqlite_writes_per_cycle": sql_totals["writes"] / cycles,
+        "sqlite_commits_per_cycle": sql_totals["commits"] / cycles,
+        "sqlite_by_database": sql_by_database,
+        "cycle_errors": errors,
+        "data_engine_calls": dict(engine.calls),
+        "phases_ms": {
+            name: round(timing["wall_ms"], 3)
+            for name, timing in sorted(
+                summary["phases"].items(), key=lambda item: item[1]["wall_ms"], reverse=True
+            )
+            if "." not in name
+        },
+    }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def git_info() -> dict[str, Any]:
+    """Commit and dirty flag of the working tree, if inside a git repository."""
+    def _git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    try:
+        return {"commit": _git("rev-parse", "HEAD"), "dirty": bool(_git("status", "--porcelain", "--untracked-files=no"))}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def compare_results(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Print a metric-by-metric comparison and return the regressions.
+
+    Args:
+        current: Results of this run
+        baseline: Results loaded from an earlier run
+        threshold: Relative change (e.g. 0.1 for 10%) counted as a regression
+
+    Returns:
+        Descriptions of metrics that regressed beyond the threshold
+    """
+    regressions = []
+    base_commit = (baseline.get("git", {}).get("commit") or "unknown")[:10]
+    print(f"\nComparison against {base_commit} (regression threshold {threshold:.0%})")
+    for universe, result in current["results"].items():
+        before = baseline.get("results", {}).get(universe)
+        if before is None:
+            print(f"  {universe} symbols: not in baseline")
+            continue
+        print(f"  {universe} symbols:")
+        for key, higher_is_better in COMPARED_METRICS:
+            old, new = before.get(key), result.get(key)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else 0.0
+            worse = -change if higher_is_better else change
+            flag = "REGRESSION" if worse > threshold else ""
+            print(f"    {key:<26} {old:>12.3f} -> {new:>12.3f}  {change:+7.1%}  {flag}")
+            if flag:
+                regressions.append(f"{universe} symbols: {key} {change:+.1%}")
+    return regressions
+
+
+def _run_isolated(kwargs: dict[str, Any]) -> dict[str, Any]:
+    # A fresh process per universe keeps peak RSS and module caches independent
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(run_universe, kwds=kwargs)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--universes", default="5,50,500", help="Comma-separated universe sizes")
+    parser.add_argument("--cycles", type=int, default=10, help="Measured cycles per universe")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured warmup cycles")
+    parser.add_argument("--seed", type=int, default=42, help="Fixture seed")
+    parser.add_argument("--config", default=str(PROJECT_ROOT / "config" / "profit_optimized.yaml"))
+    parser.add_argument("--fixture-dir", default=str(DEFAULT_FIXTURE_DIR))
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/<time>_<commit>.json)")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Regression threshold for --compare")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 if --compare finds regressions")
+    parser.add_argument("--no-isolate", action="store_true", help="Run all universes in this process")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+
+    if args.cycles < 1:
+        parser.error("--cycles must be at least 1")
+    universes = [int(size) for size in args.universes.split(",") if size.strip()]
+    git = git_info()
+    report: dict[str, Any] = {
+        "benchmark": "trading_cycle",
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "git": git,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {"cycles": args.cycles, "warmup": args.warmup, "seed": args.seed, "config": args.config},
+        "results": {},
+    }
+
+    for size in universes:
+        kwargs = {
+            "num_symbols": size,
+            "cycles": args.cycles,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "config_path": args.config,
+            "fixture_dir": args.fixture_dir,
+            "log_level": args.log_level,
+        }
+        result = run_universe(**kwargs) if args.no_isolate else _run_isolated(kwargs)
+        report["results"][str(size)] = result
+        print(
+            f"{size:>4} symbols: {result['cycles_per_sec']:7.2f} cycles/s  "
+            f"p50 {result['latency_p50_ms']:8.1f}ms  p99 {result['latency_p99_ms']:8.1f}ms  "
+            f"rss {result['peak_rss_mb']:7.1f}MiB  "
+            f"sqlite {result['sqlite_writes_per_cycle']:.1f} writes/{result['sqlite_commits_per_cycle']:.1f} commits per cycle"
+        )
+
+    output = args.output
+    if not output:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = str(DEFAULT_RESULTS_DIR / f"{stamp}_{(git['commit'] or 'nogit')[:10]}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare_results(report, json.load(f), args.threshold)
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,17 +2,16 @@
 Market pricing and ATR accessor for crypto trading bot.
 
 This module provides hardened executable pricing with retry logic
-and ATR calculation for risk management.
+and ATR access (through the shared ATRService) for risk management.
 """
 
-from typing import Optional, Dict
+from typing import Any, Optional
 import logging
 import time
 
-logger = logging.getLogger(__name__)
+from crypto_mvp.indicators.atr_service import get_atr_service
 
-# Cache for ATR values per symbol per cycle
-_atr_cache: Dict[str, float] = {}
+logger = logging.getLogger(__name__)
 
 
 def get_executable_price(symbol: str) -> Optional[float]:
@@ -105,126 +104,51 @@ def _get_secondary_price(symbol: str, use_cache: bool = True) -> Optional[float]
     return mock_prices.get(symbol)
 
 
-def get_atr(symbol: str, lookback: int = 14) -> Optional[float]:
+def get_atr(symbol: str, lookback: int = 14, data_engine: Optional[Any] = None) -> Optional[float]:
     """
     Get Average True Range (ATR) for a symbol.
-    
+
+    Served by the shared ATRService, so this accessor, the stop model and the
+    risk manager read the same cached value until the candle closes.
+
     Args:
         symbol: Trading symbol
         lookback: Number of periods for ATR calculation
-        
+        data_engine: Data engine for fetching candles on a cache miss
+            (without one only a cached value is returned)
+
     Returns:
         ATR value or None if not available
     """
-    # Check cache first
-    cache_key = f"{symbol}_{lookback}"
-    if cache_key in _atr_cache:
-        return _atr_cache[cache_key]
-    
-    # Calculate ATR from OHLCV data
-    atr_value = _calculate_atr(symbol, lookback)
-    
-    if atr_value and atr_value > 0:
-        # Cache the result
-        _atr_cache[cache_key] = atr_value
-        return atr_value
-    
-    return None
+    service = get_atr_service()
+    if data_engine is None:
+        return service.get_cached_atr(symbol, period=lookback)
+    return service.get_atr(symbol, data_engine, period=lookback)
 
 
-def get_atr_1m_60(symbol: str) -> Optional[float]:
+def get_atr_1m_60(symbol: str, data_engine: Optional[Any] = None) -> Optional[float]:
     """
     Get ATR for 1-minute timeframe with 60 samples (1 hour of data).
-    
-    This is specifically for OCO order management.
-    
-    Args:
-        symbol: Trading symbol
-        
-    Returns:
-        ATR value for 1m/60 samples or None if not available
-    """
-    # Use specific cache key for 1m/60 ATR
-    cache_key = f"{symbol}_1m_60"
-    if cache_key in _atr_cache:
-        return _atr_cache[cache_key]
-    
-    # Calculate ATR for 1m timeframe with 60 samples
-    atr_value = _calculate_atr_1m_60(symbol)
-    
-    if atr_value and atr_value > 0:
-        # Cache the result
-        _atr_cache[cache_key] = atr_value
-        return atr_value
-    
-    return None
-
-
-def _calculate_atr(symbol: str, lookback: int) -> Optional[float]:
-    """
-    Calculate ATR from OHLCV data.
-    
-    In a real implementation, this would fetch historical data
-    and calculate the ATR using the standard formula.
-    """
-    # Mock ATR values based on symbol volatility
-    mock_atr = {
-        "BTC/USDT": 1500.0,  # ~3% of price
-        "ETH/USDT": 90.0,    # ~3% of price
-        "BNB/USDT": 9.0,     # ~3% of price
-        "ADA/USDT": 0.015,   # ~3% of price
-        "SOL/USDT": 3.0,     # ~3% of price
-        "DOT/USDT": 0.21,    # ~3% of price
-        "LINK/USDT": 0.45,   # ~3% of price
-        "UNI/USDT": 0.18,    # ~3% of price
-    }
-    
-    # Simulate occasional missing ATR data
-    import random
-    if random.random() < 0.2:  # 20% chance of missing ATR
-        return None
-    
-    return mock_atr.get(symbol)
 
+    This is specifically for OCO order management.
 
-def _calculate_atr_1m_60(symbol: str) -> Optional[float]:
-    """
-    Calculate ATR for 1-minute timeframe with 60 samples.
-    
-    This provides more responsive ATR values for OCO order management
-    compared to the standard 14-period ATR.
-    
     Args:
         symbol: Trading symbol
-        
+        data_engine: Data engine for fetching candles on a cache miss
+            (without one only a cached value is returned)
+
     Returns:
         ATR value for 1m/60 samples or None if not available
     """
-    # Mock ATR values for 1m/60 timeframe (more responsive than 14-period)
-    # These are typically smaller than the standard ATR due to shorter timeframe
-    mock_atr_1m_60 = {
-        "BTC/USDT": 500.0,   # ~1% of price (more responsive)
-        "ETH/USDT": 30.0,    # ~1% of price
-        "BNB/USDT": 3.0,     # ~1% of price
-        "ADA/USDT": 0.005,   # ~1% of price
-        "SOL/USDT": 1.0,     # ~1% of price
-        "DOT/USDT": 0.07,    # ~1% of price
-        "LINK/USDT": 0.15,   # ~1% of price
-        "UNI/USDT": 0.06,    # ~1% of price
-    }
-    
-    # Simulate occasional missing ATR data (lower failure rate for OCO)
-    import random
-    if random.random() < 0.1:  # 10% chance of missing ATR (lower than standard)
-        return None
-    
-    return mock_atr_1m_60.get(symbol)
+    service = get_atr_service()
+    if data_engine is None:
+        return service.get_cached_atr(symbol, period=60, timeframe="1m")
+    return service.get_atr(symbol, data_engine, period=60, timeframe="1m")
 
 
 def clear_atr_cache():
-    """Clear ATR cache (call at start of each cycle)."""
-    global _atr_cache
-    _atr_cache.clear()
+    """Clear the shared ATR cache."""
+    get_atr_service().clear_cache()
 
 
 def get_mark_price(symbol: str) -> Optional[float]:
@@ -2,10 +2,15 @@
 Analytics module for cryptocurrency trading performance analysis.
 """
 
+from .event_journal import EventJournal, EventJournalReader, EventType, JournalEvent
 from .profit_analytics import ProfitAnalytics
 from .profit_logger import ProfitLogger
 
 __all__ = [
+    "EventJournal",
+    "EventJournalReader",
+    "EventType",
+    "JournalEvent",
     "ProfitAnalytics",
     "ProfitLogger",
 ]
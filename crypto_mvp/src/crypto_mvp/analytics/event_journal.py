@@ -0,0 +1,508 @@
+"""
+Append-only binary journal of trading events.
+
+Cycle boundaries, signals, decisions, orders, fills and exits are recorded as
+typed records in one place, so what happened in a session can be read back
+without grepping text logs. Callers only encode the record; a background
+flusher thread writes the pending records in blocks.
+
+Layout of a journal directory::
+
+    journal-000001.bin   segment: magic, then blocks of records
+    journal-000001.idx   index: magic, then one fixed-size entry per block
+
+A record is a fixed header (timestamp, cycle id, event type, symbol and
+payload lengths), the UTF-8 symbol and a compact JSON payload. Each index
+entry holds its block's offset, length, record count, time range, a bit mask
+of the event types in it, a 64-bit hash mask of its symbols and a CRC32, so
+the reader skips whole segments and blocks that cannot match a time range,
+event type or symbol filter and only reads the blocks that can.
+
+A block is written before its index entry; on open, bytes after the last
+indexed block (a write cut short by a crash) are truncated away.
+
+Command line: ``python -m crypto_mvp.analytics.event_journal <directory>``.
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import IntEnum
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from ..core.logging_utils import LoggerMixin
+
+SEGMENT_PREFIX = "journal-"
+DATA_SUFFIX = ".bin"
+INDEX_SUFFIX = ".idx"
+DATA_MAGIC = b"CMVPJ01\n"
+INDEX_MAGIC = b"CMVPX01\n"
+
+# timestamp (epoch s), cycle id, event type, symbol length, payload length
+RECORD_HEADER = struct.Struct("<dIBBI")
+# offset, length, records, first/last timestamp, type mask, symbol mask, crc32
+INDEX_ENTRY = struct.Struct("<QIIddIQI")
+
+TimeBound = Union[datetime, float, int, None]
+
+
+class EventType(IntEnum):
+    """Journal record types."""
+
+    CYCLE_START = 1
+    CYCLE_END = 2
+    SIGNAL = 3
+    DECISION = 4
+    ORDER = 5
+    FILL = 6
+    EXIT = 7
+
+
+class IndexEntry(NamedTuple):
+    """Index entry of one block."""
+
+    offset: int
+    length: int
+    records: int
+    first_ts: float
+    last_ts: float
+    type_mask: int
+    symbol_mask: int
+    crc: int
+
+
+@dataclass
+class JournalEvent:
+    """One journal record."""
+
+    timestamp: datetime
+    event_type: EventType
+    symbol: Optional[str] = None
+    cycle_id: int = 0
+    data: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "event_type": self.event_type.name.lower(),
+            "symbol": self.symbol,
+            "cycle_id": self.cycle_id,
+            "data": self.data,
+        }
+
+
+def symbol_bit(symbol: str) -> int:
+    """Bit of a symbol in a block's symbol mask."""
+    return 1 << (zlib.crc32(symbol.encode()) % 64)
+
+
+def parse_event_type(value: Union[str, int, EventType]) -> EventType:
+    """Convert an event type name ("fill", "CYCLE_END") or number to EventType."""
+    if isinstance(value, str):
+        return EventType[value.strip().upper()]
+    return EventType(value)
+
+
+def _epoch(value: TimeBound) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+def _segment_numbers(directory: str) -> list[int]:
+    numbers = []
+    if os.path.isdir(directory):
+        for name in os.listdir(directory):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(DATA_SUFFIX):
+                numbers.append(int(name[len(SEGMENT_PREFIX):-len(DATA_SUFFIX)]))
+    return sorted(numbers)
+
+
+def _segment_path(directory: str, segment: int, suffix: str) -> str:
+    return os.path.join(directory, f"{SEGMENT_PREFIX}{segment:06d}{suffix}")
+
+
+def _read_index(directory: str, segment: int) -> list[IndexEntry]:
+    """Read a segment's index, ignoring a torn last entry and unwritten blocks."""
+    index_path = _segment_path(directory, segment, INDEX_SUFFIX)
+    data_path = _segment_path(directory, segment, DATA_SUFFIX)
+    try:
+        with open(index_path, "rb") as f:
+            raw = f.read()
+        data_size = os.path.getsize(data_path)
+    except FileNotFoundError:
+        return []
+    if not raw.startswith(INDEX_MAGIC):
+        return []
+
+    entries = []
+    body = raw[len(INDEX_MAGIC):]
+    for start in range(0, len(body) - INDEX_ENTRY.size + 1, INDEX_ENTRY.size):
+        entry = IndexEntry(*INDEX_ENTRY.unpack_from(body, start))
+        if entry.offset + entry.length > data_size:
+            break
+        entries.append(entry)
+    return entries
+
+
+def _decode_block(block: bytes) -> Iterator[Tuple[float, int, int, Optional[str], bytes]]:
+    """Yield (timestamp, cycle id, event type, symbol, payload) of a block's records."""
+    position = 0
+    while position < len(block):
+        timestamp, cycle_id, event_type, symbol_len, payload_len = RECORD_HEADER.unpack_from(block, position)
+        position += RECORD_HEADER.size
+        symbol = block[position:position + symbol_len].decode() if symbol_len else None
+        position += symbol_len
+        payload = block[position:position + payload_len]
+        position += payload_len
+        yield timestamp, cycle_id, event_type, symbol, payload
+
+
+class EventJournal(LoggerMixin):
+    """
+    Writer of a journal directory with a background flusher.
+
+    ``record`` encodes the event and queues it; the flusher writes queued
+    records as one block every ``flush_interval_s`` or as soon as
+    ``block_records`` are pending.
+    """
+
+    def __init__(self, directory: str, config: Optional[dict[str, Any]] = None):
+        """Open (or create) a journal and start its flusher.
+
+        Args:
+            directory: Journal directory
+            config: Journal settings (``analytics.event_journal``):
+                segment_max_bytes, block_records, flush_interval_s,
+                max_pending, fsync
+        """
+        super().__init__()
+        self.directory = directory
+        self.config = config or {}
+        self.segment_max_bytes = self.config.get("segment_max_bytes", 64 * 1024 * 1024)
+        self.block_records = max(1, self.config.get("block_records", 256))
+        self.flush_interval_s = self.config.get("flush_interval_s", 1.0)
+        # Records held for the flusher; more are dropped (counted) rather than
+        # blocking the trading loop
+        self.max_pending = self.config.get("max_pending", 100000)
+        self.fsync = self.config.get("fsync", False)
+        os.makedirs(directory, exist_ok=True)
+
+        self._pending: list[Tuple[float, int, Optional[str], bytes]] = []
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self.stats = {"records": 0, "blocks": 0, "bytes": 0, "dropped": 0, "write_errors": 0}
+
+        segments = _segment_numbers(directory)
+        self.segment = segments[-1] if segments else 1
+        self._data_file = None
+        self._index_file = None
+        self._open_segment(self.segment)
+
+        self._flusher = threading.Thread(target=self._run_flusher, name="event-journal-flusher", daemon=True)
+        self._flusher.start()
+
+    def _open_segment(self, segment: int) -> None:
+        """Open a segment for appending, truncating anything after its last indexed block."""
+        data_path = _segment_path(self.directory, segment, DATA_SUFFIX)
+        index_path = _segment_path(self.directory, segment, INDEX_SUFFIX)
+        entries = _read_index(self.directory, segment)
+        data_end = entries[-1].offset + entries[-1].length if entries else len(DATA_MAGIC)
+        index_end = len(INDEX_MAGIC) + len(entries) * INDEX_ENTRY.size
+
+        for path, magic, end in ((data_path, DATA_MAGIC, data_end), (index_path, INDEX_MAGIC, index_end)):
+            if not os.path.exists(path) or os.path.getsize(path) < len(magic):
+                with open(path, "wb") as f:
+                    f.write(magic)
+            elif os.path.getsize(path) > end:
+                self.logger.warning(f"Truncating unindexed journal bytes in {path} after byte {end}")
+                with open(path, "r+b") as f:
+                    f.truncate(end)
+
+        self.segment = segment
+        self._data_file = open(data_path, "ab")
+        self._index_file = open(index_path, "ab")
+
+    def record(
+        self,
+        event_type: Union[EventType, str],
+        symbol: Optional[str] = None,
+        data: Optional[dict[str, Any]] = None,
+        cycle_id: int = 0,
+        timestamp: TimeBound = None,
+    ) -> bool:
+        """Queue one event for the flusher.
+
+        Args:
+            event_type: Record type
+            symbol: Trading symbol (None for cycle events)
+            data: JSON-serializable payload (other values are written as strings)
+            cycle_id: Trading cycle number
+            timestamp: Event time (default: now)
+
+        Returns:
+            False if the event was dropped (journal closed or too many pending)
+        """
+        if self._closed:
+            return False
+        event_type = parse_event_type(event_type)
+        ts = _epoch(timestamp) if timestamp is not None else time.time()
+        symbol_bytes = symbol.encode()[:255] if symbol else b""
+        payload = json.dumps(data or {}, separators=(",", ":"), default=str).encode()
+        encoded = (
+            RECORD_HEADER.pack(ts, max(0, int(cycle_id)) & 0xFFFFFFFF, event_type, len(symbol_bytes), len(payload))
+            + symbol_bytes
+            + payload
+        )
+
+        with self._pending_lock:
+            if len(self._pending) >= self.max_pending:
+                self.stats["dropped"] += 1
+                return False
+            self._pending.append((ts, int(event_type), symbol or None, encoded))
+            pending = len(self._pending)
+        if pending >= self.block_records:
+            self._wake.set()
+        return True
+
+    def _run_flusher(self) -> None:
+        while not self._closed:
+            # Woken by a full block: write full blocks only; on the interval
+            # write whatever is pending
+            woken = self._wake.wait(self.flush_interval_s)
+            self._wake.clear()
+            try:
+                self.flush(full_blocks_only=woken and not self._closed)
+            except Exception as e:
+                self.stats["write_errors"] += 1
+                self.logger.error(f"Event journal flush failed: {e}")
+
+    def flush(self, full_blocks_only: bool = False) -> None:
+        """Write pending records now.
+
+        Args:
+            full_blocks_only: Keep a partial last block pending
+        """
+        with self._write_lock:
+            with self._pending_lock:
+                count = len(self._pending)
+                if full_blocks_only:
+                    count -= count % self.block_records
+                pending, self._pending = self._pending[:count], self._pending[count:]
+            for start in range(0, len(pending), self.block_records):
+                self._write_block(pending[start:start + self.block_records])
+
+    def _write_block(self, records: list[Tuple[float, int, Optional[str], bytes]]) -> None:
+        """Write one block and its index entry (called with the write lock held)."""
+        if not records:
+            return
+        if self._data_file.tell() >= self.segment_max_bytes:
+            self._close_files()
+            self._open_segment(self.segment + 1)
+
+        block = b"".join(encoded for _, _, _, encoded in records)
+        type_mask = 0
+        symbol_mask = 0
+        for _, event_type, symbol, _ in records:
+            type_mask |= 1 << event_type
+            if symbol:
+                symbol_mask |= symbol_bit(symbol)
+        timestamps = [ts for ts, _, _, _ in records]
+        entry = INDEX_ENTRY.pack(
+            self._data_file.tell(), len(block), len(records), min(timestamps), max(timestamps),
+            type_mask, symbol_mask, zlib.crc32(block),
+        )
+
+        self._data_file.write(block)
+        self._data_file.flush()
+        if self.fsync:
+            os.fsync(self._data_file.fileno())
+        self._index_file.write(entry)
+        self._index_file.flush()
+        if self.fsync:
+            os.fsync(self._index_file.fileno())
+
+        self.stats["records"] += len(records)
+        self.stats["blocks"] += 1
+        self.stats["bytes"] += len(block)
+
+    def _close_files(self) -> None:
+        for f in (self._data_file, self._index_file):
+            if f is not None:
+                f.close()
+        self._data_file = None
+        self._index_file = None
+
+    def close(self) -> None:
+        """Write pending records and stop the flusher."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._flusher.join(timeout=5.0)
+        self.flush()
+        with self._write_lock:
+            self._close_files()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get written, dropped and pending counters."""
+        with self._pending_lock:
+            pending = len(self._pending)
+        return {**self.stats, "pending": pending, "segment": self.segment}
+
+
+class EventJournalReader(LoggerMixin):
+    """
+    Reader of a journal directory that uses the block index to skip data.
+    """
+
+    def __init__(self, directory: str):
+        """Initialize the reader.
+
+        Args:
+            directory: Journal directory
+        """
+        super().__init__()
+        self.directory = directory
+        self.stats = {"blocks_read": 0, "blocks_skipped": 0, "corrupt_blocks": 0}
+
+    def segments(self) -> list[int]:
+        """Segment numbers, oldest first."""
+        return _segment_numbers(self.directory)
+
+    def read_index(self, segment: int) -> list[IndexEntry]:
+        """Index entries of a segment."""
+        return _read_index(self.directory, segment)
+
+    def read(
+        self,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        symbols: Optional[Iterable[str]] = None,
+        event_types: Optional[Iterable[Union[EventType, str, int]]] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[JournalEvent]:
+        """Read matching events in write order.
+
+        Args:
+            start: Earliest event time (inclusive)
+            end: Latest event time (inclusive)
+            symbols: Only events of these symbols (cycle events have no symbol)
+            event_types: Only these record types
+            limit: Stop after this many events
+
+        Returns:
+            Iterator of matching events
+        """
+        start_ts, end_ts = _epoch(start), _epoch(end)
+        symbol_set = set(symbols) if symbols else None
+        type_set = {parse_event_type(t) for t in event_types} if event_types else None
+        symbol_mask = 0
+        for symbol in symbol_set or ():
+            symbol_mask |= symbol_bit(symbol)
+        type_mask = 0
+        for event_type in type_set or ():
+            type_mask |= 1 << event_type
+
+        emitted = 0
+        for segment in self.segments():
+            entries = self.read_index(segment)
+            matching = [
+                entry for entry in entries
+                if (start_ts is None or entry.last_ts >= start_ts)
+                and (end_ts is None or entry.first_ts <= end_ts)
+                and (type_set is None or entry.type_mask & type_mask)
+                and (symbol_set is None or entry.symbol_mask & symbol_mask)
+            ]
+            self.stats["blocks_skipped"] += len(entries) - len(matching)
+            if not matching:
+                continue
+
+            with open(_segment_path(self.directory, segment, DATA_SUFFIX), "rb") as f:
+                for entry in matching:
+                    f.seek(entry.offset)
+                    block = f.read(entry.length)
+                    self.stats["blocks_read"] += 1
+                    if zlib.crc32(block) != entry.crc:
+                        self.stats["corrupt_blocks"] += 1
+                        self.logger.warning(
+                            f"Skipping corrupt journal block in segment {segment} at byte {entry.offset}"
+                        )
+                        continue
+                    for ts, cycle_id, event_type, symbol, payload in _decode_block(block):
+                        if start_ts is not None and ts < start_ts:
+                            continue
+                        if end_ts is not None and ts > end_ts:
+                            continue
+                        if type_set is not None and event_type not in type_set:
+                            continue
+                        if symbol_set is not None and symbol not in symbol_set:
+                            continue
+                        yield JournalEvent(
+                            timestamp=datetime.fromtimestamp(ts),
+                            event_type=EventType(event_type),
+                            symbol=symbol,
+                            cycle_id=cycle_id,
+                            data=json.loads(payload) if payload else {},
+                        )
+                        emitted += 1
+                        if limit is not None and emitted >= limit:
+                            return
+
+    def summary(self) -> dict[str, Any]:
+        """Segments, blocks, records and time range, from the index alone."""
+        entries = [entry for segment in self.segments() for entry in self.read_index(segment)]
+        return {
+            "segments": len(self.segments()),
+            "blocks": len(entries),
+            "records": sum(entry.records for entry in entries),
+            "bytes": sum(entry.length for entry in entries),
+            "first": datetime.fromtimestamp(min(e.first_ts for e in entries)).isoformat() if entries else None,
+            "last": datetime.fromtimestamp(max(e.last_ts for e in entries)).isoformat() if entries else None,
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: python -m crypto_mvp.analytics.event_journal."""
+    parser = argparse.ArgumentParser(description="Read events from a trading event journal")
+    parser.add_argument("directory", help="Journal directory")
+    parser.add_argument("--symbol", action="append", help="Only this symbol (repeatable)")
+    parser.add_argument(
+        "--type", action="append", dest="event_types",
+        choices=[t.name.lower() for t in EventType], help="Only this event type (repeatable)",
+    )
+    parser.add_argument("--start", help="Earliest event time (ISO format)")
+    parser.add_argument("--end", help="Latest event time (ISO format)")
+    parser.add_argument("--limit", type=int, help="Maximum number of events")
+    parser.add_argument("--summary", action="store_true", help="Print the index summary instead of events")
+    args = parser.parse_args(argv)
+
+    reader = EventJournalReader(args.directory)
+    if args.summary:
+        print(json.dumps(reader.summary(), indent=2))
+        return
+
+    events = reader.read(
+        start=datetime.fromisoformat(args.start) if args.start else None,
+        end=datetime.fromisoformat(args.end) if args.end else None,
+        symbols=args.symbol,
+        event_types=args.event_types,
+        limit=args.limit,
+    )
+    for event in events:
+        sys.stdout.write(json.dumps(event.to_dict(), default=str) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,12 @@ Profit analytics system for tracking and analyzing trading performance.
 """
 
 import json
+import os
 from datetime import datetime
 from typing import Any, Optional
 
 from ..core.logging_utils import LoggerMixin
+from .trade_log_store import SegmentedTradeLog
 
 
 class ProfitAnalytics(LoggerMixin):
@@ -23,8 +25,10 @@ class ProfitAnalytics(LoggerMixin):
         super().__init__()
         self.config = config or {}
 
-        # Trade log storage
-        self.trade_log: list[dict[str, Any]] = []
+        # Trade log storage (None until the full history is needed after a
+        # restart from a checkpoint; see the trade_log property)
+        self._trade_log: Optional[list[dict[str, Any]]] = []
+        self._trade_count = 0
         self.daily_pnl: dict[str, float] = {}  # date -> pnl
         self.strategy_performance: dict[str, dict[str, Any]] = {}
 
@@ -45,7 +49,15 @@ class ProfitAnalytics(LoggerMixin):
 
         # File storage
         self.log_file = self.config.get("log_file", "trade_log.json")
+        # Directory for session-scoped trade logs (current directory by default)
+        self.log_dir = self.config.get("log_dir", "")
         self.auto_save = self.config.get("auto_save", True)
+        trade_log_config = self.config.get("trade_log", {})
+        self.segment_max_bytes = trade_log_config.get("segment_max_bytes", 8 * 1024 * 1024)
+        self.checkpoint_every = trade_log_config.get("checkpoint_every", 100)
+        self.fsync = trade_log_config.get("fsync", False)
+        self.trade_store: Optional[SegmentedTradeLog] = None
+        self._trades_since_checkpoint = 0
         
         # Session tracking
         self.session_id = None
@@ -55,6 +67,18 @@ class ProfitAnalytics(LoggerMixin):
         # Trade ledger reference (will be set by trading system)
         self.trade_ledger = None
 
+    @property
+    def trade_log(self) -> list[dict[str, Any]]:
+        """Full trade history, read from the segmented log on first use."""
+        if self._trade_log is None:
+            self._trade_log = self.trade_store.read_all() if self.trade_store else []
+        return self._trade_log
+
+    @trade_log.setter
+    def trade_log(self, trades: list[dict[str, Any]]) -> None:
+        self._trade_log = trades
+        self._trade_count = len(trades)
+
     def set_trade_ledger(self, trade_ledger) -> None:
         """Set the trade ledger reference for single source of truth.
         
@@ -152,7 +176,9 @@ class ProfitAnalytics(LoggerMixin):
             
             self.logger.info(f"Session ID: {session_id}")
             self.logger.info(f"Session initial capital: ${self.initial_capital:,.2f}")
-            self.log_file = f"profit_logs_{session_id}.json"
+            if self.log_dir:
+                os.makedirs(self.log_dir, exist_ok=True)
+            self.log_file = os.path.join(self.log_dir, f"profit_logs_{session_id}.json")
         else:
             self.logger.info(f"Initial capital: ${self.initial_capital:,.2f}")
             self.log_file = self.config.get("log_file", "profit_logs.json")
@@ -244,7 +270,7 @@ class ProfitAnalytics(LoggerMixin):
 
         # Create trade record
         trade_record = {
-            "id": f"trade_{len(self.trade_log) + 1}_{int(timestamp.timestamp())}",
+            "id": f"trade_{self._trade_count + 1}_{int(timestamp.timestamp())}",
             "symbol": symbol,
             "strategy": strategy,
             "side": side,
@@ -259,29 +285,32 @@ class ProfitAnalytics(LoggerMixin):
             "metadata": metadata,
         }
 
-        # Add to trade log
-        self.trade_log.append(trade_record)
-
-        # Update performance metrics
-        self._update_performance_metrics(trade_record)
-
-        # Update daily PnL
-        self._update_daily_pnl(trade_record)
-
-        # Update strategy performance
-        self._update_strategy_performance(trade_record)
+        # Add to trade log (history not yet read back after a restart stays on disk)
+        if self._trade_log is not None:
+            self._trade_log.append(trade_record)
+        self._trade_count += 1
 
-        # Update drawdown
-        self._update_drawdown()
+        self._apply_trade(trade_record)
 
         # Auto-save if enabled
         if self.auto_save:
-            self._save_trade_log()
+            self._append_trade_log(trade_record)
 
         self.logger.info(
             f"Logged trade: {symbol} {side} {quantity} @ {entry_price:.4f} -> {exit_price:.4f}, PnL: ${pnl:.2f}"
         )
 
+    def _apply_trade(self, trade_record: dict[str, Any]) -> None:
+        """Fold one trade into the running metrics.
+
+        Args:
+            trade_record: Trade record to process
+        """
+        self._update_performance_metrics(trade_record)
+        self._update_daily_pnl(trade_record)
+        self._update_strategy_performance(trade_record)
+        self._update_drawdown()
+
     def _update_performance_metrics(self, trade_record: dict[str, Any]) -> None:
         """Update overall performance metrics.
 
@@ -341,21 +370,23 @@ class ProfitAnalytics(LoggerMixin):
                 "avg_loss": 0.0,
                 "win_rate": 0.0,
                 "profit_factor": 0.0,
-                "trades": [],
+                "gross_wins": 0.0,
+                "gross_losses": 0.0,
             }
 
         # Update strategy metrics
         strategy_metrics = self.strategy_performance[strategy]
         strategy_metrics["total_trades"] += 1
         strategy_metrics["total_pnl"] += pnl
-        strategy_metrics["trades"].append(trade_record)
 
         if pnl > 0:
             strategy_metrics["winning_trades"] += 1
+            strategy_metrics["gross_wins"] += pnl
             if pnl > strategy_metrics["max_win"]:
                 strategy_metrics["max_win"] = pnl
         elif pnl < 0:
             strategy_metrics["losing_trades"] += 1
+            strategy_metrics["gross_losses"] += abs(pnl)
             if abs(pnl) > strategy_metrics["max_loss"]:
                 strategy_metrics["max_loss"] = abs(pnl)
 
@@ -365,21 +396,15 @@ class ProfitAnalytics(LoggerMixin):
                 strategy_metrics["winning_trades"] / strategy_metrics["total_trades"]
             )
 
-        # Calculate average win/loss - guard with if trades:
-        if strategy_metrics["winning_trades"] > 0 and strategy_metrics["trades"]:
-            total_wins = sum(
-                t.get("pnl", 0.0) for t in strategy_metrics["trades"] if t.get("pnl", 0.0) > 0
-            )
+        # Calculate average win/loss from running gross totals
+        if strategy_metrics["winning_trades"] > 0:
             strategy_metrics["avg_win"] = (
-                total_wins / strategy_metrics["winning_trades"]
+                strategy_metrics["gross_wins"] / strategy_metrics["winning_trades"]
             )
 
-        if strategy_metrics["losing_trades"] > 0 and strategy_metrics["trades"]:
-            total_losses = sum(
-                abs(t.get("pnl", 0.0)) for t in strategy_metrics["trades"] if t.get("pnl", 0.0) < 0
-            )
+        if strategy_metrics["losing_trades"] > 0:
             strategy_metrics["avg_loss"] = (
-                total_losses / strategy_metrics["losing_trades"]
+                strategy_metrics["gross_losses"] / strategy_metrics["losing_trades"]
             )
 
         # Calculate profit factor
@@ -461,6 +486,17 @@ class ProfitAnalytics(LoggerMixin):
 
         return analysis
 
+    def _strategy_trades(self, strategy: str) -> list[dict[str, Any]]:
+        """Trades of one strategy from the trade history.
+
+        Args:
+            strategy: Strategy name
+
+        Returns:
+            Trade records of the strategy
+        """
+        return [trade for trade in self.trade_log if trade.get("strategy") == strategy]
+
     def _calculate_strategy_sharpe_ratio(self, strategy: str) -> float:
         """Calculate Sharpe ratio for a strategy.
 
@@ -473,7 +509,7 @@ class ProfitAnalytics(LoggerMixin):
         if strategy not in self.strategy_performance:
             return 0.0
 
-        trades = self.strategy_performance[strategy]["trades"]
+        trades = self._strategy_trades(strategy)
         if not trades or len(trades) < 2:
             return 0.0
 
@@ -506,7 +542,7 @@ class ProfitAnalytics(LoggerMixin):
         if strategy not in self.strategy_performance:
             return 0.0
 
-        trades = self.strategy_performance[strategy]["trades"]
+        trades = self._strategy_trades(strategy)
         if not trades or len(trades) < 2:
             return 0.0
 
@@ -556,7 +592,7 @@ class ProfitAnalytics(LoggerMixin):
                 state_trades = state_store.get_trades()
                 
                 # Filter by session and convert to analytics format
-                from datetime import datetime, timezone
+                from datetime import timezone
                 import pytz
                 
                 # Get current date in UTC for filtering
@@ -843,28 +879,108 @@ class ProfitAnalytics(LoggerMixin):
                     break
         return consecutive
 
-    def _save_trade_log(self) -> None:
-        """Save trade log to file."""
+    def _trade_log_dir(self) -> str:
+        """Directory of the segmented trade log for the current log file."""
+        return f"{os.path.splitext(self.log_file)[0]}.segments"
+
+    def _append_trade_log(self, trade_record: dict[str, Any]) -> None:
+        """Append one trade to the segmented log, checkpointing periodically.
+
+        Args:
+            trade_record: Trade record to persist
+        """
         try:
-            with open(self.log_file, "w") as f:
-                json.dump(self.trade_log, f, indent=2)
+            if self.trade_store is None:
+                self.trade_store = SegmentedTradeLog(
+                    self._trade_log_dir(), self.segment_max_bytes, self.fsync
+                )
+            self.trade_store.append(trade_record)
+
+            self._trades_since_checkpoint += 1
+            if self._trades_since_checkpoint >= self.checkpoint_every:
+                self.checkpoint()
         except Exception as e:
             self.logger.error(f"Failed to save trade log: {e}")
 
+    def checkpoint(self) -> None:
+        """Write a compacted snapshot of the running metrics to the trade log."""
+        if self.trade_store is None:
+            return
+        self.trade_store.write_checkpoint(self._metrics_state())
+        self._trades_since_checkpoint = 0
+
+    def _metrics_state(self) -> dict[str, Any]:
+        """Running metrics as a JSON-serializable snapshot."""
+        return {
+            "trade_count": self._trade_count,
+            "winning_trades": self.winning_trades,
+            "losing_trades": self.losing_trades,
+            "total_pnl": self.total_pnl,
+            "max_drawdown": self.max_drawdown,
+            "current_drawdown": self.current_drawdown,
+            "peak_equity": self.peak_equity,
+            "current_equity": self.current_equity,
+            "daily_pnl": self.daily_pnl,
+            "strategy_performance": self.strategy_performance,
+        }
+
+    def _restore_metrics(self, state: dict[str, Any]) -> None:
+        """Restore running metrics from a checkpoint snapshot.
+
+        Args:
+            state: Snapshot written by _metrics_state
+        """
+        self._trade_count = state["trade_count"]
+        self.winning_trades = state["winning_trades"]
+        self.losing_trades = state["losing_trades"]
+        self.total_pnl = state["total_pnl"]
+        self.max_drawdown = state["max_drawdown"]
+        self.current_drawdown = state["current_drawdown"]
+        self.peak_equity = state["peak_equity"]
+        self.current_equity = state["current_equity"]
+        self.daily_pnl = dict(state["daily_pnl"])
+        self.strategy_performance = state["strategy_performance"]
+
     def _load_trade_log(self) -> None:
-        """Load trade log from file."""
+        """Load trade log from file.
+
+        Restores the latest checkpoint and replays only the trades logged after
+        it; the full history is read lazily (see trade_log). A legacy JSON trade
+        log is imported into the segmented log on first load.
+        """
         try:
-            with open(self.log_file) as f:
-                self.trade_log = json.load(f)
+            directory = self._trade_log_dir()
+            if not os.path.isdir(directory) and not os.path.exists(self.log_file):
+                self.logger.info(f"No existing trade log found at {directory}")
+                return
+
+            self.trade_store = SegmentedTradeLog(directory, self.segment_max_bytes, self.fsync)
+            state, tail = self.trade_store.load()
+            if state is None and not tail and os.path.exists(self.log_file):
+                with open(self.log_file) as f:
+                    tail = json.load(f)
+                for trade in tail:
+                    self.trade_store.append(trade)
+                self.logger.info(f"Imported {len(tail)} trades from legacy log {self.log_file}")
+
+            if state is None:
+                # No checkpoint: the tail is the whole history
+                self.trade_log = tail
+                self._recalculate_metrics()
+            else:
+                self._restore_metrics(state)
+                self._trade_log = None
+                for trade in tail:
+                    self._apply_trade(trade)
+                self._trade_count += len(tail)
 
-            # Recalculate all metrics from loaded data
-            self._recalculate_metrics()
+            if tail:
+                self.checkpoint()
 
             self.logger.info(
-                f"Loaded {len(self.trade_log)} trades from {self.log_file}"
+                f"Loaded {self._trade_count} trades from {directory} "
+                f"({len(tail)} replayed after checkpoint)"
             )
-        except FileNotFoundError:
-            self.logger.info(f"No existing trade log found at {self.log_file}")
         except Exception as e:
             self.logger.error(f"Failed to load trade log: {e}")
 
@@ -877,16 +993,14 @@ class ProfitAnalytics(LoggerMixin):
         self.total_pnl = 0.0
         self.current_equity = self.initial_capital
         self.peak_equity = self.initial_capital
+        self.max_drawdown = 0.0
+        self.current_drawdown = 0.0
         self.daily_pnl = {}
         self.strategy_performance = {}
 
         # Recalculate from trade log
         for trade in self.trade_log:
-            self._update_performance_metrics(trade)
-            self._update_daily_pnl(trade)
-            self._update_strategy_performance(trade)
-
-        self._update_drawdown()
+            self._apply_trade(trade)
 
     def get_trade_log(self) -> list[dict[str, Any]]:
         """Get complete trade log.
@@ -908,11 +1022,16 @@ class ProfitAnalytics(LoggerMixin):
         if strategy not in self.strategy_performance:
             return None
 
-        return self.strategy_performance[strategy].copy()
+        summary = self.strategy_performance[strategy].copy()
+        summary["trades"] = self._strategy_trades(strategy)
+        return summary
 
     def clear_data(self) -> None:
         """Clear all trade data."""
-        self.trade_log.clear()
+        self.trade_log = []
+        if self.trade_store is not None:
+            self.trade_store.clear()
+        self._trades_since_checkpoint = 0
         self.daily_pnl.clear()
         self.strategy_performance.clear()
 
@@ -6,6 +6,7 @@ replaced by consolidated logging in trading_system.py
 """
 
 import json
+import os
 from datetime import datetime, timezone, timedelta
 from typing import Any, Optional
 import pytz
@@ -31,6 +32,8 @@ class ProfitLogger(LoggerMixin):
         # Logging configuration
         self.log_level = self.config.get("log_level", "INFO")
         self.log_file = self.config.get("log_file", "profit_logs.json")
+        # Directory for session-scoped log files (current directory by default)
+        self.log_dir = self.config.get("log_dir", "")
         self.console_output = self.config.get("console_output", True)
         self.emoji_enabled = self.config.get("emoji_enabled", True)
         self.detailed_logging = self.config.get("detailed_logging", True)
@@ -224,7 +227,9 @@ class ProfitLogger(LoggerMixin):
             self.session_start_equity = session_initial_equity
             self.is_continuing_session = False
             
-            self.log_file = f"profit_logs_{session_id}.json"
+            if self.log_dir:
+                os.makedirs(self.log_dir, exist_ok=True)
+            self.log_file = os.path.join(self.log_dir, f"profit_logs_{session_id}.json")
             self.logger.info(f"Session ID: {session_id}")
             self.logger.info(f"Session initial equity: ${self.current_equity:,.2f}")
         
@@ -1,15 +1,218 @@
 """
 Trade ledger for persistent recording of all executed trades.
+
+Besides the raw fills, the ledger keeps a materialized ``trade_aggregates``
+table with one row per (session, date, symbol, strategy). It is updated in the
+same transaction as every commit, so metric queries read a handful of group
+rows instead of scanning the fills. Build it for an existing database with::
+
+    python -m crypto_mvp.analytics.trade_ledger trade_ledger.db --backfill
 """
 
+import argparse
 import json
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from ..core.logging_utils import LoggerMixin
 
+# Statements are module constants so each long-lived connection's statement
+# cache prepares them once and reuses them for every call.
+# Re-committing a trade_id updates the row in place: it keeps its row id, so
+# readers that page by id (get_trades_since) don't see it as a new trade.
+INSERT_FILL_SQL = """
+    INSERT INTO trades (
+        trade_id, session_id, symbol, side, quantity, fill_price,
+        effective_fill_price, fee_bps_applied, slippage_bps_applied,
+        fees, notional_value, strategy, exit_reason, executed_at, date
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(trade_id) DO UPDATE SET
+        session_id = excluded.session_id,
+        symbol = excluded.symbol,
+        side = excluded.side,
+        quantity = excluded.quantity,
+        fill_price = excluded.fill_price,
+        effective_fill_price = excluded.effective_fill_price,
+        fee_bps_applied = excluded.fee_bps_applied,
+        slippage_bps_applied = excluded.slippage_bps_applied,
+        fees = excluded.fees,
+        notional_value = excluded.notional_value,
+        strategy = excluded.strategy,
+        exit_reason = excluded.exit_reason,
+        executed_at = excluded.executed_at,
+        date = excluded.date
+"""
+SELECT_SESSION_DATE_SQL = """
+    SELECT * FROM trades
+    WHERE session_id = ? AND date = ?
+    ORDER BY executed_at ASC
+"""
+SELECT_SESSION_ASC_SQL = """
+    SELECT * FROM trades
+    WHERE session_id = ?
+    ORDER BY executed_at ASC
+"""
+SELECT_SESSION_SQL = """
+    SELECT * FROM trades
+    WHERE session_id = ?
+    ORDER BY executed_at DESC
+"""
+SELECT_SESSION_SINCE_SQL = """
+    SELECT * FROM trades
+    WHERE session_id = ? AND id > ?
+    ORDER BY id
+"""
+SELECT_DATE_SQL = """
+    SELECT * FROM trades
+    WHERE date = ?
+    ORDER BY executed_at DESC
+"""
+SELECT_ALL_SQL = """
+    SELECT * FROM trades
+    ORDER BY executed_at DESC
+"""
+
+# Order fills evicted from the OrderManager's in-memory history. Kept apart
+# from trades (every trade is already recorded there) so nothing is counted twice
+CREATE_ORDER_FILLS_SQL = """
+    CREATE TABLE IF NOT EXISTS order_fills (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        order_id TEXT NOT NULL,
+        session_id TEXT,
+        symbol TEXT NOT NULL,
+        side TEXT NOT NULL,
+        quantity REAL NOT NULL,
+        price REAL NOT NULL,
+        fees REAL NOT NULL,
+        strategy TEXT,
+        executed_at TIMESTAMP NOT NULL,
+        mark_price REAL,
+        slippage_bps REAL,
+        slippage_cost REAL,
+        fee_bps REAL,
+        is_maker INTEGER NOT NULL DEFAULT 0,
+        metadata TEXT
+    )
+"""
+INSERT_ORDER_FILL_SQL = """
+    INSERT INTO order_fills (
+        order_id, session_id, symbol, side, quantity, price, fees, strategy,
+        executed_at, mark_price, slippage_bps, slippage_cost, fee_bps, is_maker, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SELECT_ORDER_FILLS_SQL = """
+    SELECT * FROM order_fills
+    WHERE order_id = ?
+    ORDER BY id ASC
+"""
+
+# Aggregate columns after the (session_id, date, symbol, strategy) key. The
+# "fill_count" .. "last_executed_at" columns cover every fill (session
+# summaries); the rest cover valid fills only (quantity > 0 and price > 0),
+# matching the daily metrics. "Entry" fills are those without an exit reason.
+CREATE_AGGREGATES_SQL = """
+    CREATE TABLE IF NOT EXISTS trade_aggregates (
+        session_id TEXT NOT NULL,
+        date TEXT NOT NULL,
+        symbol TEXT NOT NULL,
+        strategy TEXT NOT NULL,
+        fill_count INTEGER NOT NULL,
+        total_quantity REAL NOT NULL,
+        total_fees REAL NOT NULL,
+        total_notional REAL NOT NULL,
+        first_executed_at TEXT,
+        last_executed_at TEXT,
+        valid_count INTEGER NOT NULL,
+        buy_count INTEGER NOT NULL,
+        sell_count INTEGER NOT NULL,
+        valid_fees REAL NOT NULL,
+        entry_volume REAL NOT NULL,
+        entry_notional REAL NOT NULL,
+        largest_notional REAL,
+        smallest_notional REAL,
+        PRIMARY KEY (session_id, date, symbol, strategy)
+    )
+"""
+AGGREGATE_FROM_TRADES_SQL = """
+    INSERT INTO trade_aggregates
+    SELECT
+        session_id, date, symbol, strategy,
+        COUNT(*),
+        TOTAL(ABS(quantity)),
+        TOTAL(fees),
+        TOTAL(notional_value),
+        MIN(executed_at),
+        MAX(executed_at),
+        SUM(quantity > 0 AND fill_price > 0),
+        SUM(quantity > 0 AND fill_price > 0 AND LOWER(side) = 'buy'),
+        SUM(quantity > 0 AND fill_price > 0 AND LOWER(side) = 'sell'),
+        TOTAL(CASE WHEN quantity > 0 AND fill_price > 0 THEN fees END),
+        TOTAL(CASE WHEN quantity > 0 AND fill_price > 0 AND exit_reason IS NULL
+              THEN ABS(notional_value) END),
+        TOTAL(CASE WHEN quantity > 0 AND fill_price > 0 AND exit_reason IS NULL
+              THEN notional_value END),
+        MAX(CASE WHEN quantity > 0 AND fill_price > 0 THEN ABS(notional_value) END),
+        MIN(CASE WHEN quantity > 0 AND fill_price > 0 THEN ABS(notional_value) END)
+    FROM trades
+    {where}
+    GROUP BY session_id, date, symbol, strategy
+"""
+UPSERT_AGGREGATE_SQL = """
+    INSERT INTO trade_aggregates VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (session_id, date, symbol, strategy) DO UPDATE SET
+        fill_count = fill_count + excluded.fill_count,
+        total_quantity = total_quantity + excluded.total_quantity,
+        total_fees = total_fees + excluded.total_fees,
+        total_notional = total_notional + excluded.total_notional,
+        first_executed_at = MIN(first_executed_at, excluded.first_executed_at),
+        last_executed_at = MAX(last_executed_at, excluded.last_executed_at),
+        valid_count = valid_count + excluded.valid_count,
+        buy_count = buy_count + excluded.buy_count,
+        sell_count = sell_count + excluded.sell_count,
+        valid_fees = valid_fees + excluded.valid_fees,
+        entry_volume = entry_volume + excluded.entry_volume,
+        entry_notional = entry_notional + excluded.entry_notional,
+        largest_notional = COALESCE(
+            MAX(largest_notional, excluded.largest_notional), largest_notional, excluded.largest_notional
+        ),
+        smallest_notional = COALESCE(
+            MIN(smallest_notional, excluded.smallest_notional), smallest_notional, excluded.smallest_notional
+        )
+"""
+GROUP_WHERE = "session_id = ? AND date = ? AND symbol = ? AND strategy = ?"
+DAILY_METRICS_SQL = """
+    SELECT
+        SUM(valid_count) AS trade_count,
+        TOTAL(entry_volume) AS total_volume,
+        TOTAL(valid_fees) AS total_fees,
+        TOTAL(entry_notional) AS total_notional,
+        SUM(buy_count) AS buy_trades,
+        SUM(sell_count) AS sell_trades,
+        MAX(largest_notional) AS largest_trade,
+        MIN(smallest_notional) AS smallest_trade
+    FROM trade_aggregates
+    WHERE valid_count > 0 {filters}
+"""
+SESSION_SUMMARY_SQL = """
+    SELECT
+        SUM(fill_count) AS total_trades,
+        TOTAL(total_quantity) AS total_volume,
+        TOTAL(total_fees) AS total_fees,
+        TOTAL(total_notional) AS total_notional,
+        MIN(first_executed_at) AS first_trade,
+        MAX(last_executed_at) AS last_trade,
+        COUNT(DISTINCT symbol) AS symbols_traded,
+        COUNT(DISTINCT strategy) AS strategies_used,
+        COUNT(DISTINCT date) AS trading_days
+    FROM trade_aggregates
+    WHERE session_id = ?
+"""
+
 
 class TradeLedger(LoggerMixin):
     """
@@ -17,22 +220,104 @@ class TradeLedger(LoggerMixin):
     
     This ledger ensures that all executed trades are immediately committed to persistent
     storage and can be queried for daily summaries and analytics.
+
+    The database is opened once: a single writer connection in WAL mode and a
+    small pool of read-only connections, so queries never wait on a connect
+    and readers never block the writer.
     """
     
-    def __init__(self, db_path: str = "trade_ledger.db"):
+    def __init__(self, db_path: str = "trade_ledger.db", read_pool_size: int = 4):
         """Initialize the trade ledger.
         
         Args:
             db_path: Path to SQLite database file
+            read_pool_size: Maximum number of pooled read-only connections
         """
         super().__init__()
         self.db_path = db_path
+        self.read_pool_size = max(1, read_pool_size)
+        self._write_lock = threading.RLock()
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+        self._all_readers: List[sqlite3.Connection] = []
+        self._writer: Optional[sqlite3.Connection] = None
+        # In-memory databases are private to one connection, so reads share the writer
+        self._shared_reader = db_path == ":memory:" or db_path.startswith("file::memory:")
         self._init_database()
+
+    def _connect_writer(self) -> sqlite3.Connection:
+        """Open the writer connection in WAL mode."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        if not self._shared_reader:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _writing(self) -> Iterator[sqlite3.Connection]:
+        """Run one write transaction on the writer connection."""
+        with self._write_lock:
+            try:
+                yield self._writer
+                self._writer.commit()
+            except BaseException:
+                self._writer.rollback()
+                raise
+
+    @contextmanager
+    def _reading(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled read-only connection."""
+        if self._shared_reader:
+            with self._write_lock:
+                yield self._writer
+            return
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._reader_lock:
+                create = self._reader_count < self.read_pool_size
+                if create:
+                    self._reader_count += 1
+            if create:
+                conn = sqlite3.connect(
+                    f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+                    uri=True,
+                    check_same_thread=False,
+                    timeout=30.0,
+                )
+                conn.row_factory = sqlite3.Row
+                with self._reader_lock:
+                    self._all_readers.append(conn)
+            else:
+                conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            # End the implicit read transaction so the next borrower sees new commits
+            conn.rollback()
+            self._readers.put(conn)
+
+    def close(self) -> None:
+        """Close the writer and all pooled reader connections."""
+        with self._reader_lock:
+            readers, self._all_readers = self._all_readers, []
+            self._reader_count = 0
+        for conn in readers:
+            conn.close()
+        self._readers = queue.LifoQueue()
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
     
     def _init_database(self) -> None:
         """Initialize the SQLite database with required tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            self._writer = self._connect_writer()
+            with self._writing() as conn:
                 cursor = conn.cursor()
                 
                 # Create trades table
@@ -77,8 +362,29 @@ class TradeLedger(LoggerMixin):
                 # Run migrations for existing databases
                 self._run_migrations(cursor)
                 
-                conn.commit()
-                self.logger.info(f"Trade ledger database initialized at {self.db_path}")
+                # Materialized per-group aggregates; databases created before
+                # the table existed are backfilled once, in this transaction
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'trade_aggregates'"
+                )
+                has_aggregates = cursor.fetchone() is not None
+                cursor.execute(CREATE_AGGREGATES_SQL)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_aggregates_date
+                    ON trade_aggregates(date)
+                """)
+                if not has_aggregates:
+                    groups = self._rebuild_aggregates(conn)
+                    if groups:
+                        self.logger.info(f"Backfilled {groups} trade aggregate groups")
+
+                cursor.execute(CREATE_ORDER_FILLS_SQL)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_order_fills_order_id
+                    ON order_fills(order_id)
+                """)
+                
+            self.logger.info(f"Trade ledger database initialized at {self.db_path}")
                 
         except Exception as e:
             self.logger.error(f"Failed to initialize trade ledger database: {e}")
@@ -155,6 +461,231 @@ class TradeLedger(LoggerMixin):
         Returns:
             True if successfully committed, False otherwise
         """
+        row = self._fill_row(
+            trade_id, session_id, symbol, side, quantity, fill_price, fees, strategy,
+            exit_reason, executed_at, effective_fill_price, fee_bps_applied, slippage_bps_applied,
+        )
+        notional_value = row[10]
+        effective_fill_price = row[6]
+        
+        try:
+            self.logger.info(f"TRADE_LEDGER_COMMIT: Starting commit for trade {trade_id}")
+            with self._writing() as conn:
+                self._store_fills(conn, [row])
+                
+            self.logger.info(f"TRADE_LEDGER_COMMIT: Successfully committed trade {trade_id} to database")
+            
+            # Log fill with enhanced details
+            if fee_bps_applied or slippage_bps_applied:
+                self.logger.info(
+                    f"FILL: {symbol} {side} {quantity:.6f} @ mark=${fill_price:.4f} → "
+                    f"effective=${effective_fill_price:.4f} "
+                    f"(fee={fee_bps_applied:.2f}bps, slip={slippage_bps_applied:.2f}bps), "
+                    f"fees=${fees:.4f} notional=${notional_value:.2f}"
+                )
+            else:
+                self.logger.debug(
+                    f"Committed fill to ledger: {symbol} {side} {quantity:.6f} @ ${fill_price:.4f} "
+                    f"fees=${fees:.4f} notional=${notional_value:.2f}"
+                )
+            
+            return True
+                
+        except Exception as e:
+            self.logger.error(f"Failed to commit fill to ledger: {e}")
+            return False
+
+    def commit_fills(self, fills: List[Dict[str, Any]]) -> bool:
+        """Commit a batch of fills (e.g. all fills of a cycle) in one transaction.
+        
+        Either every fill is written or none is.
+        
+        Args:
+            fills: Fill dictionaries with the keyword arguments of commit_fill
+            
+        Returns:
+            True if the whole batch was committed, False otherwise
+        """
+        if not fills:
+            return True
+        
+        try:
+            rows = [
+                self._fill_row(
+                    fill["trade_id"],
+                    fill["session_id"],
+                    fill["symbol"],
+                    fill["side"],
+                    fill["quantity"],
+                    fill["fill_price"],
+                    fill["fees"],
+                    fill.get("strategy", "unknown"),
+                    fill.get("exit_reason"),
+                    fill.get("executed_at"),
+                    fill.get("effective_fill_price"),
+                    fill.get("fee_bps_applied"),
+                    fill.get("slippage_bps_applied"),
+                )
+                for fill in fills
+            ]
+            with self._writing() as conn:
+                self._store_fills(conn, rows)
+            
+            self.logger.info(f"TRADE_LEDGER_COMMIT: Committed {len(rows)} fills in one transaction")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to commit {len(fills)} fills to ledger: {e}")
+            return False
+
+    def archive_order_fills(self, fills: List[Dict[str, Any]]) -> bool:
+        """Archive order fills evicted from memory, in one transaction.
+        
+        Args:
+            fills: Fill dictionaries with order_id, session_id, symbol, side,
+                quantity, price, fees, strategy, executed_at and optional
+                mark_price, slippage_bps, slippage_cost, fee_bps, is_maker, metadata
+            
+        Returns:
+            True if the whole batch was archived, False otherwise
+        """
+        if not fills:
+            return True
+        
+        try:
+            rows = [
+                (
+                    fill["order_id"],
+                    fill.get("session_id"),
+                    fill["symbol"],
+                    fill["side"],
+                    fill["quantity"],
+                    fill["price"],
+                    fill["fees"],
+                    fill.get("strategy", ""),
+                    (fill.get("executed_at") or datetime.now(timezone.utc)).isoformat(),
+                    fill.get("mark_price"),
+                    fill.get("slippage_bps"),
+                    fill.get("slippage_cost"),
+                    fill.get("fee_bps"),
+                    int(bool(fill.get("is_maker"))),
+                    json.dumps(fill.get("metadata") or {}, default=str),
+                )
+                for fill in fills
+            ]
+            with self._writing() as conn:
+                conn.executemany(INSERT_ORDER_FILL_SQL, rows)
+            
+            self.logger.debug(f"Archived {len(rows)} order fills")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to archive {len(fills)} order fills: {e}")
+            return False
+    
+    def get_order_fills(self, order_id: str) -> List[Dict[str, Any]]:
+        """Get the archived fills of an order.
+        
+        Args:
+            order_id: Order ID
+            
+        Returns:
+            Fill dictionaries in archive order (metadata decoded)
+        """
+        try:
+            with self._reading() as conn:
+                rows = conn.execute(SELECT_ORDER_FILLS_SQL, (order_id,)).fetchall()
+            fills = []
+            for row in rows:
+                fill = dict(row)
+                fill["is_maker"] = bool(fill["is_maker"])
+                fill["metadata"] = json.loads(fill["metadata"]) if fill["metadata"] else {}
+                fills.append(fill)
+            return fills
+        except Exception as e:
+            self.logger.error(f"Failed to get archived fills for order {order_id}: {e}")
+            return []
+
+    @staticmethod
+    def _aggregate_delta(row: tuple) -> list:
+        """Contribution of one fill row to its group's aggregate columns."""
+        quantity, fill_price, fees, notional = row[4], row[5], row[9], row[10]
+        valid = quantity > 0 and fill_price > 0
+        entry = valid and row[12] is None
+        side = row[3].lower()
+        return [
+            1,
+            abs(quantity),
+            fees,
+            notional,
+            row[13],
+            row[13],
+            int(valid),
+            int(valid and side == 'buy'),
+            int(valid and side == 'sell'),
+            fees if valid else 0.0,
+            abs(notional) if entry else 0.0,
+            notional if entry else 0.0,
+            abs(notional) if valid else None,
+            abs(notional) if valid else None,
+        ]
+
+    @staticmethod
+    def _merge_delta(current: list, delta: list) -> None:
+        """Fold one fill's aggregate contribution into another's, in place."""
+        for i in (0, 1, 2, 3, 6, 7, 8, 9, 10, 11):
+            current[i] += delta[i]
+        current[4] = min(current[4], delta[4])
+        current[5] = max(current[5], delta[5])
+        for i, pick in ((12, max), (13, min)):
+            if delta[i] is not None:
+                current[i] = delta[i] if current[i] is None else pick(current[i], delta[i])
+
+    def _rebuild_aggregates(
+        self, conn: sqlite3.Connection, where: str = "", params: tuple = ()
+    ) -> int:
+        """Recompute aggregate rows from the fills.
+        
+        Args:
+            conn: Writer connection inside an open transaction
+            where: Optional filter on columns shared by both tables
+            params: Parameters for the filter
+            
+        Returns:
+            Number of aggregate groups written
+        """
+        clause = f"WHERE {where}" if where else ""
+        conn.execute(f"DELETE FROM trade_aggregates {clause}", params)
+        return conn.execute(AGGREGATE_FROM_TRADES_SQL.format(where=clause), params).rowcount
+
+    def backfill_aggregates(self) -> int:
+        """Rebuild the materialized aggregates from every fill in the ledger.
+        
+        Returns:
+            Number of aggregate groups written
+        """
+        with self._writing() as conn:
+            groups = self._rebuild_aggregates(conn)
+        self.logger.info(f"Backfilled {groups} trade aggregate groups")
+        return groups
+
+    @staticmethod
+    def _fill_row(
+        trade_id: str,
+        session_id: str,
+        symbol: str,
+        side: str,
+        quantity: float,
+        fill_price: float,
+        fees: float,
+        strategy: str,
+        exit_reason: Optional[str],
+        executed_at: Optional[datetime],
+        effective_fill_price: Optional[float],
+        fee_bps_applied: Optional[float],
+        slippage_bps_applied: Optional[float],
+    ) -> tuple:
+        """Build the INSERT_FILL_SQL parameters for one fill."""
         if executed_at is None:
             executed_at = datetime.now(timezone.utc)
         
@@ -168,79 +699,62 @@ class TradeLedger(LoggerMixin):
         if effective_fill_price is None:
             effective_fill_price = fill_price
         
-        try:
-            self.logger.info(f"TRADE_LEDGER_COMMIT: Starting commit for trade {trade_id}")
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Check which columns exist
-                cursor.execute("PRAGMA table_info(trades)")
-                columns = [row[1] for row in cursor.fetchall()]
-                has_exit_reason = 'exit_reason' in columns
-                has_effective_fill = 'effective_fill_price' in columns
-                self.logger.info(f"TRADE_LEDGER_COMMIT: has_exit_reason={has_exit_reason}, has_effective_fill={has_effective_fill}")
-                
-                if has_exit_reason and has_effective_fill:
-                    # Insert trade record with all fields
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO trades (
-                            trade_id, session_id, symbol, side, quantity, fill_price,
-                            effective_fill_price, fee_bps_applied, slippage_bps_applied,
-                            fees, notional_value, strategy, exit_reason, executed_at, date
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        trade_id, session_id, symbol, side, quantity, fill_price,
-                        effective_fill_price, fee_bps_applied, slippage_bps_applied,
-                        fees, notional_value, strategy, exit_reason, executed_at.isoformat(), trade_date
-                    ))
-                elif has_exit_reason:
-                    # Insert trade record with exit_reason but not effective_fill
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO trades (
-                            trade_id, session_id, symbol, side, quantity, fill_price,
-                            fees, notional_value, strategy, exit_reason, executed_at, date
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        trade_id, session_id, symbol, side, quantity, fill_price,
-                        fees, notional_value, strategy, exit_reason, executed_at.isoformat(), trade_date
-                    ))
-                else:
-                    # Fallback: insert without exit_reason column
-                    self.logger.warning("exit_reason column missing, inserting without exit_reason")
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO trades (
-                            trade_id, session_id, symbol, side, quantity, fill_price,
-                            fees, notional_value, strategy, executed_at, date
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        trade_id, session_id, symbol, side, quantity, fill_price,
-                        fees, notional_value, strategy, executed_at.isoformat(), trade_date
-                    ))
-                
-                conn.commit()
-                
-                self.logger.info(f"TRADE_LEDGER_COMMIT: Successfully committed trade {trade_id} to database")
-                
-                # Log fill with enhanced details
-                if fee_bps_applied or slippage_bps_applied:
-                    self.logger.info(
-                        f"FILL: {symbol} {side} {quantity:.6f} @ mark=${fill_price:.4f} → "
-                        f"effective=${effective_fill_price:.4f} "
-                        f"(fee={fee_bps_applied:.2f}bps, slip={slippage_bps_applied:.2f}bps), "
-                        f"fees=${fees:.4f} notional=${notional_value:.2f}"
-                    )
-                else:
-                    self.logger.debug(
-                        f"Committed fill to ledger: {symbol} {side} {quantity:.6f} @ ${fill_price:.4f} "
-                        f"fees=${fees:.4f} notional=${notional_value:.2f}"
-                    )
-                
-                return True
-                
-        except Exception as e:
-            self.logger.error(f"Failed to commit fill to ledger: {e}")
-            return False
+        return (
+            trade_id, session_id, symbol, side, quantity, fill_price,
+            effective_fill_price, fee_bps_applied, slippage_bps_applied,
+            fees, notional_value, strategy, exit_reason, executed_at.isoformat(), trade_date
+        )
     
+    def _store_fills(self, conn: sqlite3.Connection, rows: List[tuple]) -> None:
+        """Insert fill rows and fold them into the aggregates.
+        
+        New fills are added to their groups' running totals. A fill that
+        replaces an existing trade_id can't be subtracted out of a min/max, so
+        the groups it leaves and joins are recomputed from their fills instead.
+        
+        Args:
+            conn: Writer connection inside an open transaction
+            rows: INSERT_FILL_SQL parameter tuples
+        """
+        trade_ids = [row[0] for row in rows]
+        replaced, stale = set(), set()
+        for start in range(0, len(trade_ids), 500):
+            chunk = trade_ids[start:start + 500]
+            for existing in conn.execute(
+                "SELECT trade_id, session_id, date, symbol, strategy FROM trades "
+                f"WHERE trade_id IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ):
+                replaced.add(existing[0])
+                stale.add(tuple(existing[1:]))
+        seen = set()
+        for trade_id in trade_ids:
+            if trade_id in seen:
+                replaced.add(trade_id)
+            seen.add(trade_id)
+        
+        conn.executemany(INSERT_FILL_SQL, rows)
+        
+        deltas: Dict[tuple, list] = {}
+        for row in rows:
+            key = (row[1], row[14], row[2], row[11])
+            if row[0] in replaced:
+                stale.add(key)
+                continue
+            delta = self._aggregate_delta(row)
+            current = deltas.get(key)
+            if current is None:
+                deltas[key] = delta
+            else:
+                self._merge_delta(current, delta)
+        
+        conn.executemany(
+            UPSERT_AGGREGATE_SQL,
+            [key + tuple(delta) for key, delta in deltas.items() if key not in stale],
+        )
+        for key in stale:
+            self._rebuild_aggregates(conn, GROUP_WHERE, key)
+
     def get_trades_by_session_and_date(
         self, 
         session_id: str, 
@@ -256,24 +770,11 @@ class TradeLedger(LoggerMixin):
             List of trade records
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row  # Enable column access by name
-                cursor = conn.cursor()
-                
+            with self._reading() as conn:
                 if date:
-                    cursor.execute("""
-                        SELECT * FROM trades 
-                        WHERE session_id = ? AND date = ?
-                        ORDER BY executed_at ASC
-                    """, (session_id, date))
+                    rows = conn.execute(SELECT_SESSION_DATE_SQL, (session_id, date)).fetchall()
                 else:
-                    cursor.execute("""
-                        SELECT * FROM trades 
-                        WHERE session_id = ?
-                        ORDER BY executed_at ASC
-                    """, (session_id,))
-                
-                rows = cursor.fetchall()
+                    rows = conn.execute(SELECT_SESSION_ASC_SQL, (session_id,)).fetchall()
                 
                 # Convert rows to dictionaries
                 trades = []
@@ -318,22 +819,31 @@ class TradeLedger(LoggerMixin):
             List of trade records for the session
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT * FROM trades 
-                    WHERE session_id = ? 
-                    ORDER BY executed_at DESC
-                """, (session_id,))
-                
-                return [dict(row) for row in cursor.fetchall()]
+            with self._reading() as conn:
+                return [dict(row) for row in conn.execute(SELECT_SESSION_SQL, (session_id,))]
                 
         except Exception as e:
             self.logger.error(f"Failed to get trades by session: {e}")
             return []
     
+    def get_trades_since(self, session_id: str, after_id: int = 0) -> List[Dict[str, Any]]:
+        """Get the trades of a session recorded after a given row id.
+        
+        Args:
+            session_id: Session identifier
+            after_id: Row id (``id`` column) of the last trade already seen
+            
+        Returns:
+            List of trade records in insertion order
+        """
+        try:
+            with self._reading() as conn:
+                return [dict(row) for row in conn.execute(SELECT_SESSION_SINCE_SQL, (session_id, after_id))]
+                
+        except Exception as e:
+            self.logger.error(f"Failed to get trades since id {after_id}: {e}")
+            return []
+    
     def get_trades_by_date(self, date: str) -> List[Dict[str, Any]]:
         """Get all trades for a date.
         
@@ -344,17 +854,8 @@ class TradeLedger(LoggerMixin):
             List of trade records for the date
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT * FROM trades 
-                    WHERE date = ? 
-                    ORDER BY executed_at DESC
-                """, (date,))
-                
-                return [dict(row) for row in cursor.fetchall()]
+            with self._reading() as conn:
+                return [dict(row) for row in conn.execute(SELECT_DATE_SQL, (date,))]
                 
         except Exception as e:
             self.logger.error(f"Failed to get trades by date: {e}")
@@ -367,16 +868,8 @@ class TradeLedger(LoggerMixin):
             List of all trade records
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT * FROM trades 
-                    ORDER BY executed_at DESC
-                """)
-                
-                return [dict(row) for row in cursor.fetchall()]
+            with self._reading() as conn:
+                return [dict(row) for row in conn.execute(SELECT_ALL_SQL)]
                 
         except Exception as e:
             self.logger.error(f"Failed to get all trades: {e}")
@@ -396,34 +889,36 @@ class TradeLedger(LoggerMixin):
         Returns:
             Dictionary with daily metrics
         """
-        if date and session_id:
-            # Get trades for specific date and session
-            trades = self.get_daily_trades(session_id, date)
-        elif session_id:
-            # Get all trades for session (all dates)
-            trades = self.get_trades_by_session(session_id)
-        elif date:
-            # Get all trades for date (all sessions)
-            trades = self.get_trades_by_date(date)
-        else:
-            # Get all trades
-            trades = self.get_all_trades()
-        
-        # Filter out invalid trades (qty <= 0, price <= 0, or not committed)
-        valid_trades = []
-        for trade in trades:
-            quantity = trade.get('quantity', 0)
-            fill_price = trade.get('fill_price', 0)
-            # All trades in ledger are committed by definition
-            committed = True
-            
-            # Skip invalid trades
-            if quantity <= 0 or fill_price <= 0 or not committed:
-                continue
-                
-            valid_trades.append(trade)
+        filters, params = "", []
+        if session_id:
+            filters += " AND session_id = ?"
+            params.append(session_id)
+        if date:
+            filters += " AND date = ?"
+            params.append(date)
+        
+        # Only valid fills (qty > 0, price > 0) are counted; the aggregates
+        # keep those totals per (session, date, symbol, strategy) group
+        try:
+            with self._reading() as conn:
+                row = conn.execute(DAILY_METRICS_SQL.format(filters=filters), params).fetchone()
+                symbols_traded = [
+                    symbol for (symbol,) in conn.execute(
+                        f"SELECT DISTINCT symbol FROM trade_aggregates WHERE valid_count > 0 {filters}",
+                        params,
+                    )
+                ]
+                strategies_used = [
+                    strategy for (strategy,) in conn.execute(
+                        f"SELECT DISTINCT strategy FROM trade_aggregates WHERE valid_count > 0 {filters}",
+                        params,
+                    )
+                ]
+        except Exception as e:
+            self.logger.error(f"Failed to calculate daily metrics from ledger: {e}")
+            row = None
         
-        if not valid_trades:
+        if not row or not row['trade_count']:
             return {
                 "total_trades": 0,
                 "trade_count": 0,  # Number of fills
@@ -442,60 +937,31 @@ class TradeLedger(LoggerMixin):
                 "session_id": session_id
             }
         
-        # Calculate metrics using only valid trades
-        total_trades = len(valid_trades)
-        
-        # Separate new exposure trades (non-reduce-only) from all trades
-        new_exposure_trades = []
-        for trade in valid_trades:
-            # Check if this is a reduce-only exit (from metadata or exit_reason)
-            is_reduce_only = (
-                trade.get('exit_reason') is not None or  # Has exit reason
-                trade.get('metadata', {}).get('reduce_only', False) or  # Marked as reduce-only
-                trade.get('metadata', {}).get('exit_action', False)  # Marked as exit action
-            )
-            
-            if not is_reduce_only:
-                new_exposure_trades.append(trade)
-        
-        # Volume: sum of absolute fill notional values (quote currency) for new exposure trades
-        total_volume = sum(abs(trade['notional_value']) for trade in new_exposure_trades)
-        total_notional = sum(trade['notional_value'] for trade in new_exposure_trades)
-        
-        # Fees: count from all fills (including reduce-only exits)
-        total_fees = sum(trade['fees'] for trade in valid_trades)
-        
-        buy_trades = len([t for t in valid_trades if t['side'].lower() == 'buy'])
-        sell_trades = len([t for t in valid_trades if t['side'].lower() == 'sell'])
-        
-        symbols_traded = list(set(trade['symbol'] for trade in valid_trades))
-        strategies_used = list(set(trade['strategy'] for trade in valid_trades))
-        
         # Trade count: number of fills (all valid trades)
-        trade_count = len(valid_trades)
+        trade_count = row['trade_count']
         
-        # Average trade size: total volume / trade count (with division by zero guard)
-        avg_trade_size = total_volume / trade_count if trade_count > 0 else 0.0
+        # Volume: sum of absolute fill notional values (quote currency) for new
+        # exposure trades; reduce-only exits (with an exit_reason) are excluded.
+        # Fees count from all fills (including reduce-only exits).
+        total_volume = row['total_volume']
         
-        # Trade size statistics (for largest/smallest trade)
-        trade_sizes = [abs(trade['notional_value']) for trade in valid_trades]
-        largest_trade = max(trade_sizes) if trade_sizes else 0.0
-        smallest_trade = min(trade_sizes) if trade_sizes else 0.0
+        # Average trade size: total volume / trade count
+        avg_trade_size = total_volume / trade_count
         
         return {
-            "total_trades": total_trades,
+            "total_trades": trade_count,
             "trade_count": trade_count,  # Number of fills
             "total_volume": total_volume,
-            "total_fees": total_fees,
-            "total_notional": total_notional,
-            "buy_trades": buy_trades,
-            "sell_trades": sell_trades,
+            "total_fees": row['total_fees'],
+            "total_notional": row['total_notional'],
+            "buy_trades": row['buy_trades'],
+            "sell_trades": row['sell_trades'],
             "symbols_traded": symbols_traded,
             "strategies_used": strategies_used,
             "win_rate": 0.0,  # Would need P&L calculation from positions
             "avg_trade_size": avg_trade_size,
-            "largest_trade": largest_trade,
-            "smallest_trade": smallest_trade,
+            "largest_trade": row['largest_trade'],
+            "smallest_trade": row['smallest_trade'],
             "date": date,
             "session_id": session_id
         }
@@ -513,29 +979,15 @@ class TradeLedger(LoggerMixin):
             Dictionary with session summary
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._reading() as conn:
                 cursor = conn.cursor()
                 
-                # Get session statistics
-                cursor.execute("""
-                    SELECT 
-                        COUNT(*) as total_trades,
-                        SUM(ABS(quantity)) as total_volume,
-                        SUM(fees) as total_fees,
-                        SUM(notional_value) as total_notional,
-                        MIN(executed_at) as first_trade,
-                        MAX(executed_at) as last_trade,
-                        COUNT(DISTINCT symbol) as symbols_traded,
-                        COUNT(DISTINCT strategy) as strategies_used,
-                        COUNT(DISTINCT date) as trading_days
-                    FROM trades 
-                    WHERE session_id = ?
-                """, (session_id,))
+                # Get session statistics from the session's aggregate groups
+                cursor.execute(SESSION_SUMMARY_SQL, (session_id,))
                 
                 row = cursor.fetchone()
                 
-                if row and row['total_trades'] > 0:
+                if row and row['total_trades']:
                     return {
                         "session_id": session_id,
                         "total_trades": row['total_trades'],
@@ -591,7 +1043,7 @@ class TradeLedger(LoggerMixin):
                 hour=0, minute=0, second=0, microsecond=0
             ) - timedelta(days=days_to_keep)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._writing() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -600,10 +1052,12 @@ class TradeLedger(LoggerMixin):
                 """, (cutoff_date.isoformat(),))
                 
                 deleted_count = cursor.rowcount
-                conn.commit()
                 
-                self.logger.info(f"Cleaned up {deleted_count} old trade records")
-                return deleted_count
+                # Drop the emptied days' aggregates; the cutoff day is recomputed
+                self._rebuild_aggregates(conn, "date <= ?", (cutoff_date.date().isoformat(),))
+                
+            self.logger.info(f"Cleaned up {deleted_count} old trade records")
+            return deleted_count
                 
         except Exception as e:
             self.logger.error(f"Failed to cleanup old trades: {e}")
@@ -616,7 +1070,7 @@ class TradeLedger(LoggerMixin):
             Dictionary with database statistics
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reading() as conn:
                 cursor = conn.cursor()
                 
                 # Get table info
@@ -630,7 +1084,7 @@ class TradeLedger(LoggerMixin):
                 total_days = cursor.fetchone()[0]
                 
                 cursor.execute("SELECT MIN(executed_at), MAX(executed_at) FROM trades")
-                date_range = cursor.fetchone()
+                date_range = tuple(cursor.fetchone())
                 
                 return {
                     "total_trades": total_trades,
@@ -643,3 +1097,30 @@ class TradeLedger(LoggerMixin):
         except Exception as e:
             self.logger.error(f"Failed to get database stats: {e}")
             return {"error": str(e)}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: python -m crypto_mvp.analytics.trade_ledger."""
+    parser = argparse.ArgumentParser(description="Trade ledger maintenance")
+    parser.add_argument("db_path", nargs="?", default="trade_ledger.db", help="Ledger database file")
+    parser.add_argument(
+        "--backfill", action="store_true",
+        help="Rebuild the materialized aggregates from all recorded fills",
+    )
+    args = parser.parse_args(argv)
+    
+    if not Path(args.db_path).exists():
+        parser.error(f"no ledger database at {args.db_path}")
+    
+    ledger = TradeLedger(args.db_path)
+    try:
+        if args.backfill:
+            groups = ledger.backfill_aggregates()
+            print(f"Backfilled {groups} aggregate groups in {args.db_path}")
+        print(json.dumps(ledger.get_database_stats(), indent=2, default=str))
+    finally:
+        ledger.close()
+
+
+if __name__ == "__main__":
+    main()
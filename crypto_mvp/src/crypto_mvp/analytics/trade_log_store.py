@@ -0,0 +1,190 @@
+"""
+Append-only, segmented trade log with compacted metric checkpoints.
+
+Trades are appended as JSON lines to numbered segment files
+(``segment-000001.jsonl``, ...) and a new segment is started once the current
+one exceeds a size limit, so recording a trade costs one small write however
+long the history is. Every so often the owner writes a checkpoint: a snapshot
+of its running metrics plus the log position it covers, replaced atomically.
+On restart only the checkpoint and the trades appended after it are read.
+
+A crash can leave a partially written last line; it is dropped and truncated
+away when the log is opened.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Any, Iterator, Optional
+
+from ..core.logging_utils import LoggerMixin
+
+CHECKPOINT_FILE = "checkpoint.json"
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl"
+
+
+class SegmentedTradeLog(LoggerMixin):
+    """
+    Directory of append-only JSONL trade segments and one metrics checkpoint.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = 8 * 1024 * 1024,
+        fsync: bool = False,
+    ):
+        """Open (or create) a segmented trade log.
+
+        Args:
+            directory: Directory holding the segments and the checkpoint
+            segment_max_bytes: Size after which a new segment is started
+            fsync: fsync every append and checkpoint (durable across power
+                loss, slower)
+        """
+        super().__init__()
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync = fsync
+        os.makedirs(directory, exist_ok=True)
+
+        segments = self._segments()
+        self.segment = segments[-1] if segments else 1
+        self.records = 0
+        self._file = None
+
+    def _segments(self) -> list[int]:
+        numbers = []
+        for name in os.listdir(self.directory):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+                numbers.append(int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]))
+        return sorted(numbers)
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"{SEGMENT_PREFIX}{segment:06d}{SEGMENT_SUFFIX}")
+
+    @property
+    def checkpoint_path(self) -> str:
+        return os.path.join(self.directory, CHECKPOINT_FILE)
+
+    def _read_segment(self, segment: int, offset: int = 0) -> Iterator[dict[str, Any]]:
+        """Yield the records of a segment from a byte offset, repairing a torn tail."""
+        path = self._segment_path(segment)
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            f.seek(offset)
+            good = offset
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete line")
+                    record = json.loads(line)
+                except ValueError:
+                    self.logger.warning(
+                        f"Dropping torn trade log record in {path} at byte {good}"
+                    )
+                    break
+                good += len(line)
+                yield record
+        if good < os.path.getsize(path):
+            with open(path, "r+b") as f:
+                f.truncate(good)
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Append one trade record.
+
+        Args:
+            record: JSON-serializable trade record
+        """
+        if self._file is None:
+            self._file = open(self._segment_path(self.segment), "ab")
+        elif self._file.tell() >= self.segment_max_bytes:
+            self._file.close()
+            self.segment += 1
+            self._file = open(self._segment_path(self.segment), "ab")
+
+        self._file.write(json.dumps(record, separators=(",", ":"), default=str).encode() + b"\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.records += 1
+
+    def position(self) -> tuple[int, int]:
+        """Current end of the log as (segment, byte offset)."""
+        if self._file is not None:
+            return self.segment, self._file.tell()
+        path = self._segment_path(self.segment)
+        return self.segment, os.path.getsize(path) if os.path.exists(path) else 0
+
+    def write_checkpoint(self, state: dict[str, Any]) -> None:
+        """Atomically replace the checkpoint with state covering the whole log.
+
+        Args:
+            state: JSON-serializable snapshot of the owner's running metrics
+        """
+        segment, offset = self.position()
+        checkpoint = {
+            "version": 1,
+            "records": self.records,
+            "segment": segment,
+            "offset": offset,
+            "written_at": datetime.now().isoformat(),
+            "state": state,
+        }
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoint, f, separators=(",", ":"), default=str)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def load(self) -> tuple[Optional[dict[str, Any]], list[dict[str, Any]]]:
+        """Read the checkpoint and the records appended after it.
+
+        Returns:
+            (checkpoint state or None, records after the checkpoint). Without a
+            checkpoint every record is returned.
+        """
+        state, segment, offset, records = None, 1, 0, 0
+        try:
+            with open(self.checkpoint_path) as f:
+                checkpoint = json.load(f)
+            state = checkpoint["state"]
+            segment, offset, records = checkpoint["segment"], checkpoint["offset"], checkpoint["records"]
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError) as e:
+            self.logger.warning(f"Ignoring unreadable trade log checkpoint: {e}")
+
+        tail = []
+        for number in self._segments():
+            if number >= segment:
+                tail.extend(self._read_segment(number, offset if number == segment else 0))
+        self.records = records + len(tail)
+        return state, tail
+
+    def read_all(self) -> list[dict[str, Any]]:
+        """Read every record in the log, oldest first."""
+        records = []
+        for number in self._segments():
+            records.extend(self._read_segment(number))
+        return records
+
+    def clear(self) -> None:
+        """Delete all segments and the checkpoint."""
+        self.close()
+        for number in self._segments():
+            os.remove(self._segment_path(number))
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        self.segment = 1
+        self.records = 0
+
+    def close(self) -> None:
+        """Close the open segment."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
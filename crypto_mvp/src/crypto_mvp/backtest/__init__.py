@@ -5,17 +5,38 @@ Backtesting module for the Crypto MVP application.
 import asyncio
 
 from .engine import BacktestEngine
+from .historical import HistoricalDataEngine, load_candle_store
+from .replay import ReplayDataEngine, ReplayFixture, replay_symbols
 from .report import BacktestReport
+from .sweep import SweepResults, SweepRunner, grid_search, random_search
+from .vectorized import BacktestRules, VectorizedBacktester
 
 __all__ = [
     "BacktestEngine",
     "BacktestReport",
+    "BacktestRules",
+    "HistoricalDataEngine",
+    "ReplayDataEngine",
+    "ReplayFixture",
+    "SweepResults",
+    "SweepRunner",
+    "VectorizedBacktester",
+    "grid_search",
+    "load_candle_store",
+    "random_search",
+    "replay_symbols",
     "run_backtest",
 ]
 
 
 def run_backtest(
-    config_path: str, symbols: list, timeframe: str, start: str, end: str
+    config_path: str,
+    symbols: list,
+    timeframe: str,
+    start: str,
+    end: str,
+    vectorized: bool = False,
+    store_dir: str = None,
 ) -> dict:
     """
     Run a backtest with the specified parameters.
@@ -26,6 +47,10 @@ def run_backtest(
         timeframe: Data timeframe (e.g., '1h', '1d')
         start: Start date (YYYY-MM-DD)
         end: End date (YYYY-MM-DD)
+        vectorized: Run the momentum strategy in batch over columnar arrays
+            instead of the event-driven composite-signal loop
+        store_dir: On-disk candle store for the event-driven loop (default:
+            backtest.historical.store_dir, else synthetic data)
 
     Returns:
         Dictionary containing backtest results and metrics
@@ -34,7 +59,10 @@ def run_backtest(
     engine = BacktestEngine(config_path)
 
     # Run backtest
-    results = asyncio.run(engine.run_backtest(symbols, timeframe, start, end))
+    if vectorized:
+        results = engine.run_vectorized_backtest(symbols, timeframe, start, end)
+    else:
+        results = asyncio.run(engine.run_backtest(symbols, timeframe, start, end, store_dir))
 
     # Generate report
     report_generator = BacktestReport()
@@ -11,6 +11,10 @@ from ..core.config_manager import ConfigManager
 from ..core.logging_utils import LoggerMixin
 from ..risk.risk_manager import ProfitOptimizedRiskManager
 from ..strategies.composite import ProfitMaximizingSignalEngine
+from .historical import HistoricalDataEngine
+from .replay import ReplayFixture
+from .sweep import SweepRunner
+from .vectorized import VectorizedBacktester
 
 
 class BacktestEngine(LoggerMixin):
@@ -33,6 +37,7 @@ class BacktestEngine(LoggerMixin):
         self.signal_engine = None
         self.risk_manager = None
         self.analytics = None
+        self.data_engine = None
 
         # Backtest state
         self.current_date = None
@@ -159,15 +164,26 @@ class BacktestEngine(LoggerMixin):
         return ohlcv_data
 
     async def run_backtest(
-        self, symbols: list[str], timeframe: str, start_date: str, end_date: str
+        self,
+        symbols: list[str],
+        timeframe: str,
+        start_date: str,
+        end_date: str,
+        store_dir: Optional[str] = None,
     ) -> dict[str, Any]:
         """Run a backtest across the specified period.
 
+        The strategies read their candles from a HistoricalDataEngine that is
+        moved one bar at a time, so every signal sees exactly the history up
+        to the bar being traded.
+
         Args:
             symbols: List of trading symbols
             timeframe: Data timeframe
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
+            store_dir: On-disk candle store to replay (default:
+                backtest.historical.store_dir, else synthetic data)
 
         Returns:
             Dictionary containing backtest results
@@ -179,14 +195,20 @@ class BacktestEngine(LoggerMixin):
             f"Starting backtest: {symbols} from {start_date} to {end_date}"
         )
 
-        # Generate synthetic data for all symbols
-        all_data = {}
-        for symbol in symbols:
-            ohlcv_data = self.generate_synthetic_ohlcv(
-                symbol, timeframe, start_date, end_date
-            )
-            all_data[symbol] = ohlcv_data
-            self.logger.info(f"Generated {len(ohlcv_data)} data points for {symbol}")
+        # Point-in-time candles for all symbols, served to the strategies
+        self.data_engine = self.build_data_engine(
+            symbols, timeframe, start_date, end_date, store_dir
+        )
+        self.signal_engine.set_data_engine(self.data_engine)
+        fixture = self.data_engine.fixture
+        missing = [symbol for symbol in symbols if symbol not in fixture.symbols]
+        if missing:
+            self.logger.warning(f"No candles for {missing}; backtesting {fixture.symbols}")
+        symbols = [symbol for symbol in symbols if symbol in fixture.symbols]
+        self.logger.info(
+            f"Loaded {fixture.num_candles - self.data_engine.start} bars for {len(symbols)} symbols "
+            f"({fixture.metadata.get('source', 'store')})"
+        )
 
         # Run backtest simulation
         backtest_results = {
@@ -204,16 +226,13 @@ class BacktestEngine(LoggerMixin):
         }
 
         # Process each time period
-        min_length = min(len(data) for data in all_data.values())
-
-        for i in range(min_length):
-            current_time = datetime.fromisoformat(all_data[symbols[0]][i]["timestamp"])
+        for i in range(fixture.num_candles - self.data_engine.start):
+            self.data_engine.cursor = self.data_engine.start + i
+            current_time = self.data_engine.current_time
             self.current_date = current_time
 
             # Get current prices for all symbols
-            current_prices = {}
-            for symbol in symbols:
-                current_prices[symbol] = all_data[symbol][i]["close"]
+            current_prices = self.data_engine.close_prices()
 
             # Generate signals for each symbol
             signals = {}
@@ -265,15 +284,7 @@ class BacktestEngine(LoggerMixin):
                                 backtest_results["trades"].append(trade)
 
                                 # Log trade to analytics
-                                self.analytics.log_trade(
-                                    symbol=trade["symbol"],
-                                    strategy=trade["strategy"],
-                                    side=trade["side"],
-                                    quantity=trade["quantity"],
-                                    entry_price=trade["entry_price"],
-                                    exit_price=trade["exit_price"],
-                                    fees=trade["fees"],
-                                )
+                                self.analytics.log_trade(trade)
 
                     except Exception as e:
                         self.logger.warning(
@@ -295,15 +306,7 @@ class BacktestEngine(LoggerMixin):
                         backtest_results["trades"].append(mock_trade)
 
                         # Log trade to analytics
-                        self.analytics.log_trade(
-                            symbol=mock_trade["symbol"],
-                            strategy=mock_trade["strategy"],
-                            side=mock_trade["side"],
-                            quantity=mock_trade["quantity"],
-                            entry_price=mock_trade["entry_price"],
-                            exit_price=mock_trade["exit_price"],
-                            fees=mock_trade["fees"],
-                        )
+                        self.analytics.log_trade(mock_trade)
 
             # Update portfolio
             self._update_portfolio()
@@ -373,6 +376,136 @@ class BacktestEngine(LoggerMixin):
 
         return final_results
 
+    def run_vectorized_backtest(
+        self, symbols: list[str], timeframe: str, start_date: str, end_date: str
+    ) -> dict[str, Any]:
+        """Run the momentum strategy over the whole period in batch.
+
+        Uses the same synthetic data as run_backtest, held as columnar arrays
+        and evaluated by VectorizedBacktester (rules under backtest.vectorized).
+
+        Args:
+            symbols: List of trading symbols
+            timeframe: Data timeframe
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+
+        Returns:
+            Dictionary containing backtest results
+        """
+        self.load_config()
+        self.logger.info(
+            f"Starting vectorized backtest: {symbols} from {start_date} to {end_date}"
+        )
+
+        fixture = self.build_fixture(symbols, timeframe, start_date, end_date)
+        initial_capital = self.config.get("trading", {}).get(
+            "initial_capital", 100000.0
+        )
+        return VectorizedBacktester(self.config).run(fixture, initial_capital)
+
+    def run_sweep(
+        self,
+        symbols: list[str],
+        timeframe: str,
+        start_date: str,
+        end_date: str,
+        runs: list[dict[str, Any]],
+        name: str = "sweep",
+        workers: Optional[int] = None,
+        work_dir: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """Run a parameter sweep of the vectorized backtest on a process pool.
+
+        Args:
+            symbols: List of trading symbols
+            timeframe: Data timeframe
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            runs: Parameter sets (dotted config path -> value), e.g. from
+                grid_search or random_search
+            name: Sweep name; rerunning the same name resumes it
+            workers: Worker processes (default from backtest.sweep.workers)
+            work_dir: Directory for shared candles and the results database
+
+        Returns:
+            Result rows, best first by the sweep objective
+        """
+        self.load_config()
+        fixture = self.build_fixture(symbols, timeframe, start_date, end_date)
+        return SweepRunner(self.config, work_dir).run(fixture, runs, name, workers)
+
+    def load_config(self) -> dict[str, Any]:
+        """Load the configuration without initializing the signal components.
+
+        Returns:
+            Configuration dictionary
+        """
+        if not self.config:
+            self.config_manager = ConfigManager(self.config_path)
+            self.config = self.config_manager.to_dict()
+        return self.config
+
+    def build_data_engine(
+        self,
+        symbols: list[str],
+        timeframe: str,
+        start_date: str,
+        end_date: str,
+        store_dir: Optional[str] = None,
+    ) -> HistoricalDataEngine:
+        """Build the point-in-time data engine for a backtest.
+
+        Candles come from the on-disk store if one is given (or configured
+        under backtest.historical.store_dir), with ``warmup_candles`` of
+        history before the start date; otherwise synthetic candles are
+        generated for the period.
+
+        Args:
+            symbols: List of trading symbols
+            timeframe: Data timeframe (synthetic data only; a store has its own)
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            store_dir: Candle store directory written by ReplayFixture.save_arrays
+
+        Returns:
+            Engine positioned on the first bar to trade
+        """
+        historical_config = self.config.get("backtest", {}).get("historical", {})
+        store_dir = store_dir or historical_config.get("store_dir")
+        if store_dir:
+            return HistoricalDataEngine.from_store(
+                store_dir,
+                symbols,
+                datetime.strptime(start_date, "%Y-%m-%d"),
+                datetime.strptime(end_date, "%Y-%m-%d"),
+                warmup=historical_config.get("warmup_candles", 100),
+            )
+        return HistoricalDataEngine(self.build_fixture(symbols, timeframe, start_date, end_date))
+
+    def build_fixture(
+        self, symbols: list[str], timeframe: str, start_date: str, end_date: str
+    ) -> ReplayFixture:
+        """Generate the period's synthetic OHLCV data as columnar arrays.
+
+        Args:
+            symbols: List of trading symbols
+            timeframe: Data timeframe
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+
+        Returns:
+            Fixture holding the candles for all symbols
+        """
+        return ReplayFixture.from_ohlcv(
+            {
+                symbol: self.generate_synthetic_ohlcv(symbol, timeframe, start_date, end_date)
+                for symbol in symbols
+            },
+            timeframe=timeframe,
+            metadata={"source": "synthetic", "start_date": start_date, "end_date": end_date},
+        )
+
     def _execute_trade(
         self,
         symbol: str,
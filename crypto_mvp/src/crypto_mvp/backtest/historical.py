@@ -0,0 +1,257 @@
+"""
+Point-in-time historical data engine for backtests.
+
+HistoricalDataEngine serves an on-disk candle store (a ReplayFixture saved
+with ``save_arrays``) through the data engine interface, so the live
+strategies run unchanged inside BacktestEngine. The candles are loaded once
+into contiguous per-column arrays; every request is answered with slices of
+those arrays ending at the current bar, so a bar costs no parsing or copying
+and nothing after the current bar is ever visible.
+
+Timeframes coarser than the store's are aggregated once on first use. A
+coarser candle is served only after the base candle that completes it has
+closed, so the in-progress candle never leaks into a decision.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from .replay import (
+    CLOSE,
+    HIGH,
+    LOW,
+    OPEN,
+    TIMEFRAME_MS,
+    VOLUME,
+    ReplayDataEngine,
+    ReplayFixture,
+)
+
+COLUMN_NAMES = ("opens", "highs", "lows", "closes", "volumes")
+
+
+def load_candle_store(
+    directory: str,
+    symbols: Optional[list[str]] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    warmup: int = 0,
+) -> tuple[ReplayFixture, int]:
+    """Open an on-disk candle store and cut it to a symbol set and period.
+
+    Args:
+        directory: Store directory written by ``ReplayFixture.save_arrays``
+        symbols: Symbols to keep (default: all in the store)
+        start: First bar to trade (candle open time)
+        end: Last bar to trade (candle open time)
+        warmup: History candles kept before ``start`` for indicators
+
+    Returns:
+        (fixture, index of the first bar to trade within it)
+    """
+    store = ReplayFixture.open_arrays(directory)
+    timestamps = np.asarray(store.timestamps)
+    first = int(np.searchsorted(timestamps, start.timestamp() * 1000, side="left")) if start else 0
+    stop = int(np.searchsorted(timestamps, end.timestamp() * 1000, side="right")) if end else len(timestamps)
+    begin = max(first - int(warmup), 0)
+    if first >= stop:
+        raise ValueError(f"No candles in {directory} between {start} and {end}")
+
+    kept = [symbol for symbol in (symbols or store.symbols) if symbol in store.symbols]
+    if not kept:
+        raise ValueError(f"None of {symbols} are in the candle store {directory}")
+    rows = [store.symbols.index(symbol) for symbol in kept]
+
+    fixture = ReplayFixture(
+        symbols=kept,
+        timeframe=store.timeframe,
+        timestamps=np.array(timestamps[begin:stop]),
+        candles=np.array(store.candles[rows, begin:stop]),
+        spread_bps=np.array(store.spread_bps[rows]),
+        sentiment=np.array(store.sentiment[begin:stop]),
+        metadata=dict(store.metadata, store=directory),
+    )
+    return fixture, first - begin
+
+
+class HistoricalDataEngine(ReplayDataEngine):
+    """
+    Data engine that serves candles as of the current bar.
+
+    ``seek`` (or ``advance``) moves the current bar; OHLCV requests return the
+    candles up to and including it, tickers quote its close. The current
+    bar's candle counts as closed: decisions are taken at its close.
+    """
+
+    def __init__(
+        self,
+        fixture: ReplayFixture,
+        start: int = 0,
+        provenance: str = "historical",
+    ):
+        """Initialize the engine and preload the candle columns.
+
+        Args:
+            fixture: Candles to serve (may be memory-mapped; they are copied once)
+            start: Index of the first current bar
+            provenance: Provenance reported on tickers
+        """
+        super().__init__(fixture, start=start, provenance=provenance)
+        self.base_ms = TIMEFRAME_MS.get(fixture.timeframe, TIMEFRAME_MS["1h"])
+        self.timestamps = self._read_only(np.asarray(fixture.timestamps, dtype=np.int64))
+        base_columns = {
+            name: self._read_only(np.ascontiguousarray(fixture.candles[:, :, column], dtype=np.float64))
+            for name, column in zip(COLUMN_NAMES, (OPEN, HIGH, LOW, CLOSE, VOLUME))
+        }
+        # Bar index -> number of candles of the timeframe complete at that bar
+        base_complete = np.arange(1, fixture.num_candles + 1)
+        self._frames: dict[str, tuple[np.ndarray, dict[str, np.ndarray], np.ndarray]] = {
+            fixture.timeframe: (self.timestamps, base_columns, base_complete),
+        }
+
+    @classmethod
+    def from_store(
+        cls,
+        directory: str,
+        symbols: Optional[list[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        warmup: int = 0,
+    ) -> "HistoricalDataEngine":
+        """Open an on-disk candle store positioned on its first bar to trade.
+
+        Args:
+            directory: Store directory written by ``ReplayFixture.save_arrays``
+            symbols: Symbols to serve (default: all in the store)
+            start: First bar to trade
+            end: Last bar to trade
+            warmup: History candles kept before ``start``
+
+        Returns:
+            Engine over the selected candles
+        """
+        fixture, first = load_candle_store(directory, symbols, start, end, warmup)
+        return cls(fixture, start=first)
+
+    @staticmethod
+    def _read_only(array: np.ndarray) -> np.ndarray:
+        array.flags.writeable = False
+        return array
+
+    @property
+    def current_time(self) -> datetime:
+        """Open time of the current bar."""
+        return datetime.fromtimestamp(int(self.timestamps[self.cursor]) / 1000)
+
+    def seek(self, when: datetime) -> bool:
+        """Move to the last bar opened at or before a time.
+
+        Args:
+            when: Point in time
+
+        Returns:
+            False if the time is before the first candle (cursor unchanged)
+        """
+        index = int(np.searchsorted(self.timestamps, when.timestamp() * 1000, side="right")) - 1
+        if index < 0:
+            return False
+        self.cursor = min(index, self.fixture.num_candles - 1)
+        return True
+
+    def _frame(self, timeframe: str) -> tuple[np.ndarray, dict[str, np.ndarray], np.ndarray]:
+        """Candles of a timeframe, aggregating from the base candles on first use.
+
+        Timeframes that are unknown, finer than the base or not a multiple of
+        it are served from the base candles.
+        """
+        frame = self._frames.get(timeframe)
+        if frame is not None:
+            return frame
+
+        frame_ms = TIMEFRAME_MS.get(timeframe)
+        if frame_ms is None or frame_ms <= self.base_ms or frame_ms % self.base_ms:
+            frame = self._frames[self.fixture.timeframe]
+        else:
+            frame = self._aggregate(frame_ms)
+        self._frames[timeframe] = frame
+        return frame
+
+    def _aggregate(self, frame_ms: int) -> tuple[np.ndarray, dict[str, np.ndarray], np.ndarray]:
+        _, base, _ = self._frames[self.fixture.timeframe]
+        buckets = self.timestamps // frame_ms
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        last = np.r_[starts[1:] - 1, len(buckets) - 1]
+        columns = {
+            "opens": base["opens"][:, starts],
+            "highs": np.maximum.reduceat(base["highs"], starts, axis=1),
+            "lows": np.minimum.reduceat(base["lows"], starts, axis=1),
+            "closes": base["closes"][:, last],
+            "volumes": np.add.reduceat(base["volumes"], starts, axis=1),
+        }
+        # A candle is complete once a base candle closing at or after its end has closed
+        bucket_end = (buckets[starts] + 1) * frame_ms
+        complete = np.searchsorted(bucket_end, self.timestamps + self.base_ms, side="right")
+        return (
+            self._read_only(buckets[starts] * frame_ms),
+            {name: self._read_only(np.ascontiguousarray(column)) for name, column in columns.items()},
+            complete,
+        )
+
+    def get_candle_columns(
+        self, symbol: str, timeframe: str = "1h", limit: int = 100
+    ) -> Optional[dict[str, np.ndarray]]:
+        """Get candles as of the current bar as read-only column views.
+
+        Same columns as ``TechnicalCalculator.parse_ohlcv``; strategies use
+        this instead of parsing ``get_ohlcv`` rows.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            limit: Maximum number of candles
+
+        Returns:
+            timestamps/opens/highs/lows/closes/volumes arrays, or None for
+            unknown symbols or before the first complete candle
+        """
+        self._count("get_candle_columns")
+        return self._window(symbol, timeframe, limit)
+
+    def _window(self, symbol: str, timeframe: str, limit: int) -> Optional[dict[str, np.ndarray]]:
+        index = self._symbol_index(symbol)
+        if index is None:
+            return None
+
+        timestamps, columns, complete = self._frame(timeframe)
+        end = int(complete[self.cursor])
+        if end == 0:
+            return None
+        begin = max(end - int(limit), 0)
+        candles = {name: column[index, begin:end] for name, column in columns.items()}
+        candles["timestamps"] = timestamps[begin:end]
+        return candles
+
+    def get_ohlcv(self, symbol: str, timeframe: str = "1h", limit: int = 100) -> list[list[float]]:
+        """Get candles as of the current bar.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            limit: Maximum number of candles
+
+        Returns:
+            List of [timestamp_ms, open, high, low, close, volume] rows
+        """
+        self._count("get_ohlcv")
+        candles = self._window(symbol, timeframe, limit)
+        if candles is None:
+            return []
+        rows = np.column_stack([candles["timestamps"]] + [candles[name] for name in COLUMN_NAMES])
+        return rows.tolist()
+
+    def close_prices(self) -> dict[str, float]:
+        """Close of the current bar for every symbol."""
+        closes = self._frames[self.fixture.timeframe][1]["closes"][:, self.cursor]
+        return {symbol: float(price) for symbol, price in zip(self.fixture.symbols, closes)}
@@ -0,0 +1,511 @@
+"""
+Deterministic market-data replay for offline runs of the trading loop.
+
+A ReplayFixture holds a fixed block of candles for a symbol universe, either
+generated from a seed or recorded once from a live data engine. ReplayDataEngine
+serves that fixture through the data engine interface used by the trading
+system (get_ticker, get_ohlcv, resolve_venue, ...) and advances one candle per
+trading cycle, so full cycles can be driven without any network access and with
+identical inputs on every run.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+import numpy as np
+
+from ..core.logging_utils import LoggerMixin
+
+TIMEFRAME_MS = {
+    "1m": 60_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "1h": 3_600_000,
+    "4h": 14_400_000,
+    "1d": 86_400_000,
+}
+
+# Seeded fixtures start here so candle timestamps are identical across runs
+FIXTURE_EPOCH_MS = 1_704_067_200_000  # 2024-01-01T00:00:00Z
+
+# OHLCV column order inside ReplayFixture.candles
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+
+
+# Starting prices for real symbols, inside the mark price sanity bands
+MAJOR_BASE_PRICES = {
+    "BTC/USDT": 60000.0,
+    "ETH/USDT": 3000.0,
+    "SOL/USDT": 150.0,
+    "XRP/USDT": 0.6,
+    "DOGE/USDT": 0.15,
+    "ADA/USDT": 0.5,
+    "BNB/USDT": 550.0,
+    "AVAX/USDT": 30.0,
+    "LINK/USDT": 15.0,
+    "DOT/USDT": 7.0,
+}
+
+
+def _parse_row(row: Any) -> Optional[list[float]]:
+    """Normalize one OHLCV row to [timestamp_ms, open, high, low, close, volume]."""
+    if isinstance(row, dict):
+        timestamp = row.get("timestamp", row.get("time", 0))
+        values = [row.get(key, 0.0) for key in ("open", "high", "low", "close", "volume")]
+    elif isinstance(row, (list, tuple)) and len(row) >= 6:
+        timestamp, values = row[0], list(row[1:6])
+    else:
+        return None
+
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp() * 1000
+    elif isinstance(timestamp, datetime):
+        timestamp = timestamp.timestamp() * 1000
+    return [float(timestamp)] + [float(value) for value in values]
+
+
+def replay_symbols(count: int) -> list[str]:
+    """Build a universe of ``count`` symbols (real majors first, then synthetic)."""
+    symbols = list(MAJOR_BASE_PRICES)[:count]
+    symbols.extend(f"SYN{i:03d}/USDT" for i in range(count - len(symbols)))
+    return symbols
+
+
+@dataclass
+class ReplayFixture:
+    """A fixed block of candles for a symbol universe."""
+
+    symbols: list[str]
+    timeframe: str
+    # Candle open times in epoch milliseconds, shape (n_candles,)
+    timestamps: np.ndarray
+    # OHLCV per symbol, shape (n_symbols, n_candles, 5)
+    candles: np.ndarray
+    # Quoted bid/ask spread per symbol in basis points, shape (n_symbols,)
+    spread_bps: np.ndarray
+    # Market-wide sentiment in [-1, 1] per candle, shape (n_candles,)
+    sentiment: np.ndarray
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def num_candles(self) -> int:
+        return int(self.timestamps.shape[0])
+
+    @classmethod
+    def generate(
+        cls,
+        symbols: list[str],
+        num_candles: int,
+        timeframe: str = "1h",
+        seed: int = 42,
+    ) -> "ReplayFixture":
+        """Generate a seeded random-walk fixture.
+
+        Each symbol gets its own drift and volatility, with an occasional
+        trending stretch so momentum and breakout strategies have something to
+        act on. The same arguments always produce the same arrays.
+
+        Args:
+            symbols: Symbol universe
+            num_candles: Number of candles per symbol
+            timeframe: Candle timeframe
+            seed: Random seed
+
+        Returns:
+            Generated fixture
+        """
+        rng = np.random.default_rng(seed)
+        n_symbols = len(symbols)
+        step_ms = TIMEFRAME_MS.get(timeframe, TIMEFRAME_MS["1h"])
+        timestamps = FIXTURE_EPOCH_MS + np.arange(num_candles, dtype=np.int64) * step_ms
+
+        base_prices = 10.0 ** rng.uniform(-1, 4, n_symbols)
+        for i, symbol in enumerate(symbols):
+            base_prices[i] = MAJOR_BASE_PRICES.get(symbol, base_prices[i])
+        drift = rng.normal(0.0, 0.0008, (n_symbols, 1))
+        volatility = rng.uniform(0.004, 0.025, (n_symbols, 1))
+        returns = drift + volatility * rng.standard_normal((n_symbols, num_candles))
+
+        # Inject a trending stretch per symbol
+        trend_start = rng.integers(0, max(num_candles - 24, 1), n_symbols)
+        trend_sign = rng.choice([-1.0, 1.0], n_symbols)
+        for i in range(n_symbols):
+            returns[i, trend_start[i]:trend_start[i] + 24] += trend_sign[i] * volatility[i, 0] * 0.6
+
+        closes = base_prices[:, None] * np.exp(np.cumsum(returns, axis=1))
+        opens = np.empty_like(closes)
+        opens[:, 0] = base_prices
+        opens[:, 1:] = closes[:, :-1]
+        wick = volatility * np.abs(rng.standard_normal((2, n_symbols, num_candles)))
+        highs = np.maximum(opens, closes) * (1.0 + wick[0])
+        lows = np.minimum(opens, closes) * (1.0 - wick[1])
+        volumes = rng.lognormal(8.0, 0.6, (n_symbols, num_candles)) * (1.0 + 40.0 * np.abs(returns))
+
+        candles = np.stack([opens, highs, lows, closes, volumes], axis=-1)
+        spread_bps = rng.uniform(0.5, 8.0, n_symbols)
+        sentiment = np.clip(np.cumsum(rng.normal(0.0, 0.08, num_candles)), -1.0, 1.0)
+
+        return cls(
+            symbols=list(symbols),
+            timeframe=timeframe,
+            timestamps=timestamps,
+            candles=candles,
+            spread_bps=spread_bps,
+            sentiment=sentiment,
+            metadata={"source": "generated", "seed": seed},
+        )
+
+    @classmethod
+    def from_ohlcv(
+        cls,
+        series: dict[str, list[Any]],
+        timeframe: str = "1h",
+        spread_bps: Optional[dict[str, float]] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> "ReplayFixture":
+        """Build a fixture from per-symbol OHLCV rows.
+
+        Rows may be [timestamp, open, high, low, close, volume] lists or dicts
+        with those keys (timestamps in epoch ms or ISO format). Symbols without
+        rows are dropped; the rest are cut to their common most recent length.
+
+        Args:
+            series: Symbol -> OHLCV rows, oldest first
+            timeframe: Candle timeframe
+            spread_bps: Optional quoted spread per symbol (default 2 bps)
+            metadata: Optional metadata stored with the fixture
+
+        Returns:
+            Fixture holding the candles
+        """
+        arrays = {}
+        for symbol, rows in series.items():
+            parsed = [_parse_row(row) for row in rows or []]
+            parsed = [row for row in parsed if row is not None]
+            if parsed:
+                arrays[symbol] = np.asarray(parsed, dtype=np.float64)
+
+        if not arrays:
+            raise ValueError("No OHLCV data for any symbol")
+
+        length = min(rows.shape[0] for rows in arrays.values())
+        kept = list(arrays)
+        spread_bps = spread_bps or {}
+        return cls(
+            symbols=kept,
+            timeframe=timeframe,
+            timestamps=arrays[kept[0]][-length:, 0].astype(np.int64),
+            candles=np.stack([arrays[symbol][-length:, 1:6] for symbol in kept]),
+            spread_bps=np.array([spread_bps.get(symbol, 2.0) for symbol in kept]),
+            sentiment=np.zeros(length),
+            metadata=dict(metadata or {}),
+        )
+
+    @classmethod
+    def record(
+        cls,
+        data_engine: Any,
+        symbols: list[str],
+        num_candles: int,
+        timeframe: str = "1h",
+    ) -> "ReplayFixture":
+        """Record a fixture from a live data engine.
+
+        Fetches ``num_candles`` candles and one ticker per symbol. Symbols that
+        return no candles are dropped; the rest are cut to a common length.
+
+        Args:
+            data_engine: Data engine exposing get_ohlcv/get_ticker
+            symbols: Symbol universe
+            num_candles: Number of candles to record per symbol
+            timeframe: Candle timeframe
+
+        Returns:
+            Recorded fixture
+        """
+        series = {}
+        spreads = {}
+        for symbol in symbols:
+            series[symbol] = data_engine.get_ohlcv(symbol, timeframe, limit=num_candles) or []
+            if not series[symbol]:
+                continue
+
+            ticker = data_engine.get_ticker(symbol) or {}
+            bid, ask = ticker.get("bid") or 0.0, ticker.get("ask") or 0.0
+            mid = (bid + ask) / 2
+            spreads[symbol] = (ask - bid) / mid * 10_000 if bid > 0 and ask > 0 else 2.0
+
+        return cls.from_ohlcv(
+            series,
+            timeframe,
+            spreads,
+            {"source": "recorded", "recorded_at": datetime.now().isoformat()},
+        )
+
+    def save(self, path: str) -> str:
+        """Save the fixture as a compressed .npz file.
+
+        Args:
+            path: Output file path
+
+        Returns:
+            The path written
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                symbols=np.array(self.symbols),
+                timeframe=np.array(self.timeframe),
+                timestamps=self.timestamps,
+                candles=self.candles,
+                spread_bps=self.spread_bps,
+                sentiment=self.sentiment,
+                metadata_keys=np.array(list(self.metadata), dtype=str),
+                metadata_values=np.array([str(v) for v in self.metadata.values()], dtype=str),
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "ReplayFixture":
+        """Load a fixture saved with save().
+
+        Args:
+            path: Fixture file path
+
+        Returns:
+            Loaded fixture
+        """
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                symbols=[str(symbol) for symbol in data["symbols"]],
+                timeframe=str(data["timeframe"]),
+                timestamps=data["timestamps"],
+                candles=data["candles"],
+                spread_bps=data["spread_bps"],
+                sentiment=data["sentiment"],
+                metadata=dict(zip(data["metadata_keys"].tolist(), data["metadata_values"].tolist())),
+            )
+
+    def save_arrays(self, directory: str) -> str:
+        """Save the fixture as uncompressed .npy arrays for memory mapping.
+
+        Processes that open the directory with open_arrays() share the candle
+        pages through the OS page cache instead of each holding a copy.
+
+        Args:
+            directory: Output directory
+
+        Returns:
+            The directory written
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name in ("timestamps", "candles", "spread_bps", "sentiment"):
+            np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(getattr(self, name)))
+        with open(os.path.join(directory, "fixture.json"), "w") as f:
+            json.dump(
+                {
+                    "symbols": self.symbols,
+                    "timeframe": self.timeframe,
+                    "metadata": {key: str(value) for key, value in self.metadata.items()},
+                },
+                f,
+            )
+        return directory
+
+    @classmethod
+    def open_arrays(cls, directory: str, mmap: bool = True) -> "ReplayFixture":
+        """Open a fixture saved with save_arrays().
+
+        Args:
+            directory: Fixture directory
+            mmap: Map the arrays read-only instead of loading them into memory
+
+        Returns:
+            Fixture backed by the arrays on disk
+        """
+        with open(os.path.join(directory, "fixture.json")) as f:
+            header = json.load(f)
+        mode = "r" if mmap else None
+        arrays = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mode, allow_pickle=False)
+            for name in ("timestamps", "candles", "spread_bps", "sentiment")
+        }
+        return cls(
+            symbols=header["symbols"],
+            timeframe=header["timeframe"],
+            metadata=header["metadata"],
+            **arrays,
+        )
+
+
+class ReplayDataEngine(LoggerMixin):
+    """
+    Data engine that serves a ReplayFixture, one candle per cycle.
+
+    The cursor starts at ``start`` (the first ``start`` candles are history) and
+    moves forward on advance(). OHLCV requests return the candles up to and
+    including the cursor; tickers quote the cursor candle's close with the
+    fixture spread. Requests for other timeframes are served from the same
+    candles.
+    """
+
+    def __init__(
+        self,
+        fixture: ReplayFixture,
+        start: Optional[int] = None,
+        provenance: str = "replay",
+    ):
+        """Initialize the replay engine.
+
+        Args:
+            fixture: Fixture to serve
+            start: Index of the first "current" candle (defaults to half the fixture)
+            provenance: Provenance reported on tickers. The order manager only
+                accepts "live" prices, so pass "live" to exercise paper execution.
+        """
+        super().__init__()
+        self.fixture = fixture
+        self.provenance = provenance
+        self._index = {symbol: i for i, symbol in enumerate(fixture.symbols)}
+        self.start = fixture.num_candles // 2 if start is None else int(start)
+        if not 0 <= self.start < fixture.num_candles:
+            raise ValueError(f"start must be within the fixture's {fixture.num_candles} candles")
+        self.cursor = self.start
+        self.initialized = False
+        self.calls: dict[str, int] = {}
+
+    def initialize(self) -> None:
+        """Nothing to connect to; kept for interface compatibility."""
+        self.initialized = True
+
+    @property
+    def remaining(self) -> int:
+        """Candles left before the fixture is exhausted."""
+        return self.fixture.num_candles - 1 - self.cursor
+
+    def advance(self, steps: int = 1) -> bool:
+        """Move the cursor forward.
+
+        Args:
+            steps: Number of candles to advance
+
+        Returns:
+            False if the fixture ran out (the cursor stays on the last candle)
+        """
+        target = self.cursor + steps
+        self.cursor = min(target, self.fixture.num_candles - 1)
+        return target == self.cursor
+
+    def reset(self) -> None:
+        """Rewind to the start candle and clear call counts."""
+        self.cursor = self.start
+        self.calls = {}
+
+    def _count(self, method: str) -> None:
+        self.calls[method] = self.calls.get(method, 0) + 1
+
+    def _symbol_index(self, symbol: str) -> Optional[int]:
+        index = self._index.get(symbol)
+        if index is None and "-" in symbol:
+            index = self._index.get(symbol.replace("-", "/"))
+        return index
+
+    def resolve_venue(self, symbol: str) -> tuple[Optional[str], str, str]:
+        """Resolve a symbol to (venue, normalized_symbol, status)."""
+        self._count("resolve_venue")
+        index = self._symbol_index(symbol)
+        if index is None:
+            return None, symbol, "unsupported"
+        return "replay", self.fixture.symbols[index], "ok"
+
+    def get_ticker(self, symbol: str) -> Optional[dict[str, Any]]:
+        """Get the ticker for the cursor candle.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Ticker dictionary, or None for unknown symbols
+        """
+        self._count("get_ticker")
+        index = self._symbol_index(symbol)
+        if index is None:
+            return None
+
+        candle = self.fixture.candles[index, self.cursor]
+        price = float(candle[CLOSE])
+        half_spread = price * float(self.fixture.spread_bps[index]) / 20_000
+        return {
+            "symbol": self.fixture.symbols[index],
+            "price": price,
+            "last": price,
+            "bid": price - half_spread,
+            "ask": price + half_spread,
+            "mid": price,
+            "high": float(candle[HIGH]),
+            "low": float(candle[LOW]),
+            "volume": float(candle[VOLUME]),
+            # Served "now" so staleness checks treat replayed quotes as fresh
+            "timestamp": datetime.now().isoformat(),
+            "candle_timestamp": int(self.fixture.timestamps[self.cursor]),
+            "venue": "replay",
+            "provenance": self.provenance,
+            "is_stale": False,
+        }
+
+    def get_ohlcv(self, symbol: str, timeframe: str = "1h", limit: int = 100) -> list[list[float]]:
+        """Get candles up to and including the cursor.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Requested timeframe (served from the fixture's candles)
+            limit: Maximum number of candles
+
+        Returns:
+            List of [timestamp_ms, open, high, low, close, volume] rows
+        """
+        self._count("get_ohlcv")
+        index = self._symbol_index(symbol)
+        if index is None:
+            return []
+
+        end = self.cursor + 1
+        begin = max(end - int(limit), 0)
+        rows = np.empty((end - begin, 6))
+        rows[:, 0] = self.fixture.timestamps[begin:end]
+        rows[:, 1:] = self.fixture.candles[index, begin:end]
+        return rows.tolist()
+
+    def get_clean_ohlcv(self, symbol: str, timeframe: str = "1h", limit: int = 100) -> list[list[float]]:
+        """Fixture candles are already clean; same as get_ohlcv."""
+        return self.get_ohlcv(symbol, timeframe, limit)
+
+    def get_sentiment_data(self, symbol: str) -> dict[str, Any]:
+        """Get market-wide sentiment for the cursor candle."""
+        self._count("get_sentiment_data")
+        score = float(self.fixture.sentiment[self.cursor])
+        return {
+            "symbol": symbol,
+            "overall_sentiment": score,
+            "fear_greed_index": round(50 + 50 * score),
+            "confidence": 0.7,
+            "source": "replay",
+        }
+
+    def get_on_chain_data(self, symbol: str) -> dict[str, Any]:
+        """Get on-chain activity derived from the cursor candle's volume."""
+        self._count("get_on_chain_data")
+        index = self._symbol_index(symbol)
+        volume = float(self.fixture.candles[index, self.cursor, VOLUME]) if index is not None else 0.0
+        return {"symbol": symbol, "active_addresses": int(volume * 3), "exchange_netflow": 0.0, "source": "replay"}
+
+    def get_whale_activity(self, symbol: str) -> dict[str, Any]:
+        """Get whale activity (none in replay)."""
+        self._count("get_whale_activity")
+        return {"symbol": symbol, "large_transactions": 0, "net_flow": 0.0, "source": "replay"}
@@ -371,6 +371,55 @@ class BacktestReport(LoggerMixin):
 
         return plot_path
 
+    def generate_sweep_report(
+        self, rows: list[dict[str, Any]], objective: str = "sharpe_ratio", top: int = 10
+    ) -> dict[str, Any]:
+        """Summarize a parameter sweep and save it as JSON.
+
+        Args:
+            rows: Sweep result rows, best first (SweepRunner.run output)
+            objective: Metric the rows are ranked by
+            top: Number of best runs to include
+
+        Returns:
+            Dictionary containing the sweep summary
+        """
+        completed = [row for row in rows if row["status"] == "ok"]
+        values = [row[objective] for row in completed if row[objective] is not None]
+
+        summary = {
+            "sweep_summary": {
+                "total_runs": len(rows),
+                "completed_runs": len(completed),
+                "failed_runs": len(rows) - len(completed),
+                "objective": objective,
+                "objective_mean": sum(values) / len(values) if values else 0.0,
+                "objective_best": values[0] if values else None,
+                "mean_run_ms": sum(row["duration_ms"] for row in rows) / len(rows)
+                if rows
+                else 0.0,
+            },
+            "best": completed[0] if completed else None,
+            "top_runs": completed[:top],
+            "failures": [
+                {"params": row["params"], "error": row["error"]}
+                for row in rows
+                if row["status"] != "ok"
+            ],
+            "generated_at": datetime.now().isoformat(),
+        }
+
+        json_path = (
+            self.output_dir
+            / f"sweep_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        with open(json_path, "w") as f:
+            json.dump(summary, f, indent=2, default=str)
+
+        self.logger.info(f"Sweep summary saved to: {json_path}")
+
+        return summary
+
     def save_detailed_results(self, backtest_results: dict[str, Any]) -> Path:
         """Save detailed backtest results to JSON.
 
@@ -0,0 +1,417 @@
+"""
+Parameter sweeps over the vectorized backtest on a process pool.
+
+A sweep runs VectorizedBacktester once per parameter set (grid or random
+search over dotted config paths such as ``backtest.vectorized.entry_threshold``
+or ``strategies.momentum.parameters.rsi_period``) and spreads the runs across
+worker processes.
+
+- Candles are written once as .npy arrays and every worker memory-maps them,
+  so tasks carry only their parameter overrides and no candle data is pickled.
+- Results stream into one SQLite table as runs finish. A run is keyed by a
+  hash of its parameters, so re-running an interrupted sweep skips the runs
+  that already completed and retries the ones that failed. A sweep only
+  resumes on the candles it started with (same symbols, timeframe and time
+  range); anything else has to run under a new name.
+"""
+
+import argparse
+import copy
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import sqlite3
+import time
+from datetime import datetime
+from typing import Any, Optional
+
+import numpy as np
+import yaml
+
+from ..core.logging_utils import LoggerMixin
+from .replay import ReplayFixture
+from .vectorized import VectorizedBacktester
+
+# Performance metrics stored as columns of the results table
+SWEEP_METRICS = (
+    "total_return",
+    "sharpe_ratio",
+    "max_drawdown",
+    "win_rate",
+    "profit_factor",
+    "total_trades",
+    "total_pnl",
+    "total_fees",
+    "final_equity",
+)
+
+
+def grid_search(space: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """Expand a search space into every combination of its values.
+
+    Args:
+        space: Dotted config path -> list of values
+
+    Returns:
+        Parameter sets, one per combination
+    """
+    for path, values in space.items():
+        if not isinstance(values, (list, tuple)):
+            raise ValueError(f"Grid values for {path} must be a list, got {values!r}")
+    paths = list(space)
+    return [dict(zip(paths, combination)) for combination in itertools.product(*space.values())]
+
+
+def random_search(space: dict[str, Any], num_samples: int, seed: int = 42) -> list[dict[str, Any]]:
+    """Draw parameter sets at random from a search space.
+
+    Args:
+        space: Dotted config path -> list of choices, or {"low": x, "high": y}
+            for a uniform range (integers when both bounds are integers)
+        num_samples: Number of parameter sets to draw
+        seed: Random seed; the same seed draws the same sets
+
+    Returns:
+        Unique parameter sets (duplicates are dropped)
+    """
+    rng = np.random.default_rng(seed)
+    samples, seen = [], set()
+    for _ in range(num_samples):
+        params = {}
+        for path, spec in space.items():
+            if isinstance(spec, dict):
+                low, high = spec["low"], spec["high"]
+                if isinstance(low, int) and isinstance(high, int):
+                    params[path] = int(rng.integers(low, high + 1))
+                else:
+                    params[path] = float(rng.uniform(low, high))
+            else:
+                params[path] = spec[int(rng.integers(len(spec)))]
+        key = run_id_for(params)
+        if key not in seen:
+            seen.add(key)
+            samples.append(params)
+    return samples
+
+
+def apply_overrides(config: dict[str, Any], params: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of config with dotted-path overrides applied.
+
+    Args:
+        config: Base configuration
+        params: Dotted config path -> value
+
+    Returns:
+        New configuration dictionary
+    """
+    config = copy.deepcopy(config)
+    for path, value in params.items():
+        node = config
+        *parents, leaf = path.split(".")
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = value
+    return config
+
+
+def run_id_for(params: dict[str, Any]) -> str:
+    """Stable identifier of a parameter set."""
+    encoded = json.dumps(params, sort_keys=True, default=str).encode()
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+def fixture_id_for(fixture: ReplayFixture) -> str:
+    """Stable identifier of a fixture's symbols, timeframe and time range."""
+    timestamps = fixture.timestamps
+    identity = {
+        "symbols": list(fixture.symbols),
+        "timeframe": fixture.timeframe,
+        "start": int(timestamps[0]) if len(timestamps) else None,
+        "end": int(timestamps[-1]) if len(timestamps) else None,
+        "candles": int(len(timestamps)),
+    }
+    encoded = json.dumps(identity, sort_keys=True).encode()
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+class SweepResults(LoggerMixin):
+    """
+    SQLite table of sweep runs, one row per (sweep, parameter set).
+    """
+
+    def __init__(self, db_path: str):
+        """Open or create the results database.
+
+        Args:
+            db_path: SQLite database path
+        """
+        super().__init__()
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(db_path)
+        self.connection.row_factory = sqlite3.Row
+        metric_columns = ", ".join(
+            f"{name} {'INTEGER' if name == 'total_trades' else 'REAL'}" for name in SWEEP_METRICS
+        )
+        self.connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS sweep_runs (
+                sweep TEXT NOT NULL,
+                run_id TEXT NOT NULL,
+                params TEXT NOT NULL,
+                status TEXT NOT NULL,
+                {metric_columns},
+                duration_ms REAL,
+                error TEXT,
+                completed_at TEXT NOT NULL,
+                PRIMARY KEY (sweep, run_id)
+            )
+            """
+        )
+        self.connection.commit()
+
+    def completed(self, sweep: str) -> set[str]:
+        """Run ids of the sweep that finished successfully."""
+        rows = self.connection.execute(
+            "SELECT run_id FROM sweep_runs WHERE sweep = ? AND status = 'ok'", (sweep,)
+        )
+        return {row["run_id"] for row in rows}
+
+    def record(
+        self,
+        sweep: str,
+        run_id: str,
+        params: dict[str, Any],
+        metrics: Optional[dict[str, Any]],
+        duration_ms: float,
+        error: Optional[str] = None,
+    ) -> None:
+        """Store one run's outcome and commit it.
+
+        Args:
+            sweep: Sweep name
+            run_id: Parameter set id
+            params: Parameter overrides of the run
+            metrics: Performance metrics, or None if the run failed
+            duration_ms: Run wall time
+            error: Error message of a failed run
+        """
+        metrics = metrics or {}
+        columns = ["sweep", "run_id", "params", "status", *SWEEP_METRICS, "duration_ms", "error", "completed_at"]
+        values = [
+            sweep,
+            run_id,
+            json.dumps(params, sort_keys=True, default=str),
+            "failed" if error else "ok",
+            *(metrics.get(name) for name in SWEEP_METRICS),
+            duration_ms,
+            error,
+            datetime.now().isoformat(),
+        ]
+        self.connection.execute(
+            f"INSERT OR REPLACE INTO sweep_runs ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})",
+            values,
+        )
+        self.connection.commit()
+
+    def rows(self, sweep: str, order_by: Optional[str] = None) -> list[dict[str, Any]]:
+        """Runs of a sweep, best first when ordered by a metric.
+
+        Args:
+            sweep: Sweep name
+            order_by: Metric to sort by, descending (max_drawdown ascending)
+
+        Returns:
+            Rows as dictionaries with params decoded
+        """
+        query = "SELECT * FROM sweep_runs WHERE sweep = ?"
+        if order_by:
+            if order_by not in SWEEP_METRICS:
+                raise ValueError(f"Unknown sweep metric: {order_by}")
+            direction = "ASC" if order_by == "max_drawdown" else "DESC"
+            query += f" ORDER BY status = 'ok' DESC, {order_by} {direction}"
+        rows = []
+        for row in self.connection.execute(query, (sweep,)):
+            row = dict(row)
+            row["params"] = json.loads(row["params"])
+            rows.append(row)
+        return rows
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+
+# Per-process state set up once by the pool initializer
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(base_config: dict[str, Any], fixture_dir: str, initial_capital: float) -> None:
+    _WORKER["config"] = base_config
+    _WORKER["fixture"] = ReplayFixture.open_arrays(fixture_dir)
+    _WORKER["initial_capital"] = initial_capital
+
+
+def _run_one(task: tuple[str, dict[str, Any]]) -> tuple[str, dict[str, Any], Optional[dict[str, Any]], float, Optional[str]]:
+    run_id, params = task
+    started = time.perf_counter()
+    try:
+        backtester = VectorizedBacktester(apply_overrides(_WORKER["config"], params))
+        results = backtester.run(_WORKER["fixture"], _WORKER["initial_capital"])
+        metrics, error = results["performance_metrics"], None
+    except Exception as e:
+        metrics, error = None, f"{type(e).__name__}: {e}"
+    return run_id, params, metrics, (time.perf_counter() - started) * 1000, error
+
+
+class SweepRunner(LoggerMixin):
+    """
+    Runs parameter sets through the vectorized backtest on a process pool.
+    """
+
+    def __init__(self, config: dict[str, Any], work_dir: Optional[str] = None):
+        """Initialize the sweep runner.
+
+        Args:
+            config: Base application config; runs apply their overrides on top.
+                Reads backtest.sweep (workers, start_method, work_dir, objective)
+            work_dir: Directory for shared fixtures and the results database
+                (overrides backtest.sweep.work_dir)
+        """
+        super().__init__()
+        self.config = config
+        sweep_config = config.get("backtest", {}).get("sweep", {})
+        self.workers = sweep_config.get("workers") or os.cpu_count() or 1
+        self.start_method = sweep_config.get("start_method")
+        self.objective = sweep_config.get("objective", "sharpe_ratio")
+        self.work_dir = work_dir or sweep_config.get("work_dir", "backtest_results/sweeps")
+        self.initial_capital = config.get("trading", {}).get("initial_capital", 100000.0)
+
+    def share_fixture(self, fixture: ReplayFixture, name: str) -> str:
+        """Write the sweep's candles for memory mapping, once per sweep.
+
+        A resumed sweep keeps the candles it started with, so its remaining
+        runs are comparable with the completed ones. Resuming with candles for
+        other symbols, another timeframe or another time range is refused.
+
+        Args:
+            fixture: Candle history
+            name: Sweep name
+
+        Returns:
+            Fixture directory
+
+        Raises:
+            ValueError: If the sweep already exists for a different fixture
+        """
+        fixture_dir = os.path.join(self.work_dir, name, "fixture")
+        if os.path.exists(os.path.join(fixture_dir, "fixture.json")):
+            shared_id = fixture_id_for(ReplayFixture.open_arrays(fixture_dir))
+            if shared_id != fixture_id_for(fixture):
+                raise ValueError(
+                    f"Sweep {name!r} was started on different candles (fixture {shared_id}); "
+                    f"use another sweep name or remove {os.path.join(self.work_dir, name)}"
+                )
+            self.logger.info(f"Sweep {name}: reusing shared candles in {fixture_dir}")
+        else:
+            fixture.save_arrays(fixture_dir)
+        return fixture_dir
+
+    def run(
+        self,
+        fixture: ReplayFixture,
+        runs: list[dict[str, Any]],
+        name: str = "sweep",
+        workers: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """Run every parameter set not yet completed for this sweep.
+
+        Args:
+            fixture: Candle history shared by all runs
+            runs: Parameter sets (dotted config path -> value)
+            name: Sweep name; rerunning the same name resumes it
+            workers: Worker processes (default from config or CPU count);
+                1 runs in this process
+
+        Returns:
+            All rows of the sweep, best first by the objective metric
+        """
+        workers = workers or self.workers
+        fixture_dir = self.share_fixture(fixture, name)
+        results = SweepResults(os.path.join(self.work_dir, "results.db"))
+        try:
+            done = results.completed(name)
+            tasks = [(run_id_for(params), params) for params in runs]
+            pending = [task for task in tasks if task[0] not in done]
+            self.logger.info(
+                f"Sweep {name}: {len(pending)} of {len(tasks)} runs pending on {min(workers, max(len(pending), 1))} workers"
+            )
+
+            started = time.perf_counter()
+            initargs = (self.config, fixture_dir, self.initial_capital)
+            if workers <= 1 or len(pending) <= 1:
+                _init_worker(*initargs)
+                outcomes = map(_run_one, pending)
+                self._collect(results, name, outcomes, len(pending))
+            else:
+                context = multiprocessing.get_context(self.start_method)
+                with context.Pool(min(workers, len(pending)), _init_worker, initargs) as pool:
+                    outcomes = pool.imap_unordered(_run_one, pending)
+                    self._collect(results, name, outcomes, len(pending))
+
+            if pending:
+                self.logger.info(
+                    f"Sweep {name}: {len(pending)} runs in {time.perf_counter() - started:.1f}s"
+                )
+            return results.rows(name, order_by=self.objective)
+        finally:
+            results.close()
+
+    def _collect(self, results: SweepResults, name: str, outcomes: Any, total: int) -> None:
+        for count, (run_id, params, metrics, duration_ms, error) in enumerate(outcomes, 1):
+            results.record(name, run_id, params, metrics, duration_ms, error)
+            if error:
+                self.logger.warning(f"Sweep {name}: run {run_id} {params} failed: {error}")
+            if count % 50 == 0 or count == total:
+                self.logger.info(f"Sweep {name}: {count}/{total} runs recorded")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Command line entry point: python -m crypto_mvp.backtest.sweep."""
+    from . import BacktestEngine, BacktestReport
+
+    parser = argparse.ArgumentParser(description="Run a backtest parameter sweep")
+    parser.add_argument("--config", default="config/profit_optimized.yaml", help="Base configuration file")
+    parser.add_argument("--space", required=True, help="YAML/JSON file mapping dotted config paths to values")
+    parser.add_argument("--samples", type=int, default=0, help="Random search samples (0 = full grid)")
+    parser.add_argument("--seed", type=int, default=42, help="Random search seed")
+    parser.add_argument("--symbols", default="BTC/USDT,ETH/USDT", help="Comma-separated symbols")
+    parser.add_argument("--timeframe", default="1h", help="Candle timeframe")
+    parser.add_argument("--start", required=True, help="Start date (YYYY-MM-DD)")
+    parser.add_argument("--end", required=True, help="End date (YYYY-MM-DD)")
+    parser.add_argument("--name", default="sweep", help="Sweep name; rerun with the same name to resume")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--work-dir", help="Directory for shared candles and the results database")
+    args = parser.parse_args(argv)
+
+    with open(args.space) as f:
+        space = yaml.safe_load(f)
+    runs = random_search(space, args.samples, args.seed) if args.samples else grid_search(space)
+
+    engine = BacktestEngine(args.config)
+    rows = engine.run_sweep(
+        args.symbols.split(","), args.timeframe, args.start, args.end, runs,
+        name=args.name, workers=args.workers, work_dir=args.work_dir,
+    )
+    objective = engine.config.get("backtest", {}).get("sweep", {}).get("objective", "sharpe_ratio")
+    summary = BacktestReport().generate_sweep_report(rows, objective=objective)
+    print(json.dumps(summary["best"], indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""
+Vectorized backtests over columnar candle arrays.
+
+The history is held as (symbols, candles) NumPy arrays (a ReplayFixture).
+Indicators and momentum scores for every candle are computed in one batch with
+MomentumStrategy.analyze_batch, and fills are simulated only at the candles
+where a position opens or closes, priced with the execution fee/slippage model.
+
+run_event_driven() is the reference implementation of the same rules: it steps
+a ReplayDataEngine candle by candle and calls MomentumStrategy.analyze() per
+symbol, the path used by the live trading loop. Both produce the same trades.
+
+Rules (long only, one position per symbol):
+- Each symbol trades its own equal share of the initial capital.
+- Enter at the close when score >= entry_threshold and the strategy set a
+  stop loss; size is position_fraction of the symbol's cash.
+- Exit at the close on stop loss (close <= stop), take profit
+  (close >= take profit) or score <= exit_threshold, checked in that order.
+  No re-entry on the exit candle. Open positions close on the last candle.
+"""
+
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import numpy as np
+
+from ..core.candle_store import get_candle_store
+from ..core.logging_utils import LoggerMixin
+from ..core.money import to_dec
+from ..execution.fee_slippage import FeeSlippageCalculator
+from ..strategies.momentum import MomentumStrategy
+from .replay import CLOSE, HIGH, LOW, VOLUME, ReplayDataEngine, ReplayFixture
+
+
+@dataclass
+class BacktestRules:
+    """Entry/exit rules shared by the vectorized and event-driven paths."""
+
+    entry_threshold: float = 0.5
+    exit_threshold: float = -0.3
+    position_fraction: float = 0.95
+    # Candles the strategy sees per decision (its OHLCV limit in the live loop)
+    window: int = 100
+
+    @classmethod
+    def from_config(cls, config: Optional[dict[str, Any]]) -> "BacktestRules":
+        config = config or {}
+        return cls(
+            entry_threshold=config.get("entry_threshold", cls.entry_threshold),
+            exit_threshold=config.get("exit_threshold", cls.exit_threshold),
+            position_fraction=config.get("position_fraction", cls.position_fraction),
+            window=config.get("window", cls.window),
+        )
+
+
+class _Sleeve:
+    """Cash and open position of one symbol's share of the capital."""
+
+    def __init__(self, symbol: str, cash: float, fees: FeeSlippageCalculator):
+        self.symbol = symbol
+        self.cash = cash
+        self.fees = fees
+        self.position: Optional[dict[str, Any]] = None
+
+    @property
+    def quantity(self) -> float:
+        return self.position["quantity"] if self.position else 0.0
+
+    def buy(self, index: int, price: float, fraction: float, stop: float, take: float, score: float) -> bool:
+        quantity = self.cash * fraction / price
+        if quantity <= 0:
+            return False
+        fill = self.fees.calculate_fill_with_costs(self.symbol, "BUY", to_dec(quantity), to_dec(price))
+        self.cash -= float(fill["total_cost"])
+        self.position = {
+            "entry_index": index,
+            "quantity": quantity,
+            "entry_price": float(fill["effective_fill_price"]),
+            "entry_cost": float(fill["total_cost"]),
+            "entry_fees": float(fill["fees"]),
+            "stop_loss": stop,
+            "take_profit": take,
+            "signal_score": score,
+        }
+        return True
+
+    def sell(self, index: int, price: float, reason: str, timestamps: np.ndarray) -> dict[str, Any]:
+        position = self.position
+        fill = self.fees.calculate_fill_with_costs(
+            self.symbol, "SELL", to_dec(position["quantity"]), to_dec(price)
+        )
+        proceeds = float(fill["total_cost"])
+        self.cash += proceeds
+        self.position = None
+        return {
+            "symbol": self.symbol,
+            "strategy": "momentum",
+            "side": "buy",
+            "quantity": position["quantity"],
+            "entry_index": position["entry_index"],
+            "exit_index": index,
+            "entry_time": _iso(timestamps[position["entry_index"]]),
+            "exit_time": _iso(timestamps[index]),
+            "timestamp": _iso(timestamps[position["entry_index"]]),
+            "entry_price": position["entry_price"],
+            "exit_price": float(fill["effective_fill_price"]),
+            "fees": position["entry_fees"] + float(fill["fees"]),
+            "pnl": proceeds - position["entry_cost"],
+            "exit_reason": reason,
+            "stop_loss": position["stop_loss"],
+            "take_profit": position["take_profit"],
+            "signal_score": position["signal_score"],
+        }
+
+
+def _iso(timestamp_ms: Any) -> str:
+    return datetime.fromtimestamp(float(timestamp_ms) / 1000, tz=timezone.utc).isoformat()
+
+
+def _exit_reason(close: float, stop: float, take: float, score: float, exit_threshold: float) -> Optional[str]:
+    if close <= stop:
+        return "stop_loss"
+    if close >= take:
+        return "take_profit"
+    if score <= exit_threshold:
+        return "signal"
+    return None
+
+
+class VectorizedBacktester(LoggerMixin):
+    """
+    Backtests the momentum strategy over a whole candle history in batch.
+    """
+
+    def __init__(self, config: Optional[dict[str, Any]] = None):
+        """Initialize the backtester.
+
+        Args:
+            config: Full application config; reads strategies.momentum,
+                backtest.vectorized (BacktestRules) and backtest.venue
+        """
+        super().__init__()
+        config = config or {}
+        backtest_config = config.get("backtest", {})
+        self.rules = BacktestRules.from_config(backtest_config.get("vectorized", {}))
+        self.strategy_config = config.get("strategies", {}).get("momentum", {})
+        self.fees = FeeSlippageCalculator(backtest_config.get("venue", "default"))
+
+    def _new_strategy(self) -> MomentumStrategy:
+        return MomentumStrategy(self.strategy_config)
+
+    def _sleeves(self, fixture: ReplayFixture, initial_capital: float) -> list[_Sleeve]:
+        share = initial_capital / len(fixture.symbols)
+        return [_Sleeve(symbol, share, self.fees) for symbol in fixture.symbols]
+
+    def _check_history(self, fixture: ReplayFixture) -> int:
+        start = self.rules.window - 1
+        if fixture.num_candles <= start:
+            raise ValueError(
+                f"Need more than {start} candles for a {self.rules.window}-candle window, "
+                f"got {fixture.num_candles}"
+            )
+        return start
+
+    def run(self, fixture: ReplayFixture, initial_capital: float = 100000.0) -> dict[str, Any]:
+        """Run the vectorized backtest.
+
+        Args:
+            fixture: Columnar candle history
+            initial_capital: Starting capital, split equally across symbols
+
+        Returns:
+            Results with trades, equity curve and performance metrics
+        """
+        start = self._check_history(fixture)
+        rules = self.rules
+        candles = fixture.candles
+        closes = candles[..., CLOSE]
+        signals = self._new_strategy().analyze_batch(
+            candles[..., HIGH], candles[..., LOW], closes, candles[..., VOLUME], rules.window
+        )
+        score, stop_loss, take_profit = signals["score"], signals["stop_loss"], signals["take_profit"]
+        last = fixture.num_candles - 1
+
+        with np.errstate(invalid="ignore"):
+            entries = (score >= rules.entry_threshold) & ~np.isnan(stop_loss)
+            signal_exits = score <= rules.exit_threshold
+
+        trades = []
+        cash = np.empty_like(closes)
+        quantity = np.zeros_like(closes)
+        for row, sleeve in enumerate(self._sleeves(fixture, initial_capital)):
+            cash[row] = sleeve.cash
+            candidates = np.flatnonzero(entries[row, start:]) + start
+            t = start
+            while True:
+                k = np.searchsorted(candidates, t)
+                if k >= len(candidates):
+                    break
+                entry = int(candidates[k])
+                stop, take = stop_loss[row, entry], take_profit[row, entry]
+                if not sleeve.buy(entry, closes[row, entry], rules.position_fraction, stop, take, score[row, entry]):
+                    t = entry + 1
+                    continue
+                cash[row, entry:] = sleeve.cash
+
+                # First later candle hitting the stop, the target or an exit signal
+                later = slice(entry + 1, last + 1)
+                hits = np.flatnonzero(
+                    (closes[row, later] <= stop) | (closes[row, later] >= take) | signal_exits[row, later]
+                )
+                if len(hits):
+                    exit_index = entry + 1 + int(hits[0])
+                    reason = _exit_reason(
+                        closes[row, exit_index], stop, take, score[row, exit_index], rules.exit_threshold
+                    )
+                else:
+                    exit_index, reason = last, "end_of_data"
+
+                quantity[row, entry:exit_index] = sleeve.quantity
+                trades.append(sleeve.sell(exit_index, closes[row, exit_index], reason, fixture.timestamps))
+                cash[row, exit_index:] = sleeve.cash
+                t = exit_index + 1
+
+        equity = (cash + quantity * closes).sum(axis=0)[start:]
+        trades.sort(key=lambda trade: (trade["exit_index"], fixture.symbols.index(trade["symbol"])))
+        return self._results(fixture, start, equity, trades, initial_capital, "vectorized")
+
+    def run_event_driven(self, fixture: ReplayFixture, initial_capital: float = 100000.0) -> dict[str, Any]:
+        """Run the same rules candle by candle through MomentumStrategy.analyze().
+
+        This is the live loop's per-symbol path and serves as the reference for
+        run(); it is far slower on long histories.
+
+        Args:
+            fixture: Candle history
+            initial_capital: Starting capital, split equally across symbols
+
+        Returns:
+            Results with trades, equity curve and performance metrics
+        """
+        start = self._check_history(fixture)
+        rules = self.rules
+        engine = ReplayDataEngine(fixture, start=start)
+        strategy = self._new_strategy()
+        strategy.data_engine = engine
+        timeframe = fixture.timeframe
+        sleeves = self._sleeves(fixture, initial_capital)
+        last = fixture.num_candles - 1
+        candle_store = get_candle_store()
+
+        trades = []
+        equity = np.empty(fixture.num_candles - start)
+        for t in range(start, last + 1):
+            engine.cursor = t
+            candle_store.begin_cycle(t)
+            try:
+                for row, sleeve in enumerate(sleeves):
+                    close = float(fixture.candles[row, t, CLOSE])
+                    analysis = strategy.analyze(sleeve.symbol, timeframe)
+                    score = analysis["score"]
+
+                    if sleeve.position:
+                        position = sleeve.position
+                        reason = _exit_reason(
+                            close, position["stop_loss"], position["take_profit"], score, rules.exit_threshold
+                        )
+                        if reason is None and t == last:
+                            reason = "end_of_data"
+                        if reason:
+                            trades.append(sleeve.sell(t, close, reason, fixture.timestamps))
+                    elif score >= rules.entry_threshold and analysis["stop_loss"] is not None:
+                        sleeve.buy(
+                            t, close, rules.position_fraction,
+                            analysis["stop_loss"], analysis["take_profit"], score,
+                        )
+                        if t == last:
+                            trades.append(sleeve.sell(t, close, "end_of_data", fixture.timestamps))
+            finally:
+                candle_store.end_cycle()
+
+            equity[t - start] = sum(
+                sleeve.cash + sleeve.quantity * float(fixture.candles[row, t, CLOSE])
+                for row, sleeve in enumerate(sleeves)
+            )
+
+        return self._results(fixture, start, equity, trades, initial_capital, "event")
+
+    def _results(
+        self,
+        fixture: ReplayFixture,
+        start: int,
+        equity: np.ndarray,
+        trades: list[dict[str, Any]],
+        initial_capital: float,
+        mode: str,
+    ) -> dict[str, Any]:
+        pnls = np.array([trade["pnl"] for trade in trades])
+        wins, losses = pnls[pnls > 0].sum(), -pnls[pnls < 0].sum()
+        returns = np.diff(equity) / equity[:-1] if len(equity) > 1 else np.array([])
+        running_peak = np.maximum.accumulate(equity) if len(equity) else equity
+        final_equity = float(equity[-1]) if len(equity) else initial_capital
+
+        self.logger.info(
+            f"Backtest ({mode}) completed: {len(trades)} trades over "
+            f"{len(equity)} candles x {len(fixture.symbols)} symbols, final equity ${final_equity:,.2f}"
+        )
+        return {
+            "backtest_config": {
+                "mode": mode,
+                "symbols": list(fixture.symbols),
+                "timeframe": fixture.timeframe,
+                "start_date": _iso(fixture.timestamps[start]),
+                "end_date": _iso(fixture.timestamps[-1]),
+                "initial_capital": initial_capital,
+                "rules": asdict(self.rules),
+            },
+            "trades": trades,
+            "equity_curve": [
+                {"timestamp": _iso(timestamp), "equity": float(value)}
+                for timestamp, value in zip(fixture.timestamps[start:], equity)
+            ],
+            "performance_metrics": {
+                "total_return": (final_equity - initial_capital) / initial_capital,
+                "total_trades": len(trades),
+                "win_rate": float((pnls > 0).mean()) if len(pnls) else 0.0,
+                "profit_factor": float(wins / losses) if losses > 0 else 0.0,
+                "max_drawdown": float(((running_peak - equity) / running_peak).max()) if len(equity) else 0.0,
+                "sharpe_ratio": float(returns.mean() / returns.std() * np.sqrt(8760))
+                if len(returns) > 1 and returns.std() > 0 else 0.0,
+                "total_pnl": float(pnls.sum()),
+                "total_fees": float(sum(trade["fees"] for trade in trades)),
+                "final_equity": final_equity,
+            },
+        }
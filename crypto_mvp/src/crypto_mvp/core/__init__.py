@@ -2,6 +2,7 @@
 Core utilities for the Crypto MVP application.
 """
 
+from .async_logging import get_logging_stats, set_log_level, stop_log_pipeline
 from .config_manager import ConfigManager
 from .logging_utils import get_logger, setup_logging
 from .utils import format_currency, format_percentage, get_version, validate_config
@@ -10,6 +11,9 @@ __all__ = [
     "ConfigManager",
     "setup_logging",
     "get_logger",
+    "set_log_level",
+    "get_logging_stats",
+    "stop_log_pipeline",
     "get_version",
     "validate_config",
     "format_currency",
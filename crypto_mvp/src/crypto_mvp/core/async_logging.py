@@ -0,0 +1,316 @@
+"""
+Asynchronous logging pipeline for the trading loop.
+
+With ``logging.async.enabled`` set, loggers created by ``get_logger`` get a
+single queue handler instead of their own stream and file handlers. A
+background writer thread (a ``QueueListener``) owns the real handlers, so the
+formatting, console writes and file rotation happen off the event loop
+thread that runs ``run_trading_cycle``.
+
+Records are queued unformatted: %-style arguments are merged into the
+message by the writer, and only for records that pass the logger level and
+the rate limits. Arguments that could change before the writer gets to them
+(dicts, lists, objects) are merged on the calling thread, still only for
+records that are actually emitted. The queue is bounded and never blocks the
+caller; records that do not fit are dropped and counted.
+
+High-frequency event keys (the ``UPPER_CASE`` prefix of a message such as
+``NAV_REBUILD:``) can be limited with a token bucket (``per_second`` and
+``burst``) or sampled (``sample_every``). Warnings and errors are never
+limited. Logger levels can be overridden per subsystem, from config or at
+runtime with ``set_log_level``.
+"""
+
+import atexit
+import logging
+import queue
+import re
+import threading
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional, Union
+
+# UPPER_CASE event key at the start of a message ("NAV_REBUILD: ...")
+EVENT_KEY_PATTERN = re.compile(r"^([A-Z][A-Z0-9]*(?:_[A-Z0-9]+)+|[A-Z][A-Z0-9]{2,}(?=:))")
+
+# Argument types that cannot change between the log call and the writer
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, bytes, type(None), Decimal, datetime, date, Enum)
+
+_pipeline: Optional["AsyncLogPipeline"] = None
+_pipeline_lock = threading.Lock()
+# Runtime level overrides by logger name; get_logger applies them too
+_level_overrides: Dict[str, int] = {}
+
+
+def event_key(record: logging.LogRecord) -> Optional[str]:
+    """Get the event key of a record's message.
+
+    Args:
+        record: Log record
+
+    Returns:
+        Event key, or None if the message does not start with one
+    """
+    if not isinstance(record.msg, str):
+        return None
+    match = EVENT_KEY_PATTERN.match(record.msg)
+    return match.group(1) if match else None
+
+
+def _level_number(level: Union[str, int]) -> int:
+    """Convert a level name or number to a level number."""
+    if isinstance(level, int):
+        return level
+    return getattr(logging, str(level).upper(), logging.INFO)
+
+
+class EventRateLimiter(logging.Filter):
+    """
+    Filter that limits or samples records by event key.
+
+    Each configured key gets either a token bucket (``per_second`` records a
+    second, up to ``burst`` at once) or a sampler that passes one record in
+    ``sample_every``. Keys without a rule, and records at WARNING or above,
+    always pass.
+    """
+
+    def __init__(self, rules: Optional[Dict[str, Dict[str, Any]]] = None):
+        """Initialize the rate limiter.
+
+        Args:
+            rules: Rule by event key (``logging.async.rate_limits``)
+        """
+        super().__init__()
+        self.rules = dict(rules or {})
+        self._buckets: Dict[str, List[float]] = {}  # key -> [tokens, last refill]
+        self._seen: Dict[str, int] = {}
+        self.suppressed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rules:
+            return True
+        key = event_key(record)
+        rule = self.rules.get(key) if key else None
+        if not rule:
+            return True
+
+        with self._lock:
+            if self._allow(key, rule):
+                return True
+            self.suppressed[key] = self.suppressed.get(key, 0) + 1
+            return False
+
+    def _allow(self, key: str, rule: Dict[str, Any]) -> bool:
+        """Apply the key's rule (called with the lock held)."""
+        sample_every = int(rule.get("sample_every", 0) or 0)
+        if sample_every > 1:
+            seen = self._seen.get(key, 0)
+            self._seen[key] = seen + 1
+            return seen % sample_every == 0
+
+        per_second = float(rule.get("per_second", 0) or 0)
+        if per_second <= 0:
+            return True
+        burst = max(1.0, float(rule.get("burst", per_second)))
+        now = time.monotonic()
+        bucket = self._buckets.setdefault(key, [burst, now])
+        bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * per_second)
+        bucket[1] = now
+        if bucket[0] >= 1.0:
+            bucket[0] -= 1.0
+            return True
+        return False
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the writer thread and never blocks.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record on unformatted unless its arguments are mutable."""
+        args = record.args
+        if args and not _immutable_args(args):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _immutable_args(args: Any) -> bool:
+    """Whether log call arguments are safe to format later on another thread."""
+    values = args.values() if isinstance(args, dict) else args
+    return all(isinstance(value, _IMMUTABLE_ARG_TYPES) for value in values)
+
+
+class _WriterListener(QueueListener):
+    """QueueListener that counts written records and waits for room to stop."""
+
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.written = 0
+        self.write_errors = 0
+
+    def handle(self, record: logging.LogRecord) -> None:
+        try:
+            super().handle(record)
+            self.written += 1
+        except Exception:
+            self.write_errors += 1
+
+    def enqueue_sentinel(self) -> None:
+        # The queue is bounded; wait for the writer to make room
+        self.queue.put(self._sentinel)
+
+
+class AsyncLogPipeline:
+    """
+    Queue, rate limiter and background writer shared by every attached logger.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]], handlers: List[logging.Handler]):
+        """Initialize and start the pipeline.
+
+        Args:
+            config: Pipeline settings (``logging.async``): max_queue, rate_limits
+            handlers: Output handlers owned by the writer thread; logger levels
+                decide what is written, so give them no level of their own
+        """
+        self.config = config or {}
+        self.handlers = list(handlers)
+        self.queue: queue.Queue = queue.Queue(self.config.get("max_queue", 10000))
+        self.rate_limiter = EventRateLimiter(self.config.get("rate_limits", {}))
+        self.queue_handler = DeferredQueueHandler(self.queue)
+        self.queue_handler.addFilter(self.rate_limiter)
+        self._loggers: Dict[str, logging.Logger] = {}
+
+        self.listener = _WriterListener(self.queue, *self.handlers)
+        self.listener.start()
+        self.running = True
+
+    def attach(self, logger_instance: logging.Logger) -> None:
+        """Route a logger's records through the pipeline.
+
+        Args:
+            logger_instance: Logger whose handlers are replaced by the queue handler
+        """
+        logger_instance.handlers.clear()
+        logger_instance.addHandler(self.queue_handler)
+        logger_instance.propagate = False
+        self._loggers[logger_instance.name] = logger_instance
+
+    def stop(self) -> None:
+        """Write every queued record and stop the writer thread.
+
+        Attached loggers fall back to writing to the output handlers directly,
+        so records logged during shutdown are not lost.
+        """
+        if not self.running:
+            return
+        self.running = False
+        self.listener.stop()
+        for handler in self.handlers:
+            handler.flush()
+        for logger_instance in self._loggers.values():
+            if self.queue_handler in logger_instance.handlers:
+                logger_instance.removeHandler(self.queue_handler)
+                for handler in self.handlers:
+                    logger_instance.addHandler(handler)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue, write, drop and suppression counters."""
+        return {
+            "running": self.running,
+            "queued": self.queue.qsize(),
+            "max_queue": self.queue.maxsize,
+            "written": self.listener.written,
+            "write_errors": self.listener.write_errors,
+            "dropped": self.queue_handler.dropped,
+            "suppressed": dict(self.rate_limiter.suppressed),
+            "loggers": len(self._loggers),
+        }
+
+
+def start_log_pipeline(config: Optional[Dict[str, Any]], handlers: List[logging.Handler]) -> AsyncLogPipeline:
+    """Start the shared pipeline, or return the one already running.
+
+    Args:
+        config: Pipeline settings (``logging.async``)
+        handlers: Output handlers for the writer thread (unused if already running)
+
+    Returns:
+        Running pipeline
+    """
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None or not _pipeline.running:
+            _pipeline = AsyncLogPipeline(config, handlers)
+        return _pipeline
+
+
+def get_log_pipeline() -> Optional[AsyncLogPipeline]:
+    """Get the running pipeline, if any."""
+    return _pipeline if _pipeline is not None and _pipeline.running else None
+
+
+def stop_log_pipeline() -> None:
+    """Flush and stop the shared pipeline (safe to call more than once)."""
+    with _pipeline_lock:
+        if _pipeline is not None:
+            _pipeline.stop()
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    """Get the pipeline's counters (empty if no pipeline is running)."""
+    pipeline = get_log_pipeline()
+    return pipeline.get_stats() if pipeline else {}
+
+
+def get_level_override(name: str) -> Optional[int]:
+    """Get the runtime level override of a logger, if any."""
+    return _level_overrides.get(name)
+
+
+def set_log_level(name: str, level: Union[str, int]) -> None:
+    """Change a subsystem's log level at runtime.
+
+    The override also applies to loggers created later with ``get_logger``.
+
+    Args:
+        name: Logger name (the class name for LoggerMixin classes)
+        level: Level name ("DEBUG", "WARNING", ...) or number
+    """
+    level_number = _level_number(level)
+    _level_overrides[name] = level_number
+    logger_instance = logging.getLogger(name)
+    logger_instance.setLevel(level_number)
+    # Synchronous handlers carry their own level; let them follow the logger
+    for handler in logger_instance.handlers:
+        if not isinstance(handler, QueueHandler):
+            handler.setLevel(level_number)
+
+
+def set_log_levels(levels: Optional[Dict[str, Union[str, int]]]) -> None:
+    """Apply several level overrides (``logging.levels``).
+
+    Args:
+        levels: Level by logger name
+    """
+    for name, level in (levels or {}).items():
+        set_log_level(name, level)
+
+
+atexit.register(stop_log_pipeline)
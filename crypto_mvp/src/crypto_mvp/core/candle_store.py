@@ -0,0 +1,175 @@
+"""
+Cycle-scoped store of parsed OHLCV candles shared by all strategies.
+
+_get_comprehensive_market_data fetches candles once per symbol per cycle. This
+store parses each response into NumPy columns once and hands every consumer the
+same read-only arrays, so strategies stop re-fetching and re-parsing candles.
+"""
+
+import threading
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from ..indicators.technical_calculator import get_calculator
+
+# Global cycle candle store instance
+_candle_store = None
+
+CandleKey = tuple[str, str, int]
+
+
+class CycleCandleStore:
+    """
+    Parsed candle cache for a single trading cycle.
+
+    Cache key: (symbol, timeframe, limit)
+    Cache value: dict of read-only NumPy columns as returned by
+    TechnicalCalculator.parse_ohlcv (timestamps, opens, highs, lows, closes, volumes)
+
+    Entries are only kept between begin_cycle() and end_cycle(); outside a cycle
+    every lookup misses and candles are parsed without being cached.
+
+    A request for fewer candles than a cached entry of the same symbol/timeframe
+    is served from the tail of that entry (views, no copy).
+    """
+
+    def __init__(self):
+        self._frames: dict[CandleKey, dict[str, np.ndarray]] = {}
+        self._lock = threading.Lock()
+        self.cycle_id: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.parses = 0
+
+    def begin_cycle(self, cycle_id: int) -> None:
+        """Drop all candles from the previous cycle and reset statistics.
+
+        Args:
+            cycle_id: Trading cycle ID
+        """
+        with self._lock:
+            self._frames.clear()
+            self.cycle_id = cycle_id
+            self.hits = 0
+            self.misses = 0
+            self.parses = 0
+
+    def end_cycle(self) -> None:
+        """Drop all candles once the cycle is over.
+
+        Outside an active cycle nothing is cached, so callers always see fresh
+        candles from the data engine.
+        """
+        with self._lock:
+            self._frames.clear()
+            self.cycle_id = None
+
+    @property
+    def active(self) -> bool:
+        """Whether a trading cycle is currently populating the store."""
+        return self.cycle_id is not None
+
+    def put(self, symbol: str, timeframe: str, limit: int, ohlcv: Any) -> Optional[dict[str, np.ndarray]]:
+        """Parse raw OHLCV once and store the read-only columns.
+
+        Args:
+            symbol: Canonical symbol (e.g., 'BTC/USDT')
+            timeframe: Candle timeframe (e.g., '1h')
+            limit: Number of candles requested from the data engine
+            ohlcv: Raw OHLCV rows (lists or dicts)
+
+        Returns:
+            Parsed columns, or None if there was no data
+        """
+        if not ohlcv:
+            return None
+
+        parsed = get_calculator().parse_ohlcv(ohlcv)
+        for column in parsed.values():
+            column.flags.writeable = False
+
+        with self._lock:
+            self.parses += 1
+            if self.active:
+                self._frames[(symbol, timeframe, limit)] = parsed
+        return parsed
+
+    def get(self, symbol: str, timeframe: str, limit: int) -> Optional[dict[str, np.ndarray]]:
+        """Get parsed candles, counting a hit or miss.
+
+        Args:
+            symbol: Canonical symbol
+            timeframe: Candle timeframe
+            limit: Number of candles wanted
+
+        Returns:
+            Parsed read-only columns or None if not cached
+        """
+        with self._lock:
+            frame = self._lookup(symbol, timeframe, limit)
+            if frame is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return frame
+
+    def get_or_fetch(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+        fetch: Callable[[], Any],
+    ) -> Optional[dict[str, np.ndarray]]:
+        """Get parsed candles, fetching and parsing them once on a miss.
+
+        Args:
+            symbol: Canonical symbol
+            timeframe: Candle timeframe
+            limit: Number of candles wanted
+            fetch: Zero-argument callable returning raw OHLCV rows
+
+        Returns:
+            Parsed read-only columns or None if no data is available
+        """
+        frame = self.get(symbol, timeframe, limit)
+        if frame is not None:
+            return frame
+        return self.put(symbol, timeframe, limit, fetch())
+
+    def _lookup(self, symbol: str, timeframe: str, limit: int) -> Optional[dict[str, np.ndarray]]:
+        frame = self._frames.get((symbol, timeframe, limit))
+        if frame is not None:
+            return frame
+
+        # Serve smaller windows from the tail of a larger cached window
+        for (cached_symbol, cached_timeframe, cached_limit), cached in self._frames.items():
+            if cached_symbol == symbol and cached_timeframe == timeframe and cached_limit > limit:
+                return {name: column[-limit:] for name, column in cached.items()}
+        return None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss statistics for the current cycle."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "cycle_id": self.cycle_id,
+                "entries": len(self._frames),
+                "hits": self.hits,
+                "misses": self.misses,
+                "parses": self.parses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        """Clear all cached candles."""
+        with self._lock:
+            self._frames.clear()
+
+
+def get_candle_store() -> CycleCandleStore:
+    """Get the global cycle candle store instance."""
+    global _candle_store
+    if _candle_store is None:
+        _candle_store = CycleCandleStore()
+    return _candle_store
@@ -13,10 +13,21 @@ from typing import Any, Optional
 
 from loguru import logger
 
+from .async_logging import get_level_override, get_log_pipeline, start_log_pipeline
+
+# Logging config that started the async pipeline. LoggerMixin classes without
+# a logging config of their own (TradeLedger, StateStore, NAVRebuilder, ...)
+# are routed through the same pipeline with it.
+_pipeline_logging_config: Optional[dict[str, Any]] = None
+
 
 def get_logger(name: str, config: dict[str, Any]) -> logging.Logger:
     """Get a logger instance configured according to the provided config.
 
+    With ``async.enabled`` in the config the logger writes through the shared
+    asynchronous pipeline (see ``core.async_logging``) instead of its own
+    console and file handlers.
+
     Args:
         name: Logger name (typically module or class name)
         config: Logging configuration dictionary
@@ -41,10 +52,47 @@ def get_logger(name: str, config: dict[str, Any]) -> logging.Logger:
     # Clear any existing handlers
     logger_instance.handlers.clear()
 
-    # Set level
+    # Set level: runtime override, then per-logger level, then the default
     level = config.get("level", "INFO").upper()
-    logger_instance.setLevel(getattr(logging, level, logging.INFO))
+    logger_level = get_level_override(name)
+    if logger_level is None:
+        logger_level = getattr(
+            logging, str(config.get("levels", {}).get(name, level)).upper(), logging.INFO
+        )
+    logger_instance.setLevel(logger_level)
+
+    async_config = config.get("async", {})
+    if async_config.get("enabled", False):
+        # Records go through a queue to the background writer thread
+        pipeline = get_log_pipeline()
+        if pipeline is None:
+            global _pipeline_logging_config
+            pipeline = start_log_pipeline(
+                async_config, _create_output_handlers(config, logging.NOTSET)
+            )
+            _pipeline_logging_config = config
+        pipeline.attach(logger_instance)
+        return logger_instance
+
+    for handler in _create_output_handlers(config, logger_level):
+        logger_instance.addHandler(handler)
+
+    # Prevent propagation to root logger
+    logger_instance.propagate = False
+
+    return logger_instance
+
 
+def _create_output_handlers(config: dict[str, Any], level: int) -> list[logging.Handler]:
+    """Create the console handler and, if a log file is configured, the file handler.
+
+    Args:
+        config: Logging configuration dictionary
+        level: Level for the handlers
+
+    Returns:
+        Configured handlers
+    """
     # Create formatter
     format_string = config.get(
         "format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -53,9 +101,9 @@ def get_logger(name: str, config: dict[str, Any]) -> logging.Logger:
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level, logging.INFO))
+    console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    logger_instance.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if log file is specified)
     log_file = config.get("file")
@@ -73,13 +121,10 @@ def get_logger(name: str, config: dict[str, Any]) -> logging.Logger:
         file_handler = _create_rotating_file_handler(
             log_path, rotation, retention, formatter
         )
-        file_handler.setLevel(getattr(logging, level, logging.INFO))
-        logger_instance.addHandler(file_handler)
+        file_handler.setLevel(level)
+        handlers.append(file_handler)
 
-    # Prevent propagation to root logger
-    logger_instance.propagate = False
-
-    return logger_instance
+    return handlers
 
 
 def _create_rotating_file_handler(
@@ -244,6 +289,9 @@ class LoggerMixin:
 
             if logging_config:
                 self._logger = get_logger(self.__class__.__name__, logging_config)
+            elif _pipeline_logging_config is not None and get_log_pipeline() is not None:
+                # Share the running async pipeline instead of logging inline
+                self._logger = get_logger(self.__class__.__name__, _pipeline_logging_config)
             else:
                 # Fallback to basic logger
                 self._logger = logging.getLogger(self.__class__.__name__)
@@ -0,0 +1,263 @@
+"""
+Bounded-concurrency market data fetch stage for the trading cycle.
+
+The data engine exposes blocking calls (get_ticker, get_ohlcv, ...). This module
+fans those calls out across a small thread pool so a cycle waits for the slowest
+symbol instead of the sum of every round trip, while still respecting per-host
+concurrency and rate limits.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from .logging_utils import LoggerMixin
+from .utils import RateLimiter
+from .worker_pool import WorkerPool
+
+
+@dataclass
+class FetchResult:
+    """Outcome of a single data engine request."""
+
+    kind: str
+    symbol: str
+    value: Any
+    latency_ms: float
+    error: Optional[str] = None
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class MarketDataFetcher(LoggerMixin):
+    """
+    Runs ticker, OHLCV, sentiment, on-chain and whale requests concurrently.
+
+    Each request kind is mapped to a host. Every host gets its own concurrency
+    limit (semaphore) and token-bucket RateLimiter, and every request is bounded
+    by a timeout. Failed or timed-out requests fall back to the same empty values
+    the serial implementation used (None for tickers, [] for OHLCV, {} otherwise).
+    Timed-out requests that keep running are tracked by the WorkerPool, which
+    replaces its executor once too many of them hold workers.
+    """
+
+    DEFAULT_HOSTS = {
+        "ticker": "exchange",
+        "ohlcv": "exchange",
+        "sentiment": "sentiment",
+        "on_chain": "on_chain",
+        "whale": "whale",
+    }
+
+    def __init__(self, data_engine, config: Optional[dict[str, Any]] = None):
+        """Initialize the fetcher.
+
+        Args:
+            data_engine: Data engine exposing get_ticker/get_ohlcv/... methods
+            config: Fetch configuration (``market_data.fetch`` section, optional)
+        """
+        super().__init__()
+        config = config or {}
+        self.data_engine = data_engine
+        self.max_workers = int(config.get("max_workers", 16))
+        self.per_host_concurrency = int(config.get("per_host_concurrency", 8))
+        self.request_timeout = float(config.get("request_timeout_s", 10.0))
+        self.calls_per_second = float(config.get("calls_per_second", 20.0))
+        self.burst_size = int(config.get("burst_size", 20))
+        self.hosts = {**self.DEFAULT_HOSTS, **config.get("hosts", {})}
+
+        self.pool = WorkerPool(
+            self.max_workers, "market-fetch", config.get("max_abandoned_requests")
+        )
+        # Rate limiters persist across cycles so the token bucket carries over;
+        # they are created lazily inside the running event loop.
+        self._rate_limiters: dict[str, RateLimiter] = {}
+
+    def _get_rate_limiter(self, host: str) -> RateLimiter:
+        limiter = self._rate_limiters.get(host)
+        if limiter is None:
+            limiter = RateLimiter(self.calls_per_second, self.burst_size)
+            self._rate_limiters[host] = limiter
+        return limiter
+
+    async def _run(
+        self,
+        semaphores: dict[str, asyncio.Semaphore],
+        kind: str,
+        symbol: str,
+        method: str,
+        *args: Any,
+    ) -> FetchResult:
+        """Run one blocking data engine call under its host limits."""
+        host = self.hosts.get(kind, "default")
+        semaphore = semaphores.setdefault(
+            host, asyncio.Semaphore(self.per_host_concurrency)
+        )
+        start = time.perf_counter()
+
+        async with semaphore:
+            await self._get_rate_limiter(host).acquire()
+            future = None
+            try:
+                func: Callable[..., Any] = getattr(self.data_engine, method)
+                future = self.pool.submit(func, *args)
+                value = await asyncio.wait_for(
+                    asyncio.wrap_future(future), timeout=self.request_timeout
+                )
+                return FetchResult(
+                    kind, symbol, value, (time.perf_counter() - start) * 1000
+                )
+            except asyncio.TimeoutError:
+                self.pool.abandon(future)
+                return FetchResult(
+                    kind,
+                    symbol,
+                    None,
+                    (time.perf_counter() - start) * 1000,
+                    error=f"timeout after {self.request_timeout:.1f}s",
+                    timed_out=True,
+                )
+            except Exception as e:
+                return FetchResult(
+                    kind,
+                    symbol,
+                    None,
+                    (time.perf_counter() - start) * 1000,
+                    error=str(e),
+                )
+
+    async def fetch(
+        self,
+        symbols: list[str],
+        timeframe: str,
+        limit: int,
+        proxy_symbol: str = "BTC/USDT",
+    ) -> dict[str, Any]:
+        """Fetch all per-cycle market data concurrently.
+
+        Args:
+            symbols: Canonical trading symbols
+            timeframe: OHLCV timeframe
+            limit: Number of OHLCV candles per symbol
+            proxy_symbol: Symbol used for market-wide sentiment/on-chain/whale data
+
+        Returns:
+            Dictionary with ticker_data, ohlcv_data, sentiment_data, on_chain_data,
+            whale_activity and fetch_stats (per-symbol latency report, with the
+            ticker latency separately in ticker_ms)
+        """
+        semaphores: dict[str, asyncio.Semaphore] = {}
+        cycle_start = time.perf_counter()
+
+        tasks = []
+        for symbol in symbols:
+            tasks.append(self._run(semaphores, "ticker", symbol, "get_ticker", symbol))
+            tasks.append(
+                self._run(semaphores, "ohlcv", symbol, "get_ohlcv", symbol, timeframe, limit)
+            )
+        tasks.append(
+            self._run(semaphores, "sentiment", proxy_symbol, "get_sentiment_data", proxy_symbol)
+        )
+        tasks.append(
+            self._run(semaphores, "on_chain", proxy_symbol, "get_on_chain_data", proxy_symbol)
+        )
+        tasks.append(
+            self._run(semaphores, "whale", proxy_symbol, "get_whale_activity", proxy_symbol)
+        )
+
+        results: list[FetchResult] = await asyncio.gather(*tasks)
+        wall_ms = (time.perf_counter() - cycle_start) * 1000
+
+        data: dict[str, Any] = {
+            "ticker_data": {},
+            "ohlcv_data": {},
+            "sentiment_data": {},
+            "on_chain_data": {},
+            "whale_activity": {},
+        }
+        per_symbol_ms: dict[str, float] = dict.fromkeys(symbols, 0.0)
+        ticker_ms: dict[str, float] = {}
+        timeouts = 0
+        errors = 0
+
+        for result in results:
+            if not result.ok:
+                if result.timed_out:
+                    timeouts += 1
+                else:
+                    errors += 1
+                self.logger.warning(
+                    f"Failed to get {result.kind} for {result.symbol}: {result.error}"
+                )
+
+            if result.kind == "ticker":
+                data["ticker_data"][result.symbol] = result.value if result.ok else None
+                ticker_ms[result.symbol] = result.latency_ms
+            elif result.kind == "ohlcv":
+                data["ohlcv_data"][result.symbol] = result.value if result.ok else []
+            elif result.kind == "sentiment":
+                data["sentiment_data"] = result.value if result.ok else {}
+            elif result.kind == "on_chain":
+                data["on_chain_data"] = result.value if result.ok else {}
+            elif result.kind == "whale":
+                data["whale_activity"] = result.value if result.ok else {}
+
+            # A symbol is ready once its slowest request has returned
+            if result.symbol in per_symbol_ms and result.kind in ("ticker", "ohlcv"):
+                per_symbol_ms[result.symbol] = max(
+                    per_symbol_ms[result.symbol], result.latency_ms
+                )
+
+        slowest_symbol = (
+            max(per_symbol_ms, key=per_symbol_ms.get) if per_symbol_ms else None
+        )
+        data["fetch_stats"] = {
+            "wall_ms": wall_ms,
+            "per_symbol_ms": per_symbol_ms,
+            "ticker_ms": ticker_ms,
+            "slowest_symbol": slowest_symbol,
+            "slowest_ms": per_symbol_ms.get(slowest_symbol, 0.0) if slowest_symbol else 0.0,
+            "requests": len(results),
+            "timeouts": timeouts,
+            "errors": errors,
+            **self.pool.get_stats(),
+        }
+        return data
+
+    async def fetch_ohlcv(
+        self, symbols: list[str], timeframe: str, limit: int
+    ) -> dict[str, list]:
+        """Fetch OHLCV history for several symbols under the same host limits.
+
+        Args:
+            symbols: Trading symbols
+            timeframe: Candle timeframe
+            limit: Number of candles per symbol
+
+        Returns:
+            Dictionary of symbol -> raw OHLCV rows ([] for failed or timed-out requests)
+        """
+        semaphores: dict[str, asyncio.Semaphore] = {}
+        results: list[FetchResult] = await asyncio.gather(
+            *(
+                self._run(semaphores, "ohlcv", symbol, "get_ohlcv", symbol, timeframe, limit)
+                for symbol in symbols
+            )
+        )
+
+        ohlcv: dict[str, list] = {}
+        for result in results:
+            if not result.ok:
+                self.logger.warning(
+                    f"Failed to get {result.kind} for {result.symbol}: {result.error}"
+                )
+            ohlcv[result.symbol] = result.value if result.ok else []
+        return ohlcv
+
+    def close(self) -> None:
+        """Shut down the worker pool without waiting for abandoned requests."""
+        self.pool.shutdown()
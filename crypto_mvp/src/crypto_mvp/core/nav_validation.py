@@ -3,8 +3,13 @@ NAV (Net Asset Value) validation system.
 
 This module provides functionality to rebuild portfolio state from TradeLedger events
 using a PricingSnapshot and validate it against computed equity.
+
+The rebuilt state can be kept as a checkpoint (NAVCheckpoint) as of the last
+replayed trade id, so each cycle only replays the trades recorded since; a
+full rebuild from every trade of the session remains available as an audit.
 """
 
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
@@ -20,7 +25,8 @@ class NAVValidationResult:
     def __init__(self, is_valid: bool, difference: float, tolerance: float, 
                  rebuilt_cash: float, rebuilt_positions_value: float, 
                  rebuilt_realized_pnl: float, rebuilt_equity: float,
-                 computed_equity: float, error_message: Optional[str] = None):
+                 computed_equity: float, error_message: Optional[str] = None,
+                 mode: str = "full", trades_replayed: int = 0):
         self.is_valid = is_valid
         self.difference = difference
         self.tolerance = tolerance
@@ -30,6 +36,21 @@ class NAVValidationResult:
         self.rebuilt_equity = rebuilt_equity
         self.computed_equity = computed_equity
         self.error_message = error_message
+        self.mode = mode  # "full" or "incremental"
+        self.trades_replayed = trades_replayed
+
+
+@dataclass
+class NAVCheckpoint:
+    """Rebuilt portfolio state as of the last replayed trade."""
+    initial_cash: Decimal
+    cash: Decimal
+    realized_pnl: Decimal = field(default_factory=lambda: to_decimal(0.0))
+    # symbol -> {quantity, entry_price, total_cost, realized_pnl}
+    positions: Dict[str, Dict[str, Decimal]] = field(default_factory=dict)
+    last_trade_id: int = 0  # TradeLedger row id of the last replayed trade
+    trade_count: int = 0
+    session_id: Optional[str] = None
 
 
 class NAVRebuilder(LoggerMixin):
@@ -70,114 +91,160 @@ class NAVRebuilder(LoggerMixin):
             Tuple of (cash_balance, positions, realized_pnl, total_equity)
         """
         self.logger.info(f"NAV_REBUILD_START: Starting rebuild with {len(trades)} trades")
-        # Start with initial cash
+        state = self.new_checkpoint(initial_cash)
+        
+        # Process trades chronologically
+        self.replay(state, sorted(trades, key=lambda t: t.get('executed_at', '')))
+        return self.value_checkpoint(state, pricing_snapshot)
+
+    def new_checkpoint(
+        self, initial_cash: Optional[float] = None, session_id: Optional[str] = None
+    ) -> NAVCheckpoint:
+        """
+        Create an empty checkpoint: initial cash, no positions, no trades.
+
+        Args:
+            initial_cash: Starting cash balance (defaults to the constructor value)
+            session_id: Session the checkpoint belongs to
+
+        Returns:
+            New NAVCheckpoint
+        """
         cash = to_decimal(initial_cash) if initial_cash is not None else self.initial_cash
+        return NAVCheckpoint(initial_cash=cash, cash=cash, session_id=session_id)
+
+    def replay(self, state: NAVCheckpoint, trades: List[Dict[str, Any]]) -> int:
+        """
+        Apply trades, in the given order, to a checkpoint.
+
+        Args:
+            state: Checkpoint to advance
+            trades: Trade events from TradeLedger
+
+        Returns:
+            Number of trades applied
+        """
+        applied = 0
+        for trade in trades:
+            self.logger.debug(
+                "NAV_REBUILD: Trade %d: %s %s %s @ %s",
+                state.trade_count + 1, trade.get('symbol', 'unknown'), trade.get('side', 'unknown'),
+                trade.get('quantity', 0), trade.get('fill_price', 0),
+            )
+            try:
+                if self._apply_trade(state, trade):
+                    applied += 1
+            except Exception as e:
+                self.logger.error(f"Error processing trade {trade.get('trade_id', 'unknown')}: {e}")
+            finally:
+                state.trade_count += 1
+                trade_row_id = trade.get('id')
+                if isinstance(trade_row_id, int) and trade_row_id > state.last_trade_id:
+                    state.last_trade_id = trade_row_id
+        return applied
+
+    def _apply_trade(self, state: NAVCheckpoint, trade: Dict[str, Any]) -> bool:
+        """Apply one trade to cash, the symbol's position and realized P&L."""
+        symbol = trade.get('symbol', '')
+        side = trade.get('side', '').lower()
+        quantity = to_decimal(trade.get('quantity', 0.0))
+        fill_price = to_decimal(trade.get('fill_price', 0.0))
+        fees = to_decimal(trade.get('fees', 0.0))
         
-        # Track positions by symbol
-        positions = {}  # symbol -> {quantity, entry_price, total_cost, realized_pnl}
+        if not symbol or quantity == 0 or fill_price == 0:
+            return False
         
-        # Track realized P&L
-        total_realized_pnl = to_decimal(0.0)
+        # Calculate notional value
+        notional_value = safe_multiply(abs(quantity), fill_price)
         
-        # Process trades chronologically
-        sorted_trades = sorted(trades, key=lambda t: t.get('executed_at', ''))
-        self.logger.info(f"NAV_REBUILD: Processing {len(sorted_trades)} trades")
+        # Update cash balance
+        if side == 'buy':
+            # Buying: reduce cash by notional value + fees
+            state.cash -= notional_value + fees
+        elif side == 'sell':
+            # Selling: increase cash by notional value, reduce by fees
+            state.cash += notional_value - fees
+        else:
+            self.logger.warning(f"Unknown trade side: {side}")
+            return False
         
-        for i, trade in enumerate(sorted_trades):
-            self.logger.info(f"NAV_REBUILD: Trade {i+1}: {trade.get('symbol', 'unknown')} {trade.get('side', 'unknown')} {trade.get('quantity', 0)} @ {trade.get('fill_price', 0)}")
-            self.logger.info(f"NAV_REBUILD: Trade {i+1} full data: {trade}")
-            try:
-                symbol = trade.get('symbol', '')
-                side = trade.get('side', '').lower()
-                quantity = to_decimal(trade.get('quantity', 0.0))
-                fill_price = to_decimal(trade.get('fill_price', 0.0))
-                fees = to_decimal(trade.get('fees', 0.0))
-                
-                self.logger.info(f"NAV_REBUILD: Parsed - symbol='{symbol}' side='{side}' quantity={quantity} fill_price={fill_price} fees={fees}")
-                
-                if not symbol or quantity == 0 or fill_price == 0:
-                    continue
-                
-                # Calculate notional value
-                notional_value = safe_multiply(abs(quantity), fill_price)
-                
-                # Update cash balance
-                if side == 'buy':
-                    # Buying: reduce cash by notional value + fees
-                    total_cost = notional_value + fees
-                    cash -= total_cost
-                elif side == 'sell':
-                    # Selling: increase cash by notional value, reduce by fees
-                    cash += notional_value - fees
-                else:
-                    self.logger.warning(f"Unknown trade side: {side}")
-                    continue
-                
-                # Update position
-                if symbol not in positions:
-                    positions[symbol] = {
-                        'quantity': to_decimal(0.0),
-                        'entry_price': to_decimal(0.0),
-                        'total_cost': to_decimal(0.0),
-                        'realized_pnl': to_decimal(0.0)
-                    }
+        # Update position
+        if symbol not in state.positions:
+            state.positions[symbol] = {
+                'quantity': to_decimal(0.0),
+                'entry_price': to_decimal(0.0),
+                'total_cost': to_decimal(0.0),
+                'realized_pnl': to_decimal(0.0)
+            }
+        
+        pos = state.positions[symbol]
+        current_quantity = pos['quantity']
+        current_entry_price = pos['entry_price']
+        current_total_cost = pos['total_cost']
+        
+        if side == 'buy':
+            # Adding to position
+            new_quantity = current_quantity + quantity
+            if new_quantity != 0:
+                # Calculate weighted average entry price (notional value only, no fees)
+                new_total_notional = current_total_cost + notional_value
+                new_entry_price = safe_divide(new_total_notional, new_quantity)
                 
-                pos = positions[symbol]
-                current_quantity = pos['quantity']
-                current_entry_price = pos['entry_price']
-                current_total_cost = pos['total_cost']
+                pos['quantity'] = new_quantity
+                pos['entry_price'] = new_entry_price
+                pos['total_cost'] = new_total_notional
+            else:
+                # Position closed
+                pos['quantity'] = to_decimal(0.0)
+                pos['entry_price'] = to_decimal(0.0)
+                pos['total_cost'] = to_decimal(0.0)
                 
-                if side == 'buy':
-                    # Adding to position
-                    new_quantity = current_quantity + quantity
-                    if new_quantity != 0:
-                        # Calculate weighted average entry price (notional value only, no fees)
-                        new_total_notional = current_total_cost + notional_value
-                        new_entry_price = safe_divide(new_total_notional, new_quantity)
-                        
-                        pos['quantity'] = new_quantity
-                        pos['entry_price'] = new_entry_price
-                        pos['total_cost'] = new_total_notional
-                    else:
-                        # Position closed
-                        pos['quantity'] = to_decimal(0.0)
-                        pos['entry_price'] = to_decimal(0.0)
-                        pos['total_cost'] = to_decimal(0.0)
-                        
-                elif side == 'sell':
-                    # Reducing position
-                    new_quantity = current_quantity - quantity
-                    
-                    if current_quantity != 0:
-                        # Calculate realized P&L for this trade
-                        # P&L = (sell_price - entry_price) * quantity
-                        trade_pnl = safe_multiply(fill_price - current_entry_price, quantity)
-                        pos['realized_pnl'] += trade_pnl
-                        total_realized_pnl += trade_pnl
-                        
-                        # Update total cost (reduce by notional value of sold quantity)
-                        pos['total_cost'] -= notional_value
-                    
-                    if new_quantity != 0:
-                        # Position remains open
-                        pos['quantity'] = new_quantity
-                        # Keep entry price for remaining position
-                    else:
-                        # Position closed
-                        pos['quantity'] = to_decimal(0.0)
-                        pos['entry_price'] = to_decimal(0.0)
-                        pos['total_cost'] = to_decimal(0.0)
+        elif side == 'sell':
+            # Reducing position
+            new_quantity = current_quantity - quantity
+            
+            if current_quantity != 0:
+                # Calculate realized P&L for this trade
+                # P&L = (sell_price - entry_price) * quantity
+                trade_pnl = safe_multiply(fill_price - current_entry_price, quantity)
+                pos['realized_pnl'] += trade_pnl
+                state.realized_pnl += trade_pnl
                 
-            except Exception as e:
-                self.logger.error(f"Error processing trade {trade.get('trade_id', 'unknown')}: {e}")
-                continue
-        
+                # Update total cost (reduce by notional value of sold quantity)
+                pos['total_cost'] -= notional_value
+            
+            if new_quantity != 0:
+                # Position remains open
+                pos['quantity'] = new_quantity
+                # Keep entry price for remaining position
+            else:
+                # Position closed
+                pos['quantity'] = to_decimal(0.0)
+                pos['entry_price'] = to_decimal(0.0)
+                pos['total_cost'] = to_decimal(0.0)
+        return True
+
+    def value_checkpoint(
+        self, state: NAVCheckpoint, pricing_snapshot: PricingSnapshot
+    ) -> Tuple[float, Dict[str, Dict[str, Any]], float, float]:
+        """
+        Value a checkpoint's positions with a pricing snapshot.
+
+        The checkpoint itself is not modified.
+
+        Args:
+            state: Checkpoint to value
+            pricing_snapshot: PricingSnapshot to use for position valuation
+
+        Returns:
+            Tuple of (cash_balance, positions, realized_pnl, total_equity)
+        """
         # Calculate current position values using pricing snapshot
         total_positions_value = to_decimal(0.0)
-        self.logger.info(f"NAV_REBUILD: Processing {len(positions)} positions")
+        positions = {symbol: dict(pos) for symbol, pos in state.positions.items()}
+        self.logger.debug(f"NAV_REBUILD: Processing {len(positions)} positions")
         for symbol, pos in positions.items():
             quantity = pos['quantity']
-            self.logger.info(f"NAV_REBUILD: Symbol={symbol} quantity={quantity}")
             if quantity != 0:
                 # Get current price from snapshot
                 price_data = pricing_snapshot.get_mark_price(symbol)
@@ -195,7 +262,7 @@ class NAVRebuilder(LoggerMixin):
                     pos['current_price'] = current_price
                     pos['value'] = position_value
                     
-                    self.logger.info(f"NAV_REBUILD: {symbol} qty={quantity} price={current_price} value={position_value}")
+                    self.logger.debug("NAV_REBUILD: %s qty=%s price=%s value=%s", symbol, quantity, current_price, position_value)
                 else:
                     self.logger.warning(f"NAV_REBUILD: No price available for {symbol} in snapshot")
                     pos['current_price'] = to_decimal(0.0)
@@ -203,14 +270,14 @@ class NAVRebuilder(LoggerMixin):
         
         # Calculate total equity
         # Match the computed equity calculation: total_equity = cash + positions_value + realized_pnl
-        total_equity = cash + total_positions_value + total_realized_pnl
+        total_equity = state.cash + total_positions_value + state.realized_pnl
         
         # Convert back to float for compatibility
         return (
-            float(quantize_currency(cash, "USDT")),
+            float(quantize_currency(state.cash, "USDT")),
             {symbol: {k: float(v) if isinstance(v, Decimal) else v for k, v in pos.items()} 
              for symbol, pos in positions.items()},
-            float(quantize_currency(total_realized_pnl, "USDT")),
+            float(quantize_currency(state.realized_pnl, "USDT")),
             float(quantize_currency(total_equity, "USDT"))
         )
 
@@ -218,18 +285,37 @@ class NAVRebuilder(LoggerMixin):
 class NAVValidator(LoggerMixin):
     """
     Validates NAV consistency by rebuilding from TradeLedger and comparing with computed equity.
+
+    validate_nav rebuilds from every trade. validate_nav_incremental keeps the
+    rebuilt state as a checkpoint and only replays trades recorded after it;
+    audit_nav is the periodic full rebuild that re-checks (and replaces) the
+    checkpoint.
     """
     
-    def __init__(self, tolerance: float = 50.00):
+    def __init__(self, tolerance: float = 50.00, full_rebuild_interval: int = 0):
         """Initialize the NAV validator.
         
         Args:
             tolerance: Maximum allowed difference between rebuilt and computed equity (default $50)
                       Increased from $1 to handle fee timing and entry price differences
+            full_rebuild_interval: Incremental validations between full-rebuild
+                      audits (0 = no periodic audit)
         """
         super().__init__()
         self.tolerance = tolerance
+        self.full_rebuild_interval = full_rebuild_interval
         self.rebuilder = NAVRebuilder()
+
+        # Rebuilt state as of the last validated trade (incremental mode)
+        self.checkpoint: Optional[NAVCheckpoint] = None
+        self.incremental_since_audit = 0
+        self.stats = {
+            "incremental_validations": 0,
+            "full_rebuilds": 0,
+            "trades_replayed": 0,
+            "checkpoint_resets": 0,
+            "checkpoint_drifts": 0,
+        }
         
     def validate_nav(
         self,
@@ -250,67 +336,244 @@ class NAVValidator(LoggerMixin):
         Returns:
             NAVValidationResult with validation details
         """
-        self.logger.info(f"NAV_VALIDATOR_START: Starting validation with {len(trades)} trades")
+        result, _ = self._validate_full(trades, pricing_snapshot, computed_equity, initial_cash)
+        return result
+
+    def checkpoint_trade_id(self, session_id: Optional[str], initial_cash: float) -> int:
+        """
+        Ledger row id after which trades still have to be replayed.
+
+        A checkpoint of another session or initial cash is discarded first.
+
+        Args:
+            session_id: Session being validated
+            initial_cash: Starting cash balance of the session
+
+        Returns:
+            Row id of the last replayed trade (0 = replay from the start)
+        """
+        checkpoint = self.checkpoint
+        if (
+            checkpoint is None
+            or checkpoint.session_id != session_id
+            or checkpoint.initial_cash != to_decimal(initial_cash)
+        ):
+            if checkpoint is not None:
+                self.stats["checkpoint_resets"] += 1
+                self.logger.info(f"NAV_CHECKPOINT_RESET: session={session_id} initial_cash={initial_cash}")
+            self.checkpoint = self.rebuilder.new_checkpoint(initial_cash, session_id)
+        return self.checkpoint.last_trade_id
+
+    def validate_nav_incremental(
+        self,
+        new_trades: List[Dict[str, Any]],
+        pricing_snapshot: PricingSnapshot,
+        computed_equity: float,
+        initial_cash: float = 0.0,
+        session_id: Optional[str] = None,
+    ) -> NAVValidationResult:
+        """
+        Validate NAV by replaying only the trades recorded after the checkpoint.
+
+        Trades are replayed in ledger row id order; trades at or before the
+        checkpoint's last trade id are ignored, so passing a trade twice is
+        harmless.
+
+        Args:
+            new_trades: Trade events from TradeLedger with their row ``id``
+                (e.g. TradeLedger.get_trades_since(session_id, checkpoint_trade_id(...)))
+            pricing_snapshot: PricingSnapshot to use for position valuation
+            computed_equity: The computed equity to validate against
+            initial_cash: Starting cash balance
+            session_id: Session being validated
+
+        Returns:
+            NAVValidationResult with validation details
+        """
         try:
-            # Rebuild portfolio from ledger
-            self.logger.info(f"NAV_VALIDATOR_CALL: Calling rebuilder with {len(trades)} trades")
-            self.logger.info(f"NAV_VALIDATOR_CALL: initial_cash={initial_cash}")
-            self.logger.info(f"NAV_VALIDATOR_CALL: pricing_snapshot={pricing_snapshot}")
-            self.rebuilder.initial_cash = initial_cash
-            rebuilt_cash, rebuilt_positions, rebuilt_realized_pnl, rebuilt_equity = \
-                self.rebuilder.rebuild_from_ledger(trades, pricing_snapshot, initial_cash)
-            self.logger.info(f"NAV_VALIDATOR_CALL: Rebuilder returned cash={rebuilt_cash} equity={rebuilt_equity}")
-            
-            # Calculate positions value
-            rebuilt_positions_value = sum(pos.get('value', 0.0) for pos in rebuilt_positions.values())
-            
-            # Calculate difference
-            difference = abs(rebuilt_equity - computed_equity)
-            
-            # Determine if valid
-            is_valid = difference <= self.tolerance
-            
-            # Create result
-            result = NAVValidationResult(
-                is_valid=is_valid,
-                difference=difference,
-                tolerance=self.tolerance,
-                rebuilt_cash=rebuilt_cash,
-                rebuilt_positions_value=rebuilt_positions_value,
-                rebuilt_realized_pnl=rebuilt_realized_pnl,
-                rebuilt_equity=rebuilt_equity,
-                computed_equity=computed_equity,
-                error_message=None if is_valid else f"NAV validation failed: difference ${difference:.4f} > tolerance ${self.tolerance:.4f}"
+            last_trade_id = self.checkpoint_trade_id(session_id, initial_cash)
+            pending = sorted(
+                (trade for trade in new_trades if trade.get('id', 0) > last_trade_id),
+                key=lambda t: t.get('id', 0),
             )
-            
-            # Log validation result
-            if is_valid:
-                self.logger.debug(
-                    f"NAV_VALIDATION_PASS: rebuilt=${rebuilt_equity:.2f} "
-                    f"computed=${computed_equity:.2f} diff=${difference:.4f} "
-                    f"tolerance=${self.tolerance:.4f}"
-                )
-            else:
-                self.logger.error(
-                    f"NAV_VALIDATION_FAIL: rebuilt=${rebuilt_equity:.2f} "
-                    f"computed=${computed_equity:.2f} diff=${difference:.4f} "
-                    f"tolerance=${self.tolerance:.4f}"
-                )
-            
+            self.rebuilder.replay(self.checkpoint, pending)
+            self.incremental_since_audit += 1
+            self.stats["incremental_validations"] += 1
+            self.stats["trades_replayed"] += len(pending)
+            return self._build_result(
+                self.checkpoint, pricing_snapshot, computed_equity, "incremental", len(pending)
+            )
+        except Exception as e:
+            return self._error_result(e, computed_equity)
+
+    def audit_due(self) -> bool:
+        """Whether the next validation should be a full-rebuild audit."""
+        return (
+            self.checkpoint is None
+            or self.full_rebuild_interval > 0
+            and self.incremental_since_audit >= self.full_rebuild_interval
+        )
+
+    def audit_nav(
+        self,
+        trades: List[Dict[str, Any]],
+        pricing_snapshot: PricingSnapshot,
+        computed_equity: float,
+        initial_cash: float = 0.0,
+        session_id: Optional[str] = None,
+    ) -> NAVValidationResult:
+        """
+        Deep audit: full rebuild from every trade of the session.
+
+        The rebuilt state is compared with the checkpoint (a mismatch is logged
+        as NAV_CHECKPOINT_DRIFT) and then becomes the new checkpoint.
+
+        Args:
+            trades: Every trade event of the session from TradeLedger
+            pricing_snapshot: PricingSnapshot to use for position valuation
+            computed_equity: The computed equity to validate against
+            initial_cash: Starting cash balance
+            session_id: Session being validated
+
+        Returns:
+            NAVValidationResult with validation details
+        """
+        result, state = self._validate_full(trades, pricing_snapshot, computed_equity, initial_cash)
+        if state is None:
             return result
-            
+
+        state.session_id = session_id
+        checkpoint = self.checkpoint
+        if (
+            checkpoint is not None
+            and checkpoint.session_id == session_id
+            and checkpoint.initial_cash == state.initial_cash
+        ):
+            # Bring the checkpoint up to the same trades before comparing
+            self.rebuilder.replay(checkpoint, sorted(
+                (trade for trade in trades if trade.get('id', 0) > checkpoint.last_trade_id),
+                key=lambda t: t.get('id', 0),
+            ))
+            drift = self._checkpoint_drift(checkpoint, state)
+            if drift:
+                self.stats["checkpoint_drifts"] += 1
+                self.logger.warning(f"NAV_CHECKPOINT_DRIFT: checkpoint replaced by full rebuild: {drift}")
+        self.checkpoint = state
+        self.incremental_since_audit = 0
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get validation counters and the checkpoint position."""
+        checkpoint = self.checkpoint
+        return {
+            **self.stats,
+            "checkpoint_trade_id": checkpoint.last_trade_id if checkpoint else None,
+            "checkpoint_trades": checkpoint.trade_count if checkpoint else 0,
+            "full_rebuild_interval": self.full_rebuild_interval,
+        }
+
+    def _validate_full(
+        self,
+        trades: List[Dict[str, Any]],
+        pricing_snapshot: PricingSnapshot,
+        computed_equity: float,
+        initial_cash: float,
+    ) -> Tuple[NAVValidationResult, Optional[NAVCheckpoint]]:
+        """Rebuild from every trade; returns the result and the rebuilt state."""
+        self.logger.info(f"NAV_VALIDATOR_START: Starting validation with {len(trades)} trades")
+        try:
+            # Rebuild portfolio from ledger
+            self.rebuilder.initial_cash = to_decimal(initial_cash)
+            state = self.rebuilder.new_checkpoint(initial_cash)
+            self.rebuilder.replay(state, sorted(trades, key=lambda t: t.get('executed_at', '')))
+            self.stats["full_rebuilds"] += 1
+            self.stats["trades_replayed"] += len(trades)
+            return self._build_result(state, pricing_snapshot, computed_equity, "full", len(trades)), state
         except Exception as e:
-            error_msg = f"NAV validation error: {e}"
-            self.logger.error(error_msg)
-            
-            return NAVValidationResult(
-                is_valid=False,
-                difference=float('inf'),
-                tolerance=self.tolerance,
-                rebuilt_cash=0.0,
-                rebuilt_positions_value=0.0,
-                rebuilt_realized_pnl=0.0,
-                rebuilt_equity=0.0,
-                computed_equity=computed_equity,
-                error_message=error_msg
+            return self._error_result(e, computed_equity), None
+
+    def _build_result(
+        self,
+        state: NAVCheckpoint,
+        pricing_snapshot: PricingSnapshot,
+        computed_equity: float,
+        mode: str,
+        trades_replayed: int,
+    ) -> NAVValidationResult:
+        """Value the rebuilt state and compare it with the computed equity."""
+        rebuilt_cash, rebuilt_positions, rebuilt_realized_pnl, rebuilt_equity = \
+            self.rebuilder.value_checkpoint(state, pricing_snapshot)
+        
+        # Calculate positions value
+        rebuilt_positions_value = sum(pos.get('value', 0.0) for pos in rebuilt_positions.values())
+        
+        # Calculate difference
+        difference = abs(rebuilt_equity - computed_equity)
+        
+        # Determine if valid
+        is_valid = difference <= self.tolerance
+        
+        # Create result
+        result = NAVValidationResult(
+            is_valid=is_valid,
+            difference=difference,
+            tolerance=self.tolerance,
+            rebuilt_cash=rebuilt_cash,
+            rebuilt_positions_value=rebuilt_positions_value,
+            rebuilt_realized_pnl=rebuilt_realized_pnl,
+            rebuilt_equity=rebuilt_equity,
+            computed_equity=computed_equity,
+            error_message=None if is_valid else f"NAV validation failed: difference ${difference:.4f} > tolerance ${self.tolerance:.4f}",
+            mode=mode,
+            trades_replayed=trades_replayed,
+        )
+        
+        # Log validation result
+        if is_valid:
+            self.logger.debug(
+                f"NAV_VALIDATION_PASS: rebuilt=${rebuilt_equity:.2f} "
+                f"computed=${computed_equity:.2f} diff=${difference:.4f} "
+                f"tolerance=${self.tolerance:.4f} mode={mode} replayed={trades_replayed}"
             )
+        else:
+            self.logger.error(
+                f"NAV_VALIDATION_FAIL: rebuilt=${rebuilt_equity:.2f} "
+                f"computed=${computed_equity:.2f} diff=${difference:.4f} "
+                f"tolerance=${self.tolerance:.4f} mode={mode} replayed={trades_replayed}"
+            )
+        
+        return result
+
+    def _error_result(self, error: Exception, computed_equity: float) -> NAVValidationResult:
+        """Failed validation result for an unexpected error."""
+        error_msg = f"NAV validation error: {error}"
+        self.logger.error(error_msg)
+        
+        return NAVValidationResult(
+            is_valid=False,
+            difference=float('inf'),
+            tolerance=self.tolerance,
+            rebuilt_cash=0.0,
+            rebuilt_positions_value=0.0,
+            rebuilt_realized_pnl=0.0,
+            rebuilt_equity=0.0,
+            computed_equity=computed_equity,
+            error_message=error_msg
+        )
+
+    @staticmethod
+    def _checkpoint_drift(checkpoint: NAVCheckpoint, rebuilt: NAVCheckpoint) -> Dict[str, Any]:
+        """Differences between the checkpoint and a full rebuild of the same trades."""
+        cent = to_decimal(0.01)
+        drift: Dict[str, Any] = {}
+        if abs(checkpoint.cash - rebuilt.cash) > cent:
+            drift["cash"] = float(checkpoint.cash - rebuilt.cash)
+        if abs(checkpoint.realized_pnl - rebuilt.realized_pnl) > cent:
+            drift["realized_pnl"] = float(checkpoint.realized_pnl - rebuilt.realized_pnl)
+        zero = to_decimal(0.0)
+        for symbol in set(checkpoint.positions) | set(rebuilt.positions):
+            held = checkpoint.positions.get(symbol, {}).get('quantity', zero)
+            expected = rebuilt.positions.get(symbol, {}).get('quantity', zero)
+            if held != expected:
+                drift[f"{symbol}_quantity"] = float(held - expected)
+        return drift
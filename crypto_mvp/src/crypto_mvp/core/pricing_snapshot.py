@@ -3,14 +3,19 @@ Pricing snapshot system for per-cycle price consistency.
 
 This module provides a PricingSnapshot class that ensures all pricing within a trading cycle
 uses the same frozen snapshot of prices, preventing equity Δ and decision drift.
+
+Snapshots reuse the tickers the cycle's market data stage already fetched; only
+the missing symbols are fetched, concurrently and bounded by a deadline.
 """
 
-from dataclasses import dataclass, field
+from concurrent.futures import wait
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import time
 
 from .logging_utils import LoggerMixin
+from .worker_pool import WorkerPool
 
 
 @dataclass
@@ -23,6 +28,8 @@ class PriceData:
     ask: Optional[float] = None
     mid: Optional[float] = None
     provenance: Optional[Dict[str, Any]] = None  # Locked valuation source {venue, price_type}
+    origin: Optional[str] = None  # "reused", "fetched" or "stale_fallback"
+    fetch_ms: Optional[float] = None  # Ticker fetch latency
 
 
 @dataclass
@@ -46,6 +53,9 @@ class PricingSnapshot(LoggerMixin):
     
     # Hit tracking for debouncing: symbol → {last_log_time, hit_count}
     hit_tracking: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    # Snapshot construction: counts by price origin, wall time
+    fetch_stats: Dict[str, Any] = field(default_factory=dict)
     
     def __post_init__(self):
         """Initialize logger after dataclass creation."""
@@ -236,7 +246,8 @@ class PricingSnapshot(LoggerMixin):
             "hits": self.hits,
             "misses": self.misses,
             "staleness_ms": self.get_staleness_ms(),
-            "symbol_count": len(self.by_symbol)
+            "symbol_count": len(self.by_symbol),
+            "fetch": self.fetch_stats,
         }
     
     def log_pricing_context(self) -> None:
@@ -250,24 +261,147 @@ class PricingSnapshotManager(LoggerMixin):
     Manager for pricing snapshots across trading cycles.
     """
     
-    def __init__(self):
-        """Initialize the pricing snapshot manager."""
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the pricing snapshot manager.
+
+        Args:
+            config: Snapshot settings (``market_data.snapshot``, optional)
+        """
         super().__init__()
         self._current_snapshot: Optional[PricingSnapshot] = None
         self._snapshot_created: bool = False
         self._fresh_price_fetching_disabled: bool = False
-    
-    def create_snapshot(self, cycle_id: int, symbols: list[str], data_engine) -> PricingSnapshot:
+        self._pool: Optional[WorkerPool] = None
+        # Last good price per symbol: (price data, time.time() when captured)
+        self._last_prices: Dict[str, Tuple[PriceData, float]] = {}
+        self.configure(config or {})
+
+    def configure(self, config: Dict[str, Any]) -> None:
+        """Apply snapshot settings.
+
+        Args:
+            config: Snapshot settings: reuse_tickers, fetch_deadline_ms,
+                max_workers, max_abandoned_requests, stale_max_age_s
+        """
+        # Use tickers the cycle already fetched instead of fetching them again
+        self.reuse_tickers = config.get("reuse_tickers", True)
+        # Wall-clock limit for fetching the tickers that were not reused
+        self.fetch_deadline_ms = float(config.get("fetch_deadline_ms", 2000))
+        max_workers = int(config.get("max_workers", 8))
+        # Requests still running past the deadline before the pool is replaced
+        max_abandoned = config.get("max_abandoned_requests")
+        if self._pool is not None and (
+            max_workers != self.max_workers or max_abandoned != self.max_abandoned
+        ):
+            self._pool.shutdown()
+            self._pool = None
+        self.max_workers = max_workers
+        self.max_abandoned = max_abandoned
+        # Oldest last-known price used for a symbol that missed the deadline
+        self.stale_max_age_s = float(config.get("stale_max_age_s", 300))
+
+    def _get_pool(self) -> WorkerPool:
+        if self._pool is None:
+            self._pool = WorkerPool(self.max_workers, "pricing-snapshot", self.max_abandoned)
+        return self._pool
+
+    def _fetch_tickers(
+        self, symbols: List[str], data_engine
+    ) -> Tuple[Dict[str, Tuple[Any, float, Optional[Exception]]], List[str]]:
+        """Fetch tickers concurrently until all returned or the deadline passed.
+
+        Args:
+            symbols: Symbols to fetch
+            data_engine: Data engine for fetching prices
+
+        Returns:
+            Tuple of ({symbol: (ticker, latency_ms, error)} for the symbols that
+            returned in time, symbols that missed the deadline)
+        """
+        if not symbols:
+            return {}, []
+
+        def fetch(symbol: str) -> Tuple[Any, float]:
+            start = time.perf_counter()
+            ticker = data_engine.get_ticker(symbol)
+            return ticker, (time.perf_counter() - start) * 1000
+
+        pool = self._get_pool()
+        futures = {pool.submit(fetch, symbol): symbol for symbol in symbols}
+        done, not_done = wait(futures, timeout=self.fetch_deadline_ms / 1000.0)
+
+        results: Dict[str, Tuple[Any, float, Optional[Exception]]] = {}
+        for future in done:
+            try:
+                ticker, latency_ms = future.result()
+                results[futures[future]] = (ticker, latency_ms, None)
+            except Exception as e:
+                results[futures[future]] = (None, 0.0, e)
+        for future in not_done:
+            # Queued requests never start; running ones are tracked so a few
+            # hung fetches can't hold every worker for later cycles
+            pool.abandon(future)
+        return results, [symbol for symbol in symbols if symbol not in results]
+
+    def _price_data_from_ticker(
+        self, ticker_data: Dict[str, Any], origin: str, fetch_ms: Optional[float]
+    ) -> Tuple[PriceData, bool, str]:
+        """Build price data from a ticker with a positive price.
+
+        Returns:
+            Tuple of (price data, is_stale, stale_reason)
+        """
+        # Check if data is stale
+        is_stale = ticker_data.get("is_stale", False)
+        stale_reason = ticker_data.get("stale_reason", "")
+
+        # Handle provenance as either string or dict
+        provenance = ticker_data.get("provenance", "unknown")
+        if isinstance(provenance, dict):
+            source = provenance.get("source", "unknown")
+        else:
+            source = str(provenance)
+
+        # Mark source as stale if needed
+        if is_stale:
+            source = f"{source}_STALE"
+
+        price_data = PriceData(
+            price=ticker_data["price"],
+            source=source,
+            timestamp=ticker_data.get("timestamp", datetime.now().isoformat()),
+            bid=ticker_data.get("bid"),
+            ask=ticker_data.get("ask"),
+            mid=ticker_data.get("mid"),
+            origin=origin,
+            fetch_ms=fetch_ms,
+        )
+        return price_data, is_stale, stale_reason
+
+    def create_snapshot(
+        self,
+        cycle_id: int,
+        symbols: list[str],
+        data_engine,
+        tickers: Optional[Dict[str, Any]] = None,
+        ticker_latency_ms: Optional[Dict[str, float]] = None,
+    ) -> PricingSnapshot:
         """
         Create a new pricing snapshot for a cycle with resilient data fetching.
         
         Continues with other symbols even if some fail. Uses stale data when fresh unavailable.
         All prices share the same snapshot_id to avoid mixed marks.
+
+        Tickers already fetched this cycle are reused; the others are fetched
+        concurrently until fetch_deadline_ms. A symbol that misses the deadline
+        gets its last known price (within stale_max_age_s) marked stale.
         
         Args:
             cycle_id: Current cycle ID
             symbols: List of symbols to include in snapshot
             data_engine: Data engine for fetching prices
+            tickers: Tickers fetched earlier this cycle, by symbol (optional)
+            ticker_latency_ms: Fetch latency of those tickers, by symbol (optional)
             
         Returns:
             New PricingSnapshot instance
@@ -281,49 +415,81 @@ class PricingSnapshotManager(LoggerMixin):
             id=cycle_id,
             ts=datetime.now()
         )
+        started = time.perf_counter()
         
         successful_fetches = 0
         stale_fetches = 0
         failed_fetches = 0
+        origins = {"reused": 0, "fetched": 0, "stale_fallback": 0}
+
+        # Reuse this cycle's tickers, fetch the rest concurrently
+        tickers = (tickers or {}) if self.reuse_tickers else {}
+        ticker_latency_ms = ticker_latency_ms or {}
+        reused = {
+            symbol: tickers[symbol]
+            for symbol in symbols
+            if tickers.get(symbol) and tickers[symbol].get("price", 0) > 0
+        }
+        fetched, missed = self._fetch_tickers(
+            [symbol for symbol in symbols if symbol not in reused], data_engine
+        )
+        missed = set(missed)
+        now = time.time()
         
-        # Fetch prices for all symbols - continue on failures
+        # Build prices in symbol order - continue on failures
         for symbol in symbols:
             try:
-                ticker_data = data_engine.get_ticker(symbol)
+                if symbol in missed:
+                    last = self._last_prices.get(symbol)
+                    if last is None or now - last[1] > self.stale_max_age_s:
+                        failed_fetches += 1
+                        self.logger.warning(
+                            f"DATA_SKIP: Ticker for {symbol} missed the {self.fetch_deadline_ms:.0f}ms "
+                            f"deadline and no recent price is known - continuing with other symbols"
+                        )
+                        continue
+                    previous = last[0]
+                    source = previous.source if previous.source.endswith("_STALE") else f"{previous.source}_STALE"
+                    price_data = replace(
+                        previous, source=source, origin="stale_fallback", fetch_ms=self.fetch_deadline_ms
+                    )
+                    snapshot.add_price_data(symbol, price_data)
+                    stale_fetches += 1
+                    origins["stale_fallback"] += 1
+                    self.logger.info(
+                        f"Added {symbol} with STALE data: price={price_data.price}, "
+                        f"reason=deadline, age={now - last[1]:.0f}s"
+                    )
+                    continue
+
+                if symbol in reused:
+                    ticker_data, origin = reused[symbol], "reused"
+                    fetch_ms = ticker_latency_ms.get(symbol)
+                else:
+                    ticker_data, fetch_ms, error = fetched[symbol]
+                    origin = "fetched"
+                    if error is not None:
+                        raise error
                 
                 if ticker_data and ticker_data.get("price", 0) > 0:
-                    # Check if data is stale
-                    is_stale = ticker_data.get("is_stale", False)
-                    stale_reason = ticker_data.get("stale_reason", "")
-                    
-                    # Handle provenance as either string or dict
-                    provenance = ticker_data.get("provenance", "unknown")
-                    if isinstance(provenance, dict):
-                        source = provenance.get("source", "unknown")
-                    else:
-                        source = str(provenance)
-                    
-                    # Mark source as stale if needed
+                    price_data, is_stale, stale_reason = self._price_data_from_ticker(
+                        ticker_data, origin, fetch_ms
+                    )
                     if is_stale:
-                        source = f"{source}_STALE"
                         stale_fetches += 1
                     else:
                         successful_fetches += 1
-                    
-                    price_data = PriceData(
-                        price=ticker_data["price"],
-                        source=source,
-                        timestamp=ticker_data.get("timestamp", datetime.now().isoformat()),
-                        bid=ticker_data.get("bid"),
-                        ask=ticker_data.get("ask"),
-                        mid=ticker_data.get("mid")
-                    )
+                        self._last_prices[symbol] = (price_data, now)
                     snapshot.add_price_data(symbol, price_data)
+                    origins[origin] += 1
                     
                     if is_stale:
                         self.logger.info(f"Added {symbol} with STALE data: price={price_data.price}, reason={stale_reason}")
                     else:
-                        self.logger.debug(f"Added {symbol}: price={price_data.price}, bid={price_data.bid}, ask={price_data.ask}")
+                        self.logger.debug(
+                            f"Added {symbol}: price={price_data.price}, bid={price_data.bid}, "
+                            f"ask={price_data.ask} ({origin})"
+                        )
                 else:
                     failed_fetches += 1
                     self.logger.warning(f"DATA_SKIP: No valid price data for {symbol} - continuing with other symbols")
@@ -331,6 +497,13 @@ class PricingSnapshotManager(LoggerMixin):
             except Exception as e:
                 failed_fetches += 1
                 self.logger.warning(f"DATA_SKIP: Error fetching price for {symbol}: {e} - continuing with other symbols")
+
+        snapshot.fetch_stats = {
+            **origins,
+            "deadline_missed": len(missed),
+            "wall_ms": (time.perf_counter() - started) * 1000,
+            **(self._pool.get_stats() if self._pool is not None else {}),
+        }
         
         self._current_snapshot = snapshot
         self._snapshot_created = True
@@ -344,7 +517,9 @@ class PricingSnapshotManager(LoggerMixin):
         self.logger.info(
             f"SNAPSHOT_{cycle_id}_COMPLETE: {successful_fetches} fresh, "
             f"{stale_fetches} stale, {failed_fetches} failed out of {total_symbols} symbols - "
-            f"snapshot created with {len(snapshot.by_symbol)} symbols"
+            f"snapshot created with {len(snapshot.by_symbol)} symbols "
+            f"({origins['reused']} reused, {origins['fetched']} fetched, "
+            f"{len(missed)} missed the deadline, {snapshot.fetch_stats['wall_ms']:.0f}ms)"
         )
         
         if failed_fetches > 0:
@@ -402,7 +577,23 @@ def get_pricing_snapshot_manager() -> PricingSnapshotManager:
     return _pricing_snapshot_manager
 
 
-def create_pricing_snapshot(cycle_id: int, symbols: list[str], data_engine) -> PricingSnapshot:
+def configure_pricing_snapshots(config: Dict[str, Any]) -> None:
+    """
+    Apply snapshot settings to the global pricing snapshot manager.
+
+    Args:
+        config: Snapshot settings (``market_data.snapshot``)
+    """
+    get_pricing_snapshot_manager().configure(config)
+
+
+def create_pricing_snapshot(
+    cycle_id: int,
+    symbols: list[str],
+    data_engine,
+    tickers: Optional[Dict[str, Any]] = None,
+    ticker_latency_ms: Optional[Dict[str, float]] = None,
+) -> PricingSnapshot:
     """
     Create a new pricing snapshot for a cycle.
     
@@ -410,12 +601,14 @@ def create_pricing_snapshot(cycle_id: int, symbols: list[str], data_engine) -> P
         cycle_id: Current cycle ID
         symbols: List of symbols to include in snapshot
         data_engine: Data engine for fetching prices
+        tickers: Tickers fetched earlier this cycle, by symbol (optional)
+        ticker_latency_ms: Fetch latency of those tickers, by symbol (optional)
         
     Returns:
         New PricingSnapshot instance
     """
     manager = get_pricing_snapshot_manager()
-    return manager.create_snapshot(cycle_id, symbols, data_engine)
+    return manager.create_snapshot(cycle_id, symbols, data_engine, tickers, ticker_latency_ms)
 
 
 def get_current_pricing_snapshot() -> Optional[PricingSnapshot]:
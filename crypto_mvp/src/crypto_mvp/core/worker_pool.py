@@ -0,0 +1,119 @@
+"""
+Thread pool for blocking network calls that may outlive their timeout.
+
+A request that times out is abandoned by its caller, but the blocking call
+keeps its worker thread until it returns. WorkerPool counts those abandoned
+requests and, once ``max_abandoned`` of them are still running, hands new work
+to a fresh ThreadPoolExecutor. The retired executor is shut down without
+waiting, so its threads exit as soon as their hung calls return, and a few
+stuck requests can no longer starve later cycles of workers.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set
+
+from .logging_utils import LoggerMixin
+
+
+class WorkerPool(LoggerMixin):
+    """
+    ThreadPoolExecutor wrapper that is replaced once too many abandoned
+    requests still occupy its workers.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        thread_name_prefix: str,
+        max_abandoned: Optional[int] = None,
+    ):
+        """Initialize the worker pool.
+
+        Args:
+            max_workers: Worker threads per executor
+            thread_name_prefix: Thread name prefix
+            max_abandoned: Abandoned requests still running that retire the
+                executor (default: half the workers, at least 1)
+        """
+        super().__init__()
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self.max_abandoned = max(
+            1, max_abandoned if max_abandoned is not None else max_workers // 2
+        )
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._abandoned: Set[Future] = set()
+        self._lock = threading.Lock()
+        self.abandoned_count = 0
+        self.retired_pools = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=self.thread_name_prefix
+            )
+        return self._executor
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Run a blocking call on a worker.
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments
+
+        Returns:
+            Future of the call
+        """
+        return self._get_executor().submit(fn, *args)
+
+    def abandon(self, future: Future) -> None:
+        """Give up on a request; retire the executor if too many are still running.
+
+        Args:
+            future: Future returned by submit
+        """
+        # Queued requests never start; finished ones hold no worker
+        if future.cancel() or future.done():
+            return
+
+        with self._lock:
+            self._abandoned.add(future)
+            self.abandoned_count += 1
+            retire = len(self._abandoned) >= self.max_abandoned
+            if retire:
+                executor, self._executor = self._executor, None
+                stuck = len(self._abandoned)
+                self._abandoned = set()
+                self.retired_pools += 1
+        future.add_done_callback(self._release)
+
+        if retire and executor is not None:
+            self.logger.warning(
+                f"{self.thread_name_prefix}: {stuck} abandoned requests still running, "
+                f"replacing the worker pool"
+            )
+            executor.shutdown(wait=False)
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self._abandoned.discard(future)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get abandoned-request statistics."""
+        with self._lock:
+            abandoned_in_flight = len(self._abandoned)
+        return {
+            "abandoned_in_flight": abandoned_in_flight,
+            "abandoned_total": self.abandoned_count,
+            "retired_pools": self.retired_pools,
+        }
+
+    def shutdown(self) -> None:
+        """Shut down the current executor without waiting for abandoned requests."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._abandoned = set()
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -10,6 +10,7 @@ from .executors import (
     MomentumExecutor,
     SentimentExecutor,
 )
+from .fill_store import FillStore
 from .multi_strategy import MultiStrategyExecutor
 from .order_manager import Fill, Order, OrderManager, OrderSide, OrderStatus, OrderType
 
@@ -21,6 +22,7 @@ __all__ = [
     "OrderType",
     "OrderSide",
     "OrderStatus",
+    "FillStore",
     # Executors
     "BaseExecutor",
     "MomentumExecutor",
@@ -7,6 +7,11 @@ This module manages all exit logic including:
 - Trailing stops (ATR-based)
 - Time-based exits
 - Profit ladder exits
+
+All open positions are evaluated together: position metadata is loaded once
+per pass and the stop/target/time/ladder conditions are computed as NumPy
+array operations, so a cycle costs one state-store read however many
+positions are open.
 """
 
 from typing import Dict, List, Any, Optional
@@ -14,6 +19,8 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 import logging
 
+import numpy as np
+
 from ..core.money import D, q_money
 from ..core.decimal_money import to_decimal, format_currency
 
@@ -105,10 +112,9 @@ class ExitManager:
         Returns:
             List of ExitCondition objects for positions that should exit
         """
-        exits = []
-        
+        # Positions that can be evaluated: non-zero size, known entry and price
+        symbols, quantities, entry_prices, prices = [], [], [], []
         for symbol, position in positions.items():
-            # Get position details
             quantity = float(position.get("quantity", 0))
             entry_price = float(position.get("entry_price", 0))
             current_price = current_prices.get(symbol)
@@ -116,80 +122,114 @@ class ExitManager:
             if quantity == 0 or entry_price == 0 or current_price is None:
                 continue
             
-            # Get position metadata from state store
-            metadata = {}
-            if state_store and session_id:
-                try:
-                    db_positions = state_store.get_positions(session_id)
-                    for pos in db_positions:
-                        if pos["symbol"] == symbol:
-                            metadata = pos.get("metadata", {})
-                            break
-                except:
-                    pass
+            symbols.append(symbol)
+            quantities.append(quantity)
+            entry_prices.append(entry_price)
+            prices.append(float(current_price))
+        
+        if not symbols:
+            return []
+        
+        metadata_by_symbol = self._load_position_metadata(state_store, session_id)
+        
+        # Stop loss / take profit from metadata, NaN where the default applies
+        stop_losses = np.full(len(symbols), np.nan)
+        take_profits = np.full(len(symbols), np.nan)
+        hours_held = np.full(len(symbols), np.nan)
+        now = datetime.now()
+        for i, symbol in enumerate(symbols):
+            metadata = metadata_by_symbol.get(symbol, {})
+            if metadata.get("stop_loss"):
+                stop_losses[i] = float(metadata["stop_loss"])
+            if metadata.get("take_profit"):
+                take_profits[i] = float(metadata["take_profit"])
             
             # Get entry timestamp
             entry_time_str = metadata.get("entry_time") or metadata.get("timestamp")
-            entry_time = None
             if entry_time_str:
                 try:
                     entry_time = datetime.fromisoformat(entry_time_str)
-                except:
+                    hours_held[i] = (now - entry_time).total_seconds() / 3600
+                except (TypeError, ValueError):
                     pass
-            
-            # Get stop loss and take profit from metadata or calculate defaults
-            stop_loss = metadata.get("stop_loss")
-            take_profit = metadata.get("take_profit")
-            
-            if not stop_loss:
-                # Default: 2% stop loss
-                if quantity > 0:  # Long position
-                    stop_loss = entry_price * 0.98
-                else:  # Short position
-                    stop_loss = entry_price * 1.02
-            
-            if not take_profit:
-                # Default: 4% take profit (2:1 R:R)
-                if quantity > 0:  # Long position
-                    take_profit = entry_price * 1.04
-                else:  # Short position
-                    take_profit = entry_price * 0.96
-            
-            # Check stop loss
-            exit_check = self._check_stop_loss(
-                symbol, quantity, entry_price, current_price, stop_loss
-            )
-            if exit_check.should_exit:
-                exits.append(exit_check)
-                continue  # Don't check other exits if stop hit
-            
-            # Check take profit
-            exit_check = self._check_take_profit(
-                symbol, quantity, entry_price, current_price, take_profit
-            )
-            if exit_check.should_exit:
-                exits.append(exit_check)
-                continue
-            
-            # Check time-based exit
-            if entry_time:
-                exit_check = self._check_time_exit(
-                    symbol, quantity, current_price, entry_time
+        
+        quantity = np.array(quantities)
+        entry_price = np.array(entry_prices)
+        price = np.array(prices)
+        is_long = quantity > 0
+        
+        # Defaults: 2% stop loss and 4% take profit (2:1 R:R)
+        stop_loss = np.where(
+            np.isnan(stop_losses), np.where(is_long, entry_price * 0.98, entry_price * 1.02), stop_losses
+        )
+        take_profit = np.where(
+            np.isnan(take_profits), np.where(is_long, entry_price * 1.04, entry_price * 0.96), take_profits
+        )
+        
+        # Each position takes the first condition hit: stop, target, time, ladder
+        stop_hit = np.where(is_long, price <= stop_loss, price >= stop_loss)
+        target_hit = ~stop_hit & np.where(is_long, price >= take_profit, price <= take_profit)
+        with np.errstate(invalid="ignore"):
+            time_hit = ~stop_hit & ~target_hit & (hours_held >= self.time_stop_hours)
+        
+        profit_pct = np.where(
+            is_long,
+            ((price - entry_price) / entry_price) * 100,
+            ((entry_price - price) / entry_price) * 100,
+        )
+        ladder_reached = np.zeros(len(symbols), dtype=bool)
+        if self.tp_ladders:
+            lowest_level = min(ladder["profit_pct"] for ladder in self.tp_ladders)
+            ladder_reached = ~stop_hit & ~target_hit & ~time_hit & (profit_pct >= lowest_level)
+        
+        # Build the conditions (and log) only for the positions that hit one
+        exits = []
+        for i in np.flatnonzero(stop_hit | target_hit | time_hit | ladder_reached):
+            symbol = symbols[i]
+            if stop_hit[i]:
+                exit_check = self._check_stop_loss(
+                    symbol, quantities[i], entry_prices[i], prices[i], float(stop_loss[i])
+                )
+            elif target_hit[i]:
+                exit_check = self._check_take_profit(
+                    symbol, quantities[i], entry_prices[i], prices[i], float(take_profit[i])
+                )
+            elif time_hit[i]:
+                exit_check = self._time_exit(symbol, quantities[i], prices[i], float(hours_held[i]))
+            else:
+                # Partial exit, unless every reached level was already taken
+                exit_check = self._check_profit_ladder(
+                    symbol, quantities[i], entry_prices[i], prices[i]
                 )
-                if exit_check.should_exit:
-                    exits.append(exit_check)
-                    continue
-            
-            # Check profit ladder (partial exits)
-            exit_check = self._check_profit_ladder(
-                symbol, quantity, entry_price, current_price
-            )
             if exit_check.should_exit:
                 exits.append(exit_check)
-                # Note: Don't continue - can still check other exits
         
         return exits
     
+    @staticmethod
+    def _load_position_metadata(state_store, session_id: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        """Load metadata for every open position in one state store read.
+        
+        Args:
+            state_store: State store for position metadata (optional)
+            session_id: Current session ID
+            
+        Returns:
+            Dictionary mapping symbol to position metadata (first row per symbol)
+        """
+        metadata_by_symbol: Dict[str, Dict[str, Any]] = {}
+        if not (state_store and session_id):
+            return metadata_by_symbol
+        
+        try:
+            for pos in state_store.get_positions(session_id):
+                metadata = pos.get("metadata")
+                metadata_by_symbol.setdefault(pos["symbol"], metadata if isinstance(metadata, dict) else {})
+        except Exception as e:
+            logger.debug(f"Could not load position metadata for exits: {e}")
+        
+        return metadata_by_symbol
+    
     def _check_stop_loss(
         self,
         symbol: str,
@@ -270,20 +310,30 @@ class ExitManager:
         hours_held = time_in_position.total_seconds() / 3600
         
         if hours_held >= self.time_stop_hours:
-            logger.info(
-                f"TIME_STOP_HIT: {symbol} held for {hours_held:.1f}h >= {self.time_stop_hours}h"
-            )
-            return ExitCondition(
-                symbol=symbol,
-                should_exit=True,
-                reason=f"time_stop_{hours_held:.1f}h",
-                exit_price=current_price,
-                quantity=quantity,
-                exit_percentage=1.0
-            )
+            return self._time_exit(symbol, quantity, current_price, hours_held)
         
         return ExitCondition(symbol, False, "time_not_exceeded")
     
+    def _time_exit(
+        self,
+        symbol: str,
+        quantity: float,
+        current_price: float,
+        hours_held: float
+    ) -> ExitCondition:
+        """Build the exit for a position held past the time limit."""
+        logger.info(
+            f"TIME_STOP_HIT: {symbol} held for {hours_held:.1f}h >= {self.time_stop_hours}h"
+        )
+        return ExitCondition(
+            symbol=symbol,
+            should_exit=True,
+            reason=f"time_stop_{hours_held:.1f}h",
+            exit_price=current_price,
+            quantity=quantity,
+            exit_percentage=1.0
+        )
+    
     def _check_profit_ladder(
         self,
         symbol: str,
@@ -0,0 +1,143 @@
+"""
+Bounded, indexed in-memory store for order fills.
+
+FillStore keeps the most recent fills in arrival order together with an
+order_id -> fills index, so looking up an order's fills does not scan the
+history. Running totals (count, fees and notional, overall and per side)
+cover every fill ever added, including those no longer held. When the store
+grows past ``max_fills`` the oldest fills are evicted in one batch and handed
+to an optional spill callback (the OrderManager archives them in the trade
+ledger), so a multi-day session keeps a constant memory footprint.
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set
+
+from ..core.logging_utils import LoggerMixin
+
+
+class FillStore(LoggerMixin):
+    """
+    Recent fills with an order index, running totals and bounded retention.
+    """
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        spill: Optional[Callable[[List[Any]], None]] = None,
+    ):
+        """Initialize the fill store.
+
+        Args:
+            config: Retention settings (``execution.order_history``): max_fills,
+                spill_batch
+            spill: Called with each batch of evicted fills (optional)
+        """
+        super().__init__()
+        self.config = config or {}
+        # Fills kept in memory; 0 keeps every fill
+        self.max_fills = self.config.get("max_fills", 10000)
+        # Fills evicted at once when max_fills is exceeded
+        self.spill_batch = max(1, self.config.get("spill_batch", max(1, self.max_fills // 10)))
+        self.spill = spill
+
+        self._fills: Deque[Any] = deque()
+        self._by_order: Dict[str, Deque[Any]] = {}
+        # Orders still held whose oldest fills were already evicted
+        self._partially_evicted: Set[str] = set()
+
+        self.total_count = 0
+        self.total_fees = 0.0
+        self.total_notional = 0.0
+        self.by_side: Dict[str, Dict[str, float]] = {}
+        self.evicted_count = 0
+        self.spill_failures = 0
+
+    def add(self, fill: Any) -> None:
+        """Add a fill, evicting the oldest batch if the store is full.
+
+        Args:
+            fill: Fill with order_id, side, quantity, price and fees
+        """
+        self._fills.append(fill)
+        self._by_order.setdefault(fill.order_id, deque()).append(fill)
+
+        notional = abs(fill.quantity * fill.price)
+        side = getattr(fill.side, "value", fill.side)
+        totals = self.by_side.setdefault(side, {"count": 0, "fees": 0.0, "notional": 0.0})
+        totals["count"] += 1
+        totals["fees"] += fill.fees
+        totals["notional"] += notional
+        self.total_count += 1
+        self.total_fees += fill.fees
+        self.total_notional += notional
+
+        if self.max_fills and len(self._fills) > self.max_fills:
+            self._evict(len(self._fills) - self.max_fills + self.spill_batch - 1)
+
+    def _evict(self, count: int) -> None:
+        """Drop the oldest fills and hand them to the spill callback."""
+        count = min(count, len(self._fills))
+        evicted = [self._fills.popleft() for _ in range(count)]
+        for fill in evicted:
+            # Fills of one order arrive in order, so the oldest is in front
+            order_fills = self._by_order.get(fill.order_id)
+            if order_fills:
+                order_fills.popleft()
+                if order_fills:
+                    self._partially_evicted.add(fill.order_id)
+                else:
+                    del self._by_order[fill.order_id]
+                    self._partially_evicted.discard(fill.order_id)
+        self.evicted_count += count
+
+        if self.spill is not None:
+            try:
+                self.spill(evicted)
+            except Exception as e:
+                self.spill_failures += 1
+                self.logger.warning(f"Failed to spill {count} fills: {e}")
+        self.logger.debug(f"FILL_STORE: evicted {count} fills, {len(self._fills)} kept")
+
+    def get(self, order_id: str) -> List[Any]:
+        """Fills of one order still held in memory.
+
+        Args:
+            order_id: Order ID
+
+        Returns:
+            Fills in arrival order (empty if none are held)
+        """
+        return list(self._by_order.get(order_id, ()))
+
+    def has_order(self, order_id: str) -> bool:
+        """Whether any fill of the order is held in memory."""
+        return order_id in self._by_order
+
+    def has_evicted_fills(self, order_id: str) -> bool:
+        """Whether an order held in memory already lost its oldest fills to eviction."""
+        return order_id in self._partially_evicted
+
+    def all(self) -> List[Any]:
+        """All fills held in memory, oldest first."""
+        return list(self._fills)
+
+    def __len__(self) -> int:
+        return len(self._fills)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._fills)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get running totals and retention statistics."""
+        return {
+            "total_fills": self.total_count,
+            "total_fees": self.total_fees,
+            "total_notional": self.total_notional,
+            "by_side": {side: dict(totals) for side, totals in self.by_side.items()},
+            "retained_fills": len(self._fills),
+            "retained_orders": len(self._by_order),
+            "evicted_fills": self.evicted_count,
+            "spill_failures": self.spill_failures,
+            "max_fills": self.max_fills,
+        }
@@ -15,6 +15,7 @@ from ..core.decimal_money import to_decimal
 from ..risk.risk_manager import ExitAction
 from ..connectors import BaseConnector, FeeInfo
 from .order_builder import OrderBuilder
+from .fill_store import FillStore
 from ..analytics.pnl_logger import get_pnl_logger
 from .fee_slippage import FeeSlippageCalculator
 
@@ -51,6 +52,14 @@ class OrderStatus(Enum):
     EXPIRED = "expired"
 
 
+TERMINAL_ORDER_STATUSES = (
+    OrderStatus.FILLED,
+    OrderStatus.CANCELLED,
+    OrderStatus.REJECTED,
+    OrderStatus.EXPIRED,
+)
+
+
 @dataclass
 class Order:
     """Order data structure."""
@@ -134,11 +143,11 @@ class OrderManager(LoggerMixin):
         if "risk" in self.config:
             try:
                 from crypto_mvp.risk.stop_models import StopModel
-                from crypto_mvp.indicators.atr_service import ATRService
+                from crypto_mvp.indicators.atr_service import get_atr_service
                 
-                # Create ATR service
+                # Shared ATR service: one cached ATR per symbol for all consumers
                 atr_config = self.config.get("risk", {}).get("sl_tp", {})
-                atr_service = ATRService(atr_config)
+                atr_service = get_atr_service(atr_config)
                 
                 # Create stop model
                 self.stop_model = StopModel(self.config, atr_service)
@@ -185,9 +194,17 @@ class OrderManager(LoggerMixin):
             "liquidity_factor", 0.95
         )  # 95% fill probability
 
-        # Order tracking
+        # Order tracking. Fills live in an indexed store; both fills and
+        # finished orders are bounded by execution.order_history
+        history_config = self.config.get("order_history", {})
+        # Orders kept in memory; beyond this the oldest finished ones are evicted
+        self.max_orders = history_config.get("max_orders", 1000)
+        # Archive evicted fills in the trade ledger (once set_trade_ledger is called)
+        self.spill_to_ledger = history_config.get("spill_to_ledger", True)
+        self.trade_ledger = None
         self.orders: dict[str, Order] = {}
-        self.fills: list[Fill] = []
+        self.fill_store = FillStore(history_config, spill=self._spill_fills)
+        self.evicted_orders_by_status: dict[str, int] = {}
         self.order_counter = 0
         
         # Order builder for precision quantization
@@ -837,6 +854,67 @@ class OrderManager(LoggerMixin):
         self.session_id = session_id
         self.logger.debug(f"OrderManager session ID set to: {session_id}")
 
+    def set_trade_ledger(self, trade_ledger) -> None:
+        """Set the trade ledger that archives fills evicted from memory.
+
+        Args:
+            trade_ledger: TradeLedger instance
+        """
+        self.trade_ledger = trade_ledger
+        self.logger.info("Trade ledger set on order manager for fill archiving")
+
+    @property
+    def fills(self) -> list[Fill]:
+        """Fills held in memory, oldest first."""
+        return self.fill_store.all()
+
+    def _spill_fills(self, fills: list[Fill]) -> None:
+        """Archive fills evicted from the fill store in the trade ledger."""
+        if not self.spill_to_ledger or self.trade_ledger is None:
+            return
+        records = [
+            {
+                "order_id": fill.order_id,
+                "session_id": self.session_id,
+                "symbol": fill.symbol,
+                "side": fill.side.value,
+                "quantity": fill.quantity,
+                "price": fill.price,
+                "fees": fill.fees,
+                "strategy": fill.strategy,
+                "executed_at": fill.timestamp,
+                "mark_price": fill.mark_price,
+                "slippage_bps": fill.slippage_bps,
+                "slippage_cost": fill.slippage_cost,
+                "fee_bps": fill.fee_bps,
+                "is_maker": fill.is_maker,
+                "metadata": fill.metadata,
+            }
+            for fill in fills
+        ]
+        if not self.trade_ledger.archive_order_fills(records):
+            raise RuntimeError("trade ledger rejected the fill archive batch")
+
+    def _evict_orders(self) -> None:
+        """Evict the oldest finished orders once more than max_orders are held.
+
+        Evicts down to three quarters of max_orders so the scan runs once per
+        max_orders / 4 new orders. Open orders are never evicted.
+        """
+        if not self.max_orders or len(self.orders) <= self.max_orders:
+            return
+        excess = len(self.orders) - (self.max_orders * 3) // 4
+        evicted = []
+        for order_id, order in self.orders.items():
+            if len(evicted) >= excess:
+                break
+            if order.status in TERMINAL_ORDER_STATUSES:
+                evicted.append(order_id)
+        for order_id in evicted:
+            status = self.orders.pop(order_id).status.value
+            self.evicted_orders_by_status[status] = self.evicted_orders_by_status.get(status, 0) + 1
+        self.logger.debug(f"ORDER_HISTORY: evicted {len(evicted)} finished orders, {len(self.orders)} kept")
+
     def set_state_store(self, state_store) -> None:
         """Set the state store for session cash management.
         
@@ -1250,6 +1328,7 @@ class OrderManager(LoggerMixin):
 
         # Store order
         self.orders[order_id] = order
+        self._evict_orders()
 
         self.logger.debug(
             f"Created order {order_id}: {side.value} {quantity} {symbol} @ {validated_price}"
@@ -1624,7 +1703,7 @@ class OrderManager(LoggerMixin):
             order.fees = fees
 
             # Store fill
-            self.fills.append(fill)
+            self.fill_store.add(fill)
 
             self.logger.info(
                 f"Order {order.id} filled: {order.quantity} {order.symbol} @ {fill_price:.4f} fees=${fees:.4f}"
@@ -1719,35 +1798,70 @@ class OrderManager(LoggerMixin):
     def get_fills(self, order_id: Optional[str] = None) -> list[Fill]:
         """Get fills for an order or all fills.
 
+        Fills of an order that were evicted from memory are read back from
+        the trade ledger archive and merged ahead of those still held.
+
         Args:
             order_id: Order ID (optional)
 
         Returns:
-            List of fills
+            List of fills (all fills: those held in memory)
         """
         if order_id:
-            return [fill for fill in self.fills if fill.order_id == order_id]
-        return self.fills.copy()
+            held = self.fill_store.get(order_id)
+            if self.trade_ledger is None or (
+                held and not self.fill_store.has_evicted_fills(order_id)
+            ):
+                return held
+            archived = [
+                Fill(
+                    order_id=record["order_id"],
+                    symbol=record["symbol"],
+                    side=OrderSide(record["side"]),
+                    quantity=record["quantity"],
+                    price=record["price"],
+                    fees=record["fees"],
+                    timestamp=datetime.fromisoformat(record["executed_at"]),
+                    strategy=record["strategy"] or "",
+                    metadata=record["metadata"],
+                    mark_price=record["mark_price"],
+                    slippage_bps=record["slippage_bps"],
+                    slippage_cost=record["slippage_cost"],
+                    fee_bps=record["fee_bps"],
+                    is_maker=record["is_maker"],
+                )
+                for record in self.trade_ledger.get_order_fills(order_id)
+            ]
+            return archived + held
+        return self.fill_store.all()
 
     def get_order_summary(self) -> dict[str, Any]:
         """Get order manager summary.
 
+        Counts and totals include orders and fills already evicted from memory.
+
         Returns:
             Order manager summary
         """
-        total_orders = len(self.orders)
-        filled_orders = len(
-            [o for o in self.orders.values() if o.status == OrderStatus.FILLED]
-        )
-        total_fills = len(self.fills)
-        total_fees = sum(fill.fees for fill in self.fills)
+        orders_by_status = dict(self.evicted_orders_by_status)
+        for order in self.orders.values():
+            status = order.status.value
+            orders_by_status[status] = orders_by_status.get(status, 0) + 1
+        total_orders = sum(orders_by_status.values())
+        filled_orders = orders_by_status.get(OrderStatus.FILLED.value, 0)
+        fill_stats = self.fill_store.get_stats()
 
         return {
             "total_orders": total_orders,
             "filled_orders": filled_orders,
             "pending_orders": total_orders - filled_orders,
-            "total_fills": total_fills,
-            "total_fees": total_fees,
+            "orders_by_status": orders_by_status,
+            "total_fills": fill_stats["total_fills"],
+            "total_fees": fill_stats["total_fees"],
+            "total_notional": fill_stats["total_notional"],
+            "fills_by_side": fill_stats["by_side"],
+            "retained_orders": len(self.orders),
+            "retained_fills": fill_stats["retained_fills"],
             "simulation_mode": self.simulate,
             "sandbox_mode": self.sandbox_mode,
             "maker_fee_bps": self.maker_fee_bps,
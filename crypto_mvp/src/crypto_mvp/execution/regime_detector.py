@@ -11,6 +11,7 @@ import math
 from typing import Optional, Dict, Any, Tuple, Callable
 import logging
 
+from ..core.candle_store import get_candle_store
 from ..core.logging_utils import LoggerMixin
 from ..indicators.technical_calculator import get_calculator
 
@@ -369,16 +370,17 @@ class RegimeDetector(LoggerMixin):
         if (atr_current is None or atr_sma is None) and data_engine:
             calculator = get_calculator()
             try:
-                ohlcv = data_engine.get_ohlcv(symbol, "1h", limit=30)
-                if ohlcv and len(ohlcv) >= 5:
-                    parsed = calculator.parse_ohlcv(ohlcv)
+                parsed = get_candle_store().get_or_fetch(
+                    symbol, "1h", 30, lambda: data_engine.get_ohlcv(symbol, "1h", limit=30)
+                )
+                if parsed and len(parsed["closes"]) >= 5:
                     
                     # Bootstrap current ATR
                     if atr_current is None:
                         atr_current = calculator.calculate_atr_with_fallback(
                             parsed["highs"], parsed["lows"], parsed["closes"], atr_period
                         )
-                        self.logger.info(f"ATR_BOOTSTRAP: {symbol} ATR={atr_current:.4f} (from {len(ohlcv)} candles)")
+                        self.logger.info(f"ATR_BOOTSTRAP: {symbol} ATR={atr_current:.4f} (from {len(parsed['closes'])} candles)")
                     
                     # Use current ATR as proxy for SMA during warmup
                     if atr_sma is None and atr_current is not None:
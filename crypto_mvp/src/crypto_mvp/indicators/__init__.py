@@ -3,6 +3,17 @@ Technical indicators for cryptocurrency analysis.
 """
 
 from .technical_calculator import TechnicalCalculator, get_calculator
+from .incremental import (
+    IncrementalIndicatorEngine,
+    batch_atr,
+    batch_ema,
+    batch_macd,
+    batch_rsi,
+    batch_williams_r,
+    get_indicator_engine,
+    rolling_batch,
+)
+from .regime_features import RegimeFeatureFeed
 
 # Lazy imports to avoid pandas/numpy compatibility issues
 def get_advanced_indicators():
@@ -23,6 +34,15 @@ def validate_ohlcv_inputs(*args, **kwargs):
 __all__ = [
     "TechnicalCalculator",
     "get_calculator",
+    "IncrementalIndicatorEngine",
+    "get_indicator_engine",
+    "batch_rsi",
+    "batch_ema",
+    "batch_macd",
+    "batch_atr",
+    "batch_williams_r",
+    "rolling_batch",
+    "RegimeFeatureFeed",
     "get_advanced_indicators",
     "safe_atr",
     "validate_ohlcv_inputs",
@@ -1,167 +1,329 @@
 """
 ATR (Average True Range) service for computing real ATR values from candle data.
+
+ATR values are cached per (symbol, timeframe, period) until the candle they
+were computed on closes, so every consumer in a cycle (stop model, OCO levels,
+exit checks) shares one computation. Candles come from the cycle candle store,
+so computing an ATR never re-fetches candles a strategy already loaded.
 """
 
-import pandas as pd
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
 import numpy as np
-from typing import Optional, Dict, Any
+
+from crypto_mvp.core.candle_store import get_candle_store
 from crypto_mvp.core.logging_utils import LoggerMixin
 
+# Global ATR service instance shared by all ATR consumers
+_atr_service = None
+
+TIMEFRAME_SECONDS = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+}
+
+ATRKey = Tuple[str, str, int]
+
+
+def wilder_atr(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int) -> Optional[float]:
+    """Latest ATR with Wilder's smoothing over the given candles.
+
+    Args:
+        highs: High prices, oldest first
+        lows: Low prices, oldest first
+        closes: Close prices, oldest first
+        period: ATR period
+
+    Returns:
+        ATR value, or None with fewer than period + 1 candles or a non-positive result
+    """
+    if len(closes) < period + 1:
+        return None
+
+    # True Range is the maximum of high - low, |high - previous close| and
+    # |low - previous close|; the first candle has no previous close
+    prev_close = closes[:-1]
+    true_range = np.maximum(
+        highs[1:] - lows[1:],
+        np.maximum(np.abs(highs[1:] - prev_close), np.abs(lows[1:] - prev_close)),
+    )
+
+    # Wilder's smoothing: exponential average with alpha = 1 / period
+    alpha = 1.0 / period
+    atr = float(true_range[0])
+    for value in true_range[1:]:
+        atr = (1.0 - alpha) * atr + alpha * float(value)
+
+    if not np.isfinite(atr) or atr <= 0:
+        return None
+    return atr
+
 
 class ATRService(LoggerMixin):
     """
     Service for computing ATR values from OHLCV candle data.
-    
+
     Features:
     - Real ATR computation from last N candles
     - Fallback handling when candles unavailable
-    - Caching for performance
-    - Comprehensive logging
+    - Cache keyed by (symbol, timeframe, period), invalidated when a new
+      candle closes (and optionally after a TTL); unavailable ATRs are only
+      remembered for a short failure TTL so a transient fetch error is retried
+    - Hit/miss statistics
     """
-    
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
         """Initialize the ATR service.
-        
+
         Args:
             config: Configuration dictionary with ATR settings
+            clock: Wall clock in epoch seconds (injectable for tests)
         """
         super().__init__()
         self.config = config or {}
-        
+        self.clock = clock
+
         # ATR parameters
         self.atr_period = self.config.get("atr_period", 14)
-        self.cache = {}  # Simple cache for ATR values
-        
-        self.logger.info(f"ATRService initialized with period={self.atr_period}")
-    
+        self.timeframe = self.config.get("atr_timeframe", "1h")
+        # 0 = keep values until their candle closes
+        self.ttl_seconds = self.config.get("atr_cache_ttl_seconds", 0)
+        # How long an unavailable ATR (failed fetch, too few candles) is
+        # remembered before it is retried (0 = retry on every call)
+        self.failure_ttl_seconds = self.config.get("atr_failure_ttl_seconds", 5)
+
+        # (symbol, timeframe, period) -> (atr value or None, expires at)
+        self.cache: Dict[ATRKey, Tuple[Optional[float], float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self.logger.info(
+            f"ATRService initialized with period={self.atr_period}, timeframe={self.timeframe}"
+        )
+
     def get_atr(
-        self, 
-        symbol: str, 
+        self,
+        symbol: str,
         data_engine: Optional[Any] = None,
-        period: Optional[int] = None
+        period: Optional[int] = None,
+        timeframe: Optional[str] = None
     ) -> Optional[float]:
         """
         Get ATR value for a symbol.
-        
+
         Args:
             symbol: Trading symbol
             data_engine: Data engine instance for fetching candles
             period: ATR period (overrides default)
-            
+            timeframe: Candle timeframe (overrides default)
+
         Returns:
             ATR value or None if unavailable
         """
         if period is None:
             period = self.atr_period
-        
-        # Try to get real ATR from data engine (don't use cache for fresh data)
-        atr_value = self._compute_atr_from_candles(symbol, data_engine, period)
-        
+        if timeframe is None:
+            timeframe = self.timeframe
+
+        key = (symbol, timeframe, period)
+        now = self.clock()
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is not None and now < entry[1]:
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        atr_value = self._compute_atr_from_candles(symbol, data_engine, period, timeframe)
+
         if atr_value is not None:
             self.logger.debug(f"ATR for {symbol} (period={period}): {atr_value:.6f}")
         else:
             self.logger.debug(f"ATR unavailable for {symbol} (period={period})")
-            
+
+        # Without a data engine nothing was looked up, so there is nothing to remember
+        if data_engine:
+            if atr_value is not None:
+                expires_at = self._expires_at(now, timeframe)
+            else:
+                expires_at = min(self._expires_at(now, timeframe), now + self.failure_ttl_seconds)
+            if expires_at > now:
+                with self._lock:
+                    self.cache[key] = (atr_value, expires_at)
+
         return atr_value
-    
+
+    def get_atrs(
+        self,
+        symbols: Iterable[str],
+        data_engine: Optional[Any] = None,
+        period: Optional[int] = None,
+        timeframe: Optional[str] = None
+    ) -> Dict[str, Optional[float]]:
+        """
+        Get ATR values for several symbols.
+
+        Args:
+            symbols: Trading symbols
+            data_engine: Data engine instance for fetching candles
+            period: ATR period (overrides default)
+            timeframe: Candle timeframe (overrides default)
+
+        Returns:
+            Dictionary mapping symbol to ATR value (None if unavailable)
+        """
+        return {
+            symbol: self.get_atr(symbol, data_engine, period, timeframe)
+            for symbol in symbols
+        }
+
+    def get_cached_atr(
+        self,
+        symbol: str,
+        period: Optional[int] = None,
+        timeframe: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Get a still-valid cached ATR without fetching candles.
+
+        Args:
+            symbol: Trading symbol
+            period: ATR period (overrides default)
+            timeframe: Candle timeframe (overrides default)
+
+        Returns:
+            Cached ATR value, or None if nothing valid is cached
+        """
+        key = (symbol, timeframe or self.timeframe, period or self.atr_period)
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is not None and self.clock() < entry[1]:
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            return None
+
+    def _expires_at(self, now: float, timeframe: str) -> float:
+        """When a value computed at now goes stale: the next candle close, or the TTL."""
+        step = TIMEFRAME_SECONDS.get(timeframe, TIMEFRAME_SECONDS["1h"])
+        expires_at = (now // step + 1) * step
+        if self.ttl_seconds:
+            expires_at = min(expires_at, now + self.ttl_seconds)
+        return expires_at
+
     def _compute_atr_from_candles(
-        self, 
-        symbol: str, 
-        data_engine: Optional[Any], 
-        period: int
+        self,
+        symbol: str,
+        data_engine: Optional[Any],
+        period: int,
+        timeframe: Optional[str] = None
     ) -> Optional[float]:
         """
         Compute ATR from OHLCV candle data.
-        
+
         Args:
             symbol: Trading symbol
             data_engine: Data engine instance
             period: ATR period
-            
+            timeframe: Candle timeframe
+
         Returns:
             ATR value or None if computation fails
         """
         if not data_engine:
             return None
-            
+        if timeframe is None:
+            timeframe = self.timeframe
+
         try:
-            # Get OHLCV data - need at least period + 1 candles for ATR
-            candles = data_engine.get_ohlcv(symbol, limit=period + 10)
-            
-            if not candles or len(candles) < period + 1:
-                self.logger.debug(f"Insufficient candles for ATR: {len(candles) if candles else 0} < {period + 1}")
-                return None
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(candles, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            
-            # Ensure we have numeric data
-            for col in ['high', 'low', 'close']:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-            
-            # Remove any rows with NaN values
-            df = df.dropna(subset=['high', 'low', 'close'])
-            
-            if len(df) < period + 1:
-                self.logger.debug(f"Insufficient valid candles for ATR: {len(df)} < {period + 1}")
+            # Get OHLCV data - need at least period + 1 candles for ATR. The
+            # cycle candle store serves them from a strategy's larger window.
+            limit = period + 10
+            candles = get_candle_store().get_or_fetch(
+                symbol, timeframe, limit,
+                lambda: data_engine.get_ohlcv(symbol, timeframe, limit=limit),
+            )
+
+            count = len(candles["closes"]) if candles else 0
+            if count < period + 1:
+                self.logger.debug(f"Insufficient candles for ATR: {count} < {period + 1}")
                 return None
-            
-            # Calculate True Range (TR)
-            high = df['high']
-            low = df['low']
-            close = df['close']
-            
-            # True Range is the maximum of:
-            # 1. High - Low
-            # 2. |High - Previous Close|
-            # 3. |Low - Previous Close|
-            high_low = high - low
-            high_close_prev = np.abs(high - close.shift(1))
-            low_close_prev = np.abs(low - close.shift(1))
-            
-            true_range = np.maximum(high_low, np.maximum(high_close_prev, low_close_prev))
-            
-            # Calculate ATR using Wilder's smoothing (exponential moving average)
-            atr = true_range.ewm(alpha=1.0/period, adjust=False).mean()
-            
-            # Return the most recent ATR value
-            atr_value = atr.iloc[-1]
-            
-            if pd.isna(atr_value) or atr_value <= 0:
-                self.logger.debug(f"Invalid ATR value: {atr_value}")
+
+            # Remove any rows with non-numeric values
+            highs, lows, closes = candles["highs"], candles["lows"], candles["closes"]
+            valid = np.isfinite(highs) & np.isfinite(lows) & np.isfinite(closes)
+            if not valid.all():
+                highs, lows, closes = highs[valid], lows[valid], closes[valid]
+
+            if len(closes) < period + 1:
+                self.logger.debug(f"Insufficient valid candles for ATR: {len(closes)} < {period + 1}")
                 return None
-                
-            return float(atr_value)
-            
+
+            atr_value = wilder_atr(highs, lows, closes, period)
+            if atr_value is None:
+                self.logger.debug(f"Invalid ATR value for {symbol}")
+            return atr_value
+
         except Exception as e:
             self.logger.error(f"Error computing ATR for {symbol}: {e}")
             return None
-    
+
     def clear_cache(self, symbol: Optional[str] = None):
         """Clear ATR cache.
-        
+
         Args:
             symbol: Specific symbol to clear, or None to clear all
         """
-        if symbol:
-            # Clear cache for specific symbol
-            keys_to_remove = [key for key in self.cache.keys() if key.startswith(f"{symbol}_")]
-            for key in keys_to_remove:
-                del self.cache[key]
-            self.logger.debug(f"Cleared ATR cache for {symbol}")
-        else:
-            # Clear all cache
-            self.cache.clear()
-            self.logger.debug("Cleared all ATR cache")
-    
+        with self._lock:
+            if symbol:
+                # Clear cache for specific symbol
+                for key in [key for key in self.cache if key[0] == symbol]:
+                    del self.cache[key]
+                self.logger.debug(f"Cleared ATR cache for {symbol}")
+            else:
+                # Clear all cache
+                self.cache.clear()
+                self.hits = 0
+                self.misses = 0
+                self.logger.debug("Cleared all ATR cache")
+
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
-        
+
         Returns:
             Dictionary with cache statistics
         """
-        return {
-            "cache_size": len(self.cache),
-            "cached_symbols": list(set(key.split('_')[0] for key in self.cache.keys())),
-            "cache_keys": list(self.cache.keys())
-        }
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "cache_size": len(self.cache),
+                "cached_symbols": sorted({key[0] for key in self.cache}),
+                "cache_keys": [f"{symbol}_{timeframe}_{period}" for symbol, timeframe, period in self.cache],
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+def get_atr_service(config: Optional[Dict[str, Any]] = None) -> ATRService:
+    """Get the global ATR service instance.
+
+    Args:
+        config: ATR settings, used only when the instance is first created
+    """
+    global _atr_service
+    if _atr_service is None:
+        _atr_service = ATRService(config)
+    return _atr_service
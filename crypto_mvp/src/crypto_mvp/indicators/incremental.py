@@ -0,0 +1,644 @@
+"""
+Incremental (streaming) and batch (cross-symbol) indicator calculations.
+
+Two complements to TechnicalCalculator:
+
+- Batch functions (batch_rsi, batch_ema, batch_macd, batch_atr, batch_williams_r)
+  take 2-D arrays shaped (symbols, candles) and compute one indicator for every
+  symbol in a single vectorized pass. They reproduce the TechnicalCalculator
+  definitions exactly (up to float rounding); NaN marks insufficient data.
+
+- rolling_batch evaluates any batch function over the trailing window ending
+  at every candle of a history (backtests score the whole history at once).
+
+- IncrementalIndicatorEngine keeps streaming state per
+  (symbol, timeframe, indicator, period) and updates in O(1) per new candle.
+  The still-forming last candle can be revised every cycle: each stream keeps a
+  checkpoint of its state before the last candle and replays only that candle.
+"""
+
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Any, Callable, Optional, Sequence, Union
+
+import numpy as np
+
+# How often rolling sums are recomputed from their buffer to cancel float drift
+_RESUM_INTERVAL = 1024
+
+
+# ---------------------------------------------------------------------------
+# Batch (vectorized across symbols)
+# ---------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=64)
+def _ema_weights(length: int, period: int) -> np.ndarray:
+    """Weights w such that w @ values equals the SMA-seeded EMA of ``values``.
+
+    The EMA is seeded with the mean of the first ``period`` values and then
+    updated recursively, as in TechnicalCalculator._calculate_ema, so the final
+    value is a fixed linear combination of the inputs.
+    """
+    alpha = 2 / (period + 1)
+    decay = 1 - alpha
+    weights = np.empty(length)
+    weights[:period] = decay ** (length - period) / period
+    steps = np.arange(length - 1 - period, -1, -1)  # length-1-k for k >= period
+    weights[period:] = alpha * decay**steps
+    weights.flags.writeable = False
+    return weights
+
+
+@lru_cache(maxsize=32)
+def _macd_weights(length: int, fast: int, slow: int, signal: int) -> tuple[np.ndarray, np.ndarray]:
+    """Weights for the MACD line and signal line over a window of ``length``.
+
+    The MACD line series is EMA_fast - EMA_slow of every prefix from ``slow``
+    candles onward; the signal line is the SMA-seeded EMA of that series. Both
+    are linear in the closes, so they collapse to two weight vectors.
+    """
+    line = _ema_weights(length, fast) - _ema_weights(length, slow)
+
+    series_len = length - slow + 1
+    prefix_rows = np.zeros((series_len, length))
+    for j in range(series_len):
+        prefix = slow + j
+        prefix_rows[j, :prefix] = _ema_weights(prefix, fast) - _ema_weights(prefix, slow)
+
+    signal_weights = _ema_weights(series_len, signal) @ prefix_rows
+    line.flags.writeable = False
+    signal_weights.flags.writeable = False
+    return line, signal_weights
+
+
+def _as_2d(values: Any) -> np.ndarray:
+    return np.atleast_2d(np.asarray(values, dtype=float))
+
+
+def _nan_column(rows: int) -> np.ndarray:
+    return np.full(rows, np.nan)
+
+
+def batch_ema(values: np.ndarray, period: int) -> np.ndarray:
+    """SMA-seeded EMA of the full window for every row.
+
+    Args:
+        values: Array shaped (symbols, candles), most recent last
+        period: EMA period
+
+    Returns:
+        Array of EMA values per symbol (NaN if fewer than ``period`` candles)
+    """
+    values = _as_2d(values)
+    rows, length = values.shape
+    if length < period:
+        return _nan_column(rows)
+    return values @ _ema_weights(length, period)
+
+
+def batch_macd(
+    closes: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9
+) -> dict[str, np.ndarray]:
+    """MACD line, signal line and histogram for every row.
+
+    Args:
+        closes: Array shaped (symbols, candles), most recent last
+        fast: Fast EMA period
+        slow: Slow EMA period
+        signal: Signal line EMA period
+
+    Returns:
+        Dict with macd, signal and histogram arrays (NaN if insufficient data)
+    """
+    closes = _as_2d(closes)
+    rows, length = closes.shape
+    if length < slow + signal:
+        nan = _nan_column(rows)
+        return {"macd": nan, "signal": nan.copy(), "histogram": nan.copy()}
+
+    line_weights, signal_weights = _macd_weights(length, fast, slow, signal)
+    macd_line = closes @ line_weights
+    signal_line = closes @ signal_weights
+    return {"macd": macd_line, "signal": signal_line, "histogram": macd_line - signal_line}
+
+
+def batch_rsi(closes: np.ndarray, period: int = 14) -> np.ndarray:
+    """Simple-average RSI over the last ``period`` changes for every row.
+
+    Args:
+        closes: Array shaped (symbols, candles), most recent last
+        period: RSI period
+
+    Returns:
+        Array of RSI values (0-100) per symbol (NaN if insufficient data)
+    """
+    closes = _as_2d(closes)
+    rows, length = closes.shape
+    if length < period + 1:
+        return _nan_column(rows)
+
+    deltas = np.diff(closes[:, -(period + 1):], axis=1)
+    avg_gain = np.where(deltas > 0, deltas, 0).mean(axis=1)
+    avg_loss = np.where(deltas < 0, -deltas, 0).mean(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+    return np.where(avg_loss == 0, 100.0, rsi)
+
+
+def batch_atr(
+    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14
+) -> np.ndarray:
+    """Simple-average true range over the last ``period`` candles for every row.
+
+    Args:
+        highs: Array shaped (symbols, candles)
+        lows: Array shaped (symbols, candles)
+        closes: Array shaped (symbols, candles)
+        period: ATR period
+
+    Returns:
+        Array of ATR values per symbol (NaN if insufficient data)
+    """
+    highs, lows, closes = _as_2d(highs), _as_2d(lows), _as_2d(closes)
+    rows, length = closes.shape
+    if length < period + 1:
+        return _nan_column(rows)
+
+    window = slice(-period, None)
+    prev_close = closes[:, -(period + 1):-1]
+    high, low = highs[:, window], lows[:, window]
+    true_range = np.maximum(
+        high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close))
+    )
+    return true_range.mean(axis=1)
+
+
+def batch_williams_r(
+    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14
+) -> np.ndarray:
+    """Williams %R over the last ``period`` candles for every row.
+
+    Args:
+        highs: Array shaped (symbols, candles)
+        lows: Array shaped (symbols, candles)
+        closes: Array shaped (symbols, candles)
+        period: Lookback period
+
+    Returns:
+        Array of Williams %R values (-100 to 0) per symbol (NaN if insufficient data)
+    """
+    highs, lows, closes = _as_2d(highs), _as_2d(lows), _as_2d(closes)
+    rows, length = closes.shape
+    if length < period:
+        return _nan_column(rows)
+
+    highest = highs[:, -period:].max(axis=1)
+    lowest = lows[:, -period:].min(axis=1)
+    span = highest - lowest
+    with np.errstate(divide="ignore", invalid="ignore"):
+        williams = -100 * ((highest - closes[:, -1]) / span)
+    return np.where(span == 0, -50.0, williams)
+
+
+def rolling_batch(
+    fn: Callable[..., np.ndarray],
+    arrays: Sequence[np.ndarray],
+    window: int,
+    max_elements: int = 4_000_000,
+) -> np.ndarray:
+    """Apply a batch function to the trailing window ending at every candle.
+
+    Each (symbol, candle) pair becomes one row of a 2-D window matrix, so any of
+    the batch_* functions evaluates a whole history at once with exactly the
+    definition used on live windows. Candles are processed in chunks of at most
+    ``max_elements`` window values per input to bound memory.
+
+    Args:
+        fn: Batch function taking arrays shaped (rows, window) and returning one
+            value per row, e.g. batch_rsi or
+            ``lambda closes: batch_macd(closes)["histogram"]``
+        arrays: Input arrays shaped (symbols, candles)
+        window: Trailing window length passed to ``fn``
+        max_elements: Upper bound on window values materialized per chunk
+
+    Returns:
+        Array shaped (symbols, candles); NaN for candles with fewer than
+        ``window`` candles of history
+    """
+    arrays = [_as_2d(values) for values in arrays]
+    rows, length = arrays[0].shape
+    out = np.full((rows, length), np.nan)
+    count = length - window + 1
+    if count <= 0:
+        return out
+
+    views = [np.lib.stride_tricks.sliding_window_view(values, window, axis=1) for values in arrays]
+    chunk = max(max_elements // max(rows * window, 1), 1)
+    for start in range(0, count, chunk):
+        stop = min(start + chunk, count)
+        result = fn(*[view[:, start:stop].reshape(-1, window) for view in views])
+        out[:, window - 1 + start:window - 1 + stop] = np.asarray(result).reshape(rows, stop - start)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Streaming state
+# ---------------------------------------------------------------------------
+
+
+class _RollingMean:
+    """Fixed-size ring buffer with a running sum."""
+
+    __slots__ = ("period", "buffer", "index", "count", "total", "nonzero", "updates")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.buffer = [0.0] * period
+        self.index = 0
+        self.count = 0
+        self.total = 0.0
+        self.nonzero = 0  # lets an all-zero window report exactly 0.0
+        self.updates = 0
+
+    def push(self, value: float) -> None:
+        old = self.buffer[self.index]
+        if self.count == self.period:
+            self.total -= old
+            if old != 0:
+                self.nonzero -= 1
+        else:
+            self.count += 1
+        self.buffer[self.index] = value
+        self.total += value
+        if value != 0:
+            self.nonzero += 1
+        self.index = (self.index + 1) % self.period
+
+        self.updates += 1
+        if self.nonzero == 0:
+            self.total = 0.0
+        elif self.updates % _RESUM_INTERVAL == 0:
+            self.total = float(sum(self.buffer[: self.count]))
+
+    @property
+    def full(self) -> bool:
+        return self.count == self.period
+
+    def mean(self) -> float:
+        return self.total / self.period
+
+    def clone(self) -> "_RollingMean":
+        other = _RollingMean.__new__(_RollingMean)
+        other.period = self.period
+        other.buffer = self.buffer.copy()
+        other.index = self.index
+        other.count = self.count
+        other.total = self.total
+        other.nonzero = self.nonzero
+        other.updates = self.updates
+        return other
+
+
+class _EMAState:
+    """SMA-seeded exponential moving average."""
+
+    __slots__ = ("period", "alpha", "count", "seed_total", "value")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.alpha = 2 / (period + 1)
+        self.count = 0
+        self.seed_total = 0.0
+        self.value: Optional[float] = None
+
+    def push(self, x: float) -> None:
+        self.count += 1
+        if self.count < self.period:
+            self.seed_total += x
+        elif self.count == self.period:
+            self.value = (self.seed_total + x) / self.period
+        else:
+            self.value = (x - self.value) * self.alpha + self.value
+
+    def clone(self) -> "_EMAState":
+        other = _EMAState.__new__(_EMAState)
+        other.period = self.period
+        other.alpha = self.alpha
+        other.count = self.count
+        other.seed_total = self.seed_total
+        other.value = self.value
+        return other
+
+
+class StreamingEMA:
+    """EMA seeded at the first candle seen; O(1) per candle."""
+
+    def __init__(self, period: int):
+        self.ema = _EMAState(period)
+
+    def push(self, high: float, low: float, close: float) -> None:
+        self.ema.push(close)
+
+    def value(self) -> Optional[float]:
+        return self.ema.value
+
+    def clone(self) -> "StreamingEMA":
+        other = StreamingEMA.__new__(StreamingEMA)
+        other.ema = self.ema.clone()
+        return other
+
+
+class StreamingMACD:
+    """MACD line/signal/histogram seeded at the first candle seen."""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.slow_period = slow
+        self.signal_period = signal
+        self.fast = _EMAState(fast)
+        self.slow = _EMAState(slow)
+        self.signal = _EMAState(signal)
+        self.count = 0
+
+    def push(self, high: float, low: float, close: float) -> None:
+        self.count += 1
+        self.fast.push(close)
+        self.slow.push(close)
+        if self.slow.value is not None:
+            self.signal.push(self.fast.value - self.slow.value)
+
+    def value(self) -> Optional[dict[str, float]]:
+        if self.count < self.slow_period + self.signal_period:
+            return None
+        macd_line = self.fast.value - self.slow.value
+        return {
+            "macd": macd_line,
+            "signal": self.signal.value,
+            "histogram": macd_line - self.signal.value,
+        }
+
+    def clone(self) -> "StreamingMACD":
+        other = StreamingMACD.__new__(StreamingMACD)
+        other.slow_period = self.slow_period
+        other.signal_period = self.signal_period
+        other.fast = self.fast.clone()
+        other.slow = self.slow.clone()
+        other.signal = self.signal.clone()
+        other.count = self.count
+        return other
+
+
+class StreamingRSI:
+    """Simple-average RSI over the last ``period`` close-to-close changes."""
+
+    def __init__(self, period: int = 14):
+        self.gains = _RollingMean(period)
+        self.losses = _RollingMean(period)
+        self.prev_close: Optional[float] = None
+
+    def push(self, high: float, low: float, close: float) -> None:
+        if self.prev_close is not None:
+            delta = close - self.prev_close
+            self.gains.push(delta if delta > 0 else 0.0)
+            self.losses.push(-delta if delta < 0 else 0.0)
+        self.prev_close = close
+
+    def value(self) -> Optional[float]:
+        if not self.gains.full:
+            return None
+        avg_loss = self.losses.mean()
+        if avg_loss == 0:
+            return 100.0
+        return 100 - (100 / (1 + self.gains.mean() / avg_loss))
+
+    def clone(self) -> "StreamingRSI":
+        other = StreamingRSI.__new__(StreamingRSI)
+        other.gains = self.gains.clone()
+        other.losses = self.losses.clone()
+        other.prev_close = self.prev_close
+        return other
+
+
+class StreamingATR:
+    """Simple-average true range over the last ``period`` candles."""
+
+    def __init__(self, period: int = 14):
+        self.true_ranges = _RollingMean(period)
+        self.prev_close: Optional[float] = None
+
+    def push(self, high: float, low: float, close: float) -> None:
+        if self.prev_close is not None:
+            self.true_ranges.push(
+                max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+            )
+        self.prev_close = close
+
+    def value(self) -> Optional[float]:
+        return self.true_ranges.mean() if self.true_ranges.full else None
+
+    def clone(self) -> "StreamingATR":
+        other = StreamingATR.__new__(StreamingATR)
+        other.true_ranges = self.true_ranges.clone()
+        other.prev_close = self.prev_close
+        return other
+
+
+class StreamingWilliamsR:
+    """Williams %R using monotonic deques for the rolling high/low."""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.count = 0
+        self.highs: deque = deque()  # (index, high), decreasing
+        self.lows: deque = deque()  # (index, low), increasing
+        self.last_close: Optional[float] = None
+
+    def push(self, high: float, low: float, close: float) -> None:
+        index = self.count
+        self.count += 1
+        while self.highs and self.highs[-1][1] <= high:
+            self.highs.pop()
+        self.highs.append((index, high))
+        while self.lows and self.lows[-1][1] >= low:
+            self.lows.pop()
+        self.lows.append((index, low))
+
+        oldest = index - self.period
+        while self.highs[0][0] <= oldest:
+            self.highs.popleft()
+        while self.lows[0][0] <= oldest:
+            self.lows.popleft()
+        self.last_close = close
+
+    def value(self) -> Optional[float]:
+        if self.count < self.period:
+            return None
+        highest = self.highs[0][1]
+        lowest = self.lows[0][1]
+        if highest == lowest:
+            return -50.0
+        return -100 * ((highest - self.last_close) / (highest - lowest))
+
+    def clone(self) -> "StreamingWilliamsR":
+        other = StreamingWilliamsR.__new__(StreamingWilliamsR)
+        other.period = self.period
+        other.count = self.count
+        other.highs = self.highs.copy()
+        other.lows = self.lows.copy()
+        other.last_close = self.last_close
+        return other
+
+
+STREAMING_INDICATORS = {
+    "ema": StreamingEMA,
+    "macd": StreamingMACD,
+    "rsi": StreamingRSI,
+    "atr": StreamingATR,
+    "williams_r": StreamingWilliamsR,
+}
+
+PeriodKey = Union[int, tuple[int, ...]]
+
+
+class _IndicatorStream:
+    """One indicator's streaming state plus the checkpoint before its last candle."""
+
+    def __init__(self, indicator: str, period: PeriodKey):
+        self.indicator = indicator
+        self.period = period
+        self.state = self._new_state()
+        self.checkpoint = None
+        self.last_ts: Optional[float] = None
+
+    def _new_state(self):
+        factory = STREAMING_INDICATORS[self.indicator]
+        if isinstance(self.period, tuple):
+            return factory(*self.period)
+        return factory(self.period)
+
+    def sync(self, frame: dict[str, np.ndarray]) -> tuple[Any, int, bool]:
+        """Bring the stream up to date with ``frame``.
+
+        Returns:
+            Tuple of (current value, candles pushed, whether state was rebuilt)
+        """
+        timestamps = frame["timestamps"]
+        if len(timestamps) == 0:
+            return self.state.value(), 0, False
+
+        start = None
+        if self.last_ts is not None and self.checkpoint is not None:
+            position = int(np.searchsorted(timestamps, self.last_ts))
+            if position < len(timestamps) and timestamps[position] == self.last_ts:
+                start = position
+
+        rebuilt = start is None
+        if rebuilt:
+            # First sight of this series or a gap in the history: replay the window
+            self.state = self._new_state()
+            start = 0
+        else:
+            # Replay the (possibly revised) last candle from the checkpoint
+            self.state = self.checkpoint
+
+        highs, lows, closes = frame["highs"], frame["lows"], frame["closes"]
+        last = len(timestamps) - 1
+        for i in range(start, last + 1):
+            if i == last:
+                self.checkpoint = self.state.clone()
+            self.state.push(float(highs[i]), float(lows[i]), float(closes[i]))
+
+        self.last_ts = timestamps[last]
+        return self.state.value(), last + 1 - start, rebuilt
+
+
+class IncrementalIndicatorEngine:
+    """
+    Streaming indicator state keyed by (symbol, timeframe, indicator, period).
+
+    Feed the engine the same candle frames the strategies see (e.g. from the
+    cycle candle store). Only candles newer than the last one seen are pushed,
+    plus a replay of the last candle, which may still be forming. A gap in the
+    timestamps (or the first call) rebuilds the stream from the frame.
+
+    RSI, ATR and Williams %R match TechnicalCalculator on the same window. EMA
+    and MACD are true streaming values seeded at the first candle seen, so they
+    match TechnicalCalculator run over the full history since that seed.
+    """
+
+    def __init__(self):
+        self._streams: dict[tuple[str, str, str, PeriodKey], _IndicatorStream] = {}
+        self._lock = threading.Lock()
+        self.candles_pushed = 0
+        self.rebuilds = 0
+
+    def update(
+        self,
+        symbol: str,
+        timeframe: str,
+        indicator: str,
+        frame: dict[str, np.ndarray],
+        period: PeriodKey = 14,
+    ) -> Any:
+        """Update one indicator stream from a candle frame and return its value.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            indicator: One of 'ema', 'macd', 'rsi', 'atr', 'williams_r'
+            frame: Parsed candle columns (timestamps, highs, lows, closes, ...)
+            period: Indicator period; (fast, slow, signal) for 'macd'
+
+        Returns:
+            Indicator value (dict for MACD) or None if not yet warmed up
+        """
+        if indicator not in STREAMING_INDICATORS:
+            raise ValueError(f"Unknown streaming indicator: {indicator}")
+
+        key = (symbol, timeframe, indicator, period)
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is None:
+                stream = _IndicatorStream(indicator, period)
+                self._streams[key] = stream
+
+        value, pushed, rebuilt = stream.sync(frame)
+
+        with self._lock:
+            self.candles_pushed += pushed
+            self.rebuilds += int(rebuilt)
+        return value
+
+    def get(self, symbol: str, timeframe: str, indicator: str, period: PeriodKey = 14) -> Any:
+        """Get the latest value of a stream without updating it."""
+        stream = self._streams.get((symbol, timeframe, indicator, period))
+        return stream.state.value() if stream else None
+
+    def reset(self, symbol: Optional[str] = None) -> None:
+        """Drop streaming state for one symbol, or for all symbols."""
+        with self._lock:
+            if symbol is None:
+                self._streams.clear()
+            else:
+                for key in [k for k in self._streams if k[0] == symbol]:
+                    del self._streams[key]
+
+    def get_stats(self) -> dict[str, int]:
+        """Get stream counts and work done so far."""
+        with self._lock:
+            return {
+                "streams": len(self._streams),
+                "candles_pushed": self.candles_pushed,
+                "rebuilds": self.rebuilds,
+            }
+
+
+# Global instance for easy access
+_engine = IncrementalIndicatorEngine()
+
+
+def get_indicator_engine() -> IncrementalIndicatorEngine:
+    """Get the global incremental indicator engine instance."""
+    return _engine
@@ -0,0 +1,235 @@
+"""
+Incremental EMA/ADX features for regime detection across the whole universe.
+
+RegimeFeatureFeed keeps the running EMA and Wilder ADX state of every symbol
+in NumPy arrays (one slot per symbol). Each update folds the newly closed
+candles of all symbols in one vectorized pass, so the per-cycle cost is a few
+array operations per new candle rather than a full recomputation per symbol.
+Values only change when a candle closes; between closes lookups return the
+cached results.
+
+EMAs are seeded with the first close and ADX components with their first
+values (the same recursion as pandas ``ewm(adjust=False)``). A value is only
+served once enough candles have been folded in to warm it up: ``period``
+candles for an EMA, ``2 * period`` for ADX.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from ..core.logging_utils import LoggerMixin
+
+
+class RegimeFeatureFeed(LoggerMixin):
+    """
+    Running EMA and ADX values for every symbol, updated from candle arrays.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the feature feed.
+
+        Args:
+            config: Feature settings (``signals.regime.features``): ema_periods,
+                adx_period, history_limit, include_forming_candle
+        """
+        super().__init__()
+        self.config = config or {}
+        self.ema_periods = tuple(self.config.get("ema_periods", (50, 200)))
+        self.adx_period = self.config.get("adx_period", 14)
+        # Candles to load for a symbol seen for the first time
+        self.history_limit = self.config.get(
+            "history_limit", max(max(self.ema_periods), 2 * self.adx_period) + 50
+        )
+        # The newest candle of a live window is still forming; skip it by default
+        self.include_forming_candle = self.config.get("include_forming_candle", False)
+
+        self._rows: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._alloc(0)
+
+    def _alloc(self, size: int) -> None:
+        self.last_ts = np.full(size, -np.inf)
+        self.bars = np.zeros(size, dtype=np.int64)
+        self.prev_high = np.full(size, np.nan)
+        self.prev_low = np.full(size, np.nan)
+        self.prev_close = np.full(size, np.nan)
+        self.ema = {period: np.full(size, np.nan) for period in self.ema_periods}
+        self.smoothed_tr = np.full(size, np.nan)
+        self.smoothed_plus_dm = np.full(size, np.nan)
+        self.smoothed_minus_dm = np.full(size, np.nan)
+        self.adx = np.full(size, np.nan)
+
+    def _grow(self, symbols: List[str]) -> None:
+        """Add state slots for symbols seen for the first time."""
+        new = [symbol for symbol in symbols if symbol not in self._rows]
+        if not new:
+            return
+        for symbol in new:
+            self._rows[symbol] = len(self._symbols)
+            self._symbols.append(symbol)
+        extra = len(new)
+
+        def pad(array: np.ndarray, fill: float) -> np.ndarray:
+            return np.concatenate([array, np.full(extra, fill, dtype=array.dtype)])
+
+        self.last_ts = pad(self.last_ts, -np.inf)
+        self.bars = pad(self.bars, 0)
+        for name in ("prev_high", "prev_low", "prev_close", "smoothed_tr",
+                     "smoothed_plus_dm", "smoothed_minus_dm", "adx"):
+            setattr(self, name, pad(getattr(self, name), np.nan))
+        self.ema = {period: pad(values, np.nan) for period, values in self.ema.items()}
+
+    def cold_symbols(self, symbols: Iterable[str]) -> List[str]:
+        """Symbols that have no candles folded in yet (need a history load).
+
+        Args:
+            symbols: Trading symbols
+
+        Returns:
+            Symbols without feature state
+        """
+        return [
+            symbol for symbol in symbols
+            if symbol not in self._rows or self.bars[self._rows[symbol]] == 0
+        ]
+
+    def update(self, candles: Dict[str, Optional[Dict[str, np.ndarray]]]) -> int:
+        """Fold newly closed candles of many symbols into the features.
+
+        Candles at or before a symbol's last folded timestamp are ignored, so
+        overlapping windows can be passed every cycle.
+
+        Args:
+            candles: Symbol -> parsed OHLCV columns (timestamps, highs, lows,
+                closes), oldest first, as served by the cycle candle store
+
+        Returns:
+            Number of candles folded in
+        """
+        symbols = [symbol for symbol, frame in candles.items() if frame and len(frame["closes"])]
+        self._grow(symbols)
+
+        # New closed candles per symbol, right-aligned in a padded matrix so
+        # step j advances every symbol that has a candle at that step
+        pending = []
+        for symbol in symbols:
+            frame = candles[symbol]
+            end = len(frame["closes"]) if self.include_forming_candle else len(frame["closes"]) - 1
+            timestamps = np.asarray(frame["timestamps"][:end], dtype=float)
+            new = timestamps > self.last_ts[self._rows[symbol]]
+            if new.any():
+                pending.append((self._rows[symbol], frame, end, new))
+        if not pending:
+            return 0
+
+        steps = max(int(new.sum()) for _, _, _, new in pending)
+        rows = np.array([row for row, _, _, _ in pending])
+        matrix = {name: np.full((len(pending), steps), np.nan) for name in ("ts", "high", "low", "close")}
+        for i, (_, frame, end, new) in enumerate(pending):
+            count = int(new.sum())
+            for name, column in (("ts", "timestamps"), ("high", "highs"), ("low", "lows"), ("close", "closes")):
+                matrix[name][i, steps - count:] = np.asarray(frame[column][:end], dtype=float)[new]
+
+        folded = 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for j in range(steps):
+                present = ~(
+                    np.isnan(matrix["high"][:, j]) | np.isnan(matrix["low"][:, j]) | np.isnan(matrix["close"][:, j])
+                )
+                if not present.any():
+                    continue
+                self._step(
+                    rows[present],
+                    matrix["high"][present, j],
+                    matrix["low"][present, j],
+                    matrix["close"][present, j],
+                )
+                self.last_ts[rows[present]] = matrix["ts"][present, j]
+                folded += int(present.sum())
+
+        self.logger.debug(f"REGIME_FEATURES: folded {folded} candles for {len(pending)} symbols")
+        return folded
+
+    def _step(self, rows: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> None:
+        """Advance the EMA and ADX state of the given rows by one candle."""
+        for period, values in self.ema.items():
+            current = values[rows]
+            k = 2.0 / (period + 1)
+            values[rows] = np.where(np.isnan(current), close, current + k * (close - current))
+
+        prev_high, prev_low, prev_close = self.prev_high[rows], self.prev_low[rows], self.prev_close[rows]
+        has_prev = ~np.isnan(prev_close)
+
+        # Directional movement and true range against the previous candle
+        up_move = high - prev_high
+        down_move = prev_low - low
+        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+        true_range = np.maximum(
+            high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close))
+        )
+
+        # Wilder smoothing (alpha = 1 / period), seeded with the first value
+        alpha = 1.0 / self.adx_period
+
+        def smooth(state: np.ndarray, value: np.ndarray) -> np.ndarray:
+            current = state[rows]
+            updated = np.where(np.isnan(current), value, current + alpha * (value - current))
+            return np.where(has_prev, updated, current)
+
+        self.smoothed_tr[rows] = smooth(self.smoothed_tr, true_range)
+        self.smoothed_plus_dm[rows] = smooth(self.smoothed_plus_dm, plus_dm)
+        self.smoothed_minus_dm[rows] = smooth(self.smoothed_minus_dm, minus_dm)
+
+        smoothed_tr = self.smoothed_tr[rows]
+        plus_di = np.where(smoothed_tr > 0, 100.0 * self.smoothed_plus_dm[rows] / smoothed_tr, 0.0)
+        minus_di = np.where(smoothed_tr > 0, 100.0 * self.smoothed_minus_dm[rows] / smoothed_tr, 0.0)
+        di_sum = plus_di + minus_di
+        dx = np.where(di_sum > 0, 100.0 * np.abs(plus_di - minus_di) / di_sum, 0.0)
+        self.adx[rows] = smooth(self.adx, dx)
+
+        self.prev_high[rows] = high
+        self.prev_low[rows] = low
+        self.prev_close[rows] = close
+        self.bars[rows] += 1
+
+    def get_ema(self, symbol: str, period: int) -> Optional[float]:
+        """Latest EMA of a symbol's closes.
+
+        Args:
+            symbol: Trading symbol
+            period: EMA period (one of the configured ema_periods)
+
+        Returns:
+            EMA value, or None if unknown, unsupported or still warming up
+        """
+        row = self._rows.get(symbol)
+        if row is None or period not in self.ema or self.bars[row] < period:
+            return None
+        return float(self.ema[period][row])
+
+    def get_adx(self, symbol: str, period: int) -> Optional[float]:
+        """Latest Wilder ADX of a symbol.
+
+        Args:
+            symbol: Trading symbol
+            period: ADX period (must match the configured adx_period)
+
+        Returns:
+            ADX value, or None if unknown, unsupported or still warming up
+        """
+        row = self._rows.get(symbol)
+        if row is None or period != self.adx_period or self.bars[row] < 2 * period:
+            return None
+        return float(self.adx[row])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get feed statistics."""
+        warm = self.bars >= max(max(self.ema_periods), 2 * self.adx_period)
+        return {
+            "symbols": len(self._symbols),
+            "warm_symbols": int(warm.sum()),
+            "ema_periods": list(self.ema_periods),
+            "adx_period": self.adx_period,
+        }
@@ -9,6 +9,8 @@ import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 import logging
 
+from .incremental import batch_atr, batch_ema, batch_macd
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,40 +78,13 @@ class TechnicalCalculator:
         if len(closes) < slow + signal:
             return None
         
-        # Calculate EMAs
-        ema_fast = self._calculate_ema(closes, fast)
-        ema_slow = self._calculate_ema(closes, slow)
-        
-        if ema_fast is None or ema_slow is None:
-            return None
-        
-        # MACD line
-        macd_line = ema_fast - ema_slow
-        
-        # Signal line (EMA of MACD)
-        macd_values = []
-        for i in range(len(closes) - slow + 1):
-            subset_closes = closes[:slow + i]
-            fast_ema = self._calculate_ema(subset_closes, fast)
-            slow_ema = self._calculate_ema(subset_closes, slow)
-            if fast_ema is not None and slow_ema is not None:
-                macd_values.append(fast_ema - slow_ema)
-        
-        if len(macd_values) < signal:
-            return None
-        
-        signal_line = self._calculate_ema(np.array(macd_values), signal)
-        
-        if signal_line is None:
-            return None
-        
-        # Histogram
-        histogram = macd_line - signal_line
+        # MACD line and signal line are linear in the closes; apply cached weights
+        result = batch_macd(closes, fast, slow, signal)
         
         return {
-            "macd": float(macd_line),
-            "signal": float(signal_line),
-            "histogram": float(histogram)
+            "macd": float(result["macd"][0]),
+            "signal": float(result["signal"][0]),
+            "histogram": float(result["histogram"][0])
         }
     
     def calculate_bollinger_bands(
@@ -194,20 +169,8 @@ class TechnicalCalculator:
         if len(closes) < period + 1:
             return None
         
-        # Calculate True Range
-        tr_list = []
-        for i in range(1, len(closes)):
-            high_low = highs[i] - lows[i]
-            high_close = abs(highs[i] - closes[i-1])
-            low_close = abs(lows[i] - closes[i-1])
-            tr = max(high_low, high_close, low_close)
-            tr_list.append(tr)
-        
-        if len(tr_list) < period:
-            return None
-        
-        # Calculate ATR (simple moving average of TR)
-        atr = np.mean(tr_list[-period:])
+        # Simple moving average of the true range over the last period candles
+        atr = batch_atr(highs, lows, closes, period)[0]
         
         return float(atr)
     
@@ -293,15 +256,8 @@ class TechnicalCalculator:
         if len(values) < period:
             return None
         
-        # Calculate multiplier
-        multiplier = 2 / (period + 1)
-        
-        # Initialize EMA with SMA
-        ema = np.mean(values[:period])
-        
-        # Calculate EMA for remaining values
-        for value in values[period:]:
-            ema = (value - ema) * multiplier + ema
+        # SMA-seeded EMA collapses to a dot product with cached weights
+        ema = batch_ema(values, period)[0]
         
         return float(ema)
     
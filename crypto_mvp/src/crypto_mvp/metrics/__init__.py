@@ -2,9 +2,13 @@
 Metrics module for the Crypto MVP application.
 """
 
-from .collector import MetricsCollector, TradingMetrics
+from .collector import Histogram, MetricsCollector, TradingMetrics
+from .profiler import CycleProfile, CycleProfiler
 
 __all__ = [
     "MetricsCollector",
     "TradingMetrics",
+    "Histogram",
+    "CycleProfile",
+    "CycleProfiler",
 ]
@@ -6,10 +6,52 @@ import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from threading import Lock
-from typing import Any
+from typing import Any, Optional
 
 from ..core.logging_utils import LoggerMixin
 
+# Latency buckets in seconds (upper bounds; +Inf is implicit)
+DEFAULT_LATENCY_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+HistogramKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus (cumulative) semantics."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        """Initialize the histogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get cumulative bucket counts, sum and count."""
+        cumulative = []
+        running = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            running += count
+            cumulative.append((bound, running))
+        return {"buckets": cumulative, "sum": self.sum, "count": self.count}
+
 
 @dataclass
 class TradingMetrics:
@@ -64,6 +106,10 @@ class MetricsCollector(LoggerMixin):
         self._strategy_trades: dict[str, list[dict[str, Any]]] = defaultdict(list)
         self._strategy_signals: dict[str, list[dict[str, Any]]] = defaultdict(list)
 
+        # Histograms keyed by (name, sorted label pairs)
+        self._histograms: dict[HistogramKey, Histogram] = {}
+        self._histogram_help: dict[str, str] = {}
+
     def update_portfolio_metrics(
         self,
         equity: float,
@@ -180,6 +226,73 @@ class MetricsCollector(LoggerMixin):
             if len(self._strategy_signals[strategy]) > 1000:
                 self._strategy_signals[strategy].pop(0)
 
+    def observe_histogram(
+        self,
+        name: str,
+        value: float,
+        labels: Optional[dict[str, str]] = None,
+        help_text: str = "",
+    ) -> None:
+        """Record an observation in a labelled histogram.
+
+        Args:
+            name: Metric name (e.g. 'crypto_mvp_cycle_phase_wall_seconds')
+            value: Observed value
+            labels: Optional label values
+            help_text: HELP text for the metric family
+        """
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = Histogram()
+                self._histograms[key] = histogram
+            if help_text:
+                self._histogram_help.setdefault(name, help_text)
+            histogram.observe(value)
+
+    def get_histogram(
+        self, name: str, labels: Optional[dict[str, str]] = None
+    ) -> Optional[dict[str, Any]]:
+        """Get a histogram snapshot.
+
+        Args:
+            name: Metric name
+            labels: Label values
+
+        Returns:
+            Snapshot with cumulative buckets, sum and count, or None
+        """
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            return histogram.snapshot() if histogram else None
+
+    def record_cycle_profile(self, profile: Any) -> None:
+        """Record per-phase wall and CPU time of a finished trading cycle.
+
+        Args:
+            profile: CycleProfile from metrics.profiler
+        """
+        self.observe_histogram(
+            "crypto_mvp_cycle_wall_seconds", profile.wall_s,
+            help_text="Trading cycle wall time in seconds",
+        )
+        self.observe_histogram(
+            "crypto_mvp_cycle_cpu_seconds", profile.cpu_s,
+            help_text="Trading cycle CPU time in seconds",
+        )
+        for path, (wall, cpu) in profile.spans.items():
+            labels = {"phase": ".".join(path)}
+            self.observe_histogram(
+                "crypto_mvp_cycle_phase_wall_seconds", wall, labels,
+                help_text="Trading cycle phase wall time in seconds",
+            )
+            self.observe_histogram(
+                "crypto_mvp_cycle_phase_cpu_seconds", cpu, labels,
+                help_text="Trading cycle phase CPU time in seconds",
+            )
+
     def increment_cycle_count(self) -> None:
         """Increment the trading cycle count."""
         with self._lock:
@@ -362,8 +475,41 @@ class MetricsCollector(LoggerMixin):
                 ]
             )
 
+        lines.extend(self._get_histogram_lines())
+
         return "\n".join(lines)
 
+    def _get_histogram_lines(self) -> list[str]:
+        """Render histograms in Prometheus exposition format."""
+        with self._lock:
+            snapshots = [
+                (name, labels, histogram.snapshot())
+                for (name, labels), histogram in sorted(self._histograms.items())
+            ]
+            help_texts = dict(self._histogram_help)
+
+        lines: list[str] = []
+        current_name = None
+        for name, labels, snapshot in snapshots:
+            if name != current_name:
+                current_name = name
+                lines.extend(
+                    [
+                        "",
+                        f"# HELP {name} {help_texts.get(name, name)}",
+                        f"# TYPE {name} histogram",
+                    ]
+                )
+            label_text = ",".join(f'{key}="{value}"' for key, value in labels)
+            prefix = f"{label_text}," if label_text else ""
+            for bound, count in snapshot["buckets"]:
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(f'{name}_bucket{{{prefix}le="{le}"}} {count}')
+            suffix = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{name}_sum{suffix} {snapshot['sum']:.6f}")
+            lines.append(f"{name}_count{suffix} {snapshot['count']}")
+        return lines
+
     def export_metrics_to_file(self, filepath: str) -> None:
         """Export metrics to a file.
 
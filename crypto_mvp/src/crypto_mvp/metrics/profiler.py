@@ -0,0 +1,216 @@
+"""
+Per-phase timing of trading cycles (wall and CPU time).
+
+run_trading_cycle marks the start of each phase (hydration, market data,
+signals, execution, ...) on a CycleProfiler. Work timed elsewhere, such as the
+per-strategy time measured on the signal engine's worker threads, is attached
+with record(). Finished cycles are kept in a short history and can be exported
+as collapsed stacks ("folded" format) for flame graph tools.
+"""
+
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional, Union
+
+from ..core.logging_utils import LoggerMixin
+
+SpanPath = tuple[str, ...]
+
+
+@dataclass
+class CycleProfile:
+    """Timings of one finished trading cycle."""
+
+    cycle_id: int
+    wall_s: float
+    cpu_s: float
+    # Span path -> [wall seconds, cpu seconds]
+    spans: dict[SpanPath, list[float]] = field(default_factory=dict)
+
+    def phases(self) -> dict[str, dict[str, float]]:
+        """Span timings keyed by dotted path, in milliseconds."""
+        return {
+            ".".join(path): {"wall_ms": wall * 1000, "cpu_ms": cpu * 1000}
+            for path, (wall, cpu) in self.spans.items()
+        }
+
+    def slowest_phases(self, count: int = 3) -> list[tuple[str, float]]:
+        """Top-level phases sorted by wall time (name, seconds)."""
+        top = [(path[0], wall) for path, (wall, _) in self.spans.items() if len(path) == 1]
+        return sorted(top, key=lambda item: item[1], reverse=True)[:count]
+
+
+class CycleProfiler(LoggerMixin):
+    """
+    Collects wall and CPU time spans for trading cycles.
+
+    Phases are sequential: phase(name) closes the currently open top-level
+    phase and opens the next one, so run_trading_cycle only needs one marker
+    per step. span(name) nests a timed block under the current phase.
+
+    Wall time uses time.perf_counter(); CPU time uses time.process_time() and so
+    includes worker threads (fetch pool, strategy pool) active during the span.
+    """
+
+    ROOT = "cycle"
+
+    def __init__(self, history: int = 100):
+        """Initialize the profiler.
+
+        Args:
+            history: Number of finished cycles to keep
+        """
+        super().__init__()
+        self.history: deque[CycleProfile] = deque(maxlen=max(int(history), 1))
+        self._current: Optional[CycleProfile] = None
+        self._stack: list[tuple[str, float, float]] = []
+        self._cycle_start: tuple[float, float] = (0.0, 0.0)
+
+    @property
+    def last_profile(self) -> Optional[CycleProfile]:
+        return self.history[-1] if self.history else None
+
+    def begin_cycle(self, cycle_id: int) -> None:
+        """Start profiling a new cycle, discarding any unfinished one."""
+        self._current = CycleProfile(cycle_id=cycle_id, wall_s=0.0, cpu_s=0.0)
+        self._stack = []
+        self._cycle_start = (time.perf_counter(), time.process_time())
+
+    def phase(self, name: str) -> None:
+        """Close the open top-level phase and start ``name``."""
+        if self._current is None:
+            return
+        self._close_to_depth(0)
+        self._stack.append((name, time.perf_counter(), time.process_time()))
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time a block nested under the currently open spans."""
+        if self._current is None:
+            yield
+            return
+        depth = len(self._stack)
+        self._stack.append((name, time.perf_counter(), time.process_time()))
+        try:
+            yield
+        finally:
+            self._close_to_depth(depth)
+
+    def record(self, path: Union[str, SpanPath], wall_s: float, cpu_s: float) -> None:
+        """Add externally measured time to a span (accumulates).
+
+        Args:
+            path: Span path, e.g. ("signals", "momentum")
+            wall_s: Wall time in seconds
+            cpu_s: CPU time in seconds
+        """
+        if self._current is None:
+            return
+        if isinstance(path, str):
+            path = (path,)
+        totals = self._current.spans.setdefault(tuple(path), [0.0, 0.0])
+        totals[0] += wall_s
+        totals[1] += cpu_s
+
+    def end_cycle(self) -> Optional[CycleProfile]:
+        """Close all open spans and store the finished cycle.
+
+        Returns:
+            The finished cycle profile, or None if no cycle was started
+        """
+        if self._current is None:
+            return None
+        self._close_to_depth(0)
+        wall_start, cpu_start = self._cycle_start
+        profile = self._current
+        profile.wall_s = time.perf_counter() - wall_start
+        profile.cpu_s = time.process_time() - cpu_start
+        self.history.append(profile)
+        self._current = None
+        return profile
+
+    def _close_to_depth(self, depth: int) -> None:
+        while len(self._stack) > depth:
+            path = tuple(name for name, _, _ in self._stack)
+            _, wall_start, cpu_start = self._stack.pop()
+            self.record(
+                path,
+                time.perf_counter() - wall_start,
+                time.process_time() - cpu_start,
+            )
+
+    def folded_stacks(self, metric: str = "wall", cycles: Optional[int] = None) -> str:
+        """Render recent cycles as collapsed stacks for flame graph tools.
+
+        Each line is ``cycle;phase;child <microseconds>`` holding the span's
+        self time (its time minus its children's), summed over the cycles.
+
+        Args:
+            metric: 'wall' or 'cpu'
+            cycles: Number of most recent cycles to include (all if None)
+
+        Returns:
+            Folded stack text, one stack per line
+        """
+        if metric not in ("wall", "cpu"):
+            raise ValueError(f"Unknown metric: {metric}")
+        index = 0 if metric == "wall" else 1
+
+        profiles = list(self.history)
+        if cycles is not None:
+            profiles = profiles[-cycles:]
+
+        totals: dict[SpanPath, float] = {}
+        for profile in profiles:
+            root_total = profile.wall_s if index == 0 else profile.cpu_s
+            spans = {(self.ROOT,): root_total}
+            spans.update({(self.ROOT, *path): times[index] for path, times in profile.spans.items()})
+
+            for path, value in spans.items():
+                children = sum(
+                    v for p, v in spans.items() if len(p) == len(path) + 1 and p[:-1] == path
+                )
+                # Parallel children (e.g. strategies on worker threads) can exceed the parent
+                totals[path] = totals.get(path, 0.0) + max(value - children, 0.0)
+
+        lines = [
+            f"{';'.join(path)} {int(round(value * 1_000_000))}"
+            for path, value in sorted(totals.items())
+            if value > 0
+        ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def dump_flamegraph(self, path: str, metric: str = "wall", cycles: Optional[int] = None) -> str:
+        """Write folded stacks to ``path`` (e.g. for flamegraph.pl or speedscope).
+
+        Args:
+            path: Output file path
+            metric: 'wall' or 'cpu'
+            cycles: Number of most recent cycles to include (all if None)
+
+        Returns:
+            The path written
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            f.write(self.folded_stacks(metric, cycles))
+        self.logger.info(f"Cycle profile written to {path} ({metric} time)")
+        return path
+
+    def get_summary(self) -> dict[str, Any]:
+        """Average phase timings over the kept history."""
+        if not self.history:
+            return {"cycles": 0, "phases": {}}
+
+        phases: dict[str, dict[str, float]] = {}
+        for profile in self.history:
+            for name, timing in profile.phases().items():
+                entry = phases.setdefault(name, {"wall_ms": 0.0, "cpu_ms": 0.0})
+                entry["wall_ms"] += timing["wall_ms"] / len(self.history)
+                entry["cpu_ms"] += timing["cpu_ms"] / len(self.history)
+        return {"cycles": len(self.history), "phases": phases}
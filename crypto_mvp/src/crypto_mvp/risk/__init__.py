@@ -2,6 +2,8 @@
 Risk management module for the Crypto MVP application.
 """
 
+from .correlation import CorrelationEngine
+from .optimizer import MeanVarianceOptimizer, OptimizationResult
 from .portfolio import AdvancedPortfolioManager
 from .risk_manager import ProfitOptimizedRiskManager, RiskManager
 
@@ -9,4 +11,7 @@ __all__ = [
     "ProfitOptimizedRiskManager",
     "RiskManager",
     "AdvancedPortfolioManager",
+    "CorrelationEngine",
+    "MeanVarianceOptimizer",
+    "OptimizationResult",
 ]
@@ -0,0 +1,236 @@
+"""
+Rolling return history and shrunk correlation/covariance estimates.
+
+CorrelationEngine keeps the log returns of every symbol in a rolling
+(time x symbol) NumPy matrix, one row per candle timestamp. Each update
+writes only the newly closed candles, and estimates for any subset of
+symbols are computed in one vectorized pass over that matrix:
+
+- returns are demeaned and standardized per symbol; a missing return counts
+  as zero, which pulls correlations of short or gappy histories toward zero
+- the correlation matrix is shrunk toward the identity with the Ledoit-Wolf
+  intensity, so it stays well conditioned with more symbols than candles
+- covariance is the shrunk correlation scaled by annualized volatilities
+"""
+
+from typing import Any, Optional
+
+import numpy as np
+
+from ..core.logging_utils import LoggerMixin
+
+
+def ledoit_wolf_shrinkage(returns: np.ndarray) -> tuple[np.ndarray, float]:
+    """Ledoit-Wolf shrinkage of a sample covariance toward a scaled identity.
+
+    Args:
+        returns: Centered returns, shape (observations, assets)
+
+    Returns:
+        Tuple of (shrunk covariance, shrinkage intensity in [0, 1])
+    """
+    n_obs, n_assets = returns.shape
+    sample = returns.T @ returns / n_obs
+    mu = np.trace(sample) / n_assets
+
+    # Distance of the sample covariance from the target, and the variance of
+    # its entries; their ratio is the optimal intensity
+    delta = np.sum(sample**2) - 2.0 * mu * np.trace(sample) + n_assets * mu**2
+    squared = returns**2
+    beta = (np.sum(squared.T @ squared) / n_obs - np.sum(sample**2)) / n_obs
+    beta = min(max(beta, 0.0), delta)
+    shrinkage = beta / delta if delta > 0 else 0.0
+
+    shrunk = (1.0 - shrinkage) * sample
+    shrunk.flat[:: n_assets + 1] += shrinkage * mu
+    return shrunk, float(shrinkage)
+
+
+class CorrelationEngine(LoggerMixin):
+    """
+    Rolling returns matrix with vectorized, shrunk correlation estimates.
+    """
+
+    def __init__(self, config: Optional[dict[str, Any]] = None):
+        """Initialize the correlation engine.
+
+        Args:
+            config: Engine settings (``portfolio.correlation_engine``): window,
+                min_observations, shrinkage, periods_per_year,
+                include_forming_candle
+        """
+        super().__init__()
+        self.config = config or {}
+
+        # Candle timestamps (rows) kept in the rolling returns matrix
+        self.window = self.config.get("window", 240)
+        # Returns a symbol needs before its history replaces the signal estimates
+        self.min_observations = self.config.get("min_observations", 30)
+        # "ledoit_wolf" or "none"
+        self.shrinkage = self.config.get("shrinkage", "ledoit_wolf")
+        # Candles per year, for annualizing volatilities (8760 = 1h candles)
+        self.periods_per_year = self.config.get("periods_per_year", 8760)
+        # The newest candle of a live window is still forming; skip it by default
+        self.include_forming_candle = self.config.get("include_forming_candle", False)
+
+        self._cols: dict[str, int] = {}
+        self._slots: dict[float, int] = {}
+        self.returns = np.full((self.window, 0), np.nan)
+        self.slot_ts = np.full(self.window, -np.inf)
+        self.last_ts = np.full(0, -np.inf)
+        self.last_close = np.full(0, np.nan)
+
+        self.version = 0
+        self.last_shrinkage = 0.0
+        self._cache_key: Optional[tuple] = None
+        self._cache_value: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    def _grow(self, symbols: list[str]) -> None:
+        """Add matrix columns for symbols seen for the first time."""
+        new = [symbol for symbol in symbols if symbol not in self._cols]
+        if not new:
+            return
+        for symbol in new:
+            self._cols[symbol] = len(self._cols)
+        extra = len(new)
+        self.returns = np.hstack([self.returns, np.full((self.window, extra), np.nan)])
+        self.last_ts = np.concatenate([self.last_ts, np.full(extra, -np.inf)])
+        self.last_close = np.concatenate([self.last_close, np.full(extra, np.nan)])
+
+    def _slot_for(self, timestamp: float) -> Optional[int]:
+        """Matrix row of a candle timestamp, evicting the oldest row if needed."""
+        slot = self._slots.get(timestamp)
+        if slot is not None:
+            return slot
+        oldest = int(np.argmin(self.slot_ts))
+        if timestamp < self.slot_ts[oldest]:
+            # Older than everything in a full window
+            return None
+        self._slots.pop(self.slot_ts[oldest], None)
+        self.slot_ts[oldest] = timestamp
+        self.returns[oldest] = np.nan
+        self._slots[timestamp] = oldest
+        return oldest
+
+    def update(self, candles: dict[str, Optional[dict[str, np.ndarray]]]) -> int:
+        """Add the returns of newly closed candles of many symbols.
+
+        Candles at or before a symbol's last seen timestamp are ignored, so
+        overlapping windows can be passed every cycle.
+
+        Args:
+            candles: Symbol -> parsed OHLCV columns (timestamps, closes),
+                oldest first, as served by the cycle candle store
+
+        Returns:
+            Number of returns added
+        """
+        symbols = [symbol for symbol, frame in candles.items() if frame and len(frame["closes"])]
+        self._grow(symbols)
+
+        pending = []
+        for symbol in symbols:
+            frame = candles[symbol]
+            col = self._cols[symbol]
+            end = len(frame["closes"]) if self.include_forming_candle else len(frame["closes"]) - 1
+            timestamps = np.asarray(frame["timestamps"][:end], dtype=float)
+            closes = np.asarray(frame["closes"][:end], dtype=float)
+            new = timestamps > self.last_ts[col]
+            if not new.any():
+                continue
+
+            # The first new candle's return is against the last close already seen
+            previous = np.concatenate([[self.last_close[col]], closes[new][:-1]])
+            first = int(np.argmax(new))
+            if first > 0:
+                previous[0] = closes[first - 1]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                log_returns = np.log(closes[new] / previous)
+            log_returns[~np.isfinite(log_returns)] = np.nan
+
+            self.last_ts[col] = timestamps[new][-1]
+            self.last_close[col] = closes[new][-1]
+            pending.append((col, timestamps[new], log_returns))
+
+        added = 0
+        # Allocate rows oldest first so a bootstrap fills the window in order
+        for timestamp in sorted({float(ts) for _, stamps, _ in pending for ts in stamps}):
+            self._slot_for(timestamp)
+        for col, stamps, log_returns in pending:
+            slots = [self._slots.get(float(ts)) for ts in stamps]
+            keep = np.array([slot is not None for slot in slots])
+            if keep.any():
+                rows = np.array([slot for slot in slots if slot is not None])
+                self.returns[rows, col] = log_returns[keep]
+                added += int(np.isfinite(log_returns[keep]).sum())
+
+        if pending:
+            self.version += 1
+            self.logger.debug(f"CORRELATION_ENGINE: added {added} returns for {len(pending)} symbols")
+        return added
+
+    def get_matrices(self, symbols: list[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Correlation matrix and annualized volatilities from return history.
+
+        Args:
+            symbols: Symbols in matrix order
+
+        Returns:
+            Tuple of (covered mask, correlation matrix, volatilities). Symbols
+            with fewer than min_observations returns are not covered; their
+            rows/columns of the correlation matrix and their volatility are NaN.
+        """
+        key = (tuple(symbols), self.version)
+        if key == self._cache_key:
+            return self._cache_value
+
+        n_assets = len(symbols)
+        correlation = np.full((n_assets, n_assets), np.nan)
+        volatilities = np.full(n_assets, np.nan)
+
+        cols = np.array([self._cols.get(symbol, -1) for symbol in symbols], dtype=int)
+        known = cols >= 0
+        counts = np.zeros(n_assets, dtype=int)
+        if known.any():
+            counts[known] = np.isfinite(self.returns[:, cols[known]]).sum(axis=0)
+        covered = counts >= self.min_observations
+
+        if covered.any():
+            history = self.returns[:, cols[covered]]
+            history = history[np.isfinite(history).any(axis=1)]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                std = np.nanstd(history, axis=0)
+                standardized = (history - np.nanmean(history, axis=0)) / std
+            standardized[~np.isfinite(standardized)] = 0.0
+
+            if self.shrinkage == "ledoit_wolf" and covered.sum() > 1:
+                shrunk, self.last_shrinkage = ledoit_wolf_shrinkage(standardized)
+            else:
+                shrunk = standardized.T @ standardized / len(standardized)
+                self.last_shrinkage = 0.0
+
+            # Rescale to unit diagonal (missing returns shrink the variances)
+            scale = np.sqrt(np.diag(shrunk))
+            scale[scale == 0] = 1.0
+            covered_corr = np.clip(shrunk / np.outer(scale, scale), -1.0, 1.0)
+            np.fill_diagonal(covered_corr, 1.0)
+
+            index = np.flatnonzero(covered)
+            correlation[np.ix_(index, index)] = covered_corr
+            volatilities[index] = std * np.sqrt(self.periods_per_year)
+
+        self._cache_key = key
+        self._cache_value = (covered, correlation, volatilities)
+        return self._cache_value
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get engine statistics."""
+        counts = np.isfinite(self.returns).sum(axis=0)
+        return {
+            "symbols": len(self._cols),
+            "covered_symbols": int((counts >= self.min_observations).sum()),
+            "rows": int(np.isfinite(self.slot_ts).sum()),
+            "window": self.window,
+            "shrinkage": self.shrinkage,
+            "last_shrinkage": self.last_shrinkage,
+        }
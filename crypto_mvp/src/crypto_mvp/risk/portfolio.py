@@ -7,6 +7,8 @@ from typing import Any, Optional
 import numpy as np
 
 from ..core.logging_utils import LoggerMixin
+from .correlation import CorrelationEngine
+from .optimizer import MeanVarianceOptimizer
 
 
 class AdvancedPortfolioManager(LoggerMixin):
@@ -60,6 +62,24 @@ class AdvancedPortfolioManager(LoggerMixin):
             "default_correlation", 0.3
         )  # 30% default correlation
 
+        # Correlations/volatilities from price history; signal metadata and
+        # the defaults above only cover symbols without enough history
+        self.correlation_engine = CorrelationEngine(
+            self.config.get("correlation_engine", {})
+        )
+
+        # Allocation solver: "mean_variance" (constrained, warm-started) or
+        # "heuristic" (softmax over risk-adjusted scores)
+        optimizer_config = self.config.get("optimizer", {})
+        self.optimization_method = optimizer_config.get("method", "mean_variance")
+        # Annualized portfolio volatility cap for the solver; unset falls back
+        # to the portfolio's target volatility
+        self.max_volatility = optimizer_config.get("max_volatility")
+        if self.max_volatility is None:
+            self.max_volatility = self.target_volatility
+        self.optimizer = MeanVarianceOptimizer(optimizer_config)
+        self.last_optimization: dict[str, Any] = {}
+
         self.initialized = False
 
     def initialize(self) -> None:
@@ -75,6 +95,17 @@ class AdvancedPortfolioManager(LoggerMixin):
 
         self.initialized = True
 
+    def update_returns(self, candles: dict[str, Any]) -> int:
+        """Add newly closed candles to the correlation engine's return history.
+
+        Args:
+            candles: Symbol -> parsed OHLCV columns from the cycle candle store
+
+        Returns:
+            Number of returns added
+        """
+        return self.correlation_engine.update(candles)
+
     def optimize_portfolio_allocation(
         self,
         available_capital: float,
@@ -133,6 +164,7 @@ class AdvancedPortfolioManager(LoggerMixin):
             "total_assets": len(filtered_signals),
             "available_capital": available_capital,
             "optimization_method": "markowitz",
+            "optimizer": self.last_optimization,
             "risk_aversion": self.risk_aversion,
             "target_volatility": self.target_volatility,
             "correlation_penalty": self.correlation_penalty,
@@ -207,7 +239,11 @@ class AdvancedPortfolioManager(LoggerMixin):
     def _calculate_correlation_matrix(
         self, signals: dict[str, dict[str, Any]]
     ) -> np.ndarray:
-        """Calculate correlation matrix from signal data.
+        """Calculate correlation matrix from return history and signal data.
+
+        Pairs of assets with enough return history use the engine's shrunk
+        estimate; other pairs use the signals' correlation metadata or
+        default_correlation.
 
         Args:
             signals: Dictionary of signals for each asset
@@ -221,47 +257,46 @@ class AdvancedPortfolioManager(LoggerMixin):
         if n_assets <= 1:
             return np.array([[1.0]])
 
-        # Initialize correlation matrix
-        correlation_matrix = np.eye(n_assets)
+        index = {asset: i for i, asset in enumerate(asset_names)}
 
-        # Extract correlation data from signals
-        correlations = {}
-        for asset, signal_data in signals.items():
-            correlation_data = signal_data.get("correlation", {})
+        # Correlations given by each asset's signal (NaN = not given)
+        given = np.full((n_assets, n_assets), np.nan)
+        for i, asset in enumerate(asset_names):
+            correlation_data = signals[asset].get("correlation", {})
             if isinstance(correlation_data, dict):
-                correlations[asset] = correlation_data
+                for other_asset, correlation in correlation_data.items():
+                    j = index.get(other_asset)
+                    if j is not None:
+                        given[i, j] = (
+                            self.default_correlation
+                            if correlation is None
+                            else correlation
+                        )
             else:
                 # Single correlation value
-                correlations[asset] = {
-                    other_asset: correlation_data
-                    for other_asset in asset_names
-                    if other_asset != asset
-                }
-
-        # Fill correlation matrix
-        for i, asset1 in enumerate(asset_names):
-            for j, asset2 in enumerate(asset_names):
-                if i != j:
-                    # Try to get correlation from signal data
-                    correlation = None
-
-                    if asset1 in correlations and asset2 in correlations[asset1]:
-                        correlation = correlations[asset1][asset2]
-                    elif asset2 in correlations and asset1 in correlations[asset2]:
-                        correlation = correlations[asset2][asset1]
-
-                    if correlation is not None:
-                        # Clamp correlation to valid range
-                        correlation = max(-1.0, min(1.0, correlation))
-                    else:
-                        # Use default correlation
-                        correlation = self.default_correlation
-
-                    correlation_matrix[i, j] = correlation
+                given[i, :] = (
+                    self.default_correlation
+                    if correlation_data is None
+                    else correlation_data
+                )
+
+        # An asset's own value wins over the other asset's, then the default
+        correlation_matrix = np.where(
+            np.isnan(given),
+            np.where(np.isnan(given.T), self.default_correlation, given.T),
+            given,
+        )
+        correlation_matrix = np.clip(correlation_matrix, -1.0, 1.0)
 
         # Ensure matrix is symmetric
         correlation_matrix = (correlation_matrix + correlation_matrix.T) / 2
 
+        # Return history replaces the estimates wherever both assets have it
+        covered, history, _ = self.correlation_engine.get_matrices(asset_names)
+        correlation_matrix = np.where(
+            np.outer(covered, covered), history, correlation_matrix
+        )
+
         # Ensure diagonal is 1.0
         np.fill_diagonal(correlation_matrix, 1.0)
 
@@ -279,17 +314,20 @@ class AdvancedPortfolioManager(LoggerMixin):
         Returns:
             Covariance matrix (numpy array)
         """
-        n_assets = len(signals)
         asset_names = list(signals.keys())
 
-        # Extract volatilities
-        volatilities = []
-        for asset in asset_names:
-            signal_data = signals[asset]
-            volatility = signal_data.get("volatility", self.default_volatility)
-            volatilities.append(volatility)
-
-        volatilities = np.array(volatilities)
+        # Extract volatilities, realized ones where there is return history
+        volatilities = np.array(
+            [
+                signals[asset].get("volatility", self.default_volatility)
+                for asset in asset_names
+            ],
+            dtype=float,
+        )
+        covered, _, history_volatilities = self.correlation_engine.get_matrices(
+            asset_names
+        )
+        volatilities = np.where(covered, history_volatilities, volatilities)
 
         # Calculate covariance matrix: Cov = Corr * Std * Std^T
         std_matrix = np.outer(volatilities, volatilities)
@@ -305,6 +343,10 @@ class AdvancedPortfolioManager(LoggerMixin):
     ) -> dict[str, float]:
         """Perform Markowitz optimization with correlation penalties.
 
+        Weights come from the constrained mean-variance solver, warm-started
+        from the previous allocation; the softmax heuristic is the fallback
+        when the solver is disabled or fails.
+
         Args:
             expected_returns: Expected returns for each asset
             covariance_matrix: Covariance matrix
@@ -330,17 +372,80 @@ class AdvancedPortfolioManager(LoggerMixin):
         # Apply correlation penalty to covariance matrix
         Sigma_penalized = self._apply_correlation_penalty(Sigma, signals)
 
+        # Apply signal confidence weighting
+        confidence_weights = np.array(
+            [signals[asset].get("confidence", 0.5) for asset in asset_names]
+        )
+
+        if self.optimization_method == "mean_variance":
+            try:
+                result = self.optimizer.optimize(
+                    asset_names,
+                    mu * confidence_weights,
+                    Sigma_penalized,
+                    self.risk_aversion,
+                    max_weight=self.max_position_weight,
+                    min_weight=self.min_position_weight,
+                    max_positions=self.max_positions,
+                    sectors=[
+                        self.asset_sectors.get(asset, "unknown") for asset in asset_names
+                    ],
+                    sector_caps=self.sector_caps,
+                    max_volatility=self.max_volatility,
+                )
+                weights = result.weights
+                if np.all(np.isfinite(weights)) and weights.sum() > 0:
+                    self.last_optimization = {
+                        "method": "mean_variance",
+                        "status": result.status,
+                        "iterations": result.iterations,
+                        "solve_ms": result.solve_ms,
+                        "warm_start": result.warm_start,
+                        "risk_aversion": result.risk_aversion,
+                        "volatility": result.volatility,
+                        "rounds": result.rounds,
+                    }
+                    return {asset_names[i]: weights[i] for i in range(n_assets)}
+                self.logger.warning("Mean-variance solver returned no weights, using heuristic")
+            except Exception as e:
+                self.logger.warning(f"Mean-variance solver failed, using heuristic: {e}")
+
+        weights = self._heuristic_weights(
+            mu, Sigma_penalized, confidence_weights, asset_names, signals
+        )
+        self.last_optimization = {"method": "heuristic"}
+
+        # Convert back to dictionary
+        optimal_weights = {asset_names[i]: weights[i] for i in range(n_assets)}
+
+        return optimal_weights
+
+    def _heuristic_weights(
+        self,
+        mu: np.ndarray,
+        Sigma_penalized: np.ndarray,
+        confidence_weights: np.ndarray,
+        asset_names: list[str],
+        signals: dict[str, dict[str, Any]],
+    ) -> np.ndarray:
+        """Softmax allocation over risk-adjusted scores, constrained afterwards.
+
+        Args:
+            mu: Expected returns
+            Sigma_penalized: Correlation-penalized covariance matrix
+            confidence_weights: Signal confidence per asset
+            asset_names: List of asset names
+            signals: Signal data
+
+        Returns:
+            Constrained weights
+        """
         # Simple heuristic optimization (convex approximation)
         # Objective: maximize (expected_return - risk_aversion * variance)
 
         # Calculate risk-adjusted returns
         risk_adjusted_returns = mu - self.risk_aversion * np.diag(Sigma_penalized)
 
-        # Apply signal confidence weighting
-        confidence_weights = np.array(
-            [signals[asset].get("confidence", 0.5) for asset in asset_names]
-        )
-
         # Combine risk-adjusted returns with confidence
         combined_scores = risk_adjusted_returns * confidence_weights
 
@@ -353,12 +458,7 @@ class AdvancedPortfolioManager(LoggerMixin):
         weights = exp_scores / np.sum(exp_scores)
 
         # Apply position constraints
-        weights = self._apply_position_constraints(weights, asset_names, signals)
-
-        # Convert back to dictionary
-        optimal_weights = {asset_names[i]: weights[i] for i in range(n_assets)}
-
-        return optimal_weights
+        return self._apply_position_constraints(weights, asset_names, signals)
 
     def _apply_correlation_penalty(
         self, covariance_matrix: np.ndarray, signals: dict[str, dict[str, Any]]
@@ -372,22 +472,11 @@ class AdvancedPortfolioManager(LoggerMixin):
         Returns:
             Penalized covariance matrix
         """
-        n_assets = covariance_matrix.shape[0]
-        asset_names = list(signals.keys())
-
-        # Create penalty matrix
-        penalty_matrix = np.ones_like(covariance_matrix)
-
-        # Apply correlation penalty to off-diagonal elements
-        for i in range(n_assets):
-            for j in range(n_assets):
-                if i != j:
-                    correlation = covariance_matrix[i, j] / (
-                        np.sqrt(covariance_matrix[i, i] * covariance_matrix[j, j])
-                    )
-                    # Higher correlation = higher penalty
-                    penalty = 1.0 + self.correlation_penalty * abs(correlation)
-                    penalty_matrix[i, j] = penalty
+        # Higher correlation = higher penalty on off-diagonal elements
+        std = np.sqrt(np.diag(covariance_matrix))
+        correlation = covariance_matrix / np.outer(std, std)
+        penalty_matrix = 1.0 + self.correlation_penalty * np.abs(correlation)
+        np.fill_diagonal(penalty_matrix, 1.0)
 
         # Apply penalties
         penalized_covariance = covariance_matrix * penalty_matrix
@@ -593,14 +682,12 @@ class AdvancedPortfolioManager(LoggerMixin):
         correlation_matrix = self._calculate_correlation_matrix(signals)
         assets = list(signals.keys())
         
-        # Find highly correlated pairs
-        highly_correlated = []
-        for i, asset1 in enumerate(assets):
-            for j, asset2 in enumerate(assets[i+1:], i+1):
-                # Get correlation from numpy array
-                correlation = abs(correlation_matrix[i, j])
-                if correlation > self.max_correlation:
-                    highly_correlated.append((asset1, asset2, correlation))
+        # Find highly correlated pairs (upper triangle, row by row)
+        upper = np.triu(np.abs(correlation_matrix), k=1)
+        rows, cols = np.nonzero(upper > self.max_correlation)
+        highly_correlated = [
+            (assets[i], assets[j], upper[i, j]) for i, j in zip(rows, cols)
+        ]
         
         if not highly_correlated:
             return signals
@@ -762,4 +849,7 @@ class AdvancedPortfolioManager(LoggerMixin):
             "expected_return_boost": self.expected_return_boost,
             "default_volatility": self.default_volatility,
             "default_correlation": self.default_correlation,
+            "correlation_engine": self.correlation_engine.get_stats(),
+            "optimization_method": self.optimization_method,
+            "last_optimization": self.last_optimization,
         }
@@ -1266,9 +1266,13 @@ class ProfitOptimizedRiskManager(LoggerMixin):
             ATR value
         """
         try:
-            # Try to get ATR from data engine if available
-            # This is a placeholder - in real implementation, you'd access the data engine
-            # For now, use fallback calculation
+            # Reuse the ATR the stop model already computed this candle; this
+            # never fetches candles
+            from ..indicators.atr_service import get_atr_service
+            
+            atr = get_atr_service().get_cached_atr(symbol)
+            if atr:
+                return atr
             fallback_atr = 0.005 * fallback_price  # 0.5% of price as fallback
             return fallback_atr
         except Exception as e:
@@ -12,8 +12,8 @@ from fastapi import FastAPI, HTTPException
 from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
-from .core.logging_utils import get_logger
-from .metrics import MetricsCollector
+from .core.logging_utils import get_logger_legacy
+from .metrics import CycleProfiler, MetricsCollector
 
 
 class HealthResponse(BaseModel):
@@ -38,9 +38,10 @@ class MetricsServer:
         self.host = host
         self.port = port
         self.metrics_collector: Optional[MetricsCollector] = None
+        self.cycle_profiler: Optional[CycleProfiler] = None
         self.app: Optional[FastAPI] = None
         self.server_task: Optional[asyncio.Task] = None
-        self.logger = get_logger("metrics_server")
+        self.logger = get_logger_legacy("metrics_server")
         self._start_time = time.time()
 
     def set_metrics_collector(self, metrics_collector: MetricsCollector) -> None:
@@ -51,6 +52,14 @@ class MetricsServer:
         """
         self.metrics_collector = metrics_collector
 
+    def set_cycle_profiler(self, cycle_profiler: CycleProfiler) -> None:
+        """Set the cycle profiler instance.
+
+        Args:
+            cycle_profiler: CycleProfiler instance
+        """
+        self.cycle_profiler = cycle_profiler
+
     def create_app(self) -> FastAPI:
         """Create and configure the FastAPI application.
 
@@ -82,6 +91,7 @@ Available endpoints:
 - /health - Health check
 - /metrics - Prometheus metrics
 - /status - System status
+- /profile - Cycle phase timings as folded stacks (flame graph input)
 - /docs - API documentation
 
 Version: 0.1.0
@@ -112,6 +122,19 @@ Version: 0.1.0
                     status_code=500, detail=f"Error retrieving metrics: {str(e)}"
                 )
 
+        @app.get("/profile", response_class=PlainTextResponse)
+        async def get_profile(metric: str = "wall", cycles: Optional[int] = None):
+            """Get recent cycle timings in collapsed-stack format."""
+            if not self.cycle_profiler:
+                raise HTTPException(
+                    status_code=503, detail="Cycle profiler not available"
+                )
+
+            try:
+                return self.cycle_profiler.folded_stacks(metric, cycles)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
         @app.get("/status", response_class=PlainTextResponse)
         async def get_status():
             """Get system status information."""
@@ -234,6 +257,7 @@ def start_metrics_server(
     host: str = "localhost",
     port: int = 8000,
     metrics_collector: Optional[MetricsCollector] = None,
+    cycle_profiler: Optional[CycleProfiler] = None,
 ) -> MetricsServer:
     """Start the metrics server.
 
@@ -241,6 +265,7 @@ def start_metrics_server(
         host: Server host address
         port: Server port
         metrics_collector: MetricsCollector instance
+        cycle_profiler: CycleProfiler instance for the /profile endpoint
 
     Returns:
         Started MetricsServer instance
@@ -250,6 +275,8 @@ def start_metrics_server(
     _metrics_server = MetricsServer(host, port)
     if metrics_collector:
         _metrics_server.set_metrics_collector(metrics_collector)
+    if cycle_profiler:
+        _metrics_server.set_cycle_profiler(cycle_profiler)
 
     _metrics_server.start_server_background()
     return _metrics_server
@@ -2,8 +2,15 @@
 State management module for persistent storage of trading data.
 """
 
+from .position_index import PositionIndex
+from .signal_windows import RollingSignalWindow, SignalWindowCache
 from .store import StateStore
+from .write_behind import WriteBehindWriter
 
 __all__ = [
     "StateStore",
+    "PositionIndex",
+    "RollingSignalWindow",
+    "SignalWindowCache",
+    "WriteBehindWriter",
 ]
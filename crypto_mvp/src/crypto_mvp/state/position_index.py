@@ -0,0 +1,105 @@
+"""
+In-memory index of the positions table.
+
+The trading cycle reads a session's positions many times (hydration, equity
+checks, reconciliation, cash updates). The index loads each session's rows
+once and answers those reads from memory; the StateStore applies every
+position write to the database and to the index under the same lock, so the
+index stays authoritative for this process.
+
+Two counters detect divergence: ``version`` counts the index's own
+mutations, and the SQLite ``PRAGMA data_version`` recorded at load time
+changes when another connection writes the database, which drops the
+loaded sessions so they are read again.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+PositionKey = Tuple[str, str]  # (canonical symbol, strategy)
+
+
+class PositionIndex:
+    """
+    Position rows by session, keyed by (canonical symbol, strategy).
+
+    Rows are the dictionaries a ``SELECT * FROM positions`` returns; readers
+    get copies, so callers cannot modify the index by accident.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[str, Dict[PositionKey, Dict[str, Any]]] = {}
+        self.version = 0
+        self.data_version: Optional[int] = None
+        self.stats = {"loads": 0, "hits": 0, "invalidations": 0, "divergences": 0}
+
+    def is_loaded(self, session_id: str) -> bool:
+        """Whether the session's rows are held."""
+        return session_id in self._sessions
+
+    def load(self, session_id: str, rows: Iterable[Dict[str, Any]]) -> None:
+        """Replace the session's rows with rows read from the database."""
+        self._sessions[session_id] = {(row["symbol"], row["strategy"]): dict(row) for row in rows}
+        self.stats["loads"] += 1
+
+    def get_session(self, session_id: str) -> List[Dict[str, Any]]:
+        """Copies of the session's rows ordered by symbol (then row id)."""
+        self.stats["hits"] += 1
+        rows = self._sessions.get(session_id, {}).values()
+        return [dict(row) for row in sorted(rows, key=lambda row: (row["symbol"], row.get("id") or 0))]
+
+    def put(self, row: Dict[str, Any]) -> None:
+        """Insert or replace one row (only sessions already loaded are tracked)."""
+        session = self._sessions.get(row["session_id"])
+        if session is not None:
+            session[(row["symbol"], row["strategy"])] = dict(row)
+        self.version += 1
+
+    def replace_symbol(self, symbol: str, rows: Iterable[Dict[str, Any]]) -> None:
+        """Replace every loaded session's rows of a symbol with the given rows."""
+        for session in self._sessions.values():
+            for key in [key for key in session if key[0] == symbol]:
+                del session[key]
+        for row in rows:
+            session = self._sessions.get(row["session_id"])
+            if session is not None:
+                session[(row["symbol"], row["strategy"])] = dict(row)
+        self.version += 1
+
+    def remove(self, symbol: str, strategy: str) -> None:
+        """Remove a (symbol, strategy) position from every session."""
+        for session in self._sessions.values():
+            session.pop((symbol, strategy), None)
+        self.version += 1
+
+    def clear_session(self, session_id: str) -> None:
+        """Hold the session as empty (its rows were deleted)."""
+        if session_id in self._sessions:
+            self._sessions[session_id] = {}
+        self.version += 1
+
+    def clear(self) -> None:
+        """Hold every loaded session as empty (all rows were deleted)."""
+        for session_id in self._sessions:
+            self._sessions[session_id] = {}
+        self.version += 1
+
+    def invalidate(self, divergence: bool = False) -> None:
+        """Drop every loaded session so the next read goes to the database.
+
+        Args:
+            divergence: The index was found to differ from the database
+        """
+        self._sessions.clear()
+        self.data_version = None
+        self.stats["invalidations"] += 1
+        if divergence:
+            self.stats["divergences"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get load/hit counters and the mutation version."""
+        return {
+            **self.stats,
+            "version": self.version,
+            "sessions": len(self._sessions),
+            "positions": sum(len(session) for session in self._sessions.values()),
+        }
@@ -0,0 +1,236 @@
+"""
+In-memory rolling signal windows backed by the StateStore tables.
+
+Strategy and composite signal windows are read and appended for every
+strategy x symbol on every cycle. Holding them in fixed-size ring buffers turns
+those reads into O(1) lookups; the StateStore persists the appended rows to
+SQLite in one batched transaction per cycle.
+"""
+
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_WINDOW_SIZE = 200
+
+# Recompute the running sums from the buffer every this many pushes so float
+# error from add/subtract updates cannot accumulate
+_RESYNC_INTERVAL = 4096
+
+
+def window_timestamp() -> str:
+    """UTC timestamp in SQLite CURRENT_TIMESTAMP format with microseconds.
+
+    Sub-second precision keeps two cycles within the same second from
+    replacing each other under the tables' UNIQUE(..., timestamp) constraint,
+    and still sorts after second-precision rows written by older versions.
+    """
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+class RollingSignalWindow:
+    """
+    Fixed-size ring buffer of signal values with O(1) mean/std/min/max.
+
+    Mean and sample standard deviation come from running sums; min and max
+    come from monotonic deques of (sequence, value) pairs, so every push and
+    every stats read is constant time (amortized for min/max).
+    """
+
+    __slots__ = (
+        "capacity", "values", "head", "count", "seq",
+        "total", "total_sq", "max_queue", "min_queue",
+    )
+
+    def __init__(self, capacity: int = DEFAULT_WINDOW_SIZE):
+        self.capacity = capacity
+        self.values = np.zeros(capacity)
+        self.head = 0  # next slot to write
+        self.count = 0
+        self.seq = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.max_queue: deque = deque()
+        self.min_queue: deque = deque()
+
+    def push(self, value: float) -> None:
+        """Append a value, evicting the oldest one once the window is full."""
+        value = float(value)
+        if self.count == self.capacity:
+            old = self.values[self.head]
+            self.total -= old
+            self.total_sq -= old * old
+        else:
+            self.count += 1
+
+        self.values[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        self.total += value
+        self.total_sq += value * value
+
+        while self.max_queue and self.max_queue[-1][1] <= value:
+            self.max_queue.pop()
+        self.max_queue.append((self.seq, value))
+        while self.min_queue and self.min_queue[-1][1] >= value:
+            self.min_queue.pop()
+        self.min_queue.append((self.seq, value))
+
+        oldest_seq = self.seq - self.count + 1
+        while self.max_queue[0][0] < oldest_seq:
+            self.max_queue.popleft()
+        while self.min_queue[0][0] < oldest_seq:
+            self.min_queue.popleft()
+
+        self.seq += 1
+        if self.seq % _RESYNC_INTERVAL == 0:
+            window = self._ordered()
+            self.total = float(window.sum())
+            self.total_sq = float(np.dot(window, window))
+
+    def _ordered(self) -> np.ndarray:
+        """Values from oldest to newest."""
+        if self.count < self.capacity:
+            return self.values[: self.count]
+        return np.concatenate((self.values[self.head:], self.values[: self.head]))
+
+    def recent(self, limit: Optional[int] = None) -> List[float]:
+        """Get values, most recent first.
+
+        Args:
+            limit: Maximum number of values to return
+
+        Returns:
+            List of signal values (most recent first)
+        """
+        values = self._ordered()[::-1]
+        if limit is not None:
+            values = values[:limit]
+        return values.tolist()
+
+    def stats(self) -> Dict[str, float]:
+        """Get mean, sample std, min, max and count of the window."""
+        if self.count == 0:
+            return {"mean": 0.0, "std": 0.0, "min": 0.0, "max": 0.0, "count": 0}
+
+        mean = self.total / self.count
+        if self.count > 1:
+            variance = (self.total_sq - self.total * mean) / (self.count - 1)
+            std = float(np.sqrt(max(variance, 0.0)))
+        else:
+            std = 0.0
+
+        return {
+            "mean": mean,
+            "std": std,
+            "min": self.min_queue[0][1],
+            "max": self.max_queue[0][1],
+            "count": self.count,
+        }
+
+
+SignalKey = Tuple[str, str, str]
+CompositeKey = Tuple[str, str]
+
+
+class SignalWindowCache:
+    """
+    Rolling strategy and composite signal windows with pending write buffers.
+
+    Windows are loaded from SQLite the first time a key is touched (via the
+    loader callables) and kept in memory afterwards. Appended rows are queued
+    until drain_pending() hands them to the StateStore for a batched write.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_WINDOW_SIZE):
+        self.capacity = capacity
+        self._signals: Dict[SignalKey, RollingSignalWindow] = {}
+        self._composites: Dict[CompositeKey, deque] = {}
+        self._pending_signals: List[Tuple[str, str, str, float, str]] = []
+        self._pending_composites: List[Tuple[str, str, float, float, float, str, str]] = []
+        self._lock = threading.RLock()
+
+    def signal_window(self, key: SignalKey, loader) -> RollingSignalWindow:
+        """Get the window for (symbol, timeframe, strategy), loading it once.
+
+        Args:
+            key: (symbol, timeframe, strategy_name)
+            loader: Callable returning persisted values, most recent first
+
+        Returns:
+            Rolling signal window
+        """
+        with self._lock:
+            window = self._signals.get(key)
+            if window is None:
+                window = RollingSignalWindow(self.capacity)
+                for value in reversed(loader()):
+                    window.push(value)
+                self._signals[key] = window
+            return window
+
+    def composite_window(self, key: CompositeKey, loader) -> deque:
+        """Get the composite window for (symbol, timeframe), loading it once.
+
+        Args:
+            key: (symbol, timeframe)
+            loader: Callable returning persisted rows, most recent first
+
+        Returns:
+            Deque of composite rows, oldest first
+        """
+        with self._lock:
+            window = self._composites.get(key)
+            if window is None:
+                window = deque(reversed(loader()), maxlen=self.capacity)
+                self._composites[key] = window
+            return window
+
+    def append_signal(self, key: SignalKey, value: float, loader) -> None:
+        """Append a strategy signal value and queue it for persistence."""
+        with self._lock:
+            self.signal_window(key, loader).push(value)
+            self._pending_signals.append((*key, float(value), window_timestamp()))
+
+    def append_composite(self, key: CompositeKey, row: Dict[str, Any], loader) -> None:
+        """Append a composite row and queue it for persistence."""
+        with self._lock:
+            row = {**row, "timestamp": window_timestamp()}
+            self.composite_window(key, loader).append(row)
+            self._pending_composites.append((
+                *key,
+                row["composite_score"],
+                row["normalized_score"],
+                row["effective_threshold"],
+                row["regime"],
+                row["timestamp"],
+            ))
+
+    @property
+    def pending_count(self) -> int:
+        """Number of rows waiting to be written."""
+        with self._lock:
+            return len(self._pending_signals) + len(self._pending_composites)
+
+    def drain_pending(self) -> Tuple[list, list]:
+        """Take all queued rows, leaving the queues empty."""
+        with self._lock:
+            signals, self._pending_signals = self._pending_signals, []
+            composites, self._pending_composites = self._pending_composites, []
+            return signals, composites
+
+    def requeue(self, signals: list, composites: list) -> None:
+        """Put rows back at the front of the queues after a failed write."""
+        with self._lock:
+            self._pending_signals[:0] = signals
+            self._pending_composites[:0] = composites
+
+    def clear(self) -> None:
+        """Drop all windows and queued rows."""
+        with self._lock:
+            self._signals.clear()
+            self._composites.clear()
+            self._pending_signals.clear()
+            self._pending_composites.clear()
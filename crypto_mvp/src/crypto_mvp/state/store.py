@@ -6,11 +6,26 @@ import sqlite3
 import json
 import random
 import string
+import functools
+import operator
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from ..core.logging_utils import LoggerMixin
+from .position_index import PositionIndex
+from .signal_windows import DEFAULT_WINDOW_SIZE, SignalWindowCache
+from .write_behind import WriteBehindWriter
+
+
+def _synchronized(method):
+    """Run a mutating StateStore method under the connection's write lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._db_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class StateStore(LoggerMixin):
@@ -20,17 +35,42 @@ class StateStore(LoggerMixin):
     Stores positions, trades, and cash/equity information across system restarts.
     """
 
-    def __init__(self, db_path: str = "trading_state.db"):
+    # Flush queued signal window rows early if a cycle produces more than this
+    SIGNAL_WINDOW_MAX_PENDING = 2000
+
+    def __init__(
+        self,
+        db_path: str = "trading_state.db",
+        write_behind: Optional[Dict[str, Any]] = None,
+        position_index: Optional[Dict[str, Any]] = None,
+    ):
         """Initialize the state store.
         
         Args:
             db_path: Path to SQLite database file
+            write_behind: Optional write-behind settings (``state.write_behind``):
+                enabled, interval_ms, max_batch, synchronous
+            position_index: Optional position index settings
+                (``state.position_index``): enabled
         """
         super().__init__()
         self.db_path = Path(db_path)
         self.connection: Optional[sqlite3.Connection] = None
         self.initialized = False
         
+        # Write-behind group commit (disabled unless configured)
+        self.write_behind_config = write_behind or {}
+        self.write_behind_enabled = bool(self.write_behind_config.get("enabled", False))
+        self.writer: Optional[WriteBehindWriter] = None
+        self._db_lock = threading.RLock()
+        
+        # Rolling signal windows live in memory and are persisted in batches
+        self.signal_windows = SignalWindowCache(DEFAULT_WINDOW_SIZE)
+        
+        # Positions are read from memory; writes go to the table and the index
+        self.position_index_enabled = bool((position_index or {}).get("enabled", True))
+        self.position_index = PositionIndex()
+        
         # Ensure the directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -53,6 +93,9 @@ class StateStore(LoggerMixin):
             # Create tables
             self._create_tables()
             
+            if self.write_behind_enabled:
+                self._start_write_behind()
+            
             self.initialized = True
             self.logger.info(f"StateStore initialized with database: {self.db_path}")
 
@@ -60,6 +103,52 @@ class StateStore(LoggerMixin):
             self.logger.error(f"Failed to initialize StateStore: {e}")
             raise
 
+    def _start_write_behind(self) -> None:
+        """Switch the database to WAL mode and start the group commit writer."""
+        # WAL keeps committed groups intact across crashes; synchronous=NORMAL
+        # only fsyncs at checkpoints, which is safe in WAL mode
+        synchronous = str(self.write_behind_config.get("synchronous", "NORMAL")).upper()
+        if synchronous not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(f"Invalid write_behind.synchronous: {synchronous}")
+        journal_mode = self.connection.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        self.connection.execute(f"PRAGMA synchronous={synchronous}")
+        
+        self.writer = WriteBehindWriter(
+            self.connection.commit,
+            self._db_lock,
+            interval_ms=self.write_behind_config.get("interval_ms", 50),
+            max_batch=self.write_behind_config.get("max_batch", 500),
+        )
+        self.writer.start()
+        self.logger.info(
+            f"StateStore write-behind enabled: journal_mode={journal_mode}, synchronous={synchronous}, "
+            f"interval={self.writer.interval * 1000:.0f}ms, max_batch={self.writer.max_batch}"
+        )
+
+    def _commit(self) -> None:
+        """Commit now, or hand the commit to the write-behind writer."""
+        if self.writer is not None and self.writer.running:
+            self.writer.notify()
+        else:
+            self.connection.commit()
+
+    def flush(self, timeout: Optional[float] = 30.0) -> bool:
+        """Flush barrier: persist queued signal windows and commit all pending writes.
+        
+        Args:
+            timeout: Maximum seconds to wait for the writer
+            
+        Returns:
+            True if everything written so far is committed
+        """
+        if not self.initialized or self.connection is None:
+            return True
+        
+        self.flush_signal_windows()
+        if self.writer is not None:
+            return self.writer.flush(timeout)
+        return True
+
     def _create_tables(self) -> None:
         """Create database tables if they don't exist."""
         cursor = self.connection.cursor()
@@ -224,6 +313,7 @@ class StateStore(LoggerMixin):
         self.connection.commit()
         self.logger.debug("Database tables created successfully")
 
+    @_synchronized
     def save_position(
         self,
         symbol: str,
@@ -259,10 +349,20 @@ class StateStore(LoggerMixin):
             (symbol, quantity, entry_price, current_price, value, unrealized_pnl, strategy, session_id, updated_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
         """, (canonical_symbol, quantity, entry_price, current_price, position_value, unrealized_pnl, strategy, session_id))
-        
-        self.connection.commit()
+        row = None
+        if self.position_index_enabled:
+            # Read back the stored row (id and timestamps come from SQLite)
+            row = cursor.execute(
+                "SELECT * FROM positions WHERE symbol = ? AND strategy = ? AND session_id = ?",
+                (canonical_symbol, strategy, session_id),
+            ).fetchone()
+        
+        self._commit()
+        if row is not None:
+            self.position_index.put(dict(row))
         self.logger.debug(f"Saved position: {canonical_symbol} {quantity} @ {entry_price}")
 
+    @_synchronized
     def update_position_price(self, symbol: str, current_price: float) -> None:
         """Update the current price of a position.
         
@@ -286,10 +386,16 @@ class StateStore(LoggerMixin):
                 updated_at = CURRENT_TIMESTAMP
             WHERE symbol = ?
         """, (current_price, current_price, current_price, canonical_symbol))
+        rows = None
+        if self.position_index_enabled:
+            rows = cursor.execute("SELECT * FROM positions WHERE symbol = ?", (canonical_symbol,)).fetchall()
         
-        self.connection.commit()
+        self._commit()
+        if rows is not None:
+            self.position_index.replace_symbol(canonical_symbol, [dict(row) for row in rows])
         self.logger.debug(f"Updated position price: {canonical_symbol} @ {current_price}")
 
+    @_synchronized
     def remove_position(self, symbol: str, strategy: str) -> None:
         """Remove a position from the store.
         
@@ -307,12 +413,16 @@ class StateStore(LoggerMixin):
         cursor = self.connection.cursor()
         cursor.execute("DELETE FROM positions WHERE symbol = ? AND strategy = ?", (canonical_symbol, strategy))
         
-        self.connection.commit()
+        self._commit()
+        self.position_index.remove(canonical_symbol, strategy)
         self.logger.debug(f"Removed position: {canonical_symbol} (strategy: {strategy})")
 
     def get_positions(self, session_id: str) -> List[Dict[str, Any]]:
         """Get all current positions for a session.
         
+        Served from the position index; the session's rows are read from the
+        database only on first use or after another connection wrote to it.
+        
         Args:
             session_id: Session identifier (mandatory)
             
@@ -328,6 +438,17 @@ class StateStore(LoggerMixin):
         if not self.initialized:
             self.initialize()
         
+        if not self.position_index_enabled:
+            return self._select_positions(session_id)
+        
+        with self._db_lock:
+            self._check_position_index()
+            if not self.position_index.is_loaded(session_id):
+                self.position_index.load(session_id, self._select_positions(session_id))
+            return self.position_index.get_session(session_id)
+
+    def _select_positions(self, session_id: str) -> List[Dict[str, Any]]:
+        """Read a session's positions from the database."""
         cursor = self.connection.cursor()
         cursor.execute("SELECT * FROM positions WHERE session_id = ? ORDER BY symbol", (session_id,))
         
@@ -337,6 +458,48 @@ class StateStore(LoggerMixin):
         
         return positions
 
+    def _check_position_index(self) -> None:
+        """Drop the position index if another connection wrote to the database."""
+        data_version = self.connection.execute("PRAGMA data_version").fetchone()[0]
+        index = self.position_index
+        if index.data_version is not None and index.data_version != data_version:
+            self.logger.info("POSITION_INDEX: database changed by another connection, reloading positions")
+            index.invalidate()
+        index.data_version = data_version
+
+    def verify_position_index(self, session_id: str) -> bool:
+        """Compare the indexed positions of a session with a full table read.
+        
+        On a mismatch the index is dropped (and reloaded on the next read).
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            True if the index matches the database (or holds nothing to compare)
+        """
+        if not self.initialized:
+            self.initialize()
+        
+        with self._db_lock:
+            if not self.position_index.is_loaded(session_id):
+                return True
+            indexed = self.position_index.get_session(session_id)
+            stored = self._select_positions(session_id)
+            key = operator.itemgetter("symbol", "strategy")
+            if sorted(indexed, key=key) == sorted(stored, key=key):
+                return True
+            self.logger.warning(
+                f"POSITION_INDEX_DIVERGENCE: session {session_id} index has {len(indexed)} positions, "
+                f"database has {len(stored)} (index version {self.position_index.version}) - reloading"
+            )
+            self.position_index.invalidate(divergence=True)
+            return False
+
+    def get_position_index_stats(self) -> Dict[str, Any]:
+        """Get position index counters (loads, hits, invalidations, version)."""
+        return {"enabled": self.position_index_enabled, **self.position_index.get_stats()}
+
     def get_position(self, symbol: str, strategy: str) -> Optional[Dict[str, Any]]:
         """Get a specific position.
         
@@ -363,6 +526,7 @@ class StateStore(LoggerMixin):
         row = cursor.fetchone()
         return dict(row) if row else None
 
+    @_synchronized
     def save_trade(
         self,
         symbol: str,
@@ -398,7 +562,7 @@ class StateStore(LoggerMixin):
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (symbol, side, quantity, price, fees, realized_pnl, strategy, session_id, trade_id))
         
-        self.connection.commit()
+        self._commit()
         self.logger.debug(f"Saved trade: {side} {quantity} {symbol} @ {price}")
 
     def get_trades(
@@ -435,6 +599,7 @@ class StateStore(LoggerMixin):
         
         return trades
 
+    @_synchronized
     def save_cash_equity(
         self,
         cash_balance: float,
@@ -474,7 +639,7 @@ class StateStore(LoggerMixin):
         """, (cash_balance, total_equity, previous_equity, total_fees, total_realized_pnl, total_unrealized_pnl, session_id))
         self.logger.info(f"✅ INSERT_EXECUTED: rowcount={cursor.rowcount}")
         
-        self.connection.commit()
+        self._commit()
         self.logger.info(f"✅ COMMIT_COMPLETE: Database transaction committed")
         
         # Log successful save with validation
@@ -556,6 +721,7 @@ class StateStore(LoggerMixin):
             return dict(zip(column_names, row))
         return None
 
+    @_synchronized
     def save_portfolio_snapshot(
         self,
         total_equity: float,
@@ -594,7 +760,7 @@ class StateStore(LoggerMixin):
             VALUES (?, ?, ?, ?, ?, ?)
         """, (total_equity, cash_balance, total_positions_value, total_unrealized_pnl, position_count, session_id))
         
-        self.connection.commit()
+        self._commit()
         self.logger.debug(f"Saved portfolio snapshot: equity=${total_equity:,.2f}")
 
     def get_portfolio_snapshots(
@@ -654,6 +820,7 @@ class StateStore(LoggerMixin):
             "last_updated": datetime.now().isoformat()
         }
 
+    @_synchronized
     def clear_all_positions(self) -> None:
         """Clear all positions from the store."""
         if not self.initialized:
@@ -661,9 +828,11 @@ class StateStore(LoggerMixin):
         
         cursor = self.connection.cursor()
         cursor.execute("DELETE FROM positions")
-        self.connection.commit()
+        self._commit()
+        self.position_index.clear()
         self.logger.info("All positions cleared from StateStore")
 
+    @_synchronized
     def clear_session_data(self, session_id: str) -> None:
         """Clear data for a specific session only."""
         if not self.initialized:
@@ -675,9 +844,11 @@ class StateStore(LoggerMixin):
         cursor.execute("DELETE FROM cash_equity WHERE session_id = ?", (session_id,))
         cursor.execute("DELETE FROM portfolio_snapshots WHERE session_id = ?", (session_id,))
         
-        self.connection.commit()
+        self._commit()
+        self.position_index.clear_session(session_id)
         self.logger.info(f"Session data cleared for session {session_id}")
     
+    @_synchronized
     def clear_all_data(self) -> None:
         """Clear all data from the store (use with caution)."""
         if not self.initialized:
@@ -689,15 +860,24 @@ class StateStore(LoggerMixin):
         cursor.execute("DELETE FROM cash_equity")
         cursor.execute("DELETE FROM portfolio_snapshots")
         
-        self.connection.commit()
+        self._commit()
+        self.position_index.clear()
         self.logger.warning("All data cleared from StateStore")
 
     def close(self) -> None:
         """Close the database connection."""
         if self.connection:
+            try:
+                self.flush_signal_windows()
+            except Exception as e:
+                self.logger.error(f"Failed to flush signal windows on close: {e}")
+            if self.writer is not None:
+                self.writer.stop()
+                self.writer = None
             self.connection.close()
             self.connection = None
             self.initialized = False
+            self.position_index.invalidate()
             self.logger.info("StateStore connection closed")
 
     def __enter__(self):
@@ -719,6 +899,7 @@ class StateStore(LoggerMixin):
         random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
         return f"session_{timestamp}_{random_suffix}"
 
+    @_synchronized
     def new_session(
         self, 
         session_id: str, 
@@ -1000,6 +1181,7 @@ class StateStore(LoggerMixin):
         
         return max(0.0, deployed_capital)  # Ensure non-negative
 
+    @_synchronized
     def debit_cash(self, session_id: str, amount: float, fees: float = 0.0) -> bool:
         """Debit cash from session (for BUY orders).
         
@@ -1054,6 +1236,7 @@ class StateStore(LoggerMixin):
         self.logger.info(f"✅ DEBIT_COMPLETE: cash=${new_cash:.2f}, equity=${recalculated_equity:.2f}")
         return True
 
+    @_synchronized
     def credit_cash(self, session_id: str, amount: float, fees: float = 0.0) -> bool:
         """Credit cash to session (for SELL orders).
         
@@ -1108,6 +1291,7 @@ class StateStore(LoggerMixin):
         self.logger.info(f"✅ CREDIT_COMPLETE: cash=${new_cash:.2f}, equity=${recalculated_equity:.2f}")
         return True
 
+    @_synchronized
     def save_signal_window(
         self,
         symbol: str,
@@ -1117,6 +1301,9 @@ class StateStore(LoggerMixin):
     ) -> None:
         """Save a signal value to the rolling window.
         
+        The value is appended to the in-memory window immediately and written
+        to SQLite by the next flush_signal_windows() call.
+        
         Args:
             symbol: Trading symbol
             timeframe: Timeframe (e.g., '1h', '4h')
@@ -1126,26 +1313,28 @@ class StateStore(LoggerMixin):
         if not self.initialized:
             self.initialize()
         
+        key = (symbol, timeframe, strategy_name)
+        self.signal_windows.append_signal(
+            key, signal_value, lambda: self._load_signal_window(*key)
+        )
+        self.logger.debug(f"Saved signal window: {symbol}/{timeframe}/{strategy_name} = {signal_value:.4f}")
+        self._maybe_flush_signal_windows()
+
+    def _load_signal_window(
+        self,
+        symbol: str,
+        timeframe: str,
+        strategy_name: str
+    ) -> List[float]:
+        """Load persisted signal values (most recent first)."""
         cursor = self.connection.cursor()
         cursor.execute("""
-            INSERT OR REPLACE INTO signal_windows 
-            (symbol, timeframe, strategy_name, signal_value, timestamp)
-            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, (symbol, timeframe, strategy_name, signal_value))
-        
-        # Keep only the last N=200 records per symbol/timeframe/strategy
-        cursor.execute("""
-            DELETE FROM signal_windows 
+            SELECT signal_value FROM signal_windows 
             WHERE symbol = ? AND timeframe = ? AND strategy_name = ?
-            AND id NOT IN (
-                SELECT id FROM signal_windows 
-                WHERE symbol = ? AND timeframe = ? AND strategy_name = ?
-                ORDER BY timestamp DESC LIMIT 200
-            )
-        """, (symbol, timeframe, strategy_name, symbol, timeframe, strategy_name))
+            ORDER BY timestamp DESC LIMIT ?
+        """, (symbol, timeframe, strategy_name, self.signal_windows.capacity))
         
-        self.connection.commit()
-        self.logger.debug(f"Saved signal window: {symbol}/{timeframe}/{strategy_name} = {signal_value:.4f}")
+        return [row[0] for row in cursor.fetchall()]
 
     def get_signal_window(
         self,
@@ -1168,15 +1357,13 @@ class StateStore(LoggerMixin):
         if not self.initialized:
             self.initialize()
         
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT signal_value FROM signal_windows 
-            WHERE symbol = ? AND timeframe = ? AND strategy_name = ?
-            ORDER BY timestamp DESC LIMIT ?
-        """, (symbol, timeframe, strategy_name, limit))
-        
-        return [row[0] for row in cursor.fetchall()]
+        key = (symbol, timeframe, strategy_name)
+        window = self.signal_windows.signal_window(
+            key, lambda: self._load_signal_window(*key)
+        )
+        return window.recent(limit)
 
+    @_synchronized
     def save_composite_signal_window(
         self,
         symbol: str,
@@ -1188,6 +1375,9 @@ class StateStore(LoggerMixin):
     ) -> None:
         """Save composite signal values to the rolling window.
         
+        The row is appended to the in-memory window immediately and written
+        to SQLite by the next flush_signal_windows() call.
+        
         Args:
             symbol: Trading symbol
             timeframe: Timeframe
@@ -1199,26 +1389,34 @@ class StateStore(LoggerMixin):
         if not self.initialized:
             self.initialize()
         
+        key = (symbol, timeframe)
+        row = {
+            "composite_score": composite_score,
+            "normalized_score": normalized_score,
+            "effective_threshold": effective_threshold,
+            "regime": regime,
+        }
+        self.signal_windows.append_composite(
+            key, row, lambda: self._load_composite_signal_window(*key)
+        )
+        self.logger.debug(f"Saved composite signal window: {symbol}/{timeframe} score={composite_score:.4f} norm={normalized_score:.4f} thr={effective_threshold:.4f}")
+        self._maybe_flush_signal_windows()
+
+    def _load_composite_signal_window(
+        self,
+        symbol: str,
+        timeframe: str
+    ) -> List[Dict[str, Any]]:
+        """Load persisted composite rows (most recent first)."""
         cursor = self.connection.cursor()
         cursor.execute("""
-            INSERT OR REPLACE INTO composite_signal_windows 
-            (symbol, timeframe, composite_score, normalized_score, effective_threshold, regime, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        """, (symbol, timeframe, composite_score, normalized_score, effective_threshold, regime))
-        
-        # Keep only the last N=200 records per symbol/timeframe
-        cursor.execute("""
-            DELETE FROM composite_signal_windows 
+            SELECT composite_score, normalized_score, effective_threshold, regime, timestamp
+            FROM composite_signal_windows 
             WHERE symbol = ? AND timeframe = ?
-            AND id NOT IN (
-                SELECT id FROM composite_signal_windows 
-                WHERE symbol = ? AND timeframe = ?
-                ORDER BY timestamp DESC LIMIT 200
-            )
-        """, (symbol, timeframe, symbol, timeframe))
+            ORDER BY timestamp DESC LIMIT ?
+        """, (symbol, timeframe, self.signal_windows.capacity))
         
-        self.connection.commit()
-        self.logger.debug(f"Saved composite signal window: {symbol}/{timeframe} score={composite_score:.4f} norm={normalized_score:.4f} thr={effective_threshold:.4f}")
+        return [dict(row) for row in cursor.fetchall()]
 
     def get_composite_signal_window(
         self,
@@ -1239,15 +1437,16 @@ class StateStore(LoggerMixin):
         if not self.initialized:
             self.initialize()
         
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT composite_score, normalized_score, effective_threshold, regime, timestamp
-            FROM composite_signal_windows 
-            WHERE symbol = ? AND timeframe = ?
-            ORDER BY timestamp DESC LIMIT ?
-        """, (symbol, timeframe, limit))
-        
-        return [dict(row) for row in cursor.fetchall()]
+        key = (symbol, timeframe)
+        window = self.signal_windows.composite_window(
+            key, lambda: self._load_composite_signal_window(*key)
+        )
+        rows = []
+        for row in reversed(window):
+            if len(rows) >= limit:
+                break
+            rows.append(dict(row))
+        return rows
 
     def get_signal_window_stats(
         self,
@@ -1268,25 +1467,82 @@ class StateStore(LoggerMixin):
         if not self.initialized:
             self.initialize()
         
-        signals = self.get_signal_window(symbol, timeframe, strategy_name)
+        key = (symbol, timeframe, strategy_name)
+        window = self.signal_windows.signal_window(
+            key, lambda: self._load_signal_window(*key)
+        )
+        return window.stats()
+
+    def _maybe_flush_signal_windows(self) -> None:
+        """Flush early if an unusually large batch has built up."""
+        if self.signal_windows.pending_count >= self.SIGNAL_WINDOW_MAX_PENDING:
+            self.flush_signal_windows()
+
+    @_synchronized
+    def flush_signal_windows(self) -> int:
+        """Write all queued signal window rows in a single transaction.
         
-        if not signals:
-            return {"mean": 0.0, "std": 0.0, "min": 0.0, "max": 0.0, "count": 0}
+        Inserts every queued strategy and composite row, trims each touched
+        window to its last N rows, and commits once.
         
-        import statistics
+        Returns:
+            Number of rows written
+        """
+        if not self.initialized or self.connection is None:
+            return 0
         
-        mean_val = statistics.mean(signals)
-        std_val = statistics.stdev(signals) if len(signals) > 1 else 0.0
-        min_val = min(signals)
-        max_val = max(signals)
+        signals, composites = self.signal_windows.drain_pending()
+        if not signals and not composites:
+            return 0
         
-        return {
-            "mean": mean_val,
-            "std": std_val,
-            "min": min_val,
-            "max": max_val,
-            "count": len(signals)
-        }
+        capacity = self.signal_windows.capacity
+        try:
+            cursor = self.connection.cursor()
+            cursor.executemany("""
+                INSERT OR REPLACE INTO signal_windows 
+                (symbol, timeframe, strategy_name, signal_value, timestamp)
+                VALUES (?, ?, ?, ?, ?)
+            """, signals)
+            cursor.executemany("""
+                INSERT OR REPLACE INTO composite_signal_windows 
+                (symbol, timeframe, composite_score, normalized_score, effective_threshold, regime, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, composites)
+            
+            # Keep only the last N records per touched symbol/timeframe(/strategy)
+            signal_keys = sorted({row[:3] for row in signals})
+            cursor.executemany("""
+                DELETE FROM signal_windows 
+                WHERE symbol = ? AND timeframe = ? AND strategy_name = ?
+                AND id NOT IN (
+                    SELECT id FROM signal_windows 
+                    WHERE symbol = ? AND timeframe = ? AND strategy_name = ?
+                    ORDER BY timestamp DESC LIMIT ?
+                )
+            """, [(*key, *key, capacity) for key in signal_keys])
+            composite_keys = sorted({row[:2] for row in composites})
+            cursor.executemany("""
+                DELETE FROM composite_signal_windows 
+                WHERE symbol = ? AND timeframe = ?
+                AND id NOT IN (
+                    SELECT id FROM composite_signal_windows 
+                    WHERE symbol = ? AND timeframe = ?
+                    ORDER BY timestamp DESC LIMIT ?
+                )
+            """, [(*key, *key, capacity) for key in composite_keys])
+            
+            self._commit()
+        except Exception:
+            # Under write-behind the open transaction holds other callers'
+            # mutations, so only roll back when committing synchronously
+            if self.writer is None:
+                self.connection.rollback()
+            self.signal_windows.requeue(signals, composites)
+            raise
+        
+        written = len(signals) + len(composites)
+        self.logger.debug(f"Flushed {written} signal window rows in one transaction")
+        return written
 
     def get_session_metadata(self, session_id: str, key: str, default: Any = None) -> Any:
         """Get session metadata value.
@@ -1323,6 +1579,7 @@ class StateStore(LoggerMixin):
             self.logger.warning(f"Error getting session metadata {key}: {e}")
             return default
 
+    @_synchronized
     def set_session_metadata(self, session_id: str, key: str, value: Any) -> bool:
         """Set session metadata value.
         
@@ -1347,7 +1604,7 @@ class StateStore(LoggerMixin):
                    VALUES (?, ?, ?, ?)""",
                 (session_id, key, json_value, datetime.now().isoformat())
             )
-            self.connection.commit()
+            self._commit()
             
             return True
             
@@ -1357,6 +1614,7 @@ class StateStore(LoggerMixin):
 
     # LotBook persistence methods
     
+    @_synchronized
     def save_lot(
         self,
         symbol: str,
@@ -1390,7 +1648,7 @@ class StateStore(LoggerMixin):
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
         """, (symbol, lot_id, quantity, cost_price, fee, timestamp.isoformat(), session_id, trade_id))
         
-        self.connection.commit()
+        self._commit()
         self.logger.debug(f"Saved lot {lot_id}: {quantity:.6f} {symbol} @ ${cost_price:.4f}")
 
     def get_lotbook(self, symbol: str, session_id: str) -> List[Dict[str, Any]]:
@@ -1426,6 +1684,7 @@ class StateStore(LoggerMixin):
         
         return lots
 
+    @_synchronized
     def set_lotbook(self, symbol: str, lots: List[Dict[str, Any]], session_id: str) -> None:
         """Set all lots for a symbol (replaces existing).
         
@@ -1459,7 +1718,7 @@ class StateStore(LoggerMixin):
                 lot.get('trade_id')
             ))
         
-        self.connection.commit()
+        self._commit()
         self.logger.debug(f"Set lotbook for {symbol}: {len(lots)} lots")
 
     def snapshot_all_lotbooks(self, session_id: str) -> Dict[str, List[Dict[str, Any]]]:
@@ -1501,6 +1760,7 @@ class StateStore(LoggerMixin):
         """
         return self.snapshot_all_lotbooks(session_id)
 
+    @_synchronized
     def clear_lotbook(self, symbol: str, session_id: str) -> int:
         """Clear all lots for a symbol.
         
@@ -1518,11 +1778,12 @@ class StateStore(LoggerMixin):
         cursor.execute("DELETE FROM lotbook WHERE symbol = ? AND session_id = ?", (symbol, session_id))
         
         cleared_count = cursor.rowcount
-        self.connection.commit()
+        self._commit()
         
         self.logger.debug(f"Cleared {cleared_count} lots for {symbol}")
         return cleared_count
 
+    @_synchronized
     def clear_all_lotbooks(self, session_id: str) -> int:
         """Clear all lotbooks for a session.
         
@@ -1539,7 +1800,7 @@ class StateStore(LoggerMixin):
         cursor.execute("DELETE FROM lotbook WHERE session_id = ?", (session_id,))
         
         cleared_count = cursor.rowcount
-        self.connection.commit()
+        self._commit()
         
         self.logger.debug(f"Cleared all {cleared_count} lots for session {session_id}")
         return cleared_count
@@ -0,0 +1,192 @@
+"""
+Write-behind group commit for the StateStore SQLite connection.
+
+In the default mode every StateStore mutation commits (and fsyncs) on the
+calling thread. In write-behind mode mutations still execute immediately, so
+reads on the same connection see them, but instead of committing they enqueue a
+commit request. A dedicated writer thread drains the queue and commits
+everything pending in one transaction per interval (group commit).
+
+With the database in WAL mode a crash loses at most the last uncommitted group;
+committed groups are never torn and each StateStore method is applied entirely
+or not at all, because the writer commits under the same lock the mutating
+methods hold.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from ..core.logging_utils import LoggerMixin
+
+
+class _FlushBarrier:
+    """Queue item that is released once everything before it is committed."""
+
+    __slots__ = ("event", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+class WriteBehindWriter(LoggerMixin):
+    """
+    Dedicated writer thread performing group commits for a shared connection.
+
+    commit_fn always runs under ``lock``. Mutating callers hold the same lock
+    while they execute their statements, so a group never splits a mutation.
+    """
+
+    def __init__(
+        self,
+        commit_fn: Callable[[], None],
+        lock: threading.RLock,
+        interval_ms: float = 50.0,
+        max_batch: int = 500,
+    ):
+        """Initialize the writer (call start() to launch the thread).
+
+        Args:
+            commit_fn: Commits the connection's open transaction
+            lock: Lock guarding the connection's write transaction
+            interval_ms: Maximum time a mutation waits before being committed
+            max_batch: Commit early once this many mutations are pending
+        """
+        super().__init__()
+        self.commit_fn = commit_fn
+        self.lock = lock
+        self.interval = max(float(interval_ms), 0.0) / 1000.0
+        self.max_batch = max(int(max_batch), 1)
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+        self.commits = 0
+        self.mutations_committed = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="state-store-writer", daemon=True
+        )
+        self._thread.start()
+
+    def notify(self) -> None:
+        """Record a mutation that needs to be committed."""
+        self._queue.put(1)
+
+    def flush(self, timeout: Optional[float] = 30.0) -> bool:
+        """Block until every mutation enqueued so far is committed.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the barrier was reached
+        """
+        if not self.running:
+            self._commit_inline()
+            return True
+
+        barrier = _FlushBarrier()
+        self._queue.put(barrier)
+        if not barrier.event.wait(timeout):
+            self.logger.warning(f"Write-behind flush timed out after {timeout}s")
+            return False
+        if barrier.error is not None:
+            raise barrier.error
+        return True
+
+    def stop(self, timeout: Optional[float] = 30.0) -> None:
+        """Flush pending mutations and stop the writer thread."""
+        if not self.running:
+            self._commit_inline()
+            return
+        self.flush(timeout)
+        self._stopping.set()
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get group commit statistics."""
+        return {
+            "running": self.running,
+            "pending": self._queue.qsize(),
+            "commits": self.commits,
+            "mutations_committed": self.mutations_committed,
+            "avg_group_size": self.mutations_committed / self.commits if self.commits else 0.0,
+            "last_error": self.last_error,
+        }
+
+    def _commit_inline(self) -> None:
+        with self.lock:
+            self.commit_fn()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            item = self._queue.get()
+            if item is None:
+                break
+
+            pending = 0
+            barriers = []
+            deadline = time.monotonic() + self.interval
+
+            # Gather everything that arrives within the interval into one group
+            while True:
+                if isinstance(item, _FlushBarrier):
+                    barriers.append(item)
+                elif item is not None:
+                    pending += 1
+
+                if barriers or pending >= self.max_batch or item is None:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            # Include anything already queued behind the group
+            while True:
+                try:
+                    extra = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(extra, _FlushBarrier):
+                    barriers.append(extra)
+                elif extra is None:
+                    self._stopping.set()
+                else:
+                    pending += 1
+
+            error = None
+            try:
+                self._commit_inline()
+                self.commits += 1
+                self.mutations_committed += pending
+            except Exception as e:
+                error = e
+                self.last_error = str(e)
+                self.logger.error(f"Write-behind group commit failed: {e}")
+
+            for barrier in barriers:
+                barrier.error = error
+                barrier.event.set()
+
+            if item is None:
+                break
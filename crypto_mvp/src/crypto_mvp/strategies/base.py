@@ -8,7 +8,10 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
+from ..core.candle_store import get_candle_store
 from ..core.logging_utils import LoggerMixin
+from ..indicators.incremental import PeriodKey, get_indicator_engine
+from ..indicators.technical_calculator import get_calculator
 
 
 class SignalType(Enum):
@@ -128,6 +131,90 @@ class Strategy(ABC, LoggerMixin):
         """
         pass
 
+    def get_candles(
+        self, symbol: str, timeframe: str, limit: int = 100
+    ) -> Optional[dict[str, Any]]:
+        """Get parsed OHLCV columns from the cycle candle store.
+
+        Candles prefetched by the trading cycle are served from the shared store;
+        otherwise they are fetched from ``self.data_engine`` once and cached for
+        the other strategies. Data engines with ``get_candle_columns`` (the
+        backtest's HistoricalDataEngine) serve the columns directly. The
+        returned NumPy arrays are read-only.
+
+        Args:
+            symbol: Trading symbol (e.g., 'BTC/USDT')
+            timeframe: Candle timeframe (e.g., '1h')
+            limit: Number of candles wanted
+
+        Returns:
+            Dict of timestamps/opens/highs/lows/closes/volumes arrays, or None
+        """
+        data_engine = getattr(self, "data_engine", None)
+        if data_engine is None:
+            return None
+
+        # Historical engines serve point-in-time column views directly
+        get_candle_columns = getattr(data_engine, "get_candle_columns", None)
+        if get_candle_columns is not None:
+            return get_candle_columns(symbol, timeframe, limit)
+
+        return get_candle_store().get_or_fetch(
+            symbol,
+            timeframe,
+            limit,
+            lambda: data_engine.get_ohlcv(symbol, timeframe, limit=limit),
+        )
+
+    def get_indicator(
+        self,
+        symbol: str,
+        timeframe: str,
+        indicator: str,
+        candles: dict[str, Any],
+        period: PeriodKey = 14,
+    ) -> Any:
+        """Get an indicator from the shared incremental indicator engine.
+
+        The engine keeps streaming state per (symbol, timeframe, indicator,
+        period); only candles newer than the last ones it saw are pushed, so
+        strategies reading the same stream each cycle stop recomputing it over
+        the whole window. RSI, ATR and Williams %R equal TechnicalCalculator's
+        values on the same candles.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            indicator: Streaming indicator name ('rsi', 'atr', 'williams_r', ...)
+            candles: Parsed candle columns from get_candles()
+            period: Indicator period
+
+        Returns:
+            Indicator value, or None while the stream is warming up
+        """
+        return get_indicator_engine().update(symbol, timeframe, indicator, candles, period)
+
+    def get_atr_with_fallback(
+        self, symbol: str, timeframe: str, candles: dict[str, Any], period: int = 14
+    ) -> float:
+        """Get the streaming ATR, falling back to the calculator's warmup estimate.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            candles: Parsed candle columns from get_candles()
+            period: ATR period
+
+        Returns:
+            ATR value (never None)
+        """
+        atr = self.get_indicator(symbol, timeframe, "atr", candles, period)
+        if atr is not None and atr > 0:
+            return atr
+        return get_calculator().calculate_atr_with_fallback(
+            candles["highs"], candles["lows"], candles["closes"], period
+        )
+
     def get_required_data(self) -> list[str]:
         """Get list of required data types for this strategy.
 
@@ -53,21 +53,19 @@ class BreakoutStrategy(Strategy):
             if not self.data_engine:
                 return self._neutral_signal(symbol, "no_data_engine")
             
-            # Fetch real OHLCV data
-            ohlcv = self.data_engine.get_ohlcv(symbol, timeframe, limit=100)
+            # Fetch real OHLCV data (shared, already-parsed candles for this cycle)
+            parsed = self.get_candles(symbol, timeframe, limit=100)
             
-            if not ohlcv or len(ohlcv) < self.lookback_period + 10:
+            if not parsed or len(parsed["closes"]) < self.lookback_period + 10:
                 return self._neutral_signal(symbol, "insufficient_data")
             
-            # Parse OHLCV data
-            parsed = self.calculator.parse_ohlcv(ohlcv)
             highs = parsed["highs"]
             lows = parsed["lows"]
             closes = parsed["closes"]
             volumes = parsed["volumes"]
             
             # Calculate indicators (use fallback for ATR to avoid warmup blocking)
-            atr = self.calculator.calculate_atr_with_fallback(highs, lows, closes, self.atr_period)
+            atr = self.get_atr_with_fallback(symbol, timeframe, parsed, self.atr_period)
             volume_ratio = self.calculator.calculate_volume_ratio(volumes, 20)
             support_resistance = self.calculator.detect_support_resistance(
                 highs, lows, closes, self.lookback_period
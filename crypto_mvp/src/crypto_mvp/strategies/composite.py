@@ -2,7 +2,11 @@
 Composite signal engine for profit-maximizing trading decisions.
 """
 
+import asyncio
 import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Optional
 
@@ -44,6 +48,14 @@ class ProfitMaximizingSignalEngine(LoggerMixin):
         self.window_size = self.config.get("window_size", 200)
         self.dynamic_threshold_enabled = self.config.get("dynamic_threshold_enabled", True)
 
+        # Worker pool for running strategies across symbols concurrently
+        self.max_workers = int(self.config.get("generation", {}).get("max_workers", 4))
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Per-strategy analyze() time accumulated across symbols: name -> [wall_s, cpu_s]
+        self._strategy_timings: dict[str, list[float]] = {}
+        self._timings_lock = threading.Lock()
+
         # Default strategy weights (can be overridden by config)
         self.default_weights = {
             "momentum": 0.15,
@@ -151,14 +163,80 @@ class ProfitMaximizingSignalEngine(LoggerMixin):
             f"Generating composite signals for {symbol} on {timeframe} timeframe"
         )
 
-        # Collect signals from all strategies
+        individual_signals, failed = self._run_strategies(symbol, timeframe)
+        return self.build_composite_signal(symbol, timeframe, individual_signals, failed)
+
+    async def collect_strategy_signals(
+        self, symbols: list[str], timeframe: Optional[str] = None
+    ) -> dict[str, tuple[dict[str, dict[str, Any]], set[str]]]:
+        """Run every strategy for many symbols concurrently on the worker pool.
+
+        Strategy ``analyze()`` calls are synchronous, so each symbol's strategy
+        pass is submitted to a thread pool. Results are keyed and returned in the
+        order of ``symbols`` regardless of which symbol finishes first; combine
+        them with :meth:`build_composite_signal` in that same order so rolling
+        windows are updated deterministically.
+
+        Args:
+            symbols: Trading symbols
+            timeframe: Timeframe for analysis (optional)
+
+        Returns:
+            Mapping of symbol -> (individual strategy signals, failed strategy names)
+        """
+        if not self.initialized:
+            self.initialize()
+
+        timeframe = timeframe or "default"
+
+        if self.max_workers <= 1 or len(symbols) <= 1:
+            return {symbol: self._run_strategies(symbol, timeframe) for symbol in symbols}
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, self._run_strategies, symbol, timeframe)
+                for symbol in symbols
+            )
+        )
+        return dict(zip(symbols, results))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get (lazily creating) the strategy worker pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="signal-worker"
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the strategy worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _run_strategies(
+        self, symbol: str, timeframe: str
+    ) -> tuple[dict[str, dict[str, Any]], set[str]]:
+        """Run every strategy's analyze() for one symbol.
+
+        This touches no shared state (no state store access) so it is safe to run
+        on a worker thread.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe for analysis
+
+        Returns:
+            Tuple of (strategy name -> raw signal dict, names of strategies that raised)
+        """
         individual_signals = {}
-        strategy_scores = []
-        strategy_confidences = []
-        strategy_weights = []
-        normalized_scores = []
+        failed = set()
 
         for name, strategy in self.strategies.items():
+            wall_start = time.perf_counter()
+            cpu_start = time.thread_time()
             try:
                 signal = strategy.analyze(symbol, timeframe)
                 
@@ -174,6 +252,78 @@ class ProfitMaximizingSignalEngine(LoggerMixin):
                 
                 individual_signals[name] = signal
 
+            except Exception as e:
+                self.logger.warning(f"Failed to get signal from strategy {name}: {e}")
+                # Use neutral values for failed strategies
+                individual_signals[name] = {
+                    "score": 0.0,
+                    "signal_strength": 0.0,
+                    "confidence": 0.0,
+                    "error": str(e),
+                }
+                failed.add(name)
+            finally:
+                self._record_strategy_time(
+                    name, time.perf_counter() - wall_start, time.thread_time() - cpu_start
+                )
+
+        return individual_signals, failed
+
+    def _record_strategy_time(self, name: str, wall_s: float, cpu_s: float) -> None:
+        with self._timings_lock:
+            totals = self._strategy_timings.setdefault(name, [0.0, 0.0])
+            totals[0] += wall_s
+            totals[1] += cpu_s
+
+    def pop_strategy_timings(self) -> dict[str, tuple[float, float]]:
+        """Get and reset per-strategy analyze() time since the last call.
+
+        Returns:
+            Strategy name -> (wall seconds, CPU seconds), summed over symbols
+        """
+        with self._timings_lock:
+            timings = {name: (wall, cpu) for name, (wall, cpu) in self._strategy_timings.items()}
+            self._strategy_timings.clear()
+        return timings
+
+    def build_composite_signal(
+        self,
+        symbol: str,
+        timeframe: str,
+        individual_signals: dict[str, dict[str, Any]],
+        failed: Optional[set[str]] = None,
+    ) -> dict[str, Any]:
+        """Combine individual strategy signals into a composite signal.
+
+        Normalizes each signal against its rolling window and records the new
+        values in the state store, so this must run on the caller's thread.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe for analysis
+            individual_signals: Mapping of strategy name -> raw signal dict
+            failed: Names of strategies whose analyze() raised (neutral, zero weight)
+
+        Returns:
+            Composite signal dictionary (see generate_composite_signals)
+        """
+        strategy_scores = []
+        strategy_confidences = []
+        strategy_weights = []
+        normalized_scores = []
+
+        failed = failed or set()
+
+        for name, signal in individual_signals.items():
+            if name in failed:
+                # Failed strategies contribute neutral values with zero weight
+                strategy_scores.append(0.0)
+                normalized_scores.append(0.0)
+                strategy_confidences.append(0.0)
+                strategy_weights.append(0.0)
+                continue
+
+            try:
                 raw_score = signal.get("score", 0.0)
                 confidence = signal.get("confidence", 0.0)
                 weight = self.strategy_weights.get(name, 0.0)
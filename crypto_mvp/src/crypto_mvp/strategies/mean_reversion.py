@@ -52,17 +52,13 @@ class MeanReversionStrategy(Strategy):
             if not self.data_engine:
                 return self._neutral_signal(symbol, "no_data_engine")
             
-            # Fetch real OHLCV data
-            ohlcv = self.data_engine.get_ohlcv(symbol, timeframe, limit=100)
+            # Fetch real OHLCV data (shared, already-parsed candles for this cycle)
+            parsed = self.get_candles(symbol, timeframe, limit=100)
             
-            if not ohlcv or len(ohlcv) < self.bb_period + 10:
+            if not parsed or len(parsed["closes"]) < self.bb_period + 10:
                 return self._neutral_signal(symbol, "insufficient_data")
             
-            # Parse OHLCV data
-            parsed = self.calculator.parse_ohlcv(ohlcv)
             closes = parsed["closes"]
-            highs = parsed["highs"]
-            lows = parsed["lows"]
             
             # Calculate Bollinger Bands
             bb_data = self.calculator.calculate_bollinger_bands(
@@ -70,7 +66,7 @@ class MeanReversionStrategy(Strategy):
             )
             
             # Calculate RSI for confirmation
-            rsi = self.calculator.calculate_rsi(closes, self.rsi_period)
+            rsi = self.get_indicator(symbol, timeframe, "rsi", parsed, self.rsi_period)
             
             if bb_data is None or rsi is None:
                 return self._neutral_signal(symbol, "indicator_calculation_failed")
@@ -86,7 +82,7 @@ class MeanReversionStrategy(Strategy):
             signal_strength = abs(mean_reversion_score)
             
             # Calculate stop loss and take profit (use fallback for ATR to avoid warmup blocking)
-            atr = self.calculator.calculate_atr_with_fallback(highs, lows, closes, 14)
+            atr = self.get_atr_with_fallback(symbol, timeframe, parsed, 14)
             stop_loss, take_profit = self._calculate_stop_take_profit(
                 entry_price, mean_reversion_score, atr, bb_data
             )
@@ -6,9 +6,18 @@ from typing import Any, Optional
 import numpy as np
 
 from .base import Strategy
+from ..indicators.incremental import batch_atr, batch_macd, batch_rsi, batch_williams_r, rolling_batch
 from ..indicators.technical_calculator import get_calculator
 
 
+def _volume_ratio(volumes: np.ndarray) -> np.ndarray:
+    """Batch form of TechnicalCalculator.calculate_volume_ratio (last volume vs the ones before)."""
+    average = volumes[:, :-1].mean(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = volumes[:, -1] / average
+    return np.where(average == 0, 1.0, ratio)
+
+
 class MomentumStrategy(Strategy):
     """Momentum trading strategy based on technical indicators."""
 
@@ -59,22 +68,19 @@ class MomentumStrategy(Strategy):
                 # Fallback to neutral signal if no data engine
                 return self._neutral_signal(symbol, "no_data_engine")
             
-            ohlcv = self.data_engine.get_ohlcv(symbol, timeframe, limit=100)
+            # Fetch real OHLCV data (shared, already-parsed candles for this cycle)
+            parsed = self.get_candles(symbol, timeframe, limit=100)
             
-            if not ohlcv or len(ohlcv) < max(self.macd_slow, self.rsi_period) + 10:
+            if not parsed or len(parsed["closes"]) < max(self.macd_slow, self.rsi_period) + 10:
                 return self._neutral_signal(symbol, "insufficient_data")
             
-            # Parse OHLCV data
-            parsed = self.calculator.parse_ohlcv(ohlcv)
             closes = parsed["closes"]
-            highs = parsed["highs"]
-            lows = parsed["lows"]
             volumes = parsed["volumes"]
             
             # Calculate real indicators
-            rsi = self.calculator.calculate_rsi(closes, self.rsi_period)
+            rsi = self.get_indicator(symbol, timeframe, "rsi", parsed, self.rsi_period)
             macd_data = self.calculator.calculate_macd(closes, self.macd_fast, self.macd_slow, self.macd_signal)
-            williams_r = self.calculator.calculate_williams_r(highs, lows, closes, self.williams_period)
+            williams_r = self.get_indicator(symbol, timeframe, "williams_r", parsed, self.williams_period)
             volume_ratio = self.calculator.calculate_volume_ratio(volumes, 20)
             volatility = self.calculator.calculate_volatility(closes, 20)
             
@@ -96,7 +102,7 @@ class MomentumStrategy(Strategy):
             signal_strength = abs(momentum_score)
             
             # Calculate stop loss and take profit using ATR (with fallback for warmup)
-            atr = self.calculator.calculate_atr_with_fallback(highs, lows, closes, 14)
+            atr = self.get_atr_with_fallback(symbol, timeframe, parsed, 14)
             stop_loss, take_profit = self._calculate_stop_take_profit(
                 entry_price, momentum_score, atr
             )
@@ -129,6 +135,92 @@ class MomentumStrategy(Strategy):
             self.logger.warning(f"Momentum analysis failed for {symbol}: {e}")
             return self._neutral_signal(symbol, f"error:{str(e)}")
     
+    def analyze_batch(
+        self,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray,
+        window: int = 100,
+    ) -> dict[str, np.ndarray]:
+        """Score every candle of a history at once.
+
+        Equivalent to calling analyze() at each candle with the trailing
+        ``window`` candles as its OHLCV input, but computed in a few vectorized
+        passes over (symbols, candles) arrays.
+
+        Args:
+            highs: High prices shaped (symbols, candles)
+            lows: Low prices shaped (symbols, candles)
+            closes: Close prices shaped (symbols, candles)
+            volumes: Volumes shaped (symbols, candles)
+            window: Candles analyze() would see (its OHLCV limit)
+
+        Returns:
+            Dict of (symbols, candles) arrays: score, stop_loss, take_profit and
+            the underlying indicators; NaN where fewer than ``window`` candles
+            (or fewer than analyze() needs) are available
+        """
+        highs, lows, closes, volumes = (
+            np.atleast_2d(np.asarray(values, dtype=float)) for values in (highs, lows, closes, volumes)
+        )
+
+        rsi = rolling_batch(lambda c: batch_rsi(c, self.rsi_period), [closes], self.rsi_period + 1)
+        histogram = rolling_batch(
+            lambda c: batch_macd(c, self.macd_fast, self.macd_slow, self.macd_signal)["histogram"],
+            [closes],
+            window,
+        )
+        williams_r = rolling_batch(
+            lambda high, low, close: batch_williams_r(high, low, close, self.williams_period),
+            [highs, lows, closes],
+            self.williams_period,
+        )
+        volume_ratio = rolling_batch(_volume_ratio, [volumes], 20)
+        atr = rolling_batch(lambda high, low, close: batch_atr(high, low, close, 14), [highs, lows, closes], 15)
+
+        # Same component scores and combination order as _calculate_momentum_score
+        rsi_score = np.where(rsi < self.rsi_oversold, 0.5, np.where(rsi > self.rsi_overbought, -0.5, 0.0))
+        macd_score = np.where(histogram > 0, 0.3, -0.3)
+        williams_score = np.where(
+            williams_r < self.williams_oversold, 0.2, np.where(williams_r > self.williams_overbought, -0.2, 0.0)
+        )
+        score = np.clip(rsi_score + macd_score + williams_score, -1.0, 1.0)
+        # analyze() skips the volume check when the ratio is exactly 0
+        weak_volume = (volume_ratio != 0) & (volume_ratio < self.min_volume_ratio)
+        score = np.where(weak_volume, score * 0.7, score)
+
+        if window < max(self.macd_slow, self.rsi_period) + 10 or window < self.macd_slow + self.macd_signal:
+            score[:] = np.nan
+        else:
+            score[np.isnan(histogram)] = np.nan
+
+        # ATR-based stops, falling back to the calculator's bootstrap estimate
+        fallback = np.argwhere(~(atr > 0) & ~np.isnan(score))
+        for row, col in fallback:
+            start = max(col + 1 - window, 0)
+            atr[row, col] = self.calculator.calculate_atr_with_fallback(
+                highs[row, start:col + 1], lows[row, start:col + 1], closes[row, start:col + 1], 14
+            )
+        use_atr = atr > 0
+        stop_distance = np.where(use_atr, 1.5 * atr, closes * 0.02)
+        take_distance = np.where(use_atr, 3.0 * atr, closes * 0.04)
+        direction = np.where(score > 0, 1.0, -1.0)
+        has_stops = np.abs(score) >= 0.3
+        stop_loss = np.where(has_stops, closes - direction * stop_distance, np.nan)
+        take_profit = np.where(has_stops, closes + direction * take_distance, np.nan)
+
+        return {
+            "score": score,
+            "stop_loss": stop_loss,
+            "take_profit": take_profit,
+            "rsi": rsi,
+            "macd_histogram": histogram,
+            "williams_r": williams_r,
+            "volume_ratio": volume_ratio,
+            "atr": atr,
+        }
+
     def _neutral_signal(self, symbol: str, reason: str) -> dict[str, Any]:
         """Return a neutral signal when analysis fails."""
         return {
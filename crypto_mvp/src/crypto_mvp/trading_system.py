@@ -7,14 +7,26 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any, Optional, List, Dict
 
-from .analytics import ProfitAnalytics, ProfitLogger
+from .analytics import EventJournal, EventType, ProfitAnalytics, ProfitLogger
 from .analytics.trade_ledger import TradeLedger
 from .analytics.pnl_logger import get_pnl_logger
 from .core.config_manager import ConfigManager
+from .core.async_logging import get_logging_stats, set_log_levels, stop_log_pipeline
 from .core.logging_utils import LoggerMixin
 from .core.utils import get_mark_price, get_entry_price, get_exit_value, validate_mark_price, to_canonical, clear_cycle_price_cache, set_pricing_context, clear_pricing_context, PricingContextError
-from .core.pricing_snapshot import create_pricing_snapshot, clear_pricing_snapshot, get_current_pricing_snapshot
+from .core.pricing_snapshot import (
+    clear_pricing_snapshot,
+    configure_pricing_snapshots,
+    create_pricing_snapshot,
+    get_current_pricing_snapshot,
+)
 from .core.nav_validation import NAVValidator, NAVValidationResult
+from .core.market_fetch import MarketDataFetcher
+from .core.candle_store import get_candle_store
+from .indicators.atr_service import get_atr_service
+from .indicators.regime_features import RegimeFeatureFeed
+from .indicators.technical_calculator import get_calculator
+from .metrics import CycleProfiler, MetricsCollector
 from .core.decimal_money import (
     to_decimal, quantize_currency, quantize_quantity, calculate_notional, 
     calculate_fees, calculate_pnl, calculate_position_value, format_currency, 
@@ -55,6 +67,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
 
         # Core components
         self.data_engine = None
+        self.market_data_fetcher = None
         self.signal_engine = None
         self.risk_manager = None
         self.portfolio_manager = None
@@ -67,10 +80,16 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
         self.profit_analytics = None
         self.profit_logger = None
         self.trade_ledger = None
+        self.event_journal = None
 
         # State persistence
         self.state_store = None
 
+        # Observability: per-phase cycle timings and metric histograms
+        self.metrics_collector = MetricsCollector()
+        self.cycle_profiler = CycleProfiler()
+        self.metrics_server = None
+
         # LotBook for FIFO realized P&L tracking
         self.lot_books = {}  # symbol -> LotBook instance
 
@@ -142,15 +161,29 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             if not self.config_manager or not self.config:
                 self.config_manager = ConfigManager(self.config_path)
                 self.config = self.config_manager.to_dict()
+                set_log_levels(self.config.get("logging", {}).get("levels"))
+                # The logger was created before the config existed; configure it
+                # now so it (and every subsystem created below) uses the pipeline
+                if self.config.get("logging"):
+                    self.set_logger_config(self.config["logging"])
                 self.logger.info("Configuration loaded successfully")
             else:
                 self.logger.info("Configuration already loaded, using existing config")
 
+            profiling_config = self.config.get("monitoring", {}).get("profiling", {})
+            self.cycle_profiler = CycleProfiler(profiling_config.get("history", 100))
+            self._start_metrics_server()
+
             # Initialize data engine
             self.data_engine = ProfitOptimizedDataEngine()
             self.data_engine.initialize()
             self.logger.info("Data engine initialized")
 
+            # Concurrent per-symbol fetch stage on top of the data engine
+            fetch_config = self.config.get("market_data", {}).get("fetch", {})
+            self.market_data_fetcher = MarketDataFetcher(self.data_engine, fetch_config)
+            configure_pricing_snapshots(self.config.get("market_data", {}).get("snapshot", {}))
+
             # ATR calculation now handled by TechnicalCalculator (pandas-free)
             # ATRService has pandas dependency issues with numpy 2.x, so we skip it
             self.atr_service = None  # Use technical_calculator.calculate_atr() in strategies
@@ -234,26 +267,13 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             signals_config = self.config.get("signals", {})
             self.regime_detector = RegimeDetector(self.config)
             
-            # Set up regime detector callbacks (placeholder implementations)
-            def get_ema_callback(symbol: str, period: int) -> Optional[float]:
-                """Get EMA value from data engine."""
-                try:
-                    if self.data_engine:
-                        # Placeholder - in real implementation, get EMA from data engine
-                        return 50000.0  # Mock value
-                    return None
-                except Exception:
-                    return None
-            
-            def get_adx_callback(symbol: str, period: int) -> Optional[float]:
-                """Get ADX value from data engine."""
-                try:
-                    if self.data_engine:
-                        # Placeholder - in real implementation, get ADX from data engine
-                        return 25.0  # Mock value
-                    return None
-                except Exception:
-                    return None
+            # EMA/ADX come from the feature feed, updated with each cycle's candles
+            features_config = signals_config.get("regime", {}).get("features", {})
+            self.regime_features = RegimeFeatureFeed({
+                "ema_periods": (self.regime_detector.ema_fast_period, self.regime_detector.ema_slow_period),
+                "adx_period": self.regime_detector.adx_period,
+                **features_config,
+            })
             
             def get_atr_callback(symbol: str, period: int) -> Optional[float]:
                 """Get ATR value from data engine."""
@@ -264,15 +284,22 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 except Exception:
                     return None
             
-            self.regime_detector.set_callbacks(get_ema_callback, get_adx_callback, get_atr_callback)
+            self.regime_detector.set_callbacks(
+                self.regime_features.get_ema, self.regime_features.get_adx, get_atr_callback
+            )
             self.logger.info("Regime detector initialized")
 
             # Initialize analytics
             # Initialize trade ledger first (single source of truth)
             analytics_config = self.config.get("analytics", {})
             ledger_db_path = analytics_config.get("ledger_db_path", "trade_ledger.db")
-            self.trade_ledger = TradeLedger(ledger_db_path)
+            self.trade_ledger = TradeLedger(
+                ledger_db_path,
+                read_pool_size=analytics_config.get("ledger_read_pool_size", 4),
+            )
             self.logger.info(f"Trade ledger initialized at {ledger_db_path}")
+            # Fills evicted from the order manager's bounded history are archived here
+            self.order_manager.set_trade_ledger(self.trade_ledger)
             
             # Initialize profit analytics with trade ledger reference
             self.profit_analytics = ProfitAnalytics(analytics_config)
@@ -285,7 +312,10 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             nav_tolerance = analytics_config.get("nav_validation_tolerance", 50.00)
             # Force minimum tolerance of $10 for production reliability
             nav_tolerance = max(nav_tolerance, 10.00)
-            self.nav_validator = NAVValidator(tolerance=nav_tolerance)
+            self.nav_validator = NAVValidator(
+                tolerance=nav_tolerance,
+                full_rebuild_interval=analytics_config.get("nav_full_rebuild_interval", 100),
+            )
             self.logger.info(f"NAV validator initialized with tolerance ${nav_tolerance:.2f} (minimum $10.00)")
 
             # Initialize profit logger with trade ledger reference
@@ -299,9 +329,18 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             self.profit_logger.initialize(session_id)
             self.logger.info("Profit logger initialized with trade ledger")
 
+            # Structured journal of cycles, signals, decisions, orders, fills and exits
+            journal_config = analytics_config.get("event_journal", {})
+            if journal_config.get("enabled", False):
+                self.event_journal = EventJournal(journal_config.get("directory", "logs/journal"), journal_config)
+                self.logger.info(f"Event journal writing to {self.event_journal.directory}")
+
             # Initialize state store
-            db_path = self.config.get("state", {}).get("db_path", "trading_state.db")
-            self.state_store = StateStore(db_path)
+            state_config = self.config.get("state", {})
+            db_path = state_config.get("db_path", "trading_state.db")
+            self.state_store = StateStore(
+                db_path, state_config.get("write_behind"), state_config.get("position_index")
+            )
             self.state_store.initialize()
             self.logger.info("State store initialized")
             
@@ -745,7 +784,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 if cash_diff > 0.01:
                     self.logger.warning(f"🔍 SAVE_PORTFOLIO_CHECK: MISMATCH ${cash_diff:.2f} - state_store cash=${state_store_cash:.2f}, in-memory cash={format_currency(self.portfolio.get('cash_balance', 0.0))}")
                 else:
-                    self.logger.info(f"SAVE_PORTFOLIO_CHECK: in sync (state_store=${state_store_cash:.2f})")
+                    self.logger.info("SAVE_PORTFOLIO_CHECK: in sync (state_store=$%.2f)", state_store_cash)
                 
                 # CRITICAL FIX: Use state_store cash as authoritative, update in-memory to match
                 self.portfolio["cash_balance"] = to_decimal(state_store_cash)
@@ -762,7 +801,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             total_unrealized_pnl = portfolio_snapshot["total_unrealized_pnl"]
             position_count = portfolio_snapshot["position_count"]
             
-            self.logger.info(f"SAVE_PORTFOLIO_STATE: Snapshot values - cash={format_currency(to_decimal(cash_balance))}, equity={format_currency(to_decimal(total_equity))}, positions_value={format_currency(to_decimal(total_positions_value))}, position_count={position_count}")
+            self.logger.info("SAVE_PORTFOLIO_STATE: Snapshot values - cash=%s, equity=%s, positions_value=%s, position_count=%s", format_currency(to_decimal(cash_balance)), format_currency(to_decimal(total_equity)), format_currency(to_decimal(total_positions_value)), position_count)
             
             # Save cash/equity to state store with values from snapshot
             self.state_store.save_cash_equity(
@@ -774,15 +813,15 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 session_id=self.current_session_id,
                 previous_equity=float(getattr(self, '_previous_equity', total_equity))
             )
-            self.logger.info(f"SAVE_PORTFOLIO_STATE: Successfully saved cash={format_currency(to_decimal(cash_balance))} to state store")
+            self.logger.info("SAVE_PORTFOLIO_STATE: Successfully saved cash=%s to state store", format_currency(to_decimal(cash_balance)))
             
             # Save portfolio snapshot with authoritative values
             # Debug the values before saving
-            self.logger.debug(f"PORTFOLIO_SNAPSHOT_DEBUG: total_equity={total_equity} (type: {type(total_equity)})")
-            self.logger.debug(f"PORTFOLIO_SNAPSHOT_DEBUG: cash_balance={cash_balance} (type: {type(cash_balance)})")
-            self.logger.debug(f"PORTFOLIO_SNAPSHOT_DEBUG: total_positions_value={total_positions_value} (type: {type(total_positions_value)})")
-            self.logger.debug(f"PORTFOLIO_SNAPSHOT_DEBUG: total_unrealized_pnl={total_unrealized_pnl} (type: {type(total_unrealized_pnl)})")
-            self.logger.debug(f"PORTFOLIO_SNAPSHOT_DEBUG: position_count={position_count} (type: {type(position_count)})")
+            self.logger.debug("PORTFOLIO_SNAPSHOT_DEBUG: total_equity=%s (type: %s)", total_equity, type(total_equity))
+            self.logger.debug("PORTFOLIO_SNAPSHOT_DEBUG: cash_balance=%s (type: %s)", cash_balance, type(cash_balance))
+            self.logger.debug("PORTFOLIO_SNAPSHOT_DEBUG: total_positions_value=%s (type: %s)", total_positions_value, type(total_positions_value))
+            self.logger.debug("PORTFOLIO_SNAPSHOT_DEBUG: total_unrealized_pnl=%s (type: %s)", total_unrealized_pnl, type(total_unrealized_pnl))
+            self.logger.debug("PORTFOLIO_SNAPSHOT_DEBUG: position_count=%s (type: %s)", position_count, type(position_count))
             
             self.state_store.save_portfolio_snapshot(
                 total_equity=float(total_equity),
@@ -830,7 +869,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                     if latest_cash_equity:
                         old_previous = self._previous_equity
                         self._previous_equity = float(latest_cash_equity["total_equity"])
-                        self.logger.info(f"📊 UPDATED_PREVIOUS_EQUITY: ${old_previous:.2f} → ${self._previous_equity:.2f} (from state store after transaction)")
+                        self.logger.info("📊 UPDATED_PREVIOUS_EQUITY: $%.2f → $%.2f (from state store after transaction)", old_previous, self._previous_equity)
                 else:
                     self.logger.warning("Portfolio transaction validation failed - changes discarded")
                 
@@ -840,6 +879,40 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             self.logger.error(f"Portfolio transaction failed: {e}")
             return False
 
+    async def _update_regime_features(
+        self, symbols: list[str], timeframe: str, parsed_candles: dict[str, Any]
+    ) -> None:
+        """Fold this cycle's candles into the regime feature feed.
+
+        Symbols seen for the first time get one longer history load so their
+        EMA200/ADX are warm immediately; afterwards only new candles are folded.
+        The history loads go through the market data fetcher concurrently so
+        they don't block the event loop.
+
+        Args:
+            symbols: Canonical symbols of this cycle
+            timeframe: Candle timeframe
+            parsed_candles: Symbol -> parsed candle columns from the candle store
+        """
+        feed = getattr(self, "regime_features", None)
+        if feed is None:
+            return
+        try:
+            history = {}
+            cold_symbols = feed.cold_symbols(symbols)
+            if cold_symbols:
+                cold_ohlcv = await self.market_data_fetcher.fetch_ohlcv(
+                    cold_symbols, timeframe, feed.history_limit
+                )
+                for symbol, ohlcv in cold_ohlcv.items():
+                    if ohlcv:
+                        history[symbol] = get_calculator().parse_ohlcv(ohlcv)
+            if history:
+                feed.update(history)
+            feed.update(parsed_candles)
+        except Exception as e:
+            self.logger.warning(f"Failed to update regime features: {e}")
+
     async def _get_comprehensive_market_data(
         self, symbols: list[str]
     ) -> dict[str, Any]:
@@ -852,7 +925,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             Comprehensive market data dictionary
         """
         self.logger.debug(
-            f"Getting comprehensive market data for {len(symbols)} symbols"
+            "Getting comprehensive market data for %s symbols", len(symbols)
         )
 
         # Convert all symbols to canonical format
@@ -869,54 +942,46 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
         }
 
         try:
-            # Get ticker data for all symbols (using canonical format)
-            for symbol in canonical_symbols:
-                try:
-                    ticker = self.data_engine.get_ticker(symbol)
-                    market_data["ticker_data"][symbol] = ticker
-                except Exception as e:
-                    self.logger.warning(f"Failed to get ticker for {symbol}: {e}")
-                    market_data["ticker_data"][symbol] = None
-
-            # Get OHLCV data for all symbols (using canonical format)
+            # Fan out ticker, OHLCV and market-wide requests concurrently so the
+            # cycle waits for the slowest symbol rather than the sum of round trips
             timeframe = self.config.get("trading", {}).get("timeframe", "1h")
             limit = self.config.get("trading", {}).get("ohlcv_limit", 100)
 
-            for symbol in canonical_symbols:
+            if self.market_data_fetcher is None:
+                fetch_config = self.config.get("market_data", {}).get("fetch", {})
+                self.market_data_fetcher = MarketDataFetcher(self.data_engine, fetch_config)
+
+            fetched = await self.market_data_fetcher.fetch(
+                canonical_symbols, timeframe, limit, proxy_symbol="BTC/USDT"
+            )
+            market_data.update(fetched)
+
+            # Parse each symbol's candles once for every strategy this cycle
+            candle_store = get_candle_store()
+            parsed_candles = {}
+            for symbol, ohlcv in market_data["ohlcv_data"].items():
                 try:
-                    ohlcv = self.data_engine.get_ohlcv(symbol, timeframe, limit)
-                    market_data["ohlcv_data"][symbol] = ohlcv
+                    parsed_candles[symbol] = candle_store.put(symbol, timeframe, limit, ohlcv)
                 except Exception as e:
-                    self.logger.warning(f"Failed to get OHLCV for {symbol}: {e}")
-                    market_data["ohlcv_data"][symbol] = []
-
-            # Get sentiment data
-            try:
-                sentiment_data = self.data_engine.get_sentiment_data(
-                    "BTC/USDT"
-                )  # Use BTC as market sentiment proxy
-                market_data["sentiment_data"] = sentiment_data
-            except Exception as e:
-                self.logger.warning(f"Failed to get sentiment data: {e}")
-                market_data["sentiment_data"] = {}
+                    self.logger.warning(f"Failed to parse OHLCV for {symbol}: {e}")
 
-            # Get on-chain data
-            try:
-                on_chain_data = self.data_engine.get_on_chain_data("BTC/USDT")
-                market_data["on_chain_data"] = on_chain_data
-            except Exception as e:
-                self.logger.warning(f"Failed to get on-chain data: {e}")
-                market_data["on_chain_data"] = {}
+            await self._update_regime_features(canonical_symbols, timeframe, parsed_candles)
+            if self.portfolio_manager is not None:
+                try:
+                    self.portfolio_manager.update_returns(parsed_candles)
+                except Exception as e:
+                    self.logger.warning(f"Failed to update return history: {e}")
 
-            # Get whale activity
-            try:
-                whale_activity = self.data_engine.get_whale_activity("BTC/USDT")
-                market_data["whale_activity"] = whale_activity
-            except Exception as e:
-                self.logger.warning(f"Failed to get whale activity: {e}")
-                market_data["whale_activity"] = {}
+            fetch_stats = fetched.get("fetch_stats", {})
+            self.logger.info(
+                f"MARKET_DATA_FETCH: {fetch_stats.get('requests', 0)} requests in "
+                f"{fetch_stats.get('wall_ms', 0.0):.0f}ms "
+                f"(slowest={fetch_stats.get('slowest_symbol')} "
+                f"{fetch_stats.get('slowest_ms', 0.0):.0f}ms, "
+                f"timeouts={fetch_stats.get('timeouts', 0)}, errors={fetch_stats.get('errors', 0)})"
+            )
 
-            self.logger.info(f"Retrieved market data for {len(symbols)} symbols")
+            self.logger.info("Retrieved market data for %s symbols", len(symbols))
 
         except Exception as e:
             self.logger.error(f"Error getting comprehensive market data: {e}")
@@ -941,17 +1006,21 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
         all_signals = {}
 
         try:
-            # Generate composite signals for each symbol
+            # Get timeframe from config
+            timeframe = self.config.get("trading", {}).get("timeframe", "1h")
+
+            # Run every strategy for all symbols concurrently on the signal engine's
+            # worker pool, then combine in symbol order so results are deterministic
+            strategy_runs = await self.signal_engine.collect_strategy_signals(
+                symbols, timeframe
+            )
+
             for symbol in symbols:
                 try:
-                    # Get timeframe from config
-                    timeframe = self.config.get("trading", {}).get("timeframe", "1h")
-
                     # Generate composite signal
-                    composite_signal = (
-                        await self.signal_engine.generate_composite_signals(
-                            symbol, timeframe
-                        )
+                    individual_signals, failed_strategies = strategy_runs[symbol]
+                    composite_signal = self.signal_engine.build_composite_signal(
+                        symbol, timeframe, individual_signals, failed_strategies
                     )
                     
                     # Detect regime and add to signal metadata
@@ -969,9 +1038,16 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                             composite_signal["metadata"]["regime"] = "unknown"
                     
                     all_signals[symbol] = composite_signal
+                    self._journal_event(EventType.SIGNAL, symbol, {
+                        "composite_score": composite_signal.get("composite_score", 0.0),
+                        "confidence": composite_signal.get("confidence", 0.0),
+                        "regime": composite_signal.get("metadata", {}).get("regime"),
+                        "strategies": sorted(individual_signals),
+                        "failed_strategies": sorted(failed_strategies),
+                    })
 
                     self.logger.debug(
-                        f"Generated signal for {symbol}: score={composite_signal.get('composite_score', 0):.3f}"
+                        "Generated signal for %s: score=%.3f", symbol, composite_signal.get('composite_score', 0)
                     )
 
                 except Exception as e:
@@ -986,8 +1062,15 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                         "metadata": {"error": str(e)},
                     }
 
-            self.logger.info(f"Generated signals for {len(all_signals)} symbols")
-            
+            self.logger.info("Generated signals for %s symbols", len(all_signals))
+
+            # Persist this cycle's rolling signal window rows in one transaction
+            if self.state_store:
+                try:
+                    self.state_store.flush_signal_windows()
+                except Exception as e:
+                    self.logger.warning(f"Failed to flush signal windows: {e}")
+
             # Log top 2 symbols by composite score
             self._log_top_symbols(all_signals)
 
@@ -1052,10 +1135,10 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             self.logger.info(f"EQUITY_CYCLE_DEBUG: current_equity=${current_equity:,.2f}")
             self.logger.info(f"EQUITY_CYCLE_DEBUG: previous_equity=${previous_equity_float:,.2f}")
             self.logger.info(f"EQUITY_CYCLE_DEBUG: equity_change=${equity_change_float:,.2f}")
-            self.logger.info(f"EQUITY_CYCLE_DEBUG: equity_change_pct={equity_change_pct:.2f}%")
+            self.logger.info("EQUITY_CYCLE_DEBUG: equity_change_pct=%.2f%%", equity_change_pct)
             self.logger.info(f"EQUITY_CYCLE_DEBUG: cash_balance=${current_cash:,.2f}")
             self.logger.info(f"EQUITY_CYCLE_DEBUG: total_position_value=${total_position_value:,.2f}")
-            self.logger.info(f"EQUITY_CYCLE_DEBUG: position_count={position_count}")
+            self.logger.info("EQUITY_CYCLE_DEBUG: position_count=%s", position_count)
             self.logger.info(f"P&L_BREAKDOWN: trading_pnl=${trading_pnl:,.2f}, unrealized_pnl=${unrealized_pnl:,.2f}, total_pnl=${total_pnl:,.2f}")
             
             # Add warnings about P&L types
@@ -1161,14 +1244,14 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             # Update previous equity for next cycle
             old_previous = self._previous_equity
             self._previous_equity = float(current_equity)
-            self.logger.info(f"📊 UPDATED_PREVIOUS_EQUITY: ${old_previous:.2f} → ${self._previous_equity:.2f} (at end of cycle summary)")
+            self.logger.info("📊 UPDATED_PREVIOUS_EQUITY: $%.2f → $%.2f (at end of cycle summary)", old_previous, self._previous_equity)
             
             # Diagnostic summary for debugging
             self.logger.info("=" * 80)
             self.logger.info("🔍 DIAGNOSTIC SUMMARY:")
-            self.logger.info(f"  In-Memory Cash: {format_currency(self.portfolio['cash_balance'])}")
-            self.logger.info(f"  StateStore Cash: {format_currency(to_decimal(self._get_cash_balance()))}")
-            self.logger.info(f"  Position Count: {len(self.portfolio['positions'])}")
+            self.logger.info("  In-Memory Cash: %s", format_currency(self.portfolio['cash_balance']))
+            self.logger.info("  StateStore Cash: %s", format_currency(to_decimal(self._get_cash_balance())))
+            self.logger.info("  Position Count: %s", len(self.portfolio['positions']))
             self.logger.info(f"  _previous_equity: ${self._previous_equity:,.2f}")
             self.logger.info(f"  Calculated Equity: ${current_equity:,.2f}")
             self.logger.info("=" * 80)
@@ -1245,7 +1328,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                         breakdown_str = "[" + " ".join(truncated_scores) + "]"
                         log_line = f"score={composite_score:.3f} {breakdown_str} regime={regime}"
                 
-                self.logger.info(f"{symbol}: {log_line}")
+                self.logger.info("%s: %s", symbol, log_line)
                 
             except Exception as e:
                 self.logger.warning(f"Failed to log breakdown for {symbol}: {e}")
@@ -1290,7 +1373,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             # Check if strategy is enabled
             strategy_config = strategies_config.get(strategy_name, {})
             if not strategy_config.get("enabled", True):
-                self.logger.debug(f"Strategy {strategy_name} is disabled, skipping")
+                self.logger.debug("Strategy %s is disabled, skipping", strategy_name)
                 continue
             
             # Extract signal metrics
@@ -1300,7 +1383,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             
             # Check minimum confidence threshold
             if confidence < min_confidence:
-                self.logger.debug(f"Strategy {strategy_name} below confidence threshold: {confidence:.3f} < {min_confidence:.3f}")
+                self.logger.debug("Strategy %s below confidence threshold: %.3f < %.3f", strategy_name, confidence, min_confidence)
                 continue
             
             # Calculate risk-adjusted return score
@@ -1309,7 +1392,10 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 strategy_name, strategy_signal, strategy_config
             )
             
-            self.logger.debug(f"Strategy {strategy_name}: score={score:.3f}, confidence={confidence:.3f}, risk_adjusted={risk_adjusted_score:.3f}")
+            self.logger.debug(
+                "Strategy %s: score=%.3f, confidence=%.3f, risk_adjusted=%.3f",
+                strategy_name, score, confidence, risk_adjusted_score,
+            )
             
             # Select strategy with highest risk-adjusted score
             if risk_adjusted_score > best_score:
@@ -1319,7 +1405,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
         # Map strategy to available executor if needed
         if best_strategy and best_strategy in strategy_mapping:
             mapped_strategy = strategy_mapping[best_strategy]
-            self.logger.debug(f"Mapping strategy {best_strategy} to executor {mapped_strategy}")
+            self.logger.debug("Mapping strategy %s to executor %s", best_strategy, mapped_strategy)
             best_strategy = mapped_strategy
         
         # Fallback to default if no strategy meets criteria
@@ -1327,7 +1413,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             self.logger.warning("No strategy meets minimum criteria, using default momentum")
             best_strategy = "momentum"
         
-        self.logger.info(f"Selected strategy: {best_strategy} (score: {best_score:.3f})")
+        self.logger.info("Selected strategy: %s (score: %.3f)", best_strategy, best_score)
         return best_strategy
     
     def _calculate_risk_adjusted_strategy_score(
@@ -1390,7 +1476,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             Execution results dictionary
         """
         execution_start_time = datetime.now()
-        self.logger.info(f"TRADE_EXECUTION_START: {execution_start_time.isoformat()}")
+        self.logger.info("TRADE_EXECUTION_START: %s", execution_start_time.isoformat())
         self.logger.debug("Executing profit-optimized trades")
 
         execution_results = {
@@ -1415,7 +1501,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                     eligible = signal.get("metadata", {}).get("eligible", True)
                     
                     if data_quality != "ok" or not eligible:
-                        self.logger.info(f"DATA_EXCLUDE: {symbol} filtered before ranking (data_quality={data_quality}, eligible={eligible})")
+                        self.logger.info("DATA_EXCLUDE: %s filtered before ranking (data_quality=%s, eligible=%s)", symbol, data_quality, eligible)
                         self._log_decision_trace(
                             symbol=symbol,
                             signal=signal,
@@ -1470,7 +1556,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                         )
                     except ValueError as e:
                         if "no_atr_no_fallback" in str(e):
-                            self.logger.info(f"⏭️ SKIP {symbol} reason=no_atr_no_fallback (ATR failed, fallback disabled)")
+                            self.logger.info("⏭️ SKIP %s reason=no_atr_no_fallback (ATR failed, fallback disabled)", symbol)
                             # Log decision trace for ATR failure
                             self._log_decision_trace(
                                 symbol=symbol,
@@ -1488,8 +1574,9 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                     sl_tp_src = sl_tp_result["source"]
                     
                     # DEBUG: Log SL/TP derivation values
-                    self.logger.debug(f"SL_TP_DEBUG: symbol={symbol}, side={side}, entry_price={current_price}, "
-                                    f"stop_loss={stop_loss}, take_profit={take_profit}, source={sl_tp_src}")
+                    self.logger.debug("SL_TP_DEBUG: symbol=%s, side=%s, entry_price=%s, "
+                                      "stop_loss=%s, take_profit=%s, source=%s",
+                                      symbol, side, current_price, stop_loss, take_profit, sl_tp_src)
                     
                     # Calculate risk-reward ratio using new robust method
                     try:
@@ -1527,12 +1614,13 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                     }
                     
                     # DEBUG: Log candidate creation values
-                    self.logger.debug(f"CANDIDATE_DEBUG: symbol={symbol}, side={side}, composite_score={composite_score}, "
-                                    f"stop_loss={stop_loss}, take_profit={take_profit}, sl_tp_src={sl_tp_src}")
+                    self.logger.debug("CANDIDATE_DEBUG: symbol=%s, side=%s, composite_score=%s, "
+                                      "stop_loss=%s, take_profit=%s, sl_tp_src=%s",
+                                      symbol, side, composite_score, stop_loss, take_profit, sl_tp_src)
                     candidates.append(candidate)
                     
                 except Exception as e:
-                    self.logger.debug(f"Error building candidate for {symbol}: {e}")
+                    self.logger.debug("Error building candidate for %s: %s", symbol, e)
                     # Log decision trace for candidate building failure
                     self._log_decision_trace(
                         symbol=symbol,
@@ -1576,7 +1664,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 if candidate["risk_reward_ratio"] >= rr_min:
                     rr_filtered_candidates.append(candidate)
                 else:
-                    self.logger.info(f"⏭️ SKIP {candidate['symbol']} reason=rr_too_low ratio={candidate['risk_reward_ratio']:.2f}")
+                    self.logger.info("⏭️ SKIP %s reason=rr_too_low ratio=%.2f", candidate['symbol'], candidate['risk_reward_ratio'])
                     # Log decision trace for RR filtering
                     self._log_decision_trace(
                         symbol=candidate["symbol"],
@@ -1587,7 +1675,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                     )
 
             if not rr_filtered_candidates:
-                self.logger.info(f"No candidates meet minimum RR threshold ({rr_min})")
+                self.logger.info("No candidates meet minimum RR threshold (%s)", rr_min)
                 # Log decision traces for symbols that don't meet RR threshold
                 for candidate in candidates:
                     if candidate["risk_reward_ratio"] < rr_min:
@@ -1629,7 +1717,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 risk_on_cfg = self.config.get("risk", {}).get("risk_on", {})
                 min_gate_floor = risk_on_cfg.get("min_gate_floor", 0.35)
                 hard_floor_min = min_gate_floor  # Use risk-on gate floor
-                self.logger.info(f"RISK-ON: Using lower gate floor {hard_floor_min:.3f} instead of normal {gate_cfg.get('hard_floor_min', 0.53):.3f}")
+                self.logger.info("RISK-ON: Using lower gate floor %.3f instead of normal %.3f", hard_floor_min, gate_cfg.get('hard_floor_min', 0.53))
             
             # Check if new entries are halted due to daily loss limit
             halt_new_entries = False
@@ -1681,9 +1769,9 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             # Log exactly the returned list (no recomputation, no abs())
             if selected_symbols:
                 chosen_symbols = [f"{symbol}:{score:.3f}" for symbol, score in selected_symbols]
-                self.logger.info(f"ENTRY SELECTOR: top_k={enable_top_k}, K={top_k_entries if enable_top_k else 'N/A'}, floor={hard_floor_min:.3f}, chosen=[{', '.join(chosen_symbols)}]")
+                self.logger.info("ENTRY SELECTOR: top_k=%s, K=%s, floor=%.3f, chosen=[%s]", enable_top_k, (top_k_entries if enable_top_k else 'N/A'), hard_floor_min, ', '.join(chosen_symbols))
             else:
-                self.logger.info(f"ENTRY SELECTOR: top_k={enable_top_k}, K={top_k_entries if enable_top_k else 'N/A'}, floor={hard_floor_min:.3f}, chosen=[] (no candidates >= floor)")
+                self.logger.info("ENTRY SELECTOR: top_k=%s, K=%s, floor=%.3f, chosen=[] (no candidates >= floor)", enable_top_k, (top_k_entries if enable_top_k else 'N/A'), hard_floor_min)
             
             # Build filtered_candidates from selected symbols
             filtered_candidates = []
@@ -1772,7 +1860,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                     if self.symbol_filter and not self.symbol_filter.is_whitelist_empty():
                         is_allowed, reason, _ = self.symbol_filter.is_symbol_allowed(symbol)
                         if not is_allowed:
-                            self.logger.info(f"SYMBOL_FILTER: Blocked trade on {symbol} - {reason}")
+                            self.logger.info("SYMBOL_FILTER: Blocked trade on %s - %s", symbol, reason)
                             # Log decision trace for symbol filter blocking
                             self._log_decision_trace(
                                 symbol=symbol,
@@ -1870,7 +1958,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                         
                         # Skip if routed to SKIP
                         if routed_side == OrderSideAction.SKIP:
-                            self.logger.info(f"SKIP {symbol} {initial_action} reason={route_reason}")
+                            self.logger.info("SKIP %s %s reason=%s", symbol, initial_action, route_reason)
                             self._log_decision_trace(
                                 symbol=symbol,
                                 signal=signal,
@@ -1944,7 +2032,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                     # Handle rejection cases
                     if trade_result and trade_result.get("status") == "rejected":
                         reason = trade_result.get("reason", "unknown")
-                        self.logger.info(f"REJECTED {symbol} {side.upper()} reason={reason}")
+                        self.logger.info("REJECTED %s %s reason=%s", symbol, side.upper(), reason)
                         # Log decision trace for rejected trade
                         self._log_decision_trace(
                             symbol=symbol,
@@ -1963,9 +2051,9 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                         trade_result["sl_tp_src"] = sl_tp_src
                         
                         # Update portfolio with trade - only proceed if successful
-                        self.logger.info(f"🎯 EXECUTING_TRADE: about to call _update_portfolio_with_trade for {symbol}")
+                        self.logger.info("🎯 EXECUTING_TRADE: about to call _update_portfolio_with_trade for %s", symbol)
                         portfolio_updated = self._update_portfolio_with_trade(symbol, trade_result)
-                        self.logger.info(f"✅ TRADE_COMPLETED: _update_portfolio_with_trade returned {portfolio_updated}")
+                        self.logger.info("✅ TRADE_COMPLETED: _update_portfolio_with_trade returned %s", portfolio_updated)
                         
                         if portfolio_updated:
                             # Log trade to analytics
@@ -1975,9 +2063,10 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                             position_size = trade_result.get("position_size", 0)
                             
                             # DEBUG: Log the actual values being used in decision trace
-                            self.logger.debug(f"DECISION_TRACE_DEBUG: symbol={symbol}, side={side}, composite_score={composite_score}, "
-                                            f"position_size={position_size}, entry_price={current_price}, "
-                                            f"stop_loss={stop_loss}, take_profit={take_profit}")
+                            self.logger.debug("DECISION_TRACE_DEBUG: symbol=%s, side=%s, composite_score=%s, "
+                                              "position_size=%s, entry_price=%s, stop_loss=%s, take_profit=%s",
+                                              symbol, side, composite_score, position_size, current_price,
+                                              stop_loss, take_profit)
                             
                             self._log_decision_trace(
                                 symbol=symbol,
@@ -2067,7 +2156,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                     pilot_trade_executed = True
 
             self.logger.info(
-                f"Executed {execution_results['trades_executed']} trades, total PnL: ${execution_results['total_pnl']:.2f}"
+                "Executed %s trades, total PnL: $%.2f", execution_results['trades_executed'], execution_results['total_pnl']
             )
             
             # Update session trade count for daily loss limit tracking
@@ -2195,7 +2284,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                     )
                 except ValueError as e:
                     if "no_atr_no_fallback" in str(e):
-                        self.logger.debug(f"Pilot trade skipped for {symbol}: no_atr_no_fallback")
+                        self.logger.debug("Pilot trade skipped for %s: no_atr_no_fallback", symbol)
                         continue
                     else:
                         raise
@@ -2213,7 +2302,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                         side=side
                     )
                 except ValueError as e:
-                    self.logger.debug(f"RR calculation failed for pilot {symbol}: {e}")
+                    self.logger.debug("RR calculation failed for pilot %s: %s", symbol, e)
                     continue
                 
                 # Pilot criteria: RR ≥ config threshold
@@ -2242,12 +2331,12 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 })
                 
             except Exception as e:
-                self.logger.debug(f"Error evaluating {symbol} for pilot trade: {e}")
+                self.logger.debug("Error evaluating %s for pilot trade: %s", symbol, e)
                 continue
         
         if not pilot_candidates:
             rr_relax_for_pilot = self.config.get("risk", {}).get("rr_relax_for_pilot", 1.60)
-            self.logger.info(f"🔍 PILOT: No candidates meet pilot criteria (score≥0.55, RR≥{rr_relax_for_pilot})")
+            self.logger.info("🔍 PILOT: No candidates meet pilot criteria (score≥0.55, RR≥%s)", rr_relax_for_pilot)
             return None
         
         # Select best pilot candidate (highest priority score)
@@ -2346,7 +2435,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             
             # Skip if routed to SKIP
             if routed_side == OrderSideAction.SKIP:
-                self.logger.info(f"SKIP PILOT {symbol} {initial_action} reason={route_reason}")
+                self.logger.info("SKIP PILOT %s %s reason=%s", symbol, initial_action, route_reason)
                 return None
             
             # Map routed side to OrderSide
@@ -2361,7 +2450,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             # Check exploration limits before executing pilot trade
             # Note: Pilots use exploration budget (not normal budget)
             if not self.can_explore(pilot_target_notional):
-                self.logger.info(f"SKIP PILOT {symbol} {side.upper()} reason=exploration_limit")
+                self.logger.info("SKIP PILOT %s %s reason=exploration_limit", symbol, side.upper())
                 return None
             
             # Prepare gate information for telemetry
@@ -2414,7 +2503,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             pilot_capital = min(pilot_cash_limit, normal_capital)
             
             self.logger.info(
-                f"🚁 PILOT: Using {pilot_capital:.2f} capital (fallback mode)"
+                "🚁 PILOT: Using %.2f capital (fallback mode)", pilot_capital
             )
             
             trade_result = self.multi_strategy_executor.execute_strategy(
@@ -2426,7 +2515,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
         # Handle rejection cases for pilot trades
         if trade_result and trade_result.get("status") == "rejected":
             reason = trade_result.get("reason", "unknown")
-            self.logger.info(f"REJECTED PILOT {symbol} {side.upper()} reason={reason}")
+            self.logger.info("REJECTED PILOT %s %s reason=%s", symbol, side.upper(), reason)
             return None
         
         if trade_result and trade_result.get("position_size", 0) > 0:
@@ -2438,9 +2527,9 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             trade_result["sl_tp_src"] = sl_tp_src
             
             # Update portfolio with pilot trade - only log if successful
-            self.logger.info(f"🎯 EXECUTING_TRADE: about to call _update_portfolio_with_trade for {symbol} (pilot)")
+            self.logger.info("🎯 EXECUTING_TRADE: about to call _update_portfolio_with_trade for %s (pilot)", symbol)
             portfolio_updated = self._update_portfolio_with_trade(symbol, trade_result)
-            self.logger.info(f"✅ TRADE_COMPLETED: _update_portfolio_with_trade returned {portfolio_updated}")
+            self.logger.info("✅ TRADE_COMPLETED: _update_portfolio_with_trade returned %s", portfolio_updated)
             
             if portfolio_updated:
                 # Log DECISION_TRACE for pilot trade with intent="pilot_buy"
@@ -2492,7 +2581,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 return trade_result
             else:
                 # Portfolio update failed - pilot trade rejected
-                self.logger.info(f"REJECTED PILOT {symbol} {side.upper()} reason=portfolio_update_failed")
+                self.logger.info("REJECTED PILOT %s %s reason=portfolio_update_failed", symbol, side.upper())
                 return None
 
     def can_explore(self, order_value: float) -> bool:
@@ -2532,18 +2621,18 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
         
         # Check count limit
         if exploration_forced_count_today >= max_forced_per_day:
-            self.logger.info(f"EXPLORATION_LIMIT: max forced count reached ({exploration_forced_count_today}/{max_forced_per_day})")
+            self.logger.info("EXPLORATION_LIMIT: max forced count reached (%s/%s)", exploration_forced_count_today, max_forced_per_day)
             return False
             
         # Check budget limit
         if exploration_used_notional_today >= exploration_budget_usd:
-            self.logger.info(f"EXPLORATION_LIMIT: budget exhausted (${exploration_used_notional_today:.2f}/${exploration_budget_usd:.2f})")
+            self.logger.info("EXPLORATION_LIMIT: budget exhausted ($%.2f/$%.2f)", exploration_used_notional_today, exploration_budget_usd)
             return False
         
         # Check if this specific order would exceed remaining budget
         remaining_budget = exploration_budget_usd - exploration_used_notional_today
         if order_value > remaining_budget:
-            self.logger.info(f"EXPLORATION_LIMIT: insufficient budget (need ${order_value:.2f}, have ${remaining_budget:.2f} left)")
+            self.logger.info("EXPLORATION_LIMIT: insufficient budget (need $%.2f, have $%.2f left)", order_value, remaining_budget)
             return False
         
         return True
@@ -2611,15 +2700,15 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
         # Log budget status
         remaining_budget = exploration_budget_usd - exploration_used_notional_today
         remaining_count = max_forced_per_day - exploration_forced_count_today
-        self.logger.info(f"EXPLORATION: budget=${exploration_used_notional_today:.2f}/${exploration_budget_usd:.2f} (${remaining_budget:.2f} left), count={exploration_forced_count_today}/{max_forced_per_day} ({remaining_count} left)")
+        self.logger.info("EXPLORATION: budget=$%.2f/$%.2f ($%.2f left), count=%s/%s (%s left)", exploration_used_notional_today, exploration_budget_usd, remaining_budget, exploration_forced_count_today, max_forced_per_day, remaining_count)
         
         # Check budget limits
         if exploration_forced_count_today >= max_forced_per_day:
-            self.logger.info(f"EXPLORATION: skipped - max forced count reached ({exploration_forced_count_today}/{max_forced_per_day})")
+            self.logger.info("EXPLORATION: skipped - max forced count reached (%s/%s)", exploration_forced_count_today, max_forced_per_day)
             return None
             
         if exploration_used_notional_today >= exploration_budget_usd:
-            self.logger.info(f"EXPLORATION: skipped - budget exhausted (${exploration_used_notional_today:.2f}/${exploration_budget_usd:.2f})")
+            self.logger.info("EXPLORATION: skipped - budget exhausted ($%.2f/$%.2f)", exploration_used_notional_today, exploration_budget_usd)
             return None
         
         # Rank all tradable symbols by score desc and pick top-1
@@ -2637,7 +2726,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 
                 # Validate price
                 if current_price is None or current_price <= 0:
-                    self.logger.debug(f"EXPLORATION: skipped {symbol} due to invalid price")
+                    self.logger.debug("EXPLORATION: skipped %s due to invalid price", symbol)
                     continue
                 
                 # Get composite score
@@ -2659,7 +2748,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 })
                 
             except Exception as e:
-                self.logger.debug(f"EXPLORATION: error evaluating {symbol}: {e}")
+                self.logger.debug("EXPLORATION: error evaluating %s: %s", symbol, e)
                 continue
         
         # Sort by score descending and take top-1
@@ -2667,7 +2756,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
         
         
         if not exploration_candidates:
-            self.logger.info(f"EXPLORATION: no candidates meet minimum score {min_score}")
+            self.logger.info("EXPLORATION: no candidates meet minimum score %s", min_score)
             return None
         
         best_candidate = exploration_candidates[0]
@@ -2717,7 +2806,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             sl_tp_src = sl_tp_result["source"] + "_exploration_tightened"
             
         except ValueError as e:
-            self.logger.debug(f"EXPLORATION: SL/TP derivation failed for {symbol}: {e}")
+            self.logger.debug("EXPLORATION: SL/TP derivation failed for %s: %s", symbol, e)
             return None
         
         # Calculate risk-reward ratio
@@ -2729,7 +2818,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 side=side
             )
         except ValueError as e:
-            self.logger.debug(f"EXPLORATION: RR calculation failed for {symbol}: {e}")
+            self.logger.debug("EXPLORATION: RR calculation failed for %s: %s", symbol, e)
             return None
         
         # Add required fields for executors
@@ -2772,7 +2861,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             exploration_target_notional = target_notional * size_mult_vs_normal
             
             self.logger.info(
-                f"🔍 EXPLORATION: target_notional=${target_notional:.2f} * {size_mult_vs_normal:.1f} = ${exploration_target_notional:.2f}"
+                "🔍 EXPLORATION: target_notional=$%.2f * %.1f = $%.2f", target_notional, size_mult_vs_normal, exploration_target_notional
             )
             
             # Route action through execution router for exploration trades
@@ -2800,7 +2889,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             
             # Skip if routed to SKIP
             if routed_side == OrderSideAction.SKIP:
-                self.logger.info(f"SKIP EXPLORATION {symbol} {initial_action} reason={route_reason}")
+                self.logger.info("SKIP EXPLORATION %s %s reason=%s", symbol, initial_action, route_reason)
                 return None
             
             # Map routed side to OrderSide
@@ -2815,13 +2904,13 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             # Check exploration limits using can_explore
             # NOTE: Only EXPLORATION trades hit exploration budget checks
             if not self.can_explore(exploration_target_notional):
-                self.logger.info(f"EXPLORATION budget exhausted for {symbol} (need ${exploration_target_notional:.2f})")
+                self.logger.info("EXPLORATION budget exhausted for %s (need $%.2f)", symbol, exploration_target_notional)
                 return None
             
             # Exploration check passed - proceed with execution
             remaining_budget = exploration_budget_usd - exploration_used_notional_today
             self.logger.info(
-                f"EXPLORATION: can_explore passed (need ${exploration_target_notional:.2f}, have ${remaining_budget:.2f} left)"
+                "EXPLORATION: can_explore passed (need $%.2f, have $%.2f left)", exploration_target_notional, remaining_budget
             )
             
             # Create order metadata with EXPLORATION tagging
@@ -2900,7 +2989,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             exploration_capital = min(exploration_cash_limit, normal_capital)
             
             self.logger.info(
-                f"🔍 EXPLORATION: Using ${exploration_capital:.2f} capital (fallback mode)"
+                "🔍 EXPLORATION: Using $%.2f capital (fallback mode)", exploration_capital
             )
             
             trade_result = self.multi_strategy_executor.execute_strategy(
@@ -2912,7 +3001,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
         # Handle rejection cases
         if trade_result and trade_result.get("status") == "rejected":
             reason = trade_result.get("reason", "unknown")
-            self.logger.info(f"EXPLORATION: skipped due to {reason}")
+            self.logger.info("EXPLORATION: skipped due to %s", reason)
             return None
         
         if trade_result and trade_result.get("position_size", 0) > 0:
@@ -2924,9 +3013,9 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             trade_result["sl_tp_src"] = sl_tp_src
             
             # Update portfolio with exploration trade
-            self.logger.info(f"🎯 EXECUTING_TRADE: about to call _update_portfolio_with_trade for {symbol} (exploration)")
+            self.logger.info("🎯 EXECUTING_TRADE: about to call _update_portfolio_with_trade for %s (exploration)", symbol)
             portfolio_updated = self._update_portfolio_with_trade(symbol, trade_result)
-            self.logger.info(f"✅ TRADE_COMPLETED: _update_portfolio_with_trade returned {portfolio_updated}")
+            self.logger.info("✅ TRADE_COMPLETED: _update_portfolio_with_trade returned %s", portfolio_updated)
             
             if portfolio_updated:
                 # Log exploration trade to analytics
@@ -2941,7 +3030,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 return trade_result
             else:
                 # Portfolio update failed - exploration trade rejected
-                self.logger.info(f"EXPLORATION: {symbol} {side.upper()} rejected - portfolio_update_failed")
+                self.logger.info("EXPLORATION: %s %s rejected - portfolio_update_failed", symbol, side.upper())
                 return None
         
         return None
@@ -2958,9 +3047,9 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
         import traceback
         stack_trace = ''.join(traceback.format_stack()[-5:-1])
         self.logger.info(f"🔵🔵🔵 _update_portfolio_with_trade CALLED 🔵🔵🔵")
-        self.logger.info(f"  symbol={symbol}")
-        self.logger.info(f"  trade_result keys={list(trade_result.keys()) if trade_result else None}")
-        self.logger.info(f"  Called from:\n{stack_trace}")
+        self.logger.info("  symbol=%s", symbol)
+        self.logger.info("  trade_result keys=%s", (list(trade_result.keys()) if trade_result else None))
+        self.logger.info("  Called from:\n%s", stack_trace)
         
         # Store original state for rollback
         original_cash = None
@@ -2972,7 +3061,18 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             canonical_symbol = to_canonical(symbol)
             
             position_size = trade_result.get("position_size", 0)
-            self.logger.info(f"🔵 PORTFOLIO_UPDATE_ENTRY: symbol={canonical_symbol}, position_size={position_size}")
+            self.logger.info("🔵 PORTFOLIO_UPDATE_ENTRY: symbol=%s, position_size=%s", canonical_symbol, position_size)
+            self._journal_event(EventType.ORDER, canonical_symbol, {
+                "side": "buy" if position_size > 0 else "sell",
+                "quantity": position_size,
+                "entry_price": trade_result.get("entry_price"),
+                "strategy": trade_result.get("strategy"),
+                "status": trade_result.get("status"),
+                "stop_loss": trade_result.get("stop_loss"),
+                "take_profit": trade_result.get("take_profit"),
+                "pilot": trade_result.get("pilot", False),
+                "exploration": trade_result.get("exploration", False),
+            })
             execution_result = trade_result.get("execution_result", {})
             entry_price = trade_result.get("entry_price", 0)  # Fixed: get from trade_result, not execution_result
             fees = execution_result.get("fees", 0)
@@ -2982,7 +3082,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             # Step 1: Validate entry price early - before any portfolio mutations
             if entry_price is None or entry_price <= 0:
                 self.logger.error(f"Invalid entry_price: {entry_price} for {canonical_symbol}. Rejecting trade.")
-                self.logger.info(f"❌ EARLY_RETURN: reason=invalid_entry_price, price={entry_price}, symbol={canonical_symbol}")
+                self.logger.info("❌ EARLY_RETURN: reason=invalid_entry_price, price=%s, symbol=%s", entry_price, canonical_symbol)
                 return False
 
             # Step 2: Capture original state for rollback
@@ -3018,26 +3118,26 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             # Step 4: Validate sufficient cash for buy orders
             if position_size > 0 and new_cash < to_decimal(0):
                 self.logger.error(f"Insufficient cash for BUY: need {format_currency(notional_value + fees_decimal)}, have {format_currency(to_decimal(original_cash))}")
-                self.logger.info(f"❌ EARLY_RETURN: reason=insufficient_cash, needed={format_currency(notional_value + fees_decimal)}, available={format_currency(to_decimal(original_cash))}, symbol={canonical_symbol}")
+                self.logger.info("❌ EARLY_RETURN: reason=insufficient_cash, needed=%s, available=%s, symbol=%s", format_currency(notional_value + fees_decimal), format_currency(to_decimal(original_cash)), canonical_symbol)
                 return False
 
             # Step 5: Update cash balance BEFORE updating positions
             # Note: realized_pnl will be updated after LotBook processing
             
             # CRITICAL FIX: Ensure cash deduction is properly saved and logged
-            self.logger.info(f"CASH_DEDUCTION_DEBUG: Before trade - original_cash={format_currency(to_decimal(original_cash))}, notional_value={format_currency(notional_value)}, fees={format_currency(fees_decimal)}, cash_impact={format_currency(cash_impact)}")
-            self.logger.info(f"CASH_DEDUCTION_DEBUG: After calculation - new_cash={format_currency(new_cash)}")
+            self.logger.info("CASH_DEDUCTION_DEBUG: Before trade - original_cash=%s, notional_value=%s, fees=%s, cash_impact=%s", format_currency(to_decimal(original_cash)), format_currency(notional_value), format_currency(fees_decimal), format_currency(cash_impact))
+            self.logger.info("CASH_DEDUCTION_DEBUG: After calculation - new_cash=%s", format_currency(new_cash))
             
             # CRITICAL: Update in-memory portfolio FIRST to avoid stale reads
             old_cash = to_decimal(self.portfolio.get("cash_balance", 0.0))
-            self.logger.info(f"💰 CASH_UPDATE: original={format_currency(to_decimal(original_cash))} → new={format_currency(new_cash)} (impact={format_currency(cash_impact)})")
+            self.logger.info("💰 CASH_UPDATE: original=%s → new=%s (impact=%s)", format_currency(to_decimal(original_cash)), format_currency(new_cash), format_currency(cash_impact))
             self.portfolio["cash_balance"] = new_cash
-            self.logger.info(f"📝 IN_MEMORY_UPDATED: self.portfolio['cash_balance']={format_currency(self.portfolio['cash_balance'])}")
+            self.logger.info("📝 IN_MEMORY_UPDATED: self.portfolio['cash_balance']=%s", format_currency(self.portfolio['cash_balance']))
             self.portfolio["total_fees"] = to_decimal(original_fees) + fees_decimal
             
             # Log cash balance update with detailed debugging
             cash_change = new_cash - old_cash
-            self.logger.info(f"CASH_BALANCE_UPDATED[IN-MEMORY]: {format_currency(old_cash)} -> {format_currency(new_cash)} ({format_currency(cash_change)}) for {canonical_symbol} {side}")
+            self.logger.info("CASH_BALANCE_UPDATED[IN-MEMORY]: %s -> %s (%s) for %s %s", format_currency(old_cash), format_currency(new_cash), format_currency(cash_change), canonical_symbol, side)
             
             # REMOVED: Temporary save_cash_equity() here - it causes overwrites
             # Cash will be saved by the FINAL save after equity recalculation (line ~3200)
@@ -3151,12 +3251,12 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             
             # NOTE: actual_realized_pnl will be saved in the final save_cash_equity below (after equity recalculation)
             if actual_realized_pnl != expected_profit:
-                self.logger.debug(f"Realized P&L updated from LotBook: ${actual_realized_pnl:.4f} (was ${expected_profit:.4f})")
+                self.logger.debug("Realized P&L updated from LotBook: $%.4f (was $%.4f)", actual_realized_pnl, expected_profit)
             
             # Step 9b: Commit fill to trade ledger immediately after successful portfolio update
             # Always track fill in-memory for fallback purposes
             trade_id = f"{canonical_symbol}_{trade_side}_{int(datetime.now().timestamp() * 1000)}"
-            self.logger.info(f"TRADE_EXECUTION_DEBUG: Creating trade {trade_id}")
+            self.logger.info("TRADE_EXECUTION_DEBUG: Creating trade %s", trade_id)
             
             # Get exit reason if this is an exit order
             exit_reason = None
@@ -3186,11 +3286,12 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             
             # Add to in-memory fills
             self.in_memory_fills.append(fill_record)
+            self._journal_event(EventType.FILL, canonical_symbol, fill_record)
             
             # Try to commit to trade ledger with enhanced fill details
             ledger_success = False
             if self.trade_ledger:
-                self.logger.info(f"TRADE_LEDGER_DEBUG: Attempting to save trade {trade_id} to ledger")
+                self.logger.info("TRADE_LEDGER_DEBUG: Attempting to save trade %s to ledger", trade_id)
                 
                 # Extract fee and slippage details from trade_result if available
                 effective_fill_price = entry_price  # Default to entry price
@@ -3221,11 +3322,11 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                     slippage_bps_applied=slippage_bps_applied
                 )
                 if ledger_success:
-                    self.logger.info(f"TRADE_LEDGER_DEBUG: Trade {trade_id} successfully committed to ledger")
+                    self.logger.info("TRADE_LEDGER_DEBUG: Trade %s successfully committed to ledger", trade_id)
                 else:
                     self.logger.warning(f"TRADE_LEDGER_DEBUG: Failed to commit fill to trade ledger: {trade_id}")
             else:
-                self.logger.debug(f"Fill tracked in-memory only (no trade ledger): {trade_id}")
+                self.logger.debug("Fill tracked in-memory only (no trade ledger): %s", trade_id)
 
             # Step 10: Recalculate total equity and validate
             equity_after = self._get_total_equity()
@@ -3233,7 +3334,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             
             # CRITICAL FIX: Save the recalculated equity to state store
             # This is the FINAL save that includes both cash deduction AND position addition
-            self.logger.info(f"💾 FINAL_EQUITY_SAVE: Saving recalculated equity=${equity_after:.2f} (was ${equity_before:.2f})")
+            self.logger.info("💾 FINAL_EQUITY_SAVE: Saving recalculated equity=$%.2f (was $%.2f)", equity_after, equity_before)
             self.state_store.save_cash_equity(
                 cash_balance=float(new_cash),
                 total_equity=float(equity_after),  # ← CRITICAL: Use recalculated equity!
@@ -3243,11 +3344,11 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 session_id=self.current_session_id,
                 previous_equity=float(getattr(self, '_previous_equity', equity_before))
             )
-            self.logger.info(f"✅ FINAL_SAVE_COMPLETE: cash=${float(new_cash):.2f}, equity=${equity_after:.2f}")
+            self.logger.info("✅ FINAL_SAVE_COMPLETE: cash=$%.2f, equity=$%.2f", float(new_cash), equity_after)
             
             # Also update in-memory portfolio equity to match
             self.portfolio["equity"] = to_decimal(equity_after)
-            self.logger.info(f"📝 IN_MEMORY_EQUITY_UPDATED: self.portfolio['equity']={format_currency(to_decimal(equity_after))}")
+            self.logger.info("📝 IN_MEMORY_EQUITY_UPDATED: self.portfolio['equity']=%s", format_currency(to_decimal(equity_after)))
             
             # Log equity impact with fees
             if position_size > 0:  # BUY
@@ -3328,7 +3429,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 )
                 
                 if increases_net_exposure:
-                    self.logger.info(f"Entry fill detected for {canonical_symbol}, creating TP ladder orders")
+                    self.logger.info("Entry fill detected for %s, creating TP ladder orders", canonical_symbol)
                     
                     # Create TP ladder orders
                     tp_orders = self.order_manager.create_tp_ladder_orders(
@@ -3341,12 +3442,12 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                     )
                     
                     if tp_orders:
-                        self.logger.info(f"Created {len(tp_orders)} TP ladder orders for {canonical_symbol}")
+                        self.logger.info("Created %s TP ladder orders for %s", len(tp_orders), canonical_symbol)
                         # Note: Orders are created but not executed immediately - they will be GTC resting orders
                     else:
-                        self.logger.debug(f"No TP ladder orders created for {canonical_symbol}")
+                        self.logger.debug("No TP ladder orders created for %s", canonical_symbol)
                 else:
-                    self.logger.debug(f"Fill for {canonical_symbol} does not increase net exposure, skipping TP ladders")
+                    self.logger.debug("Fill for %s does not increase net exposure, skipping TP ladders", canonical_symbol)
                     
             except Exception as e:
                 self.logger.error(f"Error creating TP ladder orders for {canonical_symbol}: {e}")
@@ -3437,7 +3538,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 self.logger.error("POSITION_PRICE_UPDATE: No pricing snapshot available - cannot update position prices")
                 return
                 
-            self.logger.info(f"POSITION_PRICE_UPDATE: Processing {len(self._in_memory_positions)} hydrated positions using snapshot {pricing_snapshot.id}")
+            self.logger.info("POSITION_PRICE_UPDATE: Processing %s hydrated positions using snapshot %s", len(self._in_memory_positions), pricing_snapshot.id)
             
             # Track successful updates for validation
             successful_updates = 0
@@ -3465,17 +3566,17 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                         current_price = pricing_snapshot.get_exit_value(normalized_symbol, side)
                         
                         if current_price:
-                            self.logger.debug(f"POSITION_PRICE_UPDATE: {symbol} - got exit value from snapshot: {current_price}")
+                            self.logger.debug("POSITION_PRICE_UPDATE: %s - got exit value from snapshot: %s", symbol, current_price)
                         else:
                             # Fallback to mark price from snapshot
                             current_price = pricing_snapshot.get_mark_price(normalized_symbol)
                             if current_price:
-                                self.logger.debug(f"POSITION_PRICE_UPDATE: {symbol} - got mark price from snapshot: {current_price}")
+                                self.logger.debug("POSITION_PRICE_UPDATE: %s - got mark price from snapshot: %s", symbol, current_price)
                     else:
                         # Use standard mark price (mid price) from snapshot
                         current_price = pricing_snapshot.get_mark_price(normalized_symbol)
                         if current_price:
-                            self.logger.debug(f"POSITION_PRICE_UPDATE: {symbol} - got mark price from snapshot: {current_price}")
+                            self.logger.debug("POSITION_PRICE_UPDATE: %s - got mark price from snapshot: %s", symbol, current_price)
                     
                     # Fallback logic if symbol not in snapshot
                     if not current_price:
@@ -3484,7 +3585,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                         # Fallback 1: Last known mark from ledger (stored in position_data)
                         if position_data.get("current_price") and position_data["current_price"] > 0:
                             current_price = position_data["current_price"]
-                            self.logger.info(f"POSITION_PRICE_FALLBACK: {symbol} - using last known mark from ledger: {current_price}")
+                            self.logger.info("POSITION_PRICE_FALLBACK: %s - using last known mark from ledger: %s", symbol, current_price)
                         
                         # Fallback 2: Last trade fill price from LotBook
                         elif normalized_symbol in self.lot_books:
@@ -3493,14 +3594,14 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                                 # Get most recent lot's entry price
                                 last_lot = lot_book.lots[-1]
                                 current_price = last_lot.entry_price
-                                self.logger.info(f"POSITION_PRICE_FALLBACK: {symbol} - using last fill price from LotBook: {current_price}")
+                                self.logger.info("POSITION_PRICE_FALLBACK: %s - using last fill price from LotBook: %s", symbol, current_price)
                         
                         # Fallback 3: Entry price (last resort)
                         if not current_price:
                             current_price = position_data["entry_price"]
                             self.logger.warning(f"POSITION_PRICE_FALLBACK: {symbol} - using entry price as last resort: {current_price}")
                     
-                    self.logger.info(f"POSITION_PRICE_DEBUG: {symbol} - final price: {current_price}")
+                    self.logger.info("POSITION_PRICE_DEBUG: %s - final price: %s", symbol, current_price)
                     
                     if current_price and validate_mark_price(current_price, normalized_symbol):
                         # Calculate new position value
@@ -3511,8 +3612,8 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                         # Update total positions value
                         total_positions_value += to_decimal(new_value)
                         
-                        self.logger.info(f"POSITION_PRICE_DEBUG: {symbol} - updating price from {position_data.get('current_price', 'None')} to {current_price}")
-                        self.logger.info(f"POSITION_PRICE_DEBUG: {symbol} - updating value to {new_value} (quantity={quantity}, price={current_price})")
+                        self.logger.info("POSITION_PRICE_DEBUG: %s - updating price from %s to %s", symbol, position_data.get('current_price', 'None'), current_price)
+                        self.logger.info("POSITION_PRICE_DEBUG: %s - updating value to %s (quantity=%s, price=%s)", symbol, new_value, quantity, current_price)
                         
                         # Update state store position with live price and value
                         # Note: Hydration already validated positions exist, no need to double-check
@@ -3546,7 +3647,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                             # Increment bars since entry
                             pos["meta"]["bars_since_entry"] = pos["meta"].get("bars_since_entry", 0) + 1
                             
-                            self.logger.info(f"POSITION_PRICE_DEBUG: {symbol} - updated in-memory value from {old_value} to {new_value}")
+                            self.logger.info("POSITION_PRICE_DEBUG: %s - updated in-memory value from %s to %s", symbol, old_value, new_value)
                             successful_updates += 1
                         else:
                             self.logger.error(f"POSITION_HYDRATION_MISMATCH: Position {symbol} not found in in-memory portfolio after hydration")
@@ -3566,12 +3667,12 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 # Don't raise - allow partial updates as long as some succeeded
             
             # Log total positions value after updates
-            self.logger.info(f"POSITION_PRICE_UPDATE: Total positions value = {format_currency(total_positions_value)}")
+            self.logger.info("POSITION_PRICE_UPDATE: Total positions value = %s", format_currency(total_positions_value))
             
             # Save updated portfolio state
             self._save_portfolio_state()
             
-            self.logger.info(f"POSITION_PRICE_UPDATE: Successfully updated {successful_updates} position prices")
+            self.logger.info("POSITION_PRICE_UPDATE: Successfully updated %s position prices", successful_updates)
             
         except Exception as e:
             self.logger.error(f"Error updating position prices: {e}")
@@ -3635,7 +3736,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             # 🛡️ BULLETPROOF: Read cash directly from state store (AUTHORITATIVE SOURCE)
             # Do NOT use self.portfolio["cash_balance"] as it can be stale
             cash_balance = to_decimal(self.state_store.get_session_cash(self.current_session_id))
-            self.logger.info(f"💎 SNAPSHOT_CASH_SOURCE: using authoritative state_store cash={format_currency(cash_balance)}")
+            self.logger.info("💎 SNAPSHOT_CASH_SOURCE: using authoritative state_store cash=%s", format_currency(cash_balance))
             
             active_positions = self.portfolio.get("positions", {})
             
@@ -3690,7 +3791,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             
             # Calculate positions value using mark prices (SINGLE SOURCE OF TRUTH)
             total_positions_value = to_decimal(0.0)
-            self.logger.info(f"📸 SNAPSHOT_POSITIONS_START: Calculating positions from self.portfolio['positions'], count={len(active_positions)}")
+            self.logger.info("📸 SNAPSHOT_POSITIONS_START: Calculating positions from self.portfolio['positions'], count=%s", len(active_positions))
             for symbol, position in active_positions.items():
                 quantity = to_decimal(position.get("quantity", 0.0))
                 if abs_decimal(quantity) > to_decimal(1e-8):  # Has position
@@ -3707,21 +3808,21 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                         if mark_price and validate_mark_price(mark_price, canonical_symbol):
                             position_value = calculate_position_value(quantity, to_decimal(mark_price))
                             total_positions_value += position_value
-                            self.logger.info(f"  📊 Position: {canonical_symbol} qty={float(quantity):.6f}, mark_price=${mark_price:.4f}, value=${float(position_value):.2f}")
+                            self.logger.info("  📊 Position: %s qty=%.6f, mark_price=$%.4f, value=$%.2f", canonical_symbol, float(quantity), mark_price, float(position_value))
                         else:
                             # Fallback to entry price if mark price unavailable
                             entry_price = to_decimal(position.get("entry_price", 0.0))
                             position_value = calculate_position_value(quantity, entry_price)
                             total_positions_value += position_value
-                            self.logger.info(f"  📊 Position: {canonical_symbol} qty={float(quantity):.6f}, entry_price=${float(entry_price):.4f} (fallback), value=${float(position_value):.2f}")
+                            self.logger.info("  📊 Position: %s qty=%.6f, entry_price=$%.4f (fallback), value=$%.2f", canonical_symbol, float(quantity), float(entry_price), float(position_value))
                     except Exception as e:
                         self.logger.warning(f"Failed to get mark price for {symbol}: {e}")
                         # Use entry price as fallback
                         entry_price = to_decimal(position.get("entry_price", 0.0))
                         position_value = calculate_position_value(quantity, entry_price)
                         total_positions_value += position_value
-                        self.logger.info(f"  📊 Position: {canonical_symbol} qty={float(quantity):.6f}, entry_price=${float(entry_price):.4f} (fallback-error), value=${float(position_value):.2f}")
-            self.logger.info(f"📸 SNAPSHOT_POSITIONS_TOTAL: total_positions_value=${float(total_positions_value):.2f}")
+                        self.logger.info("  📊 Position: %s qty=%.6f, entry_price=$%.4f (fallback-error), value=$%.2f", canonical_symbol, float(quantity), float(entry_price), float(position_value))
+            self.logger.info("📸 SNAPSHOT_POSITIONS_TOTAL: total_positions_value=$%.2f", float(total_positions_value))
             
             # Get realized P&L from state store (for logging only)
             total_realized_pnl = to_decimal(0.0)
@@ -3740,15 +3841,15 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             cash_balance_d = D(cash_balance)
             total_positions_value_d = D(total_positions_value)
             
-            self.logger.debug(f"🔍 EQUITY_CALC_TYPES: cash_balance={cash_balance} (type:{type(cash_balance)}), total_positions_value={total_positions_value} (type:{type(total_positions_value)})")
+            self.logger.debug("🔍 EQUITY_CALC_TYPES: cash_balance=%s (type:%s), total_positions_value=%s (type:%s)", cash_balance, type(cash_balance), total_positions_value, type(total_positions_value))
             
             # Calculate equity using Decimal arithmetic with q_money for final precision
             total_equity_d = q_money(cash_balance_d + total_positions_value_d)
             total_equity = to_decimal(total_equity_d)  # Convert back to existing decimal type for compatibility
             
             # Log the authoritative equity calculation with detailed breakdown
-            self.logger.info(f"EQUITY_SNAPSHOT: cash={format_currency(cash_balance)}, positions={format_currency(total_positions_value)}, total={format_currency(total_equity)} (realized_pnl={format_currency(total_realized_pnl)} already in cash)")
-            self.logger.info(f"EQUITY_BREAKDOWN: cash={format_currency(cash_balance)} + positions={format_currency(total_positions_value)} = {format_currency(total_equity)}")
+            self.logger.info("EQUITY_SNAPSHOT: cash=%s, positions=%s, total=%s (realized_pnl=%s already in cash)", format_currency(cash_balance), format_currency(total_positions_value), format_currency(total_equity), format_currency(total_realized_pnl))
+            self.logger.info("EQUITY_BREAKDOWN: cash=%s + positions=%s = %s", format_currency(cash_balance), format_currency(total_positions_value), format_currency(total_equity))
             
             # Calculate position metrics
             position_count = len(active_positions)
@@ -3943,10 +4044,28 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             import json
             trace_json = json.dumps(decision_trace, separators=(',', ':'))
             self.logger.info(f"DECISION_TRACE {trace_json}")
+            self._journal_event(EventType.DECISION, symbol, decision_trace)
             
         except Exception as e:
             self.logger.error(f"Failed to log decision trace for {symbol}: {e}")
 
+    def _journal_event(
+        self, event_type: EventType, symbol: Optional[str] = None, data: Optional[dict[str, Any]] = None
+    ) -> None:
+        """Record an event in the event journal (if enabled) for the current cycle.
+
+        Args:
+            event_type: Journal record type
+            symbol: Trading symbol (None for cycle events)
+            data: Event payload
+        """
+        if self.event_journal is None:
+            return
+        try:
+            self.event_journal.record(event_type, symbol, data, cycle_id=self.cycle_count)
+        except Exception as e:
+            self.logger.warning(f"Failed to journal {event_type.name} event: {e}")
+
     def _determine_winning_subsignal(self, signal: dict[str, Any]) -> tuple[str, float]:
         """Determine the winning sub-signal from composite signal data.
         
@@ -4392,7 +4511,10 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                         else:  # Short position
                             unrealized_pnl = (avg_cost - mark_price) * abs(quantity)
                         
-                        self.logger.debug(f"Position {canonical_symbol}: {quantity:.6f} × ${mark_price:.4f} = ${position_value:.2f} (avg_cost=${avg_cost:.4f} pnl=${unrealized_pnl:.2f})")
+                        self.logger.debug(
+                            "Position %s: %.6f × $%.4f = $%.2f (avg_cost=$%.4f pnl=$%.2f)",
+                            canonical_symbol, quantity, mark_price, position_value, avg_cost, unrealized_pnl,
+                        )
                     else:
                         self.logger.warning(f"No valid mark price for {canonical_symbol}, using entry price for valuation")
                         mark_price = position["entry_price"]
@@ -4442,9 +4564,9 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             new_positions = {}
             validation_errors = []
             
-            self.logger.debug(f"POSITION_HYDRATE_DEBUG: Processing {len(positions_list)} positions from state store")
+            self.logger.debug("POSITION_HYDRATE_DEBUG: Processing %d positions from state store", len(positions_list))
             for i, position in enumerate(positions_list):
-                self.logger.debug(f"POSITION_HYDRATE_DEBUG: Position {i+1}: {position}")
+                self.logger.debug("POSITION_HYDRATE_DEBUG: Position %d: %s", i + 1, position)
                 try:
                     # Validate position schema
                     required_fields = ["symbol", "quantity", "entry_price"]
@@ -4499,7 +4621,10 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                             "updated_at": datetime.now()
                         })
                         
-                        self.logger.debug(f"AGGREGATED: {canonical_symbol} -> {total_quantity} @ {weighted_entry_price} (combined from {existing['strategy']} + {strategy})")
+                        self.logger.debug(
+                            "AGGREGATED: %s -> %s @ %s (combined from %s + %s)",
+                            canonical_symbol, total_quantity, weighted_entry_price, existing["strategy"], strategy,
+                        )
                     else:
                         # First position for this symbol
                         new_positions[canonical_symbol] = {
@@ -4515,7 +4640,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                             "updated_at": position.get("updated_at", datetime.now())
                         }
                         
-                        self.logger.debug(f"HYDRATED: {canonical_symbol} -> {quantity} @ {entry_price}")
+                        self.logger.debug("HYDRATED: %s -> %s @ %s", canonical_symbol, quantity, entry_price)
                     
                 except Exception as e:
                     error_msg = f"Error processing position {position.get('symbol', 'unknown')}: {e}"
@@ -4661,13 +4786,32 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
     def cleanup(self) -> None:
         """Cleanup resources and close connections."""
         try:
+            if self.market_data_fetcher:
+                self.market_data_fetcher.close()
+
+            if self.signal_engine:
+                self.signal_engine.close()
+
             if self.state_store:
                 self.state_store.close()
                 self.logger.info("State store connection closed")
+
+            if self.event_journal:
+                self.event_journal.close()
+                self.logger.info("Event journal closed")
+
+            if self.metrics_server:
+                from .serve import stop_metrics_server
+
+                stop_metrics_server()
+                self.metrics_server = None
             
             self.logger.info("Trading system cleanup completed")
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
+        finally:
+            # Write out queued log records before the process exits
+            stop_log_pipeline()
 
     async def run_trading_cycle(self) -> dict[str, Any]:
         """Run one complete trading cycle.
@@ -4688,13 +4832,17 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             self.logger.warning("SESSION_VALIDATION_WARNING: Session state validation returned False, but continuing execution to observe system behavior")
             # raise RuntimeError("Session state validation failed - system not properly initialized")  # DISABLED: Allow execution to continue
 
+        self.cycle_profiler.begin_cycle(self.cycle_count + 1)
+
         # Hydrate in-memory positions from state store at cycle start with fail-fast validation
+        self.cycle_profiler.phase("hydration")
         if not self._hydrate_positions_from_store():
             self.logger.error("POSITION_HYDRATE_FAILED: Aborting trading cycle due to position hydration failure")
             raise RuntimeError("Position hydration failed - cycle aborted to prevent data inconsistency")
 
         self.cycle_count += 1
         cycle_start_time = datetime.now()
+        self._journal_event(EventType.CYCLE_START, None, {"session_id": self.current_session_id})
         
         # Reset reconciliation iteration counter for each new cycle
         self._reconcile_iterations = 0
@@ -4704,7 +4852,10 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
         
         # Clear per-cycle price cache for fresh data
         clear_cycle_price_cache(self.cycle_count - 1)  # Clear previous cycle
-        self.logger.debug(f"Cleared price cache for cycle #{self.cycle_count}")
+        self.logger.debug("Cleared price cache for cycle #%s", self.cycle_count)
+
+        # Start a fresh shared candle store; filled once by market data fetch
+        get_candle_store().begin_cycle(self.cycle_count)
         
         # Clear previous pricing snapshot and context
         clear_pricing_snapshot()
@@ -4712,9 +4863,9 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
         
         # Set up pricing context for this cycle
         pricing_context = set_pricing_context(self.cycle_count)
-        self.logger.debug(f"Set pricing context for cycle #{self.cycle_count}")
+        self.logger.debug("Set pricing context for cycle #%s", self.cycle_count)
 
-        self.logger.info(f"Starting trading cycle #{self.cycle_count}")
+        self.logger.info("Starting trading cycle #%s", self.cycle_count)
 
         cycle_results = {
             "cycle_id": f"cycle_{self.cycle_count}",
@@ -4741,25 +4892,38 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                     if is_allowed:
                         symbols.append(symbol)
                     else:
-                        self.logger.info(f"SYMBOL_FILTER: Skipping {symbol} - {reason}")
-                self.logger.info(f"SYMBOL_WHITELIST: Filtered {len(all_symbols)} symbols to {len(symbols)} whitelisted symbols")
+                        self.logger.info("SYMBOL_FILTER: Skipping %s - %s", symbol, reason)
+                self.logger.info("SYMBOL_WHITELIST: Filtered %s symbols to %s whitelisted symbols", len(all_symbols), len(symbols))
             else:
                 symbols = all_symbols
-                self.logger.info(f"SYMBOL_WHITELIST: No whitelist configured, using all {len(symbols)} symbols")
+                self.logger.info("SYMBOL_WHITELIST: No whitelist configured, using all %s symbols", len(symbols))
 
             # 1. Get comprehensive market data and create pricing snapshot
             self.logger.info("Step 1: Getting comprehensive market data and creating pricing snapshot")
+            self.cycle_profiler.phase("market_data")
             try:
                 market_data = await self._get_comprehensive_market_data(symbols)
                 cycle_results["market_data"] = market_data
+                cycle_results["market_data_latency"] = market_data.get("fetch_stats", {})
                 
-                # Create pricing snapshot for this cycle
+                # Create pricing snapshot for this cycle, reusing the tickers
+                # fetched above (market data is keyed by canonical symbol)
+                self.cycle_profiler.phase("pricing_snapshot")
+                ticker_data = market_data.get("ticker_data", {})
+                ticker_ms = market_data.get("fetch_stats", {}).get("ticker_ms", {})
                 pricing_snapshot = create_pricing_snapshot(
                     cycle_id=self.cycle_count,
                     symbols=symbols,
-                    data_engine=self.data_engine
+                    data_engine=self.data_engine,
+                    tickers={symbol: ticker_data.get(to_canonical(symbol)) for symbol in symbols},
+                    ticker_latency_ms={
+                        symbol: ticker_ms[to_canonical(symbol)]
+                        for symbol in symbols
+                        if to_canonical(symbol) in ticker_ms
+                    },
                 )
-                self.logger.info(f"Created pricing snapshot for cycle {self.cycle_count} with {len(pricing_snapshot.by_symbol)} symbols")
+                cycle_results["pricing_snapshot_fetch"] = pricing_snapshot.fetch_stats
+                self.logger.info("Created pricing snapshot for cycle %s with %s symbols", self.cycle_count, len(pricing_snapshot.by_symbol))
                 
             except Exception as e:
                 self.logger.warning(f"Failed to get comprehensive market data: {e}")
@@ -4768,6 +4932,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
 
             # 1.5. Update position prices with latest market data
             self.logger.info("Step 1.5: Updating position prices")
+            self.cycle_profiler.phase("position_prices")
             try:
                 self._update_position_prices()
             except Exception as e:
@@ -4776,6 +4941,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
 
             # 1.6. Check risk-on triggers and manage risk-on window
             self.logger.info("Step 1.6: Checking risk-on triggers")
+            self.cycle_profiler.phase("risk_checks")
             self._manage_risk_on_window(symbols)
 
             # 1.7. Check daily loss limits and halt flag
@@ -4784,6 +4950,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             
             # 1.8. Check for exit conditions (BEFORE generating new signals)
             self.logger.info("Step 1.8: Checking exit conditions for existing positions")
+            self.cycle_profiler.phase("exits")
             exit_results = await self._check_and_execute_exits(symbols)
             if exit_results.get("exits_executed", 0) > 0:
                 self.logger.info(
@@ -4793,16 +4960,21 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
 
             # 2. Generate all signals
             self.logger.info("Step 2: Generating trading signals")
+            self.cycle_profiler.phase("signals")
             signals = await self._generate_all_signals(market_data)
             cycle_results["signals"] = signals
+            for strategy_name, (wall_s, cpu_s) in self.signal_engine.pop_strategy_timings().items():
+                self.cycle_profiler.record(("signals", strategy_name), wall_s, cpu_s)
 
             # 3. Execute profit-optimized trades
             self.logger.info("Step 3: Executing profit-optimized trades")
+            self.cycle_profiler.phase("execution")
             execution_results = await self._execute_profit_optimized_trades(signals)
             cycle_results["execution_results"] = execution_results
 
             # 3.5. Auto-manage exits based on risk manager suggestions
             self.logger.info("Step 3.5: Auto-managing exits")
+            self.cycle_profiler.phase("exit_management")
             try:
                 # Get current marks for exit management
                 current_marks = {}
@@ -4828,7 +5000,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                                 )
                                 if exit_value:
                                     current_marks[symbol] = exit_value
-                                    self.logger.debug(f"Using exit value for {symbol} ({side}): {exit_value}")
+                                    self.logger.debug("Using exit value for %s (%s): %s", symbol, side, exit_value)
                                 else:
                                     # Fallback to mark price
                                     ticker_data = self.data_engine.get_ticker(symbol)
@@ -4855,7 +5027,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 )
                 
                 if exit_orders:
-                    self.logger.info(f"Created {len(exit_orders)} exit orders")
+                    self.logger.info("Created %s exit orders", len(exit_orders))
                     # Track exit events for P&L logging
                     exit_events = []
                     
@@ -4866,7 +5038,16 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                             if current_price > 0:
                                 fill = self.order_manager.execute_order(order, current_price)
                                 if fill.quantity > 0:
-                                    self.logger.info(f"Exit order filled: {order.symbol} {fill.quantity} @ {fill.price}")
+                                    self.logger.info("Exit order filled: %s %s @ %s", order.symbol, fill.quantity, fill.price)
+                                    self._journal_event(EventType.EXIT, order.symbol, {
+                                        "side": fill.side.value,
+                                        "quantity": fill.quantity,
+                                        "exit_price": fill.price,
+                                        "fees": fill.fees,
+                                        "order_id": order.id,
+                                        "reason": (order.metadata or {}).get("exit_reason"),
+                                        "exit_type": (order.metadata or {}).get("exit_type"),
+                                    })
                                     
                                     # Log exit event for P&L tracking
                                     try:
@@ -4940,8 +5121,9 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 cycle_results["errors"].append(f"Exit management error: {e}")
 
             # 4. Update portfolio using transactional approach
+            self.cycle_profiler.phase("portfolio_commit")
             portfolio_update_start = datetime.now()
-            self.logger.info(f"PORTFOLIO_UPDATE_START: {portfolio_update_start.isoformat()}")
+            self.logger.info("PORTFOLIO_UPDATE_START: %s", portfolio_update_start.isoformat())
             self.logger.info("Step 4: Updating portfolio with transactional validation")
             
             # Commit portfolio changes using transactional approach
@@ -4978,6 +5160,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
 
             # 5. Analytics and logging
             self.logger.info("Step 5: Analytics and logging")
+            self.cycle_profiler.phase("analytics")
             
             # Generate comprehensive cycle summary
             self._log_cycle_summary(cycle_results, execution_results)
@@ -5110,7 +5293,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                             
                             # Log ledger summary
                             entries_count = ledger_metrics.get("total_trades", 0)
-                            self.logger.info(f"summary_src=ledger entries={entries_count} trades_executed={entries_count}")
+                            self.logger.info("summary_src=ledger entries=%s trades_executed=%s", entries_count, entries_count)
                             
                         except Exception as e:
                             self.logger.error(f"Failed to query trade ledger: {e}")
@@ -5137,7 +5320,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                         if execution_trades != ledger_trades:
                             self.logger.warning(f"Trade count mismatch: execution={execution_trades}, ledger={ledger_trades}")
                         else:
-                            self.logger.info(f"Trade count validation passed: {execution_trades} trades")
+                            self.logger.info("Trade count validation passed: %s trades", execution_trades)
                     else:
                         # Fall back to profit report data
                         execution_trades = execution_results.get("trades_executed", 0)
@@ -5146,7 +5329,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                         if execution_trades != summary_trades:
                             self.logger.warning(f"Trade count mismatch: execution={execution_trades}, summary={summary_trades}")
                         else:
-                            self.logger.info(f"Trade count validation passed: {execution_trades} trades")
+                            self.logger.info("Trade count validation passed: %s trades", execution_trades)
                     
                     daily_summary_data.update({
                         "performance": {
@@ -5224,7 +5407,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 self.logger.warning("No pricing snapshot available for cycle completion logging")
 
             self.logger.info(
-                f"Trading cycle #{self.cycle_count} completed in {cycle_duration:.2f}s"
+                "Trading cycle #%s completed in %.2fs", self.cycle_count, cycle_duration
             )
             self.logger.info(f"Portfolio equity: ${self._get_total_equity():,.2f}")
             # Available capital is now logged immediately after portfolio state save (line 3202)
@@ -5241,6 +5424,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             cycle_results["errors"].append(error_msg)
 
         # LotBook persistence validation
+        self.cycle_profiler.phase("validation")
         try:
             snapshot_result = self._snapshot_all_lotbooks()
             if snapshot_result.get("all_match", False):
@@ -5263,10 +5447,6 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 cycle_results["nav_validation"] = "SKIP"
             else:
                 self.logger.info("NAV_VALIDATION_ENTRY: Pricing snapshot available, proceeding with validation")
-                # Get trades from ledger for this session
-                trades = self.trade_ledger.get_trades_by_session(self.current_session_id)
-                self.logger.info(f"NAV_VALIDATION_DEBUG: Retrieved {len(trades)} trades from ledger")
-                
                 # Get computed equity
                 computed_equity = self._get_total_equity()
                 
@@ -5274,15 +5454,31 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 # Use the initial capital from config, not the current cash balance
                 initial_cash = self.config.get("trading", {}).get("initial_capital", 100000.0)
                 
-                # Run NAV validation
-                self.logger.info(f"NAV_VALIDATION_CALL: About to call nav_validator.validate_nav")
-                nav_result = self.nav_validator.validate_nav(
-                    trades=trades,
-                    pricing_snapshot=pricing_snapshot,
-                    computed_equity=computed_equity,
-                    initial_cash=initial_cash
+                # Run NAV validation: replay only the trades recorded since the
+                # validator's checkpoint, with a periodic full rebuild as audit
+                if self.nav_validator.audit_due():
+                    trades = self.trade_ledger.get_trades_by_session(self.current_session_id)
+                    nav_result = self.nav_validator.audit_nav(
+                        trades=trades,
+                        pricing_snapshot=pricing_snapshot,
+                        computed_equity=computed_equity,
+                        initial_cash=initial_cash,
+                        session_id=self.current_session_id,
+                    )
+                else:
+                    after_id = self.nav_validator.checkpoint_trade_id(self.current_session_id, initial_cash)
+                    trades = self.trade_ledger.get_trades_since(self.current_session_id, after_id)
+                    nav_result = self.nav_validator.validate_nav_incremental(
+                        new_trades=trades,
+                        pricing_snapshot=pricing_snapshot,
+                        computed_equity=computed_equity,
+                        initial_cash=initial_cash,
+                        session_id=self.current_session_id,
+                    )
+                cycle_results["nav_validation_mode"] = nav_result.mode
+                self.logger.debug(
+                    "NAV_VALIDATION: mode=%s replayed %s trades", nav_result.mode, nav_result.trades_replayed
                 )
-                self.logger.info(f"NAV_VALIDATION_CALL: nav_validator.validate_nav completed")
                 
                 # Log validation result
                 if nav_result.is_valid:
@@ -5313,8 +5509,128 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             cycle_results["errors"].append(f"NAV validation error: {e}")
             # Don't abort on validation errors, just log them
 
+        # Candle store statistics (fetch/parse reuse across strategies)
+        candle_store = get_candle_store()
+        cycle_results["candle_store"] = candle_store.get_stats()
+        self.logger.debug(
+            f"CANDLE_STORE: hits={cycle_results['candle_store']['hits']} "
+            f"misses={cycle_results['candle_store']['misses']} "
+            f"parses={cycle_results['candle_store']['parses']}"
+        )
+        candle_store.end_cycle()
+        cycle_results["atr_cache"] = get_atr_service().get_cache_stats()
+
+        # Positions are served from the state store's index; check it against
+        # a full table read every verify_interval cycles
+        if self.state_store:
+            index_config = self.config.get("state", {}).get("position_index", {})
+            verify_interval = index_config.get("verify_interval", 100)
+            if verify_interval and self.cycle_count % verify_interval == 0:
+                try:
+                    self.state_store.verify_position_index(self.current_session_id)
+                except Exception as e:
+                    self.logger.warning(f"Position index verification failed: {e}")
+            cycle_results["position_index"] = self.state_store.get_position_index_stats()
+
+        logging_stats = get_logging_stats()
+        if logging_stats:
+            cycle_results["logging"] = logging_stats
+
+        if self.event_journal:
+            snapshot_summary = cycle_results.get("portfolio_snapshot", {})
+            self._journal_event(EventType.CYCLE_END, None, {
+                "session_id": self.current_session_id,
+                "duration": cycle_results.get("duration"),
+                "total_equity": snapshot_summary.get("total_equity"),
+                "cash_balance": snapshot_summary.get("cash_balance"),
+                "active_positions": snapshot_summary.get("active_positions"),
+                "nav_validation": cycle_results.get("nav_validation"),
+                "errors": len(cycle_results.get("errors", [])),
+            })
+            cycle_results["event_journal"] = self.event_journal.get_stats()
+
+        # Flush barrier: everything this cycle wrote is durable before it returns
+        self.cycle_profiler.phase("state_flush")
+        if self.state_store:
+            try:
+                self.state_store.flush()
+            except Exception as e:
+                self.logger.error(f"State store flush failed at cycle end: {e}")
+                cycle_results["errors"].append(f"State store flush error: {e}")
+
+        self._finish_cycle_profile(cycle_results)
+
         return cycle_results
 
+    def _start_metrics_server(self) -> None:
+        """Serve this system's metrics collector and cycle profiler over HTTP.
+
+        Uses monitoring.metrics_server (enabled, host, port). A metrics server
+        already running in this process is reused and pointed at this system,
+        so /metrics and /profile expose the cycle phase histograms.
+        """
+        server_config = self.config.get("monitoring", {}).get("metrics_server", {})
+        if not server_config.get("enabled", False):
+            return
+
+        try:
+            from .serve import get_metrics_server, start_metrics_server
+
+            self.metrics_server = get_metrics_server()
+            if self.metrics_server is None:
+                self.metrics_server = start_metrics_server(
+                    server_config.get("host", "localhost"),
+                    server_config.get("port", 8001),
+                    self.metrics_collector,
+                    self.cycle_profiler,
+                )
+            else:
+                self.metrics_server.set_metrics_collector(self.metrics_collector)
+                self.metrics_server.set_cycle_profiler(self.cycle_profiler)
+            self.logger.info(
+                f"Metrics server exposing /metrics on {self.metrics_server.host}:{self.metrics_server.port}"
+            )
+        except Exception as e:
+            self.logger.warning(f"Metrics server not started: {e}")
+
+    def _finish_cycle_profile(self, cycle_results: dict[str, Any]) -> None:
+        """Close the cycle profile, record histograms and report overruns.
+
+        Args:
+            cycle_results: Cycle results to attach phase timings to
+        """
+        profile = self.cycle_profiler.end_cycle()
+        if profile is None:
+            return
+
+        cycle_results["phase_timings"] = profile.phases()
+        self.metrics_collector.record_cycle_profile(profile)
+
+        cycle_interval = self.config.get("trading", {}).get("cycle_interval", 60)
+        if cycle_interval and profile.wall_s > cycle_interval:
+            slowest = ", ".join(f"{name}={wall:.2f}s" for name, wall in profile.slowest_phases())
+            self.logger.warning(
+                f"CYCLE_OVERRUN: cycle #{profile.cycle_id} took {profile.wall_s:.2f}s "
+                f"(interval {cycle_interval}s); slowest phases: {slowest}"
+            )
+            profiling_config = self.config.get("monitoring", {}).get("profiling", {})
+            if profiling_config.get("dump_on_overrun", False):
+                self.dump_cycle_profile()
+
+    def dump_cycle_profile(self, path: Optional[str] = None, metric: str = "wall") -> str:
+        """Write recent cycle phase timings as a flame-graph-compatible folded file.
+
+        Args:
+            path: Output path (defaults to monitoring.profiling.flamegraph_path)
+            metric: 'wall' or 'cpu'
+
+        Returns:
+            The path written
+        """
+        profiling_config = self.config.get("monitoring", {}).get("profiling", {})
+        path = path or profiling_config.get("flamegraph_path", "logs/cycle_profile.folded")
+        return self.cycle_profiler.dump_flamegraph(path, metric)
+
     def _assert_equity_consistency(self) -> None:
         """Post-cycle assertion: cash + marked position value ≈ reported equity.
         
@@ -5403,7 +5719,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             if self.state_store and self.current_session_id:
                 trades = self.state_store.get_trades()
                 session_trades = [t for t in trades if t.get('session_id') == self.current_session_id]
-                self.logger.debug(f"Verified {len(session_trades)} trades committed to state store for session {self.current_session_id}")
+                self.logger.debug("Verified %s trades committed to state store for session %s", len(session_trades), self.current_session_id)
             
         except Exception as e:
             self.logger.error(f"Error ensuring trades are committed: {e}")
@@ -5611,6 +5927,14 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                             f"EXIT_EXECUTED: {symbol} {exit_side} {exit_qty:.6f} P&L=${pnl:.2f} "
                             f"reason={exit_condition.reason}"
                         )
+                        self._journal_event(EventType.EXIT, symbol, {
+                            "side": exit_side,
+                            "quantity": exit_qty,
+                            "exit_price": exit_condition.exit_price,
+                            "entry_price": entry_price,
+                            "pnl": pnl,
+                            "reason": exit_condition.reason,
+                        })
                     else:
                         self.logger.warning(f"EXIT_FAILED: {symbol} exit order failed")
                         
@@ -5676,7 +6000,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 self.state_store.set_session_metadata(
                     self.current_session_id, "risk_on_window_cycles_remaining", new_cycles_remaining
                 )
-                self.logger.debug(f"RISK-ON: window continues, {new_cycles_remaining} cycles remaining")
+                self.logger.debug("RISK-ON: window continues, %s cycles remaining", new_cycles_remaining)
             else:
                 # Window ended
                 self.state_store.set_session_metadata(
@@ -5695,7 +6019,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
         current_equity = self._get_total_equity()
         is_first_cycle = (self.cycle_count == 1)
         
-        self.logger.info(f"DAILY_LOSS_CHECK: cycle_count={self.cycle_count}, is_first_cycle={is_first_cycle}")
+        self.logger.info("DAILY_LOSS_CHECK: cycle_count=%s, is_first_cycle=%s", self.cycle_count, is_first_cycle)
         
         should_halt, reason = self.risk_manager.check_daily_loss_limit(
             state_store=self.state_store,
@@ -5743,7 +6067,10 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                         position_unrealized = (current_price - avg_cost) * quantity
                         unrealized_pnl += position_unrealized
                         
-                        self.logger.debug(f"UNREALIZED_PNL: {symbol} qty={quantity:.6f} current=${current_price:.4f} avg_cost=${avg_cost:.4f} unrealized=${position_unrealized:.2f}")
+                        self.logger.debug(
+                            "UNREALIZED_PNL: %s qty=%.6f current=$%.4f avg_cost=$%.4f unrealized=$%.2f",
+                            symbol, quantity, current_price, avg_cost, position_unrealized,
+                        )
             
             self.logger.debug(f"TOTAL_UNREALIZED_PNL: ${unrealized_pnl:,.2f}")
             return unrealized_pnl
@@ -6052,7 +6379,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             if trade_id:
                 existing_lot = self._check_duplicate_fill(canonical_symbol, trade_id)
                 if existing_lot:
-                    self.logger.info(f"DUPLICATE_FILL: {trade_id} already processed, returning cached result")
+                    self.logger.info("DUPLICATE_FILL: %s already processed, returning cached result", trade_id)
                     return {
                         "realized_pnl": 0.0,  # No additional P&L for duplicate
                         "total_fees": 0.0,    # No additional fees for duplicate
@@ -6066,7 +6393,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
             # Get or create LotBook for this symbol
             if canonical_symbol not in self.lot_books:
                 self.lot_books[canonical_symbol] = LotBook()
-                self.logger.debug(f"Created new LotBook for {canonical_symbol}")
+                self.logger.debug("Created new LotBook for %s", canonical_symbol)
             
             lot_book = self.lot_books[canonical_symbol]
             
@@ -6094,7 +6421,7 @@ class ProfitMaximizingTradingSystem(LoggerMixin):
                 
                 realized_pnl = 0.0  # No realized P&L on buys
                 
-                self.logger.debug(f"BUY: Added lot {lot_id} to {canonical_symbol}: {quantity:.6f} @ ${fill_price:.4f}")
+                self.logger.debug("BUY: Added lot %s to %s: %.6f @ $%.4f", lot_id, canonical_symbol, quantity, fill_price)
                 
             elif side.lower() == "sell":
                 # Consume lots using FIFO
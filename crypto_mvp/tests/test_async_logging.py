@@ -0,0 +1,198 @@
+"""
+Tests for the asynchronous logging pipeline.
+"""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from src.crypto_mvp.core import async_logging, logging_utils
+from src.crypto_mvp.core.async_logging import (
+    AsyncLogPipeline,
+    DeferredQueueHandler,
+    EventRateLimiter,
+    get_logging_stats,
+    set_log_level,
+    stop_log_pipeline,
+)
+from src.crypto_mvp.core.logging_utils import LoggerMixin, get_logger
+
+
+class RecordingHandler(logging.Handler):
+    """Keeps each written message and the thread that formatted it."""
+
+    def __init__(self, gate=None):
+        super().__init__()
+        self.gate = gate
+        self.messages = []
+        self.threads = []
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait()
+        self.messages.append(record.getMessage())
+        self.threads.append(threading.current_thread().name)
+
+
+class Probe:
+    """Counts how often it is converted to a string."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "probe"
+
+
+@pytest.fixture(autouse=True)
+def reset_pipeline():
+    yield
+    stop_log_pipeline()
+    async_logging._pipeline = None
+    async_logging._level_overrides.clear()
+    logging_utils._pipeline_logging_config = None
+
+
+def make_logger(name, pipeline, level=logging.INFO):
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    pipeline.attach(logger)
+    return logger
+
+
+class TestAsyncLogPipeline:
+    """Test queueing, deferred formatting and shutdown."""
+
+    def test_get_logger_writes_through_the_writer_thread(self, tmp_path):
+        log_file = tmp_path / "logs" / "app.log"
+        config = {"level": "INFO", "file": str(log_file), "async": {"enabled": True}}
+        logger = get_logger("AsyncTestSystem", config)
+        assert [type(h) for h in logger.handlers] == [DeferredQueueHandler]
+
+        for i in range(20):
+            logger.info("CYCLE_DONE: cycle %d equity=%.2f", i, 1000.0 + i)
+        logger.debug("not written")
+        assert get_logging_stats()["loggers"] == 1
+
+        stop_log_pipeline()
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 20
+        assert lines[-1].endswith("CYCLE_DONE: cycle 19 equity=1019.00")
+
+        # After shutdown the logger writes synchronously instead of losing records
+        logger.info("after stop")
+        assert log_file.read_text().splitlines()[-1].endswith("after stop")
+
+    def test_formatting_is_deferred_to_the_writer(self):
+        handler = RecordingHandler()
+        pipeline = AsyncLogPipeline({}, [handler])
+        logger = make_logger("AsyncTestDeferred", pipeline)
+
+        probe = Probe()
+        logger.debug("POSITION_HYDRATE_DEBUG: %s", probe)
+        assert probe.calls == 0  # Below the logger level: never formatted
+
+        logger.info("QUOTE: %s @ %.2f", "BTC/USDT", 50000.0)
+        logger.info("POSITION: %s", {"symbol": "ETH/USDT"})
+        pipeline.stop()
+
+        assert handler.messages == ["QUOTE: BTC/USDT @ 50000.00", "POSITION: {'symbol': 'ETH/USDT'}"]
+        assert all(name != threading.current_thread().name for name in handler.threads)
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        gate = threading.Event()
+        handler = RecordingHandler(gate)
+        pipeline = AsyncLogPipeline({"max_queue": 5}, [handler])
+        logger = make_logger("AsyncTestFull", pipeline)
+
+        started = time.monotonic()
+        for i in range(100):
+            logger.info("TICK: %d", i)
+        assert time.monotonic() - started < 1.0
+        assert pipeline.get_stats()["dropped"] > 0
+
+        gate.set()
+        pipeline.stop()
+        stats = pipeline.get_stats()
+        assert stats["written"] + stats["dropped"] == 100
+
+
+    def test_subsystems_without_logging_config_share_the_pipeline(self, tmp_path):
+        class AsyncTestLedger(LoggerMixin):
+            pass
+
+        # No pipeline yet: plain logger
+        assert DeferredQueueHandler not in [type(h) for h in AsyncTestLedger().logger.handlers]
+
+        log_file = tmp_path / "app.log"
+        config = {"level": "INFO", "file": str(log_file), "async": {"enabled": True}}
+        get_logger("AsyncTestSystem", config)
+
+        ledger_logger = AsyncTestLedger().logger
+        assert [type(h) for h in ledger_logger.handlers] == [DeferredQueueHandler]
+        assert ledger_logger.level == logging.INFO
+        ledger_logger.info("TRADE_COMMITTED: %s", "t1")
+
+        stop_log_pipeline()
+        assert log_file.read_text().strip().endswith("TRADE_COMMITTED: t1")
+
+
+class TestEventRateLimiter:
+    """Test sampling and token-bucket limits by event key."""
+
+    def test_sampling_passes_one_in_n(self):
+        handler = RecordingHandler()
+        pipeline = AsyncLogPipeline({"rate_limits": {"NAV_REBUILD": {"sample_every": 10}}}, [handler])
+        logger = make_logger("AsyncTestSample", pipeline)
+
+        probe = Probe()
+        for i in range(100):
+            logger.info("NAV_REBUILD: Trade %d %s", i, probe)
+        logger.info("OTHER_EVENT: not limited")
+        logger.warning("NAV_REBUILD: warnings always pass")
+        pipeline.stop()
+
+        assert len(handler.messages) == 12
+        assert handler.messages[:2] == ["NAV_REBUILD: Trade 0 probe", "NAV_REBUILD: Trade 10 probe"]
+        # Suppressed records are never formatted
+        assert probe.calls == 10
+        assert pipeline.get_stats()["suppressed"] == {"NAV_REBUILD": 90}
+
+    def test_token_bucket_allows_a_burst(self):
+        limiter = EventRateLimiter({"QUOTE_UPDATE": {"per_second": 0.001, "burst": 5}})
+        records = [
+            logging.LogRecord("t", logging.INFO, __file__, 1, "QUOTE_UPDATE: %d", (i,), None)
+            for i in range(20)
+        ]
+        assert sum(limiter.filter(record) for record in records) == 5
+        assert limiter.suppressed == {"QUOTE_UPDATE": 15}
+
+    def test_event_key_extraction(self):
+        def key(message):
+            return async_logging.event_key(logging.LogRecord("t", logging.INFO, __file__, 1, message, None, None))
+
+        assert key("NAV_REBUILD: Trade 1") == "NAV_REBUILD"
+        assert key("POSITION_HYDRATE_DEBUG: Position 1") == "POSITION_HYDRATE_DEBUG"
+        assert key("HYDRATED: BTC/USDT -> 1") == "HYDRATED"
+        assert key("NAV validator initialized") is None
+        assert key("Trading started") is None
+
+
+class TestLevelOverrides:
+    """Test per-subsystem levels from config and at runtime."""
+
+    def test_runtime_override_applies_to_existing_and_new_loggers(self, tmp_path):
+        log_file = tmp_path / "app.log"
+        config = {"level": "INFO", "file": str(log_file), "levels": {"AsyncTestQuiet": "WARNING"}}
+        quiet = get_logger("AsyncTestQuiet", config)
+        assert quiet.level == logging.WARNING
+
+        set_log_level("AsyncTestQuiet", "DEBUG")
+        quiet.debug("now visible")
+        assert log_file.read_text().strip().endswith("now visible")
+
+        # A logger created after the override keeps it
+        assert get_logger("AsyncTestQuiet", config).level == logging.DEBUG
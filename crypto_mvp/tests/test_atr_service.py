@@ -0,0 +1,208 @@
+"""
+Tests for the cached ATRService.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# atr_service imports crypto_mvp absolutely
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from crypto_mvp.core.candle_store import get_candle_store
+from crypto_mvp.indicators.atr_service import ATRService, get_atr_service, wilder_atr
+
+
+class CountingEngine:
+    """Data engine serving seeded candles and counting get_ohlcv calls."""
+
+    def __init__(self, num_candles=120, seed=7):
+        rng = np.random.default_rng(seed)
+        closes = 100 + np.cumsum(rng.normal(0, 1, num_candles))
+        self.candles = [
+            [i * 3_600_000, c, c + abs(rng.normal(0, 1)), c - abs(rng.normal(0, 1)), c, 1000.0]
+            for i, c in enumerate(closes)
+        ]
+        self.calls = 0
+
+    def get_ohlcv(self, symbol, timeframe="1h", limit=100):
+        self.calls += 1
+        return self.candles[-limit:]
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def idle_candle_store():
+    get_candle_store().end_cycle()
+    yield
+    get_candle_store().end_cycle()
+
+
+class TestATRCache:
+    """Test candle-boundary caching and statistics."""
+
+    def test_cached_until_the_candle_closes(self):
+        engine = CountingEngine()
+        clock = FakeClock(10 * 3600 + 60)
+        service = ATRService({}, clock=clock)
+
+        atr = service.get_atr("BTC/USDT", engine)
+        assert atr is not None
+        clock.now += 1800
+        assert service.get_atr("BTC/USDT", engine) == atr
+        assert engine.calls == 1
+
+        # A new 1h candle closes at 11:00
+        clock.now = 11 * 3600
+        service.get_atr("BTC/USDT", engine)
+        assert engine.calls == 2
+
+        # Period and timeframe are part of the key
+        service.get_atr("BTC/USDT", engine, period=20)
+        service.get_atr("BTC/USDT", engine, timeframe="15m")
+        assert engine.calls == 4
+
+        stats = service.get_cache_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 4
+        assert stats["cache_size"] == 3
+        assert stats["cached_symbols"] == ["BTC/USDT"]
+
+        service.clear_cache("BTC/USDT")
+        assert service.get_cache_stats()["cache_size"] == 0
+
+    def test_ttl_shortens_the_lifetime(self):
+        engine = CountingEngine()
+        clock = FakeClock(10 * 3600)
+        service = ATRService({"atr_cache_ttl_seconds": 60}, clock=clock)
+
+        service.get_atr("ETH/USDT", engine)
+        clock.now += 59
+        service.get_atr("ETH/USDT", engine)
+        clock.now += 1
+        service.get_atr("ETH/USDT", engine)
+        assert engine.calls == 2
+
+    def test_failed_fetch_is_retried_after_the_failure_ttl(self):
+        engine = CountingEngine()
+        candles = engine.candles
+
+        def flaky_get_ohlcv(symbol, timeframe="1h", limit=100):
+            engine.calls += 1
+            if engine.calls == 1:
+                raise ConnectionError("exchange timeout")
+            return candles[-limit:]
+
+        engine.get_ohlcv = flaky_get_ohlcv
+        clock = FakeClock(10 * 3600)
+        service = ATRService({"atr_failure_ttl_seconds": 5}, clock=clock)
+
+        assert service.get_atr("BTC/USDT", engine) is None
+        # Remembered briefly, so consumers in the same moment don't all refetch
+        assert service.get_atr("BTC/USDT", engine) is None
+        assert engine.calls == 1
+
+        clock.now += 5
+        atr = service.get_atr("BTC/USDT", engine)
+        assert atr is not None and engine.calls == 2
+        # The recovered value is cached until the candle closes
+        clock.now += 600
+        assert service.get_atr("BTC/USDT", engine) == atr and engine.calls == 2
+
+        # Without a failure TTL an unavailable ATR is never cached
+        retrying = ATRService({"atr_failure_ttl_seconds": 0}, clock=clock)
+        engine.calls = 0
+        assert retrying.get_atr("ETH/USDT", engine) is None
+        assert retrying.get_cache_stats()["cache_size"] == 0
+        assert retrying.get_atr("ETH/USDT", engine) is not None
+
+    def test_bulk_lookup_and_cache_only_reads(self):
+        engine = CountingEngine()
+        service = ATRService({}, clock=FakeClock(3600 * 5))
+
+        assert service.get_cached_atr("BTC/USDT") is None
+        atrs = service.get_atrs(["BTC/USDT", "ETH/USDT", "BTC/USDT"], engine)
+        assert set(atrs) == {"BTC/USDT", "ETH/USDT"}
+        assert engine.calls == 2
+
+        assert service.get_cached_atr("BTC/USDT") == atrs["BTC/USDT"]
+        assert service.get_cached_atr("SOL/USDT") is None
+        assert engine.calls == 2
+
+        # Without a data engine nothing is fetched or cached
+        assert service.get_atr("SOL/USDT") is None
+        assert "SOL/USDT" not in service.get_cache_stats()["cached_symbols"]
+
+    def test_uses_candles_already_loaded_this_cycle(self):
+        engine = CountingEngine()
+        store = get_candle_store()
+        store.begin_cycle(1)
+        # A strategy loaded a 100-candle window this cycle
+        store.get_or_fetch("BTC/USDT", "1h", 100, lambda: engine.get_ohlcv("BTC/USDT", "1h", 100))
+
+        service = ATRService({})
+        assert service.get_atr("BTC/USDT", engine) is not None
+        assert engine.calls == 1
+
+
+class TestMarketPricesATR:
+    """The market.prices ATR accessors share the global service's cache."""
+
+    def setup_method(self):
+        get_atr_service().clear_cache()
+
+    def teardown_method(self):
+        get_atr_service().clear_cache()
+
+    def test_accessors_delegate_to_shared_service(self):
+        from market import prices
+
+        engine = CountingEngine()
+        assert prices.get_atr("BTC/USDT") is None
+
+        atr = prices.get_atr("BTC/USDT", data_engine=engine)
+        assert atr == get_atr_service().get_cached_atr("BTC/USDT", period=14)
+        assert prices.get_atr("BTC/USDT") == atr
+        assert prices.get_atr("BTC/USDT", data_engine=engine) == atr
+        assert engine.calls == 1
+
+        atr_1m = prices.get_atr_1m_60("BTC/USDT", data_engine=engine)
+        assert atr_1m == get_atr_service().get_cached_atr("BTC/USDT", period=60, timeframe="1m")
+        assert engine.calls == 2
+
+        prices.clear_atr_cache()
+        assert prices.get_atr("BTC/USDT") is None
+
+
+class TestWilderATR:
+    """Test the NumPy ATR computation."""
+
+    def test_matches_pandas_wilder_smoothing(self):
+        pd = pytest.importorskip("pandas")
+        engine = CountingEngine(num_candles=24)
+        frame = pd.DataFrame(engine.candles, columns=["timestamp", "open", "high", "low", "close", "volume"])
+        prev_close = frame["close"].shift(1)
+        true_range = np.maximum(
+            frame["high"] - frame["low"],
+            np.maximum(np.abs(frame["high"] - prev_close), np.abs(frame["low"] - prev_close)),
+        )
+        expected = true_range.ewm(alpha=1.0 / 14, adjust=False).mean().iloc[-1]
+
+        actual = wilder_atr(
+            frame["high"].to_numpy(), frame["low"].to_numpy(), frame["close"].to_numpy(), 14
+        )
+        assert actual == pytest.approx(expected, rel=1e-12)
+
+    def test_insufficient_candles(self):
+        values = np.ones(14)
+        assert wilder_atr(values, values, values, 14) is None
+        # Flat candles have no range
+        assert wilder_atr(np.ones(20), np.ones(20), np.ones(20), 14) is None
@@ -0,0 +1,139 @@
+"""
+Tests for backtest parameter sweeps.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# The backtest package pulls in execution, which imports crypto_mvp absolutely
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from crypto_mvp.backtest import (
+    BacktestReport,
+    ReplayFixture,
+    SweepRunner,
+    replay_symbols,
+)
+from crypto_mvp.backtest.sweep import (
+    apply_overrides,
+    fixture_id_for,
+    grid_search,
+    random_search,
+    run_id_for,
+)
+from crypto_mvp.backtest.vectorized import VectorizedBacktester
+
+SPACE = {
+    "backtest.vectorized.entry_threshold": [0.4, 0.5, 0.6],
+    "backtest.vectorized.exit_threshold": [-0.3, 0.0],
+}
+
+
+@pytest.fixture
+def fixture():
+    return ReplayFixture.generate(replay_symbols(3), num_candles=300, seed=11)
+
+
+class TestSearchSpaces:
+    """Test parameter set generation."""
+
+    def test_grid_and_overrides(self):
+        runs = grid_search(SPACE)
+        assert len(runs) == 6
+        assert runs[0] == {"backtest.vectorized.entry_threshold": 0.4, "backtest.vectorized.exit_threshold": -0.3}
+
+        base = {"backtest": {"vectorized": {"window": 60}}}
+        config = apply_overrides(base, runs[0])
+        assert config["backtest"]["vectorized"] == {"window": 60, "entry_threshold": 0.4, "exit_threshold": -0.3}
+        assert base == {"backtest": {"vectorized": {"window": 60}}}
+
+        with pytest.raises(ValueError):
+            grid_search({"backtest.vectorized.window": 60})
+
+    def test_random_search_is_seeded(self):
+        space = {
+            "strategies.momentum.parameters.rsi_period": {"low": 10, "high": 20},
+            "backtest.vectorized.entry_threshold": {"low": 0.3, "high": 0.7},
+            "backtest.vectorized.window": [60, 100],
+        }
+        runs = random_search(space, 20, seed=5)
+
+        assert runs == random_search(space, 20, seed=5)
+        assert len({run_id_for(run) for run in runs}) == len(runs)
+        for run in runs:
+            assert isinstance(run["strategies.momentum.parameters.rsi_period"], int)
+            assert 10 <= run["strategies.momentum.parameters.rsi_period"] <= 20
+            assert 0.3 <= run["backtest.vectorized.entry_threshold"] <= 0.7
+            assert run["backtest.vectorized.window"] in (60, 100)
+
+
+class TestSweepRunner:
+    """Test running sweeps on a process pool."""
+
+    def test_pool_matches_sequential_backtests(self, fixture, tmp_path):
+        runs = grid_search(SPACE)
+        rows = SweepRunner({}, str(tmp_path)).run(fixture, runs, "grid", workers=2)
+
+        assert len(rows) == len(runs)
+        assert all(row["status"] == "ok" for row in rows)
+        sharpes = [row["sharpe_ratio"] for row in rows]
+        assert sharpes == sorted(sharpes, reverse=True)
+
+        shared = ReplayFixture.open_arrays(str(tmp_path / "grid" / "fixture"))
+        assert isinstance(shared.candles, np.memmap)
+        assert np.array_equal(shared.candles, fixture.candles)
+
+        for row in rows:
+            expected = VectorizedBacktester(apply_overrides({}, row["params"])).run(fixture, 100000.0)
+            metrics = expected["performance_metrics"]
+            assert row["total_trades"] == metrics["total_trades"]
+            assert row["final_equity"] == pytest.approx(metrics["final_equity"])
+
+    def test_resume_skips_completed_runs(self, fixture, tmp_path):
+        runs = grid_search(SPACE)
+        runner = SweepRunner({"trading": {"initial_capital": 5000.0}}, str(tmp_path))
+
+        first = runner.run(fixture, runs[:2], "resume", workers=1)
+        finished = {row["run_id"]: row["completed_at"] for row in first}
+
+        # A resumed sweep keeps its original candles for the same symbols and range
+        other = ReplayFixture.generate(replay_symbols(3), num_candles=300, seed=12)
+        rows = runner.run(other, runs + [{"backtest.vectorized.window": 500}], "resume", workers=1)
+
+        assert len(rows) == len(runs) + 1
+        for row in rows:
+            if row["run_id"] in finished:
+                assert row["completed_at"] == finished[row["run_id"]]
+        failed = [row for row in rows if row["status"] == "failed"]
+        assert len(failed) == 1 and "ValueError" in failed[0]["error"]
+        assert rows[-1]["status"] == "failed"
+
+        expected = VectorizedBacktester(apply_overrides({}, runs[3])).run(fixture, 5000.0)
+        by_id = {row["run_id"]: row for row in rows}
+        assert by_id[run_id_for(runs[3])]["final_equity"] == pytest.approx(
+            expected["performance_metrics"]["final_equity"]
+        )
+
+        summary = BacktestReport(str(tmp_path / "reports")).generate_sweep_report(rows)
+        assert summary["sweep_summary"]["completed_runs"] == len(runs)
+        assert summary["sweep_summary"]["failed_runs"] == 1
+        assert summary["best"]["run_id"] == rows[0]["run_id"]
+
+    def test_resume_refuses_a_different_fixture(self, fixture, tmp_path):
+        runs = grid_search(SPACE)[:1]
+        runner = SweepRunner({}, str(tmp_path))
+        runner.run(fixture, runs, "sweep", workers=1)
+
+        longer = ReplayFixture.generate(replay_symbols(3), num_candles=400, seed=11)
+        other_symbols = ReplayFixture.generate(replay_symbols(4), num_candles=300, seed=11)
+        for other in (longer, other_symbols):
+            assert fixture_id_for(other) != fixture_id_for(fixture)
+            with pytest.raises(ValueError, match="different candles"):
+                runner.run(other, runs, "sweep", workers=1)
+
+        rows = runner.run(longer, runs, "longer", workers=1)
+        assert rows[0]["status"] == "ok"
+
@@ -0,0 +1,134 @@
+"""
+Tests for the cycle-scoped shared OHLCV candle store.
+"""
+
+import numpy as np
+import pytest
+
+from src.crypto_mvp.core.candle_store import CycleCandleStore, get_candle_store
+from src.crypto_mvp.strategies.breakout import BreakoutStrategy
+from src.crypto_mvp.strategies.mean_reversion import MeanReversionStrategy
+from src.crypto_mvp.strategies.momentum import MomentumStrategy
+
+
+def _make_ohlcv(n=100, start=100.0):
+    rows = []
+    price = start
+    for i in range(n):
+        price *= 1.0 + 0.01 * np.sin(i / 3.0)
+        rows.append([i * 3600, price, price * 1.01, price * 0.99, price, 1000.0 + i])
+    return rows
+
+
+class CountingDataEngine:
+    """Data engine that counts OHLCV fetches."""
+
+    def __init__(self):
+        self.ohlcv_calls = 0
+
+    def get_ohlcv(self, symbol, timeframe, limit=100):
+        self.ohlcv_calls += 1
+        return _make_ohlcv(limit)
+
+
+class TestCycleCandleStore:
+    """Test the candle store itself."""
+
+    def test_put_and_get_returns_read_only_columns(self):
+        store = CycleCandleStore()
+        store.begin_cycle(1)
+        store.put("BTC/USDT", "1h", 100, _make_ohlcv())
+
+        frame = store.get("BTC/USDT", "1h", 100)
+
+        assert len(frame["closes"]) == 100
+        with pytest.raises(ValueError):
+            frame["closes"][0] = 0.0
+        assert store.get_stats()["hits"] == 1
+
+    def test_smaller_window_served_from_tail(self):
+        store = CycleCandleStore()
+        store.begin_cycle(1)
+        rows = _make_ohlcv(100)
+        store.put("BTC/USDT", "1h", 100, rows)
+
+        frame = store.get("BTC/USDT", "1h", 30)
+
+        assert len(frame["closes"]) == 30
+        assert frame["closes"][-1] == rows[-1][4]
+        assert frame["timestamps"][0] == rows[70][0]
+        assert store.get("BTC/USDT", "4h", 30) is None
+        assert store.get("BTC/USDT", "1h", 200) is None
+
+    def test_nothing_cached_outside_a_cycle(self):
+        store = CycleCandleStore()
+        engine = CountingDataEngine()
+
+        for _ in range(2):
+            store.get_or_fetch("BTC/USDT", "1h", 100, lambda: engine.get_ohlcv("BTC/USDT", "1h"))
+
+        assert engine.ohlcv_calls == 2
+
+        store.begin_cycle(1)
+        for _ in range(2):
+            store.get_or_fetch("BTC/USDT", "1h", 100, lambda: engine.get_ohlcv("BTC/USDT", "1h"))
+        assert engine.ohlcv_calls == 3
+
+        store.end_cycle()
+        assert store.get("BTC/USDT", "1h", 100) is None
+
+    def test_begin_cycle_resets_entries_and_stats(self):
+        store = CycleCandleStore()
+        store.begin_cycle(1)
+        store.put("BTC/USDT", "1h", 100, _make_ohlcv())
+        store.get("BTC/USDT", "1h", 100)
+
+        store.begin_cycle(2)
+
+        stats = store.get_stats()
+        assert stats["cycle_id"] == 2
+        assert stats["entries"] == 0
+        assert stats["hits"] == 0
+
+
+class TestStrategiesShareCandles:
+    """Strategies read prefetched candles instead of fetching their own."""
+
+    def teardown_method(self):
+        get_candle_store().end_cycle()
+
+    def test_strategies_use_prefetched_candles(self):
+        engine = CountingDataEngine()
+        strategies = [MomentumStrategy(), BreakoutStrategy(), MeanReversionStrategy()]
+        for strategy in strategies:
+            strategy.data_engine = engine
+
+        store = get_candle_store()
+        store.begin_cycle(1)
+        store.put("BTC/USDT", "1h", 100, _make_ohlcv(100))
+
+        for strategy in strategies:
+            signal = strategy.analyze("BTC/USDT", "1h")
+            assert signal["metadata"].get("error") is not True
+
+        stats = store.get_stats()
+        assert engine.ohlcv_calls == 0
+        assert stats["hits"] == 3
+        assert stats["misses"] == 0
+        assert stats["parses"] == 1
+
+    def test_first_strategy_miss_is_shared_with_the_rest(self):
+        engine = CountingDataEngine()
+        strategies = [MomentumStrategy(), BreakoutStrategy(), MeanReversionStrategy()]
+        for strategy in strategies:
+            strategy.data_engine = engine
+
+        store = get_candle_store()
+        store.begin_cycle(1)
+
+        for strategy in strategies:
+            strategy.analyze("ETH/USDT", "1h")
+
+        assert engine.ohlcv_calls == 1
+        assert store.get_stats()["misses"] == 1
+        assert store.get_stats()["hits"] == 2
@@ -0,0 +1,194 @@
+"""
+Tests for the rolling correlation engine and its use in portfolio optimization.
+"""
+
+import numpy as np
+import pytest
+
+from src.crypto_mvp.risk.correlation import CorrelationEngine, ledoit_wolf_shrinkage
+from src.crypto_mvp.risk.portfolio import AdvancedPortfolioManager
+
+HOUR_MS = 3_600_000
+
+
+def make_frames(num_symbols, num_candles, seed=11, factor_weight=0.7):
+    """Candles driven by one common factor plus idiosyncratic noise."""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0, 0.01, num_candles)
+    frames = {}
+    for s in range(num_symbols):
+        noise = rng.normal(0, 0.01, num_candles)
+        closes = 100 * np.exp(np.cumsum(factor_weight * market + noise))
+        frames[f"A{s:03d}/USDT"] = {
+            "timestamps": np.arange(num_candles, dtype=float) * HOUR_MS,
+            "closes": closes,
+        }
+    return frames
+
+
+def window(frame, end, start=0):
+    return {name: column[start:end] for name, column in frame.items()}
+
+
+def reference_shrinkage(returns):
+    """Ledoit-Wolf intensity as published (normalized by the asset count)."""
+    n_obs, n_assets = returns.shape
+    sample = returns.T @ returns / n_obs
+    mu = np.trace(sample) / n_assets
+    delta = np.sum((sample - mu * np.eye(n_assets)) ** 2) / n_assets
+    beta = sum(
+        np.sum((np.outer(row, row) - sample) ** 2) for row in returns
+    ) / (n_obs**2 * n_assets)
+    return min(beta, delta) / delta
+
+
+def legacy_correlation_matrix(signals, default_correlation):
+    """Nested-loop signal correlation matrix as computed before vectorizing."""
+    names = list(signals)
+    correlations = {}
+    for asset, signal_data in signals.items():
+        data = signal_data.get("correlation", {})
+        correlations[asset] = data if isinstance(data, dict) else {o: data for o in names if o != asset}
+    matrix = np.eye(len(names))
+    for i, a1 in enumerate(names):
+        for j, a2 in enumerate(names):
+            if i != j:
+                value = None
+                if a1 in correlations and a2 in correlations[a1]:
+                    value = correlations[a1][a2]
+                elif a2 in correlations and a1 in correlations[a2]:
+                    value = correlations[a2][a1]
+                matrix[i, j] = default_correlation if value is None else max(-1.0, min(1.0, value))
+    matrix = (matrix + matrix.T) / 2
+    np.fill_diagonal(matrix, 1.0)
+    return matrix
+
+
+class TestCorrelationEngine:
+    """Test the rolling returns matrix and shrunk estimates."""
+
+    def test_shrinkage_matches_reference(self):
+        rng = np.random.default_rng(3)
+        returns = rng.normal(0, 1, (40, 12))
+        returns -= returns.mean(axis=0)
+
+        shrunk, intensity = ledoit_wolf_shrinkage(returns)
+        assert intensity == pytest.approx(reference_shrinkage(returns), rel=1e-10)
+
+        sample = returns.T @ returns / len(returns)
+        mu = np.trace(sample) / 12
+        expected = (1 - intensity) * sample + intensity * mu * np.eye(12)
+        assert np.allclose(shrunk, expected)
+
+    def test_more_symbols_than_candles_stays_positive_definite(self):
+        frames = make_frames(120, 61)
+        engine = CorrelationEngine({"include_forming_candle": True})
+        assert engine.update(frames) == 120 * 60
+
+        covered, correlation, volatilities = engine.get_matrices(list(frames))
+        assert covered.all()
+        assert np.allclose(np.diag(correlation), 1.0)
+        assert np.allclose(correlation, correlation.T)
+        # 60 returns cannot support a full-rank 120x120 sample estimate
+        assert np.linalg.eigvalsh(correlation).min() > 0
+        assert 0 < engine.last_shrinkage < 1
+
+        # The common factor shows up as positive correlation
+        off_diagonal = correlation[~np.eye(120, dtype=bool)]
+        assert 0.2 < off_diagonal.mean() < 0.5
+        assert np.all(volatilities > 0)
+
+    def test_incremental_updates_match_one_pass(self):
+        frames = make_frames(8, 200)
+        batch = CorrelationEngine()
+        batch.update(frames)
+
+        incremental = CorrelationEngine()
+        incremental.update({s: window(f, 150) for s, f in list(frames.items())[:4]})
+        incremental.update({s: window(f, 120) for s, f in list(frames.items())[4:]})
+        for end in range(121, 201):
+            incremental.update({s: window(f, end, max(0, end - 100)) for s, f in frames.items()})
+
+        symbols = list(frames)
+        for expected, actual in zip(batch.get_matrices(symbols), incremental.get_matrices(symbols)):
+            assert np.allclose(expected, actual, equal_nan=True)
+
+    def test_window_keeps_the_most_recent_candles(self):
+        frames = make_frames(3, 400)
+        engine = CorrelationEngine({"window": 100, "include_forming_candle": True})
+        engine.update({s: window(f, 250) for s, f in frames.items()})
+        engine.update(frames)
+
+        stats = engine.get_stats()
+        assert stats["rows"] == 100 and stats["covered_symbols"] == 3
+
+        recent = CorrelationEngine({"window": 100, "include_forming_candle": True})
+        recent.update({s: window(f, 400, 299) for s, f in frames.items()})
+        symbols = list(frames)
+        assert np.allclose(engine.get_matrices(symbols)[1], recent.get_matrices(symbols)[1])
+
+    def test_short_histories_are_not_covered(self):
+        frames = make_frames(2, 100)
+        engine = CorrelationEngine({"min_observations": 50})
+        engine.update({"A000/USDT": frames["A000/USDT"], "A001/USDT": window(frames["A001/USDT"], 100, 60)})
+
+        covered, correlation, volatilities = engine.get_matrices(["A000/USDT", "A001/USDT", "NEW/USDT"])
+        assert covered.tolist() == [True, False, False]
+        assert correlation[0, 0] == 1.0 and np.isnan(correlation[0, 1])
+        assert np.isnan(volatilities[1:]).all()
+
+
+class TestPortfolioCorrelations:
+    """Test AdvancedPortfolioManager using return history."""
+
+    def make_signals(self, symbols, seed=4):
+        rng = np.random.default_rng(seed)
+        return {
+            symbol: {
+                "score": float(rng.uniform(-1, 1)),
+                "confidence": float(rng.uniform(0.3, 0.9)),
+                "signal_strength": float(rng.uniform(0, 1)),
+                "volatility": 0.2,
+            }
+            for symbol in symbols
+        }
+
+    def test_signal_correlations_without_history(self):
+        manager = AdvancedPortfolioManager()
+        signals = self.make_signals(["A", "B", "C", "D"])
+        signals["A"]["correlation"] = {"B": 0.9, "C": None, "X": 0.1}
+        signals["B"]["correlation"] = {"A": 0.5}
+        signals["C"]["correlation"] = 1.5
+        signals["D"]["correlation"] = {"B": -0.4}
+
+        expected = legacy_correlation_matrix(signals, manager.default_correlation)
+        assert np.allclose(manager._calculate_correlation_matrix(signals), expected)
+
+    def test_history_replaces_signal_estimates(self):
+        frames = make_frames(3, 120, factor_weight=0.0)
+        manager = AdvancedPortfolioManager()
+        manager.update_returns(frames)
+
+        signals = self.make_signals([*frames, "NEW/USDT"])
+        for symbol in signals:
+            signals[symbol]["correlation"] = 0.95
+
+        correlation = manager._calculate_correlation_matrix(signals)
+        # Independent histories are nearly uncorrelated
+        assert np.abs(correlation[:3, :3][~np.eye(3, dtype=bool)]).max() < 0.3
+        assert np.allclose(correlation[3, :3], 0.95)
+
+        covariance = manager._calculate_covariance_matrix(signals, correlation)
+        assert covariance[3, 3] == pytest.approx(0.2**2)
+        # Realized hourly volatility of 1% annualizes to roughly 94%
+        assert 0.6 < np.sqrt(covariance[0, 0]) < 1.3
+
+    def test_allocates_over_hundreds_of_symbols(self):
+        frames = make_frames(250, 200)
+        manager = AdvancedPortfolioManager({"max_positions": 250, "max_portfolio_risk": 100.0, "max_correlation": 0.99})
+        manager.update_returns(frames)
+
+        result = manager.optimize_portfolio_allocation(10_000.0, self.make_signals(frames))
+        assert sum(result["optimal_weights"].values()) == pytest.approx(1.0)
+        assert result["expected_volatility"] > 0
+        assert manager.get_portfolio_summary()["correlation_engine"]["covered_symbols"] == 250
@@ -0,0 +1,159 @@
+"""
+Tests for cycle phase profiling, timing histograms and the /profile endpoint.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.crypto_mvp.metrics import CycleProfiler, MetricsCollector
+from src.crypto_mvp.serve import MetricsServer
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def _profile_cycle(profiler, cycle_id=1):
+    profiler.begin_cycle(cycle_id)
+    profiler.phase("market_data")
+    time.sleep(0.03)
+    profiler.phase("signals")
+    _busy(0.02)
+    profiler.record(("signals", "momentum"), 0.012, 0.010)
+    profiler.record(("signals", "momentum"), 0.004, 0.003)
+    profiler.phase("execution")
+    with profiler.span("orders"):
+        _busy(0.005)
+    return profiler.end_cycle()
+
+
+class TestCycleProfiler:
+    """Test phase spans and folded stack export."""
+
+    def test_phases_capture_wall_and_cpu_time(self):
+        profile = _profile_cycle(CycleProfiler())
+        phases = profile.phases()
+
+        assert set(phases) == {
+            "market_data", "signals", "signals.momentum", "execution", "execution.orders",
+        }
+        # Sleeping costs wall time but almost no CPU
+        assert phases["market_data"]["wall_ms"] >= 25
+        assert phases["market_data"]["cpu_ms"] < phases["market_data"]["wall_ms"] / 2
+        assert phases["signals"]["cpu_ms"] >= 10
+        # Externally recorded spans accumulate
+        assert phases["signals.momentum"]["wall_ms"] == pytest.approx(16.0)
+        assert profile.slowest_phases(1)[0][0] == "market_data"
+        assert profile.wall_s >= sum(
+            timing["wall_ms"] for name, timing in phases.items() if "." not in name
+        ) / 1000
+
+    def test_folded_stacks_use_self_time(self, tmp_path):
+        profiler = CycleProfiler(history=5)
+        for cycle_id in range(1, 4):
+            _profile_cycle(profiler, cycle_id)
+
+        folded = profiler.folded_stacks()
+        stacks = dict(line.rsplit(" ", 1) for line in folded.strip().splitlines())
+
+        assert {"cycle;market_data", "cycle;signals", "cycle;signals;momentum", "cycle;execution;orders"} <= set(stacks)
+        assert int(stacks["cycle;signals;momentum"]) == 3 * 16000
+        profile = profiler.last_profile
+        signals_self = profile.spans[("signals",)][0] - profile.spans[("signals", "momentum")][0]
+        assert signals_self > 0
+
+        path = profiler.dump_flamegraph(str(tmp_path / "out" / "cycle.folded"), metric="cpu", cycles=1)
+        assert open(path).read() == profiler.folded_stacks("cpu", 1)
+
+        with pytest.raises(ValueError):
+            profiler.folded_stacks("io")
+
+    def test_spans_outside_a_cycle_are_ignored(self):
+        profiler = CycleProfiler()
+        profiler.phase("signals")
+        with profiler.span("orders"):
+            pass
+        assert profiler.end_cycle() is None
+        assert profiler.folded_stacks() == ""
+
+
+class TestPhaseHistograms:
+    """Test histogram export through the metrics collector and server."""
+
+    def test_cycle_profile_histograms_in_prometheus_output(self):
+        collector = MetricsCollector()
+        profile = _profile_cycle(CycleProfiler())
+        collector.record_cycle_profile(profile)
+        collector.record_cycle_profile(profile)
+
+        snapshot = collector.get_histogram(
+            "crypto_mvp_cycle_phase_wall_seconds", {"phase": "market_data"}
+        )
+        assert snapshot["count"] == 2
+        assert snapshot["buckets"][-1] == (float("inf"), 2)
+        # 30ms of sleep lands in the 50ms bucket but not the 25ms one
+        buckets = dict(snapshot["buckets"])
+        assert buckets[0.025] == 0 and buckets[0.05] == 2
+
+        text = collector.get_prometheus_metrics()
+        assert "# TYPE crypto_mvp_cycle_phase_wall_seconds histogram" in text
+        assert 'crypto_mvp_cycle_phase_cpu_seconds_bucket{phase="signals.momentum",le="+Inf"} 2' in text
+        assert "crypto_mvp_cycle_wall_seconds_count 2" in text
+
+    def test_profile_endpoint_serves_folded_stacks(self):
+        profiler = CycleProfiler()
+        _profile_cycle(profiler)
+        server = MetricsServer()
+        server.set_cycle_profiler(profiler)
+        app = server.create_app()
+
+        endpoint = next(route.endpoint for route in app.routes if getattr(route, "path", "") == "/profile")
+        body = asyncio.run(endpoint(metric="wall", cycles=None))
+        assert body == profiler.folded_stacks()
+        assert "cycle;signals;momentum 16000" in body
+
+
+class TestMetricsServerWiring:
+    """Test that the trading system's collector backs the metrics server."""
+
+    def test_metrics_endpoint_exposes_histograms_after_a_cycle(self, monkeypatch):
+        from fastapi.testclient import TestClient
+
+        from src.crypto_mvp import serve
+        from src.crypto_mvp.trading_system import ProfitMaximizingTradingSystem
+
+        monkeypatch.setattr(serve, "_metrics_server", None)
+        monkeypatch.setattr(serve.MetricsServer, "start_server_background", lambda self: None)
+
+        system = ProfitMaximizingTradingSystem()
+        system.config = {"monitoring": {"metrics_server": {"enabled": True}}}
+        system._start_metrics_server()
+        assert serve.get_metrics_server() is system.metrics_server
+
+        system.cycle_profiler.begin_cycle(1)
+        system.cycle_profiler.phase("market_data")
+        time.sleep(0.01)
+        system.cycle_profiler.phase("signals")
+        results = {}
+        system._finish_cycle_profile(results)
+        assert "market_data" in results["phase_timings"]
+
+        client = TestClient(system.metrics_server.create_app())
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert "# TYPE crypto_mvp_cycle_phase_wall_seconds histogram" in response.text
+        assert 'crypto_mvp_cycle_phase_wall_seconds_count{phase="market_data"} 1' in response.text
+        assert "crypto_mvp_cycle_wall_seconds_count 1" in response.text
+        assert "cycle;market_data" in client.get("/profile").text
+
+    def test_metrics_server_disabled_by_config(self):
+        from src.crypto_mvp.trading_system import ProfitMaximizingTradingSystem
+
+        system = ProfitMaximizingTradingSystem()
+        system.config = {"monitoring": {"metrics_server": {"enabled": False}}}
+        system._start_metrics_server()
+        assert system.metrics_server is None
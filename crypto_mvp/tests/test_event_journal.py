@@ -0,0 +1,156 @@
+"""
+Tests for the binary event journal, its reader and command line.
+"""
+
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.crypto_mvp.analytics.event_journal import (
+    EventJournal,
+    EventJournalReader,
+    EventType,
+    main,
+)
+
+START = datetime(2026, 1, 5, 12, 0, 0)
+SYMBOLS = ["BTC/USDT", "ETH/USDT", "SOL/USDT", "XRP/USDT"]
+
+
+def write_session(journal, cycles=20):
+    """Cycle start/end around one signal and one fill per symbol, a minute apart."""
+    for cycle in range(1, cycles + 1):
+        at = START + timedelta(minutes=cycle)
+        journal.record(EventType.CYCLE_START, cycle_id=cycle, timestamp=at)
+        for i, symbol in enumerate(SYMBOLS):
+            journal.record(EventType.SIGNAL, symbol, {"composite_score": 0.1 * i}, cycle, at)
+            journal.record("fill", symbol, {"quantity": cycle, "executed_at": at}, cycle, at)
+        journal.record(EventType.CYCLE_END, data={"duration": 1.5}, cycle_id=cycle, timestamp=at)
+
+
+@pytest.fixture
+def journal_dir(tmp_path):
+    return str(tmp_path / "journal")
+
+
+class TestEventJournal:
+    """Test writing, filtered reads and recovery."""
+
+    def test_round_trip_with_filters(self, journal_dir):
+        journal = EventJournal(journal_dir, {"block_records": 10})
+        write_session(journal)
+        journal.close()
+        assert journal.get_stats()["records"] == 20 * 10
+
+        reader = EventJournalReader(journal_dir)
+        events = list(reader.read())
+        assert len(events) == 200
+        assert events[0].event_type == EventType.CYCLE_START and events[0].cycle_id == 1
+        assert events[-1].data == {"duration": 1.5}
+
+        fills = list(reader.read(symbols=["ETH/USDT"], event_types=["fill"]))
+        assert [event.data["quantity"] for event in fills] == list(range(1, 21))
+        assert fills[0].data["executed_at"] == str(START + timedelta(minutes=1))
+
+        window = list(reader.read(
+            start=START + timedelta(minutes=5), end=START + timedelta(minutes=6),
+            event_types=[EventType.CYCLE_END],
+        ))
+        assert [event.cycle_id for event in window] == [5, 6]
+        assert window[0].timestamp == START + timedelta(minutes=5)
+
+    def test_index_skips_blocks_outside_the_time_range(self, journal_dir):
+        journal = EventJournal(journal_dir, {"block_records": 10, "flush_interval_s": 60})
+        write_session(journal, cycles=50)
+        journal.close()
+
+        reader = EventJournalReader(journal_dir)
+        events = list(reader.read(start=START + timedelta(minutes=50)))
+        assert len(events) == 10
+        assert reader.stats["blocks_read"] <= 2
+        assert reader.stats["blocks_skipped"] >= 48
+
+        assert len(list(reader.read(limit=7))) == 7
+        summary = reader.summary()
+        assert summary["records"] == 500 and summary["blocks"] == 50
+
+    def test_segments_roll_over_and_reopen_appends(self, journal_dir):
+        journal = EventJournal(journal_dir, {"block_records": 10, "segment_max_bytes": 2000})
+        write_session(journal, cycles=10)
+        journal.close()
+
+        journal = EventJournal(journal_dir, {"block_records": 10, "segment_max_bytes": 2000})
+        journal.record(EventType.EXIT, "BTC/USDT", {"reason": "stop_loss"}, 11, START + timedelta(minutes=11))
+        journal.close()
+
+        reader = EventJournalReader(journal_dir)
+        assert len(reader.segments()) > 1
+        events = list(reader.read())
+        assert len(events) == 101
+        assert events[-1].event_type == EventType.EXIT and events[-1].data == {"reason": "stop_loss"}
+
+    def test_torn_tail_is_truncated_on_open(self, journal_dir):
+        journal = EventJournal(journal_dir, {"block_records": 10})
+        write_session(journal, cycles=3)
+        journal.close()
+
+        data_path = os.path.join(journal_dir, "journal-000001.bin")
+        size = os.path.getsize(data_path)
+        with open(data_path, "ab") as f:
+            f.write(b"\x00partial block")
+        with open(os.path.join(journal_dir, "journal-000001.idx"), "ab") as f:
+            f.write(b"\x01\x02")
+
+        assert len(list(EventJournalReader(journal_dir).read())) == 30
+        EventJournal(journal_dir).close()
+        assert os.path.getsize(data_path) == size
+
+    def test_corrupt_block_is_skipped(self, journal_dir):
+        journal = EventJournal(journal_dir, {"block_records": 10, "flush_interval_s": 60})
+        write_session(journal, cycles=3)
+        journal.close()
+
+        reader = EventJournalReader(journal_dir)
+        entry = reader.read_index(1)[1]
+        with open(os.path.join(journal_dir, "journal-000001.bin"), "r+b") as f:
+            f.seek(entry.offset + 5)
+            f.write(b"\xff\xff")
+
+        assert len(list(reader.read())) == 20
+        assert reader.stats["corrupt_blocks"] == 1
+
+    def test_background_flusher_writes_pending_records(self, journal_dir):
+        journal = EventJournal(journal_dir, {"block_records": 1000, "flush_interval_s": 0.05})
+        journal.record(EventType.CYCLE_START, cycle_id=1)
+        deadline = time.monotonic() + 5.0
+        while journal.get_stats()["records"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert journal.get_stats()["records"] == 1
+        journal.close()
+        assert not journal.record(EventType.CYCLE_END, cycle_id=1)
+
+    def test_full_queue_drops(self, journal_dir):
+        journal = EventJournal(journal_dir, {"max_pending": 5, "flush_interval_s": 60})
+        results = [journal.record(EventType.SIGNAL, "BTC/USDT", {"i": i}) for i in range(8)]
+        assert results.count(False) == 3 and journal.get_stats()["dropped"] == 3
+        journal.close()
+
+
+class TestEventJournalCLI:
+    """Test the command line reader."""
+
+    def test_cli_filters_and_prints_json_lines(self, journal_dir, capsys):
+        journal = EventJournal(journal_dir)
+        write_session(journal, cycles=5)
+        journal.close()
+
+        main([journal_dir, "--symbol", "SOL/USDT", "--type", "signal", "--start", (START + timedelta(minutes=4)).isoformat()])
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [line["cycle_id"] for line in lines] == [4, 5]
+        assert lines[0]["event_type"] == "signal" and lines[0]["symbol"] == "SOL/USDT"
+
+        main([journal_dir, "--summary"])
+        assert json.loads(capsys.readouterr().out)["records"] == 50
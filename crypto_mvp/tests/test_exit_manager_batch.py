@@ -0,0 +1,148 @@
+"""
+Tests for the batched ExitManager.check_exits pass.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# The execution package imports crypto_mvp absolutely
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from crypto_mvp.execution.exit_manager import ExitManager
+
+
+class FakeStateStore:
+    """State store returning fixed position rows and counting reads."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def get_positions(self, session_id):
+        self.calls += 1
+        return self.rows
+
+
+def reference_exits(manager, positions, current_prices, state_store, session_id):
+    """Per-position exit checks as check_exits did them before batching."""
+    exits = []
+    for symbol, position in positions.items():
+        quantity = float(position.get("quantity", 0))
+        entry_price = float(position.get("entry_price", 0))
+        current_price = current_prices.get(symbol)
+        if quantity == 0 or entry_price == 0 or current_price is None:
+            continue
+
+        metadata = {}
+        for pos in state_store.get_positions(session_id):
+            if pos["symbol"] == symbol:
+                metadata = pos.get("metadata", {})
+                break
+        entry_time_str = metadata.get("entry_time") or metadata.get("timestamp")
+        entry_time = datetime.fromisoformat(entry_time_str) if entry_time_str else None
+        stop_loss = metadata.get("stop_loss") or (entry_price * 0.98 if quantity > 0 else entry_price * 1.02)
+        take_profit = metadata.get("take_profit") or (entry_price * 1.04 if quantity > 0 else entry_price * 0.96)
+
+        args = (symbol, quantity, entry_price, current_price)
+        for check in (
+            lambda args=args, stop_loss=stop_loss: manager._check_stop_loss(*args, stop_loss),
+            lambda args=args, take_profit=take_profit: manager._check_take_profit(*args, take_profit),
+            lambda symbol=symbol, quantity=quantity, current_price=current_price, entry_time=entry_time: (
+                manager._check_time_exit(symbol, quantity, current_price, entry_time) if entry_time else None
+            ),
+            lambda args=args: manager._check_profit_ladder(*args),
+        ):
+            exit_check = check()
+            if exit_check is not None and exit_check.should_exit:
+                exits.append(exit_check)
+                break
+    return exits
+
+
+def make_book(count, seed=3):
+    rng = np.random.default_rng(seed)
+    positions, prices, rows = {}, {}, []
+    for i in range(count):
+        symbol = f"C{i:04d}/USDT"
+        quantity = float(rng.uniform(0.1, 2.0)) * (1 if i % 3 else -1)
+        entry_price = float(rng.uniform(10.0, 500.0))
+        move = float(rng.uniform(-0.03, 0.05)) * (1 if quantity > 0 else -1)
+        positions[symbol] = {"quantity": quantity, "entry_price": entry_price}
+        prices[symbol] = entry_price * (1 + move)
+
+        metadata = {}
+        if i % 5 == 0:
+            metadata["stop_loss"] = entry_price * (0.995 if quantity > 0 else 1.005)
+        if i % 7 == 0:
+            metadata["take_profit"] = entry_price * (1.01 if quantity > 0 else 0.99)
+        if i % 4 == 0:
+            metadata["entry_time"] = (datetime.now() - timedelta(hours=float(i % 48))).isoformat()
+        rows.append({"symbol": symbol, "metadata": metadata})
+
+    # Unpriced and empty positions are skipped
+    positions["NOPRICE/USDT"] = {"quantity": 1.0, "entry_price": 10.0}
+    positions["FLAT/USDT"] = {"quantity": 0.0, "entry_price": 10.0}
+    prices["FLAT/USDT"] = 10.0
+    return positions, prices, rows
+
+
+def as_tuples(exits):
+    return [
+        (e.symbol, e.should_exit, e.reason, e.exit_price, e.quantity, e.exit_percentage)
+        for e in exits
+    ]
+
+
+class TestBatchedExitChecks:
+    """Test that the batched pass matches per-position checks."""
+
+    def test_matches_per_position_checks(self):
+        positions, prices, rows = make_book(300)
+        batched, reference = ExitManager({}), ExitManager({})
+        store = FakeStateStore(rows)
+
+        # Repeated passes also exercise the ladder levels already taken
+        reasons = set()
+        for _ in range(3):
+            expected = reference_exits(reference, positions, prices, store, "s1")
+            store.calls = 0
+            exits = batched.check_exits(positions, prices, store, "s1")
+
+            assert store.calls == 1
+            assert as_tuples(exits) == as_tuples(expected)
+            assert batched.ladder_exits_taken == reference.ladder_exits_taken
+            reasons.update(e.reason.split("_")[0] for e in exits)
+
+        assert reasons == {"stop", "take", "time", "profit"}
+
+    def test_without_state_store_uses_defaults(self):
+        manager = ExitManager({"exits": {"tp_ladders": []}})
+        positions = {
+            "A/USDT": {"quantity": 1.0, "entry_price": 100.0},
+            "B/USDT": {"quantity": -1.0, "entry_price": 100.0},
+            "C/USDT": {"quantity": 1.0, "entry_price": 100.0},
+        }
+        prices = {"A/USDT": 97.0, "B/USDT": 95.0, "C/USDT": 101.0}
+
+        exits = manager.check_exits(positions, prices)
+
+        assert [(e.symbol, e.reason) for e in exits] == [
+            ("A/USDT", "stop_loss_hit"),
+            ("B/USDT", "take_profit_hit"),
+        ]
+        assert manager.check_exits({}, {}) == []
+
+    def test_unreadable_store_falls_back_to_defaults(self):
+        class BrokenStore:
+            def get_positions(self, session_id):
+                raise RuntimeError("database is locked")
+
+        manager = ExitManager({})
+        exits = manager.check_exits(
+            {"A/USDT": {"quantity": 1.0, "entry_price": 100.0}}, {"A/USDT": 105.0}, BrokenStore(), "s1"
+        )
+        assert [e.reason for e in exits] == ["take_profit_hit"]
+
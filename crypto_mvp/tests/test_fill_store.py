@@ -0,0 +1,152 @@
+"""
+Tests for the indexed fill store and bounded order history of OrderManager.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from crypto_mvp.analytics.trade_ledger import TradeLedger
+from crypto_mvp.execution.fill_store import FillStore
+from crypto_mvp.execution.order_manager import (
+    Fill,
+    Order,
+    OrderManager,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+)
+
+START = datetime(2026, 1, 5, 12, 0, 0)
+
+
+def make_fill(i, order_id=None, side=OrderSide.BUY):
+    return Fill(
+        order_id=order_id or f"order_{i}",
+        symbol="BTC/USDT",
+        side=side,
+        quantity=0.1,
+        price=50_000.0 + i,
+        fees=1.0,
+        timestamp=START + timedelta(seconds=i),
+        strategy="momentum",
+        metadata={"i": i},
+        mark_price=50_000.0,
+        slippage_bps=2.5,
+        slippage_cost=1.25,
+        fee_bps=20.0,
+        is_maker=i % 2 == 0,
+    )
+
+
+def make_order(i, status):
+    return Order(
+        id=f"order_{i}",
+        symbol="BTC/USDT",
+        side=OrderSide.BUY,
+        order_type=OrderType.MARKET,
+        quantity=0.1,
+        status=status,
+    )
+
+
+class TestFillStore:
+    """Test the order index, running totals and eviction."""
+
+    def test_index_and_running_totals_survive_eviction(self):
+        spilled = []
+        store = FillStore({"max_fills": 100, "spill_batch": 10}, spill=spilled.extend)
+        for i in range(250):
+            side = OrderSide.BUY if i % 2 == 0 else OrderSide.SELL
+            store.add(make_fill(i, order_id=f"order_{i // 5}", side=side))
+
+        assert 90 <= len(store) <= 100
+        assert len(spilled) + len(store) == 250
+        # Oldest fills go first, in order
+        assert [fill.price for fill in spilled] == [50_000.0 + i for i in range(len(spilled))]
+
+        stats = store.get_stats()
+        assert stats["total_fills"] == 250 and stats["evicted_fills"] == len(spilled)
+        assert stats["total_fees"] == pytest.approx(250.0)
+        assert stats["by_side"]["buy"]["count"] == 125 and stats["by_side"]["sell"]["count"] == 125
+
+        assert [fill.price for fill in store.get("order_49")] == [50_000.0 + i for i in range(245, 250)]
+        assert not store.has_order("order_0") and store.get("order_0") == []
+        assert stats["retained_orders"] == len({fill.order_id for fill in store})
+
+    def test_unbounded_store_keeps_everything(self):
+        store = FillStore({"max_fills": 0})
+        for i in range(500):
+            store.add(make_fill(i))
+        assert len(store) == 500 and store.get_stats()["evicted_fills"] == 0
+
+    def test_spill_failure_does_not_lose_totals(self):
+        def failing(fills):
+            raise OSError("disk full")
+
+        store = FillStore({"max_fills": 10, "spill_batch": 5}, spill=failing)
+        for i in range(20):
+            store.add(make_fill(i))
+        stats = store.get_stats()
+        assert stats["spill_failures"] > 0 and stats["total_fills"] == 20
+
+
+class TestOrderManagerHistory:
+    """Test OrderManager's bounded history and ledger archive."""
+
+    def test_evicted_fills_are_read_back_from_the_ledger(self, tmp_path):
+        manager = OrderManager({"order_history": {"max_fills": 20, "spill_batch": 5}}, "session_1")
+        manager.set_trade_ledger(TradeLedger(str(tmp_path / "ledger.db")))
+        for i in range(60):
+            manager.fill_store.add(make_fill(i, order_id=f"order_{i // 3}"))
+
+        assert len(manager.fills) <= 20
+        archived = manager.get_fills("order_0")
+        assert len(archived) == 3
+        first = archived[0]
+        assert first.side == OrderSide.BUY and first.timestamp == START
+        assert first.price == 50_000.0 and first.is_maker and first.metadata == {"i": 0}
+        assert first.slippage_bps == 2.5 and first.strategy == "momentum"
+
+        # Fills still in memory come from the index
+        assert [fill.price for fill in manager.get_fills("order_19")] == [50_057.0, 50_058.0, 50_059.0]
+        assert manager.get_fills("unknown") == []
+
+        summary = manager.get_order_summary()
+        assert summary["total_fills"] == 60 and summary["total_fees"] == pytest.approx(60.0)
+        assert summary["retained_fills"] == len(manager.fills)
+
+    def test_partially_evicted_order_merges_archive_and_memory(self, tmp_path):
+        manager = OrderManager({"order_history": {"max_fills": 10, "spill_batch": 4}}, "session_1")
+        manager.set_trade_ledger(TradeLedger(str(tmp_path / "ledger.db")))
+        # One order with 6 fills, the first ones pushed out by the batch eviction
+        for i in range(6):
+            manager.fill_store.add(make_fill(i, order_id="order_big"))
+        for i in range(6, 11):
+            manager.fill_store.add(make_fill(i))
+
+        assert manager.fill_store.has_evicted_fills("order_big")
+        assert 0 < len(manager.fill_store.get("order_big")) < 6
+        fills = manager.get_fills("order_big")
+        assert [fill.price for fill in fills] == [50_000.0 + i for i in range(6)]
+
+    def test_finished_orders_are_evicted_open_ones_kept(self):
+        manager = OrderManager({"order_history": {"max_orders": 100}})
+        for i in range(150):
+            status = OrderStatus.PENDING if i % 10 == 0 else OrderStatus.FILLED
+            manager.orders[f"order_{i}"] = make_order(i, status)
+            manager._evict_orders()
+
+        assert len(manager.orders) <= 100
+        pending = [order for order in manager.orders.values() if order.status == OrderStatus.PENDING]
+        assert len(pending) == 15
+
+        summary = manager.get_order_summary()
+        assert summary["total_orders"] == 150
+        assert summary["filled_orders"] == 135
+        assert summary["orders_by_status"] == {"filled": 135, "pending": 15}
+        assert summary["retained_orders"] == len(manager.orders)
@@ -0,0 +1,147 @@
+"""
+Tests for the point-in-time historical data engine and its backtest wiring.
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+# The backtest package pulls in execution, which imports crypto_mvp absolutely
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from crypto_mvp.backtest.engine import BacktestEngine
+from crypto_mvp.backtest.historical import HistoricalDataEngine, load_candle_store
+from crypto_mvp.backtest.replay import ReplayFixture, replay_symbols
+from crypto_mvp.strategies.momentum import MomentumStrategy
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "..", "config", "profit_optimized.yaml")
+HOUR_MS = 3_600_000
+
+
+@pytest.fixture
+def fixture():
+    return ReplayFixture.generate(replay_symbols(3), num_candles=200, seed=11)
+
+
+def bar_time(fixture, index):
+    return datetime.fromtimestamp(int(fixture.timestamps[index]) / 1000)
+
+
+class TestHistoricalDataEngine:
+    """Test point-in-time windows over preloaded candles."""
+
+    def test_windows_end_at_the_current_bar(self, fixture):
+        engine = HistoricalDataEngine(fixture, start=50)
+
+        rows = engine.get_ohlcv("BTC/USDT", "1h", limit=30)
+        assert len(rows) == 30
+        assert rows[-1][0] == fixture.timestamps[50]
+        assert np.allclose(np.array(rows)[:, 1:], fixture.candles[0, 21:51])
+        assert engine.get_ticker("BTC/USDT")["price"] == pytest.approx(fixture.candles[0, 50, 3])
+
+        assert len(engine.get_ohlcv("BTC/USDT", "1h", limit=500)) == 51
+        assert engine.get_ohlcv("MISSING/USDT") == []
+
+        engine.advance()
+        assert engine.get_ohlcv("BTC/USDT", "1h", limit=1)[0][0] == fixture.timestamps[51]
+        assert engine.close_prices()["ETH/USDT"] == pytest.approx(fixture.candles[1, 51, 3])
+
+    def test_column_windows_are_read_only_views(self, fixture):
+        engine = HistoricalDataEngine(fixture, start=120)
+        candles = engine.get_candle_columns("ETH/USDT", "1h", limit=100)
+
+        assert len(candles["closes"]) == 100
+        assert np.array_equal(candles["closes"], fixture.candles[1, 21:121, 3])
+        assert candles["closes"].base is not None
+        with pytest.raises(ValueError):
+            candles["closes"][0] = 0.0
+
+    def test_coarser_timeframe_only_shows_complete_candles(self, fixture):
+        engine = HistoricalDataEngine(fixture)
+        per_bucket = 4
+        # Fixture candles start on a 4h boundary
+        assert fixture.timestamps[0] % (per_bucket * HOUR_MS) == 0
+
+        engine.cursor = 2
+        assert engine.get_ohlcv("BTC/USDT", "4h") == []
+        engine.cursor = 3
+        assert len(engine.get_ohlcv("BTC/USDT", "4h")) == 1
+        engine.cursor = 10
+        rows = np.array(engine.get_ohlcv("BTC/USDT", "4h", limit=100))
+        assert len(rows) == 2
+
+        base = fixture.candles[0, :8].reshape(2, per_bucket, 5)
+        assert np.allclose(rows[:, 1], base[:, 0, 0])
+        assert np.allclose(rows[:, 2], base[:, :, 1].max(axis=1))
+        assert np.allclose(rows[:, 3], base[:, :, 2].min(axis=1))
+        assert np.allclose(rows[:, 4], base[:, -1, 3])
+        assert np.allclose(rows[:, 5], base[:, :, 4].sum(axis=1))
+        assert list(rows[:, 0]) == [fixture.timestamps[0], fixture.timestamps[4]]
+
+    def test_from_store_cuts_period_and_warmup(self, fixture, tmp_path):
+        store = fixture.save_arrays(str(tmp_path / "store"))
+
+        engine = HistoricalDataEngine.from_store(
+            store, ["ETH/USDT", "MISSING/USDT"], bar_time(fixture, 100), bar_time(fixture, 149), warmup=30
+        )
+        assert engine.fixture.symbols == ["ETH/USDT"]
+        assert engine.fixture.num_candles == 80
+        assert engine.cursor == engine.start == 30
+        assert engine.current_time == bar_time(fixture, 100)
+        assert len(engine.get_ohlcv("ETH/USDT", "1h", limit=100)) == 31
+
+        # Warmup is cut at the start of the store
+        _, first = load_candle_store(store, start=bar_time(fixture, 10), warmup=50)
+        assert first == 10
+
+        with pytest.raises(ValueError):
+            load_candle_store(store, start=datetime(2030, 1, 1))
+
+    def test_seek_moves_to_the_last_bar_at_or_before(self, fixture):
+        engine = HistoricalDataEngine(fixture)
+
+        assert engine.seek(datetime.fromtimestamp((int(fixture.timestamps[40]) + HOUR_MS // 2) / 1000))
+        assert engine.cursor == 40
+        assert not engine.seek(datetime(2000, 1, 1))
+        assert engine.cursor == 40
+
+    def test_strategies_read_point_in_time_columns(self, fixture):
+        engine = HistoricalDataEngine(fixture, start=150)
+        strategy = MomentumStrategy({})
+        strategy.data_engine = engine
+
+        candles = strategy.get_candles("BTC/USDT", "1h", limit=100)
+        assert candles["timestamps"][-1] == fixture.timestamps[150]
+        signal = strategy.analyze("BTC/USDT", "1h")
+        assert signal["entry_price"] == pytest.approx(fixture.candles[0, 150, 3])
+        assert signal["metadata"]["data_points"] == 100
+
+
+class TestBacktestEngineHistorical:
+    """Test the event-driven backtest running over a candle store."""
+
+    def test_run_backtest_replays_the_store(self, tmp_path):
+        # 2024-01-01 onwards: 2024-01-05 00:00 is bar 96, 2024-01-06 00:00 bar 120
+        fixture = ReplayFixture.generate(["BTC/USDT", "ETH/USDT"], num_candles=150, seed=5)
+        store = fixture.save_arrays(str(tmp_path / "store"))
+        day_five = bar_time(fixture, 96)
+
+        engine = BacktestEngine(CONFIG_PATH)
+        engine.initialize()
+        results = asyncio.run(engine.run_backtest(
+            ["BTC/USDT", "ETH/USDT", "MISSING/USDT"], "1h",
+            day_five.strftime("%Y-%m-%d"), bar_time(fixture, 120).strftime("%Y-%m-%d"),
+            store_dir=store,
+        ))
+
+        data_engine = engine.data_engine
+        assert engine.signal_engine.strategies["momentum"].data_engine is data_engine
+        assert data_engine.start == 96 and data_engine.fixture.num_candles == 121
+        assert data_engine.cursor == 120
+        assert results["backtest_config"]["symbols"] == ["BTC/USDT", "ETH/USDT"]
+        assert len(results["equity_curve"]) == 25
+        assert results["portfolio_snapshots"][0]["date"] == day_five.date().isoformat()
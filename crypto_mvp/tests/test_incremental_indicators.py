@@ -0,0 +1,250 @@
+"""
+Tests for the batch and incremental indicator engine.
+"""
+
+import numpy as np
+import pytest
+
+from src.crypto_mvp.core.candle_store import get_candle_store
+from src.crypto_mvp.indicators.incremental import (
+    IncrementalIndicatorEngine,
+    batch_atr,
+    batch_ema,
+    batch_macd,
+    batch_rsi,
+    batch_williams_r,
+    get_indicator_engine,
+)
+from src.crypto_mvp.indicators.technical_calculator import TechnicalCalculator
+from src.crypto_mvp.strategies.momentum import MomentumStrategy
+
+
+def _legacy_ema(values, period):
+    """Scalar SMA-seeded EMA as TechnicalCalculator computed it before vectorization."""
+    if len(values) < period:
+        return None
+    multiplier = 2 / (period + 1)
+    ema = np.mean(values[:period])
+    for value in values[period:]:
+        ema = (value - ema) * multiplier + ema
+    return float(ema)
+
+
+def _legacy_macd(closes, fast=12, slow=26, signal=9):
+    if len(closes) < slow + signal:
+        return None
+    macd_line = _legacy_ema(closes, fast) - _legacy_ema(closes, slow)
+    macd_values = [
+        _legacy_ema(closes[: slow + i], fast) - _legacy_ema(closes[: slow + i], slow)
+        for i in range(len(closes) - slow + 1)
+    ]
+    signal_line = _legacy_ema(np.array(macd_values), signal)
+    return {"macd": macd_line, "signal": signal_line, "histogram": macd_line - signal_line}
+
+
+def _legacy_atr(highs, lows, closes, period=14):
+    if len(closes) < period + 1:
+        return None
+    tr = [
+        max(highs[i] - lows[i], abs(highs[i] - closes[i - 1]), abs(lows[i] - closes[i - 1]))
+        for i in range(1, len(closes))
+    ]
+    return float(np.mean(tr[-period:]))
+
+
+def _candles(n, seed=7):
+    rng = np.random.default_rng(seed)
+    closes = 100 + np.cumsum(rng.normal(0, 1, n))
+    highs = closes + np.abs(rng.normal(0, 0.5, n))
+    lows = closes - np.abs(rng.normal(0, 0.5, n))
+    timestamps = np.arange(n, dtype=float) * 3_600_000
+    return {"timestamps": timestamps, "highs": highs, "lows": lows, "closes": closes}
+
+
+def _window(frame, start, stop):
+    return {name: column[start:stop] for name, column in frame.items()}
+
+
+class TestBatchIndicators:
+    """Batch results must equal the TechnicalCalculator per-symbol results."""
+
+    def setup_method(self):
+        self.calc = TechnicalCalculator()
+        self.frames = [_candles(100, seed) for seed in range(5)]
+        self.closes = np.vstack([f["closes"] for f in self.frames])
+        self.highs = np.vstack([f["highs"] for f in self.frames])
+        self.lows = np.vstack([f["lows"] for f in self.frames])
+
+    def test_batch_matches_calculator_per_symbol(self):
+        rsi = batch_rsi(self.closes, 14)
+        ema = batch_ema(self.closes, 20)
+        macd = batch_macd(self.closes)
+        atr = batch_atr(self.highs, self.lows, self.closes, 14)
+        williams = batch_williams_r(self.highs, self.lows, self.closes, 14)
+
+        for row, f in enumerate(self.frames):
+            assert rsi[row] == pytest.approx(self.calc.calculate_rsi(f["closes"], 14), rel=1e-12)
+            assert ema[row] == pytest.approx(self.calc.calculate_ema(f["closes"], 20), rel=1e-12)
+            assert atr[row] == pytest.approx(
+                self.calc.calculate_atr(f["highs"], f["lows"], f["closes"], 14), rel=1e-12
+            )
+            assert williams[row] == pytest.approx(
+                self.calc.calculate_williams_r(f["highs"], f["lows"], f["closes"], 14), rel=1e-12
+            )
+            expected = self.calc.calculate_macd(f["closes"])
+            for key in ("macd", "signal", "histogram"):
+                assert macd[key][row] == pytest.approx(expected[key], rel=1e-9, abs=1e-12)
+
+    def test_insufficient_data_is_nan(self):
+        short = self.closes[:, :10]
+        assert np.isnan(batch_rsi(short, 14)).all()
+        assert np.isnan(batch_macd(short)["signal"]).all()
+        assert batch_rsi(short, 14).shape == (5,)
+
+    def test_flat_series_edge_cases(self):
+        flat = np.full((2, 30), 50.0)
+        assert (batch_rsi(flat, 14) == 100.0).all()
+        assert (batch_williams_r(flat, flat, flat, 14) == -50.0).all()
+        assert (batch_atr(flat, flat, flat, 14) == 0.0).all()
+
+    def test_vectorized_calculator_matches_scalar_reference(self):
+        f = self.frames[0]
+        for period in (5, 12, 26, 50):
+            assert self.calc.calculate_ema(f["closes"], period) == pytest.approx(
+                _legacy_ema(f["closes"], period), rel=1e-12
+            )
+        assert self.calc.calculate_atr(f["highs"], f["lows"], f["closes"]) == pytest.approx(
+            _legacy_atr(f["highs"], f["lows"], f["closes"]), rel=1e-12
+        )
+        expected = _legacy_macd(f["closes"])
+        actual = self.calc.calculate_macd(f["closes"])
+        for key in expected:
+            assert actual[key] == pytest.approx(expected[key], rel=1e-9, abs=1e-12)
+
+
+class TestIncrementalIndicatorEngine:
+    """Streaming state must track the calculator as candles arrive."""
+
+    def setup_method(self):
+        self.calc = TechnicalCalculator()
+        self.engine = IncrementalIndicatorEngine()
+        self.history = _candles(300)
+
+    def test_windowed_indicators_match_on_sliding_window(self):
+        # The data engine returns a sliding 100-candle window every cycle
+        for end in range(100, 300, 7):
+            frame = _window(self.history, end - 100, end)
+            high, low, close = frame["highs"], frame["lows"], frame["closes"]
+
+            rsi = self.engine.update("BTC/USDT", "1h", "rsi", frame, 14)
+            atr = self.engine.update("BTC/USDT", "1h", "atr", frame, 14)
+            williams = self.engine.update("BTC/USDT", "1h", "williams_r", frame, 14)
+
+            assert rsi == pytest.approx(self.calc.calculate_rsi(close, 14), rel=1e-9)
+            assert atr == pytest.approx(self.calc.calculate_atr(high, low, close, 14), rel=1e-9)
+            assert williams == pytest.approx(
+                self.calc.calculate_williams_r(high, low, close, 14), rel=1e-12
+            )
+
+        stats = self.engine.get_stats()
+        assert stats["rebuilds"] == 3
+        # Each cycle pushes only the 7 new candles plus the replayed last candle
+        assert stats["candles_pushed"] < 3 * (100 + 8 * 30)
+
+    def test_ema_and_macd_match_full_history_since_seed(self):
+        for end in range(60, 300, 11):
+            frame = _window(self.history, 0, end)
+            closes = frame["closes"]
+            ema = self.engine.update("ETH/USDT", "1h", "ema", frame, 20)
+            macd = self.engine.update("ETH/USDT", "1h", "macd", frame, (12, 26, 9))
+
+            assert ema == pytest.approx(self.calc.calculate_ema(closes, 20), rel=1e-12)
+            expected = self.calc.calculate_macd(closes)
+            for key in ("macd", "signal", "histogram"):
+                assert macd[key] == pytest.approx(expected[key], rel=1e-9, abs=1e-9)
+
+    def test_revised_last_candle_is_replayed(self):
+        frame = _window(self.history, 0, 100)
+        self.engine.update("SOL/USDT", "1h", "rsi", frame, 14)
+
+        revised = {name: column.copy() for name, column in frame.items()}
+        revised["closes"][-1] += 3.0
+        revised["highs"][-1] += 3.0
+        value = self.engine.update("SOL/USDT", "1h", "rsi", revised, 14)
+
+        assert value == pytest.approx(self.calc.calculate_rsi(revised["closes"], 14), rel=1e-9)
+        assert self.engine.get_stats()["rebuilds"] == 1
+
+    def test_gap_in_history_rebuilds_stream(self):
+        self.engine.update("BTC/USDT", "1h", "atr", _window(self.history, 0, 100), 14)
+        frame = _window(self.history, 200, 300)
+        value = self.engine.update("BTC/USDT", "1h", "atr", frame, 14)
+
+        assert value == pytest.approx(
+            self.calc.calculate_atr(frame["highs"], frame["lows"], frame["closes"], 14), rel=1e-9
+        )
+        assert self.engine.get_stats()["rebuilds"] == 2
+
+    def test_unknown_indicator_and_reset(self):
+        with pytest.raises(ValueError):
+            self.engine.update("BTC/USDT", "1h", "vwap", self.history)
+
+        self.engine.update("BTC/USDT", "1h", "rsi", self.history, 14)
+        self.engine.update("ETH/USDT", "1h", "rsi", self.history, 14)
+        self.engine.reset("BTC/USDT")
+        assert self.engine.get("BTC/USDT", "1h", "rsi", 14) is None
+        assert self.engine.get("ETH/USDT", "1h", "rsi", 14) is not None
+
+
+class _WindowDataEngine:
+    """Serves the trailing 100 candles of a history up to a movable cursor."""
+
+    def __init__(self, history, cursor):
+        self.history = history
+        self.cursor = cursor
+
+    def get_ohlcv(self, symbol, timeframe="1h", limit=100):
+        start = max(self.cursor - limit, 0)
+        h = self.history
+        return [
+            [h["timestamps"][i], h["closes"][i], h["highs"][i], h["lows"][i], h["closes"][i], 1000.0]
+            for i in range(start, self.cursor)
+        ]
+
+
+class TestStrategiesReadEngine:
+    """Strategies read windowed indicators from the shared engine."""
+
+    def setup_method(self):
+        # Outside a cycle the candle store serves fresh candles on every call
+        get_candle_store().end_cycle()
+        get_indicator_engine().reset()
+
+    def teardown_method(self):
+        get_indicator_engine().reset()
+
+    def test_momentum_advances_streams_with_new_candles_only(self):
+        calc = TechnicalCalculator()
+        history = _candles(200)
+        strategy = MomentumStrategy()
+        strategy.data_engine = _WindowDataEngine(history, 100)
+        before = get_indicator_engine().get_stats()
+
+        for cursor in range(100, 110):
+            strategy.data_engine.cursor = cursor
+            result = strategy.analyze("BTC/USDT", "1h")
+            frame = _window(history, cursor - 100, cursor)
+            assert result["metadata"]["rsi"] == pytest.approx(calc.calculate_rsi(frame["closes"], 14), rel=1e-9)
+            assert result["metadata"]["williams_r"] == pytest.approx(
+                calc.calculate_williams_r(frame["highs"], frame["lows"], frame["closes"], 14), rel=1e-12
+            )
+            assert result["metadata"]["atr"] == pytest.approx(
+                calc.calculate_atr(frame["highs"], frame["lows"], frame["closes"], 14), rel=1e-9
+            )
+
+        stats = get_indicator_engine().get_stats()
+        assert stats["streams"] == 3
+        assert stats["rebuilds"] - before["rebuilds"] == 3
+        # One full window per stream, then the new candle plus the replayed last one
+        assert stats["candles_pushed"] - before["candles_pushed"] == 3 * (100 + 9 * 2)
+
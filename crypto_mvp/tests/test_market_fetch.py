@@ -0,0 +1,173 @@
+"""
+Tests for the concurrent market data fetch stage.
+"""
+
+import asyncio
+import threading
+import time
+
+from src.crypto_mvp.core.market_fetch import MarketDataFetcher
+
+
+class FakeDataEngine:
+    """Blocking data engine with a fixed per-call delay."""
+
+    def __init__(self, delay=0.05, slow_symbols=None, failing_symbols=None):
+        self.delay = delay
+        self.slow_symbols = slow_symbols or {}
+        self.failing_symbols = set(failing_symbols or [])
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _call(self, symbol):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.slow_symbols.get(symbol, self.delay))
+            if symbol in self.failing_symbols:
+                raise RuntimeError(f"boom {symbol}")
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def get_ticker(self, symbol):
+        self._call(symbol)
+        return {"symbol": symbol, "price": 100.0}
+
+    def get_ohlcv(self, symbol, timeframe, limit):
+        self._call(symbol)
+        return [[i, 1.0, 2.0, 0.5, 1.5, 10.0] for i in range(limit)]
+
+    def get_sentiment_data(self, symbol):
+        return {"score": 0.1}
+
+    def get_on_chain_data(self, symbol):
+        return {"flows": 1}
+
+    def get_whale_activity(self, symbol):
+        return {"whales": 2}
+
+
+def _fetch(fetcher, symbols, limit=5):
+    return asyncio.run(fetcher.fetch(symbols, "1h", limit))
+
+
+class TestMarketDataFetcher:
+    """Test the bounded-concurrency fetch stage."""
+
+    def test_fetch_runs_symbols_concurrently(self):
+        engine = FakeDataEngine(delay=0.05)
+        fetcher = MarketDataFetcher(engine, {"max_workers": 20, "per_host_concurrency": 20})
+        symbols = [f"S{i}/USDT" for i in range(10)]
+
+        start = time.perf_counter()
+        data = _fetch(fetcher, symbols)
+        elapsed = time.perf_counter() - start
+        fetcher.close()
+
+        # 20 serial calls would take ~1s
+        assert elapsed < 0.5
+        assert set(data["ticker_data"]) == set(symbols)
+        assert all(len(data["ohlcv_data"][s]) == 5 for s in symbols)
+        assert data["sentiment_data"] == {"score": 0.1}
+        assert data["on_chain_data"] == {"flows": 1}
+        assert data["whale_activity"] == {"whales": 2}
+
+    def test_per_host_concurrency_limit(self):
+        engine = FakeDataEngine(delay=0.02)
+        fetcher = MarketDataFetcher(engine, {"max_workers": 16, "per_host_concurrency": 3})
+
+        _fetch(fetcher, [f"S{i}/USDT" for i in range(8)])
+        fetcher.close()
+
+        assert engine.max_in_flight <= 3
+
+    def test_timeout_and_errors_fall_back_to_empty_values(self):
+        engine = FakeDataEngine(
+            delay=0.01,
+            slow_symbols={"SLOW/USDT": 0.5},
+            failing_symbols={"BAD/USDT"},
+        )
+        fetcher = MarketDataFetcher(engine, {"request_timeout_s": 0.1})
+
+        data = _fetch(fetcher, ["BTC/USDT", "SLOW/USDT", "BAD/USDT"])
+        fetcher.close()
+
+        assert data["ticker_data"]["BTC/USDT"]["price"] == 100.0
+        assert data["ticker_data"]["SLOW/USDT"] is None
+        assert data["ohlcv_data"]["SLOW/USDT"] == []
+        assert data["ticker_data"]["BAD/USDT"] is None
+        assert data["ohlcv_data"]["BAD/USDT"] == []
+
+        stats = data["fetch_stats"]
+        assert stats["timeouts"] == 2
+        assert stats["errors"] == 2
+
+    def test_hung_requests_do_not_starve_later_cycles(self):
+        engine = FakeDataEngine(delay=0.01, slow_symbols={"HANG/USDT": 0.5})
+        fetcher = MarketDataFetcher(
+            engine, {"max_workers": 2, "request_timeout_s": 0.1, "max_abandoned_requests": 2}
+        )
+
+        # Both workers stay busy with the hung ticker and OHLCV calls
+        data = _fetch(fetcher, ["HANG/USDT"])
+        assert data["ticker_data"]["HANG/USDT"] is None
+        assert data["fetch_stats"]["retired_pools"] == 1
+
+        # The next cycle runs on a fresh pool instead of queueing behind them
+        data = _fetch(fetcher, ["BTC/USDT"])
+        fetcher.close()
+
+        assert data["ticker_data"]["BTC/USDT"]["price"] == 100.0
+        assert data["fetch_stats"]["timeouts"] == 0
+        assert data["fetch_stats"]["abandoned_in_flight"] == 0
+
+    def test_per_symbol_latency_report(self):
+        engine = FakeDataEngine(delay=0.01, slow_symbols={"ETH/USDT": 0.1})
+        fetcher = MarketDataFetcher(engine)
+
+        data = _fetch(fetcher, ["BTC/USDT", "ETH/USDT"])
+        fetcher.close()
+
+        stats = data["fetch_stats"]
+        assert set(stats["per_symbol_ms"]) == {"BTC/USDT", "ETH/USDT"}
+        assert stats["ticker_ms"]["ETH/USDT"] >= 100 > stats["ticker_ms"]["BTC/USDT"]
+        assert stats["slowest_symbol"] == "ETH/USDT"
+        assert stats["slowest_ms"] >= 100
+        assert stats["requests"] == 2 * 2 + 3
+        # Wall time tracks the slowest symbol, not the sum of all calls
+        assert stats["wall_ms"] < stats["slowest_ms"] + 100
+
+    def test_fetch_ohlcv_loads_histories_concurrently(self):
+        engine = FakeDataEngine(delay=0.05, failing_symbols={"BAD/USDT"})
+        fetcher = MarketDataFetcher(engine, {"max_workers": 20, "per_host_concurrency": 20})
+        symbols = [f"S{i}/USDT" for i in range(10)] + ["BAD/USDT"]
+
+        start = time.perf_counter()
+        history = asyncio.run(fetcher.fetch_ohlcv(symbols, "1h", 250))
+        elapsed = time.perf_counter() - start
+        fetcher.close()
+
+        # 11 serial calls would take ~0.55s
+        assert elapsed < 0.3
+        assert engine.max_in_flight > 1
+        assert all(len(history[f"S{i}/USDT"]) == 250 for i in range(10))
+        assert history["BAD/USDT"] == []
+
+    def test_missing_engine_method_is_reported_not_raised(self):
+        class TickerOnlyEngine:
+            def get_ticker(self, symbol):
+                return {"price": 1.0}
+
+            def get_ohlcv(self, symbol, timeframe, limit):
+                return []
+
+        fetcher = MarketDataFetcher(TickerOnlyEngine())
+        data = _fetch(fetcher, ["BTC/USDT"])
+        fetcher.close()
+
+        assert data["sentiment_data"] == {}
+        assert data["whale_activity"] == {}
+        assert data["fetch_stats"]["errors"] == 3
@@ -0,0 +1,154 @@
+"""
+Tests for checkpointed (incremental) NAV validation.
+"""
+
+import random
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from src.crypto_mvp.analytics.trade_ledger import TradeLedger
+from src.crypto_mvp.core.nav_validation import NAVValidator
+from src.crypto_mvp.core.pricing_snapshot import PricingSnapshot
+
+PRICES = {"BTC/USDT": 50000.0, "ETH/USDT": 3000.0, "SOL/USDT": 150.0}
+START = datetime(2026, 1, 5, 12, 0, 0)
+
+
+def make_snapshot():
+    snapshot = Mock(spec=PricingSnapshot)
+    snapshot.get_mark_price.side_effect = lambda symbol, cycle_id=None: PRICES.get(symbol)
+    return snapshot
+
+
+def record_trades(ledger, session_id, count, start, seed):
+    """Random buys and sells (never short) committed to the ledger."""
+    rng = random.Random(seed)
+    held = dict.fromkeys(PRICES, 0.0)
+    for i in range(count):
+        symbol = rng.choice(list(PRICES))
+        side = "sell" if held[symbol] > 0 and rng.random() < 0.4 else "buy"
+        quantity = round(held[symbol] * rng.uniform(0.2, 1.0), 6) if side == "sell" else round(rng.uniform(0.01, 1.0), 6)
+        held[symbol] += quantity if side == "buy" else -quantity
+        ledger.commit_fill(
+            trade_id=f"{session_id}_{start + i}",
+            session_id=session_id,
+            symbol=symbol,
+            side=side,
+            quantity=quantity,
+            fill_price=PRICES[symbol] * rng.uniform(0.98, 1.02),
+            fees=rng.uniform(0.1, 5.0),
+            strategy="test",
+            executed_at=START + timedelta(minutes=start + i),
+        )
+
+
+def full_rebuild(ledger, session_id):
+    result = NAVValidator(tolerance=1e9).validate_nav(
+        ledger.get_trades_by_session(session_id), make_snapshot(), 0.0, 100_000.0
+    )
+    return result.rebuilt_cash, result.rebuilt_realized_pnl, result.rebuilt_equity
+
+
+def validate(validator, ledger, session_id, initial_cash=100_000.0):
+    snapshot = make_snapshot()
+    if validator.audit_due():
+        return validator.audit_nav(
+            ledger.get_trades_by_session(session_id), snapshot, 0.0, initial_cash, session_id
+        )
+    after_id = validator.checkpoint_trade_id(session_id, initial_cash)
+    return validator.validate_nav_incremental(
+        ledger.get_trades_since(session_id, after_id), snapshot, 0.0, initial_cash, session_id
+    )
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return TradeLedger(str(tmp_path / "ledger.db"))
+
+
+class TestIncrementalNAVValidation:
+    """Test that replaying new trades onto the checkpoint matches a full rebuild."""
+
+    def test_incremental_matches_full_rebuild(self, ledger):
+        validator = NAVValidator(tolerance=1e9)
+        replayed = []
+        for cycle in range(10):
+            record_trades(ledger, "s1", 15, cycle * 15, seed=cycle)
+            result = validate(validator, ledger, "s1")
+            replayed.append((result.mode, result.trades_replayed))
+
+            expected = full_rebuild(ledger, "s1")
+            assert result.rebuilt_cash == pytest.approx(expected[0], abs=0.01)
+            assert result.rebuilt_realized_pnl == pytest.approx(expected[1], abs=0.01)
+            assert result.rebuilt_equity == pytest.approx(expected[2], abs=0.01)
+
+        # One full rebuild to start, then only each cycle's new trades
+        assert replayed == [("full", 15)] + [("incremental", 15)] * 9
+        stats = validator.get_stats()
+        assert stats["full_rebuilds"] == 1 and stats["trades_replayed"] == 150
+        assert stats["checkpoint_trades"] == 150
+
+    def test_cycle_without_trades_replays_nothing(self, ledger):
+        validator = NAVValidator()
+        record_trades(ledger, "s1", 5, 0, seed=1)
+        validate(validator, ledger, "s1")
+
+        result = validate(validator, ledger, "s1")
+        assert result.mode == "incremental" and result.trades_replayed == 0
+        # Passing already replayed trades again is harmless
+        again = validator.validate_nav_incremental(
+            ledger.get_trades_by_session("s1"), make_snapshot(), 0.0, 100_000.0, "s1"
+        )
+        assert again.trades_replayed == 0 and again.rebuilt_equity == result.rebuilt_equity
+
+    def test_recommitted_trade_is_not_replayed_twice(self, ledger):
+        validator = NAVValidator(tolerance=1e9)
+        record_trades(ledger, "s1", 10, 0, seed=3)
+        validate(validator, ledger, "s1")
+
+        # Committing the same trades again (e.g. a retried batch) keeps their row ids
+        record_trades(ledger, "s1", 10, 0, seed=3)
+        assert ledger.get_trades_since("s1", validator.checkpoint.last_trade_id) == []
+
+        record_trades(ledger, "s1", 5, 10, seed=4)
+        result = validate(validator, ledger, "s1")
+        assert result.mode == "incremental" and result.trades_replayed == 5
+
+        expected = full_rebuild(ledger, "s1")
+        assert result.rebuilt_cash == pytest.approx(expected[0], abs=0.01)
+        assert result.rebuilt_equity == pytest.approx(expected[2], abs=0.01)
+
+    def test_periodic_audit_replaces_a_drifted_checkpoint(self, ledger):
+        validator = NAVValidator(tolerance=1e9, full_rebuild_interval=3)
+        modes = []
+        for cycle in range(8):
+            record_trades(ledger, "s1", 4, cycle * 4, seed=cycle)
+            modes.append(validate(validator, ledger, "s1").mode)
+        assert modes == ["full", "incremental", "incremental", "incremental", "full",
+                         "incremental", "incremental", "incremental"]
+        assert validator.get_stats()["checkpoint_drifts"] == 0
+
+        # Corrupt the checkpoint: the audit reports it and restores the rebuilt state
+        validator.checkpoint.cash += 1000
+        record_trades(ledger, "s1", 4, 100, seed=99)
+        result = validate(validator, ledger, "s1")
+        assert result.mode == "full"
+        assert validator.get_stats()["checkpoint_drifts"] == 1
+        assert result.rebuilt_cash == pytest.approx(full_rebuild(ledger, "s1")[0], abs=0.01)
+        assert float(validator.checkpoint.cash) == pytest.approx(result.rebuilt_cash, abs=0.01)
+
+    def test_new_session_resets_the_checkpoint(self, ledger):
+        validator = NAVValidator(tolerance=1e9)
+        record_trades(ledger, "s1", 10, 0, seed=1)
+        record_trades(ledger, "s2", 10, 0, seed=2)
+        validate(validator, ledger, "s1")
+
+        assert validator.checkpoint_trade_id("s2", 100_000.0) == 0
+        result = validator.validate_nav_incremental(
+            ledger.get_trades_since("s2", 0), make_snapshot(), 0.0, 100_000.0, "s2"
+        )
+        assert result.trades_replayed == 10
+        assert result.rebuilt_equity == pytest.approx(full_rebuild(ledger, "s2")[2], abs=0.01)
+        assert validator.get_stats()["checkpoint_resets"] == 1
@@ -0,0 +1,128 @@
+"""
+Tests for concurrent per-symbol composite signal generation.
+"""
+
+import asyncio
+import threading
+import time
+
+from src.crypto_mvp.strategies.base import Strategy
+from src.crypto_mvp.strategies.composite import ProfitMaximizingSignalEngine
+
+
+class SleepyStrategy(Strategy):
+    """Deterministic strategy whose runtime depends on the symbol."""
+
+    def __init__(self, name, delays, fail_on=None):
+        super().__init__()
+        self.name = name
+        self.delays = delays
+        self.fail_on = fail_on or set()
+        self.threads = set()
+
+    def analyze(self, symbol, timeframe=None):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delays.get(symbol, 0.01))
+        if symbol in self.fail_on:
+            raise RuntimeError(f"{self.name} failed on {symbol}")
+        score = (sum(ord(c) for c in symbol + self.name) % 200) / 100.0 - 1.0
+        return {"score": score, "signal_strength": abs(score), "confidence": 0.6}
+
+    def get_required_data(self):
+        return []
+
+
+class InMemoryWindowStore:
+    """Minimal state store recording signal window writes in call order."""
+
+    def __init__(self):
+        self.writes = []
+
+    def save_signal_window(self, symbol, timeframe, strategy_name, value):
+        self.writes.append((symbol, strategy_name, value))
+
+    def get_signal_window_stats(self, symbol, timeframe, strategy_name):
+        values = [v for s, n, v in self.writes if s == symbol and n == strategy_name]
+        return {"mean": 0.0, "std": 0.0, "min": 0.0, "max": 0.0, "count": len(values)}
+
+    def save_composite_signal_window(self, *args):
+        pass
+
+    def get_composite_signal_window(self, symbol, timeframe, limit=200):
+        return []
+
+
+def _make_engine(max_workers, delays, fail_on=None):
+    engine = ProfitMaximizingSignalEngine({"generation": {"max_workers": max_workers}})
+    engine.strategies = {
+        "alpha": SleepyStrategy("alpha", delays, fail_on),
+        "beta": SleepyStrategy("beta", delays),
+    }
+    engine.strategy_weights = {"alpha": 0.5, "beta": 0.5}
+    engine.initialized = True
+    engine.state_store = InMemoryWindowStore()
+    return engine
+
+
+async def _generate(engine, symbols):
+    runs = await engine.collect_strategy_signals(symbols, "1h")
+    return {
+        symbol: engine.build_composite_signal(symbol, "1h", *runs[symbol])
+        for symbol in symbols
+    }
+
+
+class TestParallelSignalGeneration:
+    """Test the signal engine's concurrent strategy scheduler."""
+
+    SYMBOLS = ["BTC/USDT", "ETH/USDT", "SOL/USDT", "XRP/USDT"]
+
+    def test_results_match_serial_generation(self):
+        # Earlier symbols are slower, so they finish last when run concurrently
+        delays = {"BTC/USDT": 0.08, "ETH/USDT": 0.05, "SOL/USDT": 0.02, "XRP/USDT": 0.0}
+
+        parallel = _make_engine(4, delays)
+        serial = _make_engine(1, delays)
+
+        parallel_results = asyncio.run(_generate(parallel, self.SYMBOLS))
+        serial_results = {
+            symbol: asyncio.run(serial.generate_composite_signals(symbol, "1h"))
+            for symbol in self.SYMBOLS
+        }
+
+        assert list(parallel_results) == self.SYMBOLS
+        for symbol in self.SYMBOLS:
+            assert parallel_results[symbol]["composite_score"] == serial_results[symbol]["composite_score"]
+            assert parallel_results[symbol]["individual_signals"] == serial_results[symbol]["individual_signals"]
+
+        # Rolling windows are written in the same deterministic order
+        assert parallel.state_store.writes == serial.state_store.writes
+        parallel.close()
+
+    def test_symbols_run_concurrently_on_worker_threads(self):
+        delays = dict.fromkeys(self.SYMBOLS, 0.1)
+        engine = _make_engine(4, delays)
+
+        start = time.perf_counter()
+        asyncio.run(engine.collect_strategy_signals(self.SYMBOLS, "1h"))
+        elapsed = time.perf_counter() - start
+        engine.close()
+
+        # Serial execution would take 4 symbols x 2 strategies x 0.1s
+        assert elapsed < 0.5
+        assert len(engine.strategies["alpha"].threads) > 1
+        assert threading.get_ident() not in engine.strategies["alpha"].threads
+
+    def test_failed_strategy_is_neutral_with_zero_weight(self):
+        engine = _make_engine(2, {}, fail_on={"ETH/USDT"})
+
+        results = asyncio.run(_generate(engine, ["BTC/USDT", "ETH/USDT"]))
+        engine.close()
+
+        eth_alpha = results["ETH/USDT"]["individual_signals"]["alpha"]
+        assert "error" in eth_alpha
+        assert eth_alpha["score"] == 0.0
+        assert "error" not in results["BTC/USDT"]["individual_signals"]["alpha"]
+        # Only the successful strategy was recorded in the rolling window for ETH
+        eth_writes = [w for w in engine.state_store.writes if w[0] == "ETH/USDT"]
+        assert [w[1] for w in eth_writes] == ["beta"]
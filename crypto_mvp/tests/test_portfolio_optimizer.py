@@ -0,0 +1,200 @@
+"""
+Tests for the constrained mean-variance optimizer.
+"""
+
+import numpy as np
+import pytest
+
+from src.crypto_mvp.risk.optimizer import MeanVarianceOptimizer, project_weights
+from src.crypto_mvp.risk.portfolio import AdvancedPortfolioManager
+
+
+def make_problem(n_assets, seed=0):
+    """One-factor covariance (annualized) and expected returns."""
+    rng = np.random.default_rng(seed)
+    loadings = rng.uniform(0.3, 0.9, n_assets)
+    idiosyncratic = rng.uniform(0.2, 0.6, n_assets)
+    covariance = np.outer(loadings, loadings) * 0.25 + np.diag(idiosyncratic**2)
+    expected_returns = rng.uniform(-0.1, 0.3, n_assets)
+    return [f"A{i:03d}/USDT" for i in range(n_assets)], expected_returns, covariance
+
+
+def random_feasible(n_assets, upper, groups, caps, rng, count=200):
+    return [project_weights(rng.normal(0, 1, n_assets), upper, groups, caps) for _ in range(count)]
+
+
+class TestProjection:
+    """Test the projection onto the capped simplex with sector caps."""
+
+    def test_projection_is_feasible_and_closest(self):
+        rng = np.random.default_rng(1)
+        n_assets = 40
+        upper = np.full(n_assets, 0.1)
+        groups = np.arange(n_assets) % 4
+        caps = np.array([0.2, np.inf, 0.3, np.inf])
+
+        for _ in range(20):
+            point = rng.normal(0, 0.5, n_assets)
+            projected = project_weights(point, upper, groups, caps)
+            assert projected.sum() == pytest.approx(1.0, abs=1e-9)
+            assert projected.min() >= 0 and projected.max() <= 0.1 + 1e-12
+            assert np.all(np.bincount(groups, projected) <= np.where(np.isinf(caps), 1.0, caps) + 1e-9)
+
+            # No feasible point is closer: (v - p).(y - p) <= 0 for every feasible y
+            for other in random_feasible(n_assets, upper, groups, caps, rng, count=20):
+                assert (point - projected) @ (other - projected) <= 1e-7
+
+
+class TestMeanVarianceOptimizer:
+    """Test solution quality, constraints, warm start and time budget."""
+
+    def test_convex_solution_is_optimal(self):
+        assets, mu, covariance = make_problem(30)
+        optimizer = MeanVarianceOptimizer({"tolerance": 1e-9, "time_budget_ms": 5000})
+        sectors = ["l1" if i % 3 == 0 else "defi" for i in range(30)]
+        result = optimizer.optimize(
+            assets, mu, covariance, 1.0, max_weight=0.25, sectors=sectors, sector_caps={"l1": 0.4}
+        )
+        assert result.status == "converged"
+
+        weights = result.weights
+        assert weights.sum() == pytest.approx(1.0)
+        assert weights.max() <= 0.25 + 1e-9
+        assert weights[::3].sum() <= 0.4 + 1e-9
+
+        # First-order optimality: no feasible direction improves the utility
+        gradient = -mu + covariance @ weights
+        groups = np.array([0 if s == "l1" else 1 for s in sectors])
+        rng = np.random.default_rng(2)
+        for other in random_feasible(30, np.full(30, 0.25), groups, np.array([0.4, np.inf]), rng):
+            assert gradient @ (other - weights) >= -1e-6
+
+    def test_position_limits_and_risk_budget(self):
+        assets, mu, covariance = make_problem(120, seed=3)
+        optimizer = MeanVarianceOptimizer()
+        result = optimizer.optimize(
+            assets, mu, covariance, 0.5, max_weight=0.3, min_weight=0.02, max_positions=8
+        )
+        held = result.weights[result.weights > 0]
+        assert 0 < len(held) <= 8 and held.min() >= 0.02
+        assert result.weights.sum() == pytest.approx(1.0)
+
+        capped = MeanVarianceOptimizer().optimize(
+            assets, mu, covariance, 0.5, max_weight=0.3, max_positions=8,
+            max_volatility=result.volatility * 0.9,
+        )
+        assert "risk" in capped.rounds and capped.risk_aversion > 0.5
+        assert capped.volatility < result.volatility
+
+    def test_warm_start_converges_faster(self):
+        assets, mu, covariance = make_problem(200, seed=4)
+        optimizer = MeanVarianceOptimizer({"time_budget_ms": 5000})
+        cold = optimizer.optimize(assets, mu, covariance, 1.0, max_weight=0.3, max_positions=10)
+        assert not cold.warm_start
+
+        warm = optimizer.optimize(assets, mu, covariance, 1.0, max_weight=0.3, max_positions=10)
+        assert warm.warm_start and warm.status == "converged"
+        assert warm.iterations * 3 < cold.iterations
+        # Same positions, and at least as good a solution
+        assert set(np.flatnonzero(warm.weights)) == set(np.flatnonzero(cold.weights))
+
+        def utility(weights):
+            return mu @ weights - 0.5 * weights @ covariance @ weights
+
+        assert utility(warm.weights) >= utility(cold.weights) - 1e-9
+
+        optimizer.reset()
+        assert not optimizer.optimize(assets, mu, covariance, 1.0, max_weight=0.3).warm_start
+
+    @pytest.mark.parametrize("limits, risk_aversion", [
+        ({"max_weight": 0.25}, 1.0),
+        ({"max_weight": 0.3, "max_positions": 5, "min_weight": 0.02}, 1.2),
+    ])
+    def test_warm_start_matches_cold_solve_when_returns_change(self, limits, risk_aversion):
+        assets = [f"A{i:03d}/USDT" for i in range(12)]
+        covariance = np.eye(12) * 0.01
+        mu = np.linspace(0.01, 0.3, 12)
+
+        optimizer = MeanVarianceOptimizer({"time_budget_ms": 5000})
+        optimizer.optimize(assets, mu, covariance, risk_aversion, **limits)
+        # Every held asset sits at its cap; the best assets are now the excluded ones
+        reversed_mu = mu[::-1].copy()
+        warm = optimizer.optimize(assets, reversed_mu, covariance, risk_aversion, **limits)
+        cold = MeanVarianceOptimizer({"time_budget_ms": 5000}).optimize(
+            assets, reversed_mu, covariance, risk_aversion, **limits
+        )
+
+        def utility(weights):
+            return reversed_mu @ weights - 0.5 * risk_aversion * weights @ covariance @ weights
+
+        assert warm.warm_start and "pricing" in warm.rounds
+        assert utility(warm.weights) == pytest.approx(utility(cold.weights), abs=1e-6)
+        assert warm.weights == pytest.approx(cold.weights, abs=1e-4)
+
+    def test_time_budget_returns_feasible_weights(self):
+        assets, mu, covariance = make_problem(50, seed=5)
+        result = MeanVarianceOptimizer({"time_budget_ms": 0}).optimize(
+            assets, mu, covariance, 1.0, max_weight=0.1
+        )
+        assert result.status == "budget_exhausted" and result.iterations == 0
+        assert result.weights.sum() == pytest.approx(1.0)
+        assert result.weights.max() <= 0.1 + 1e-12
+
+    def test_caps_too_tight_for_the_universe_are_relaxed(self):
+        assets, mu, covariance = make_problem(3, seed=6)
+        result = MeanVarianceOptimizer().optimize(assets, mu, covariance, 1.0, max_weight=0.3)
+        assert result.weights.sum() == pytest.approx(1.0)
+
+
+class TestPortfolioManagerOptimizer:
+    """Test AdvancedPortfolioManager's use of the solver."""
+
+    def make_signals(self, count, seed=7):
+        rng = np.random.default_rng(seed)
+        return {
+            f"A{i:03d}/USDT": {
+                "score": float(rng.uniform(0, 1)),
+                "confidence": float(rng.uniform(0.4, 0.9)),
+                "signal_strength": float(rng.uniform(0, 1)),
+                "volatility": float(rng.uniform(0.2, 0.6)),
+            }
+            for i in range(count)
+        }
+
+    def test_optimizer_metadata_and_fallback(self):
+        config = {"max_positions": 6, "max_portfolio_risk": 100.0, "max_correlation": 0.99}
+        manager = AdvancedPortfolioManager(config)
+        signals = self.make_signals(20)
+
+        result = manager.optimize_portfolio_allocation(10_000.0, signals)
+        optimizer = result["metadata"]["optimizer"]
+        assert optimizer["method"] == "mean_variance" and not optimizer["warm_start"]
+        assert sum(result["optimal_weights"].values()) == pytest.approx(1.0)
+        assert max(result["optimal_weights"].values()) <= manager.max_position_weight + 1e-9
+
+        again = manager.optimize_portfolio_allocation(10_000.0, signals)
+        assert again["metadata"]["optimizer"]["warm_start"]
+
+        def broken(*args, **kwargs):
+            raise FloatingPointError("diverged")
+
+        manager.optimizer.optimize = broken
+        fallback = manager.optimize_portfolio_allocation(10_000.0, signals)
+        assert fallback["metadata"]["optimizer"] == {"method": "heuristic"}
+        assert sum(fallback["optimal_weights"].values()) == pytest.approx(1.0)
+
+    def test_heuristic_method(self):
+        manager = AdvancedPortfolioManager({
+            "max_portfolio_risk": 100.0, "max_correlation": 0.99, "optimizer": {"method": "heuristic"},
+        })
+        result = manager.optimize_portfolio_allocation(10_000.0, self.make_signals(5))
+        assert result["metadata"]["optimizer"] == {"method": "heuristic"}
+
+    def test_volatility_cap_defaults_to_target_volatility(self):
+        manager = AdvancedPortfolioManager({"target_volatility": 0.12})
+        assert manager.max_volatility == 0.12
+
+        capped = AdvancedPortfolioManager({
+            "target_volatility": 0.12, "optimizer": {"max_volatility": 0.3},
+        })
+        assert capped.max_volatility == 0.3
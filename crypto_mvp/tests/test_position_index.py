@@ -0,0 +1,91 @@
+"""
+Tests for the StateStore's in-memory position index.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.crypto_mvp.state.store import StateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    state_store = StateStore(str(tmp_path / "state.db"))
+    state_store.initialize()
+    yield state_store
+    state_store.close()
+
+
+def table_rows(store, session_id):
+    return store._select_positions(session_id)
+
+
+class TestPositionIndex:
+    """Test that indexed reads match the table through every kind of write."""
+
+    def test_reads_match_the_table_after_writes(self, store):
+        store.save_position("BTC/USDT", 0.5, 50000.0, 50500.0, "momentum", "s1")
+        store.save_position("ETH/USDT", 2.0, 3000.0, 2900.0, "breakout", "s1")
+        store.save_position("ETH/USDT", 1.0, 3000.0, 3100.0, "momentum", "s2")
+        assert store.get_positions("s1") == table_rows(store, "s1")
+
+        # Replace, price update (all sessions), remove
+        store.save_position("BTC/USDT", 0.75, 50200.0, 50500.0, "momentum", "s1")
+        store.update_position_price("ETH/USDT", 3200.0)
+        store.remove_position("BTC/USDT", "momentum")
+        assert store.get_positions("s1") == table_rows(store, "s1")
+        assert store.get_positions("s2") == table_rows(store, "s2")
+        assert [p["current_price"] for p in store.get_positions("s2")] == [3200.0]
+        assert store.verify_position_index("s1") and store.verify_position_index("s2")
+
+        store.clear_session_data("s1")
+        assert store.get_positions("s1") == [] == table_rows(store, "s1")
+        store.clear_all_positions()
+        assert store.get_positions("s2") == []
+
+    def test_session_is_read_from_the_table_once(self, store):
+        store.save_position("BTC/USDT", 0.5, 50000.0, 50500.0, "momentum", "s1")
+        for _ in range(7):
+            store.get_positions("s1")
+        store.save_position("SOL/USDT", 10.0, 150.0, 151.0, "momentum", "s1")
+        assert len(store.get_positions("s1")) == 2
+
+        stats = store.get_position_index_stats()
+        assert stats["loads"] == 1 and stats["hits"] == 8
+        assert stats["version"] == 2 and stats["positions"] == 2
+
+    def test_returned_rows_are_copies(self, store):
+        store.save_position("BTC/USDT", 0.5, 50000.0, 50500.0, "momentum", "s1")
+        store.get_positions("s1")[0]["quantity"] = 99.0
+        assert store.get_positions("s1")[0]["quantity"] == 0.5
+
+    def test_write_by_another_connection_reloads(self, store):
+        store.save_position("BTC/USDT", 0.5, 50000.0, 50500.0, "momentum", "s1")
+        store.get_positions("s1")
+
+        other = sqlite3.connect(str(store.db_path))
+        other.execute("UPDATE positions SET quantity = 0.25")
+        other.commit()
+        other.close()
+
+        assert store.get_positions("s1")[0]["quantity"] == 0.25
+        assert store.get_position_index_stats()["loads"] == 2
+
+    def test_divergence_is_detected(self, store):
+        store.save_position("BTC/USDT", 0.5, 50000.0, 50500.0, "momentum", "s1")
+        store.get_positions("s1")
+        # A write on the store's own connection that bypasses the index
+        store.connection.execute("DELETE FROM positions")
+
+        assert not store.verify_position_index("s1")
+        assert store.get_positions("s1") == []
+        assert store.get_position_index_stats()["divergences"] == 1
+
+    def test_index_can_be_disabled(self, tmp_path):
+        store = StateStore(str(tmp_path / "state.db"), position_index={"enabled": False})
+        store.initialize()
+        store.save_position("BTC/USDT", 0.5, 50000.0, 50500.0, "momentum", "s1")
+        assert store.get_positions("s1") == table_rows(store, "s1")
+        assert store.get_position_index_stats()["loads"] == 0
+        store.close()
@@ -2,12 +2,15 @@
 Unit tests for pricing snapshot system.
 """
 
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime
 
 from src.crypto_mvp.core.pricing_snapshot import (
     PricingSnapshot,
+    PricingSnapshotManager,
     PriceData,
     create_pricing_snapshot,
     clear_pricing_snapshot,
@@ -233,6 +236,87 @@ class TestPricingSnapshotManager:
         assert not is_fresh_price_fetching_disabled()
 
 
+class TestSnapshotTickerReuse:
+    """Test ticker reuse, concurrent fetches and the fetch deadline."""
+
+    def make_engine(self, delays=None):
+        delays = delays or {}
+
+        def get_ticker(symbol):
+            time.sleep(delays.get(symbol, 0.0))
+            if symbol == "BAD/USDT":
+                raise ConnectionError("exchange down")
+            return {"price": 100.0, "bid": 99.0, "ask": 101.0, "provenance": {"source": "binance"}}
+
+        engine = Mock()
+        engine.get_ticker.side_effect = get_ticker
+        return engine
+
+    def test_reuses_cycle_tickers_and_fetches_the_rest(self):
+        manager = PricingSnapshotManager()
+        engine = self.make_engine()
+        tickers = {
+            "BTC/USDT": {"price": 50000.0, "provenance": "coinbase"},
+            "ETH/USDT": None,  # failed earlier in the cycle
+        }
+
+        snapshot = manager.create_snapshot(
+            1, ["BTC/USDT", "ETH/USDT", "SOL/USDT"], engine, tickers, {"BTC/USDT": 42.0}
+        )
+
+        assert sorted(call.args[0] for call in engine.get_ticker.call_args_list) == ["ETH/USDT", "SOL/USDT"]
+        btc = snapshot.by_symbol["BTC/USDT"]
+        assert btc.price == 50000.0 and btc.origin == "reused" and btc.fetch_ms == 42.0
+        sol = snapshot.by_symbol["SOL/USDT"]
+        assert sol.origin == "fetched" and sol.fetch_ms >= 0 and sol.source == "binance"
+        assert snapshot.fetch_stats["reused"] == 1 and snapshot.fetch_stats["fetched"] == 2
+
+    def test_fetches_run_concurrently(self):
+        manager = PricingSnapshotManager({"max_workers": 8})
+        symbols = [f"S{i}/USDT" for i in range(8)]
+        started = time.perf_counter()
+        snapshot = manager.create_snapshot(1, symbols, self.make_engine({s: 0.1 for s in symbols}))
+        assert len(snapshot.by_symbol) == 8
+        assert time.perf_counter() - started < 0.5
+
+    def test_deadline_misses_fall_back_to_stale_prices(self):
+        manager = PricingSnapshotManager({"fetch_deadline_ms": 100})
+        manager.create_snapshot(1, ["SLOW/USDT"], self.make_engine())
+        manager.clear_snapshot()
+
+        engine = self.make_engine({"SLOW/USDT": 0.5, "NEW/USDT": 0.5})
+        snapshot = manager.create_snapshot(2, ["SLOW/USDT", "NEW/USDT", "BAD/USDT", "BTC/USDT"], engine)
+
+        slow = snapshot.by_symbol["SLOW/USDT"]
+        assert slow.price == 100.0 and slow.source == "binance_STALE" and slow.origin == "stale_fallback"
+        # No earlier price, or the fetch failed: skipped as before
+        assert "NEW/USDT" not in snapshot.by_symbol and "BAD/USDT" not in snapshot.by_symbol
+        assert snapshot.by_symbol["BTC/USDT"].origin == "fetched"
+        assert snapshot.fetch_stats["deadline_missed"] == 2
+        assert snapshot.fetch_stats["stale_fallback"] == 1
+
+    def test_hung_fetches_do_not_hold_the_pool(self):
+        manager = PricingSnapshotManager({
+            "max_workers": 2, "fetch_deadline_ms": 100, "max_abandoned_requests": 2,
+        })
+        hung = {"HANG1/USDT": 0.5, "HANG2/USDT": 0.5}
+        first = manager.create_snapshot(1, list(hung), self.make_engine(hung))
+        assert first.fetch_stats["deadline_missed"] == 2
+        assert first.fetch_stats["retired_pools"] == 1
+        manager.clear_snapshot()
+
+        snapshot = manager.create_snapshot(2, ["BTC/USDT"], self.make_engine(hung))
+        assert snapshot.by_symbol["BTC/USDT"].origin == "fetched"
+        assert snapshot.fetch_stats["deadline_missed"] == 0
+
+    def test_reuse_can_be_disabled(self):
+        manager = PricingSnapshotManager({"reuse_tickers": False})
+        engine = self.make_engine()
+        snapshot = manager.create_snapshot(1, ["BTC/USDT"], engine, {"BTC/USDT": {"price": 1.0}})
+        assert snapshot.by_symbol["BTC/USDT"].price == 100.0
+        assert engine.get_ticker.call_count == 1
+
+
 class TestPricingFunctionsWithSnapshot:
     """Test pricing functions with snapshot system."""
     
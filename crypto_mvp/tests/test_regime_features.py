@@ -0,0 +1,140 @@
+"""
+Tests for the vectorized regime feature feed.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# The execution package imports crypto_mvp absolutely
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from crypto_mvp.execution.regime_detector import RegimeDetector
+from crypto_mvp.indicators import RegimeFeatureFeed
+
+HOUR_MS = 3_600_000
+
+
+def make_frames(num_symbols, num_candles, seed=5, drift=0.0):
+    rng = np.random.default_rng(seed)
+    frames = {}
+    for s in range(num_symbols):
+        closes = 100 * np.exp(np.cumsum(rng.normal(drift, 0.01, num_candles)))
+        spread = closes * np.abs(rng.normal(0, 0.005, num_candles))
+        frames[f"S{s:03d}/USDT"] = {
+            "timestamps": np.arange(num_candles, dtype=float) * HOUR_MS,
+            "highs": closes + spread,
+            "lows": closes - spread,
+            "closes": closes,
+        }
+    return frames
+
+
+def window(frame, end, start=0):
+    return {name: column[start:end] for name, column in frame.items()}
+
+
+def reference_adx(highs, lows, closes, period):
+    """Wilder ADX with first-value seeding, one candle at a time."""
+    alpha = 1.0 / period
+    s_tr = s_pdm = s_mdm = adx = None
+    for i in range(1, len(closes)):
+        up, down = highs[i] - highs[i - 1], lows[i - 1] - lows[i]
+        pdm = up if up > down and up > 0 else 0.0
+        mdm = down if down > up and down > 0 else 0.0
+        tr = max(highs[i] - lows[i], abs(highs[i] - closes[i - 1]), abs(lows[i] - closes[i - 1]))
+        s_tr = tr if s_tr is None else s_tr + alpha * (tr - s_tr)
+        s_pdm = pdm if s_pdm is None else s_pdm + alpha * (pdm - s_pdm)
+        s_mdm = mdm if s_mdm is None else s_mdm + alpha * (mdm - s_mdm)
+        pdi, mdi = 100 * s_pdm / s_tr, 100 * s_mdm / s_tr
+        dx = 100 * abs(pdi - mdi) / (pdi + mdi) if pdi + mdi > 0 else 0.0
+        adx = dx if adx is None else adx + alpha * (dx - adx)
+    return adx
+
+
+class TestRegimeFeatureFeed:
+    """Test EMA/ADX values and incremental updates."""
+
+    def test_matches_reference_indicators(self):
+        pd = pytest.importorskip("pandas")
+        frames = make_frames(4, 260)
+        feed = RegimeFeatureFeed({"include_forming_candle": True})
+        assert feed.update(frames) == 4 * 260
+
+        for symbol, frame in frames.items():
+            closes = pd.Series(frame["closes"])
+            for period in (50, 200):
+                expected = closes.ewm(span=period, adjust=False).mean().iloc[-1]
+                assert feed.get_ema(symbol, period) == pytest.approx(expected, rel=1e-10)
+            expected_adx = reference_adx(frame["highs"], frame["lows"], frame["closes"], 14)
+            assert feed.get_adx(symbol, 14) == pytest.approx(expected_adx, rel=1e-10)
+
+    def test_incremental_updates_match_one_pass(self):
+        frames = make_frames(6, 240, seed=9)
+        batch = RegimeFeatureFeed()
+        batch.update(frames)
+
+        incremental = RegimeFeatureFeed()
+        # Overlapping 100-candle windows, symbols arriving at different times
+        incremental.update({symbol: window(frame, 220) for symbol, frame in list(frames.items())[:3]})
+        incremental.update({symbol: window(frame, 180) for symbol, frame in list(frames.items())[3:]})
+        for end in range(181, 241):
+            incremental.update({symbol: window(frame, end, max(0, end - 100)) for symbol, frame in frames.items()})
+
+        for symbol in frames:
+            for period in (50, 200):
+                assert incremental.get_ema(symbol, period) == batch.get_ema(symbol, period)
+            assert incremental.get_adx(symbol, 14) == batch.get_adx(symbol, 14)
+
+    def test_forming_candle_and_repeats_are_not_folded(self):
+        frames = make_frames(2, 230)
+        feed = RegimeFeatureFeed()
+        # The newest candle of each window is still forming
+        assert feed.update(frames) == 2 * 229
+        assert feed.update(frames) == 0
+
+        symbol = "S000/USDT"
+        before = feed.get_ema(symbol, 50)
+        changed = dict(frames[symbol], closes=frames[symbol]["closes"].copy())
+        changed["closes"][-1] *= 2
+        feed.update({symbol: changed})
+        assert feed.get_ema(symbol, 50) == before
+
+    def test_warmup_and_unsupported_periods(self):
+        frames = make_frames(1, 120)
+        feed = RegimeFeatureFeed()
+        feed.update(frames)
+        symbol = "S000/USDT"
+
+        assert feed.get_ema(symbol, 50) is not None
+        assert feed.get_ema(symbol, 200) is None
+        assert feed.get_adx(symbol, 14) is not None
+        assert feed.get_ema(symbol, 21) is None
+        assert feed.get_adx(symbol, 7) is None
+        assert feed.get_ema("UNKNOWN/USDT", 50) is None
+        assert feed.cold_symbols([symbol, "NEW/USDT"]) == ["NEW/USDT"]
+        assert feed.get_stats() == {"symbols": 1, "warm_symbols": 0, "ema_periods": [50, 200], "adx_period": 14}
+
+
+class TestRegimeDetectionFromFeed:
+    """Test regime detection served by the feed for a large universe."""
+
+    def test_detects_regimes_for_hundreds_of_symbols(self):
+        trending = make_frames(150, 260, seed=1, drift=0.006)
+        flat = make_frames(150, 260, seed=2)
+        frames = {**trending, **{symbol.replace("S", "F"): frame for symbol, frame in flat.items()}}
+
+        feed = RegimeFeatureFeed()
+        feed.update(frames)
+        detector = RegimeDetector({})
+        detector.set_callbacks(feed.get_ema, feed.get_adx)
+
+        regimes = {symbol: detector.detect_regime(symbol)[0] for symbol in frames}
+        assert set(regimes.values()) <= {"trend", "range"}
+        assert sum(regimes[symbol] == "trend" for symbol in trending) > 140
+        assert sum(regimes[symbol] == "range" for symbol in frames if symbol.startswith("F")) > 75
+
+        regime, details = detector.detect_regime("MISSING/USDT")
+        assert regime == "unknown" and details["reason"] == "missing_indicators"
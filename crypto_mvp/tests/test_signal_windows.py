@@ -0,0 +1,118 @@
+"""
+Tests for in-memory rolling signal windows and their batched persistence.
+"""
+
+import statistics
+
+import numpy as np
+import pytest
+
+from src.crypto_mvp.state.signal_windows import RollingSignalWindow
+from src.crypto_mvp.state.store import StateStore
+
+
+class CountingConnection:
+    """sqlite3 connection proxy that counts commits."""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+        return self._connection.commit()
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = StateStore(str(tmp_path / "windows.db"))
+    store.initialize()
+    yield store
+    store.close()
+
+
+class TestRollingSignalWindow:
+    """Test the ring buffer's running statistics."""
+
+    def test_stats_match_statistics_module_after_wraparound(self):
+        rng = np.random.default_rng(3)
+        window = RollingSignalWindow(capacity=50)
+        history = []
+
+        for value in rng.normal(0, 1, 180):
+            window.push(value)
+            history.append(float(value))
+            expected = history[-50:]
+
+            stats = window.stats()
+            assert stats["count"] == len(expected)
+            assert stats["mean"] == pytest.approx(statistics.mean(expected), abs=1e-12)
+            assert stats["min"] == min(expected)
+            assert stats["max"] == max(expected)
+            if len(expected) > 1:
+                assert stats["std"] == pytest.approx(statistics.stdev(expected), rel=1e-9)
+
+        assert window.recent(5) == list(reversed(history[-5:]))
+
+    def test_empty_and_single_value(self):
+        window = RollingSignalWindow(capacity=4)
+        assert window.stats() == {"mean": 0.0, "std": 0.0, "min": 0.0, "max": 0.0, "count": 0}
+
+        window.push(0.5)
+        assert window.stats()["std"] == 0.0
+        assert window.recent() == [0.5]
+
+
+class TestBatchedSignalWindows:
+    """Test that StateStore serves windows from memory and writes in batches."""
+
+    def test_saves_are_visible_before_flush(self, store):
+        for value in (0.1, 0.2, 0.3):
+            store.save_signal_window("BTC/USDT", "1h", "momentum", value)
+
+        assert store.get_signal_window("BTC/USDT", "1h", "momentum") == [0.3, 0.2, 0.1]
+        assert store.get_signal_window_stats("BTC/USDT", "1h", "momentum")["mean"] == pytest.approx(0.2)
+
+        # Nothing has reached SQLite yet
+        rows = store.connection.execute("SELECT COUNT(*) FROM signal_windows").fetchone()[0]
+        assert rows == 0
+
+    def test_flush_writes_one_transaction_and_trims(self, store):
+        counting = CountingConnection(store.connection)
+        store.connection = counting
+
+        for i in range(250):
+            store.save_signal_window("BTC/USDT", "1h", "momentum", i / 250)
+            store.save_signal_window("ETH/USDT", "1h", "momentum", -i / 250)
+        store.save_composite_signal_window("BTC/USDT", "1h", 0.4, 0.5, 0.6, "trending")
+
+        assert counting.commits == 0
+        assert store.flush_signal_windows() == 501
+        assert counting.commits == 1
+        assert store.flush_signal_windows() == 0
+
+        count = store.connection.execute(
+            "SELECT COUNT(*) FROM signal_windows WHERE symbol = 'BTC/USDT'"
+        ).fetchone()[0]
+        assert count == 200
+
+    def test_windows_reload_from_sqlite_after_restart(self, tmp_path):
+        db_path = str(tmp_path / "restart.db")
+        first = StateStore(db_path)
+        first.initialize()
+        for i in range(5):
+            first.save_signal_window("SOL/USDT", "1h", "breakout", float(i))
+            first.save_composite_signal_window("SOL/USDT", "1h", i, i / 10, 0.6, "ranging")
+        # close() flushes whatever is still queued
+        first.close()
+
+        second = StateStore(db_path)
+        second.initialize()
+        assert second.get_signal_window("SOL/USDT", "1h", "breakout") == [4.0, 3.0, 2.0, 1.0, 0.0]
+        composite = second.get_composite_signal_window("SOL/USDT", "1h", limit=2)
+        assert [row["normalized_score"] for row in composite] == [0.4, 0.3]
+        assert composite[0]["regime"] == "ranging"
+        second.close()
@@ -0,0 +1,189 @@
+"""
+Tests for the TradeLedger materialized aggregates.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.crypto_mvp.analytics.trade_ledger import TradeLedger, main
+
+SYMBOLS = ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
+STRATEGIES = ["momentum", "breakout"]
+
+
+def make_fills(count, start=0, sessions=("s1", "s2")):
+    fills = []
+    for i in range(start, start + count):
+        fills.append({
+            "trade_id": f"t{i}",
+            "session_id": sessions[i % len(sessions)],
+            "symbol": SYMBOLS[i % 3],
+            "side": "BUY" if i % 4 == 0 else ("buy" if i % 2 else "sell"),
+            # Every 7th fill is invalid (non-positive quantity)
+            "quantity": -0.5 if i % 7 == 0 else 0.1 + (i % 5) * 0.05,
+            "fill_price": 100.0 + i,
+            "fees": 0.01 * (i % 9),
+            "strategy": STRATEGIES[i % 2],
+            "exit_reason": "take_profit" if i % 5 == 0 else None,
+            "executed_at": datetime(2024, 1, 1 + i % 3, i % 24, tzinfo=timezone.utc),
+        })
+    return fills
+
+
+def scan_metrics(ledger, date=None, session_id=None):
+    """Reference daily metrics computed by scanning every fill."""
+    trades = [
+        trade for trade in ledger.get_all_trades()
+        if (date is None or trade["date"] == date)
+        and (session_id is None or trade["session_id"] == session_id)
+        and trade["quantity"] > 0 and trade["fill_price"] > 0
+    ]
+    entries = [trade for trade in trades if trade["exit_reason"] is None]
+    sizes = [abs(trade["notional_value"]) for trade in trades]
+    return {
+        "trade_count": len(trades),
+        "total_volume": sum(abs(trade["notional_value"]) for trade in entries),
+        "total_notional": sum(trade["notional_value"] for trade in entries),
+        "total_fees": sum(trade["fees"] for trade in trades),
+        "buy_trades": sum(trade["side"].lower() == "buy" for trade in trades),
+        "sell_trades": sum(trade["side"].lower() == "sell" for trade in trades),
+        "symbols_traded": sorted({trade["symbol"] for trade in trades}),
+        "strategies_used": sorted({trade["strategy"] for trade in trades}),
+        "largest_trade": max(sizes, default=0.0),
+        "smallest_trade": min(sizes, default=0.0),
+    }
+
+
+def assert_matches_scan(ledger, date=None, session_id=None):
+    expected = scan_metrics(ledger, date, session_id)
+    metrics = ledger.calculate_daily_metrics(date=date, session_id=session_id)
+    assert metrics["total_trades"] == expected["trade_count"]
+    for key, value in expected.items():
+        if isinstance(value, list):
+            assert sorted(metrics[key]) == value, key
+        else:
+            assert metrics[key] == pytest.approx(value), key
+
+
+def aggregate_rows(ledger):
+    with ledger._reading() as conn:
+        rows = conn.execute(
+            "SELECT * FROM trade_aggregates ORDER BY session_id, date, symbol, strategy"
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = TradeLedger(str(tmp_path / "ledger.db"))
+    yield ledger
+    ledger.close()
+
+
+class TestTradeLedgerAggregates:
+    """Test that metrics from the aggregates match a full scan of the fills."""
+
+    @pytest.mark.parametrize("date,session_id", [
+        (None, None), ("2024-01-02", None), (None, "s1"), ("2024-01-03", "s2"), ("2024-02-01", "s1"),
+    ])
+    def test_metrics_match_full_scan(self, ledger, date, session_id):
+        fills = make_fills(60)
+        for fill in fills[:10]:
+            ledger.commit_fill(**fill)
+        ledger.commit_fills(fills[10:])
+
+        assert_matches_scan(ledger, date, session_id)
+
+    def test_replaced_trade_ids_are_not_double_counted(self, ledger):
+        fills = make_fills(30)
+        ledger.commit_fills(fills)
+
+        # Re-commit the largest fill into another group, and one id twice in a batch
+        moved = dict(fills[29], session_id="s1", symbol="ADA/USDT", quantity=0.01)
+        ledger.commit_fill(**moved)
+        ledger.commit_fills([dict(fills[3], fees=9.0), dict(fills[3], fees=1.0, quantity=3.0)])
+
+        assert len(ledger.get_all_trades()) == 30
+        for session_id in (None, "s1", "s2"):
+            assert_matches_scan(ledger, session_id=session_id)
+
+        incremental = aggregate_rows(ledger)
+        ledger.backfill_aggregates()
+        rebuilt = aggregate_rows(ledger)
+        assert len(incremental) == len(rebuilt)
+        for row, expected in zip(incremental, rebuilt):
+            assert row.keys() == expected.keys()
+            for key, value in expected.items():
+                if isinstance(value, float):
+                    assert row[key] == pytest.approx(value), key
+                else:
+                    assert row[key] == value, key
+
+    def test_session_summary_uses_all_fills(self, ledger):
+        fills = make_fills(40)
+        ledger.commit_fills(fills)
+        summary = ledger.get_session_summary("s2")
+
+        session = [fill for fill in ledger.get_all_trades() if fill["session_id"] == "s2"]
+        assert summary["total_trades"] == len(session)
+        assert summary["total_volume"] == pytest.approx(sum(abs(t["quantity"]) for t in session))
+        assert summary["total_fees"] == pytest.approx(sum(t["fees"] for t in session))
+        assert summary["total_notional"] == pytest.approx(sum(t["notional_value"] for t in session))
+        assert summary["first_trade"] == min(t["executed_at"] for t in session)
+        assert summary["last_trade"] == max(t["executed_at"] for t in session)
+        assert summary["symbols_traded"] == 3
+        assert summary["strategies_used"] == 1
+        assert summary["trading_days"] == 3
+        assert ledger.get_session_summary("missing")["total_trades"] == 0
+
+    def test_cleanup_updates_aggregates(self, ledger):
+        now = datetime.now(timezone.utc)
+        fills = make_fills(20)
+        for i, fill in enumerate(fills):
+            fill["executed_at"] = now - timedelta(days=200 if i < 12 else 0)
+        ledger.commit_fills(fills)
+
+        assert ledger.cleanup_old_trades(days_to_keep=90) == 12
+        assert_matches_scan(ledger)
+        assert ledger.get_session_summary("s1")["total_trades"] == 4
+
+
+class TestAggregateBackfill:
+    """Test building aggregates for databases that predate them."""
+
+    def _legacy_database(self, tmp_path, fills):
+        ledger = TradeLedger(str(tmp_path / "legacy.db"))
+        ledger.commit_fills(fills)
+        ledger.close()
+        conn = sqlite3.connect(str(tmp_path / "legacy.db"))
+        conn.execute("DROP TABLE trade_aggregates")
+        conn.commit()
+        conn.close()
+
+    def test_existing_database_is_backfilled_on_open(self, tmp_path):
+        self._legacy_database(tmp_path, make_fills(50))
+
+        ledger = TradeLedger(str(tmp_path / "legacy.db"))
+        assert_matches_scan(ledger)
+        assert_matches_scan(ledger, date="2024-01-01", session_id="s2")
+        ledger.close()
+
+    def test_backfill_command(self, tmp_path, capsys):
+        self._legacy_database(tmp_path, make_fills(50))
+        ledger = TradeLedger(str(tmp_path / "legacy.db"))
+        with ledger._writing() as conn:
+            conn.execute("DELETE FROM trade_aggregates")
+        ledger.close()
+
+        main([str(tmp_path / "legacy.db"), "--backfill"])
+        assert "Backfilled" in capsys.readouterr().out
+
+        ledger = TradeLedger(str(tmp_path / "legacy.db"))
+        groups = {
+            (t["session_id"], t["date"], t["symbol"], t["strategy"]) for t in ledger.get_all_trades()
+        }
+        assert len(aggregate_rows(ledger)) == len(groups)
+        assert_matches_scan(ledger, session_id="s1")
+        ledger.close()
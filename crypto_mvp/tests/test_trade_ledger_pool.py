@@ -0,0 +1,129 @@
+"""
+Tests for TradeLedger connection management and batched commits.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from src.crypto_mvp.analytics.trade_ledger import TradeLedger
+
+
+def make_fill(i, session_id="s1", **overrides):
+    fill = {
+        "trade_id": f"t{i}",
+        "session_id": session_id,
+        "symbol": "BTC/USDT",
+        "side": "buy" if i % 2 else "sell",
+        "quantity": 0.1,
+        "fill_price": 50000.0 + i,
+        "fees": 2.5,
+        "strategy": "momentum",
+        "executed_at": datetime(2024, 1, 1, 0, i % 60, tzinfo=timezone.utc),
+    }
+    fill.update(overrides)
+    return fill
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = TradeLedger(str(tmp_path / "ledger.db"), read_pool_size=2)
+    yield ledger
+    ledger.close()
+
+
+class TestTradeLedgerConnections:
+    """Test the long-lived writer and pooled readers."""
+
+    def test_queries_reuse_pooled_connections(self, ledger):
+        with patch("src.crypto_mvp.analytics.trade_ledger.sqlite3.connect", wraps=sqlite3.connect) as connect:
+            for i in range(5):
+                assert ledger.commit_fill(**make_fill(i))
+                ledger.calculate_daily_metrics(session_id="s1")
+                ledger.get_trades_by_date("2024-01-01")
+                ledger.get_all_trades()
+
+        # One reader opened lazily; the writer was opened at construction
+        assert connect.call_count == 1
+        assert "mode=ro" in connect.call_args.args[0]
+        assert ledger.get_database_stats()["total_trades"] == 5
+
+        journal_mode = ledger._writer.execute("PRAGMA journal_mode").fetchone()[0]
+        assert journal_mode == "wal"
+
+    def test_readers_see_writes_and_are_read_only(self, ledger):
+        assert ledger.get_trades_by_session("s1") == []
+        ledger.commit_fill(**make_fill(1))
+        assert [t["trade_id"] for t in ledger.get_trades_by_session("s1")] == ["t1"]
+
+        with ledger._reading() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM trades")
+
+    def test_concurrent_readers_share_a_bounded_pool(self, ledger):
+        ledger.commit_fills([make_fill(i) for i in range(20)])
+        results, errors = [], []
+
+        def read():
+            try:
+                for _ in range(20):
+                    results.append(ledger.calculate_daily_metrics(session_id="s1")["total_trades"])
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert set(results) == {20}
+        assert ledger._reader_count <= 2
+
+    def test_in_memory_ledger(self):
+        ledger = TradeLedger(":memory:")
+        ledger.commit_fills([make_fill(1), make_fill(2)])
+        assert len(ledger.get_all_trades()) == 2
+        ledger.close()
+
+
+class TestCommitFills:
+    """Test the batched fill API."""
+
+    def test_batch_matches_individual_commits(self, ledger, tmp_path):
+        fills = [make_fill(i, exit_reason="tp" if i == 3 else None) for i in range(6)]
+        assert ledger.commit_fills(fills)
+
+        single = TradeLedger(str(tmp_path / "single.db"))
+        for fill in fills:
+            single.commit_fill(**fill)
+
+        def rows(source):
+            return [
+                {key: value for key, value in trade.items() if key not in ("id", "created_at")}
+                for trade in source.get_trades_by_session_and_date("s1")
+            ]
+
+        assert rows(ledger) == rows(single)
+        assert ledger.calculate_daily_metrics(session_id="s1") == single.calculate_daily_metrics(session_id="s1")
+        single.close()
+
+    def test_batch_is_one_transaction(self, ledger):
+        statements = []
+        ledger._writer.set_trace_callback(statements.append)
+        assert ledger.commit_fills([make_fill(i) for i in range(10)])
+        ledger._writer.set_trace_callback(None)
+
+        assert statements.count("COMMIT") == 1
+
+    def test_failed_batch_writes_nothing(self, ledger):
+        ledger.commit_fill(**make_fill(0))
+        fills = [make_fill(1), make_fill(2, session_id=None)]
+
+        assert not ledger.commit_fills(fills)
+        assert [t["trade_id"] for t in ledger.get_all_trades()] == ["t0"]
+        assert ledger.commit_fills([])
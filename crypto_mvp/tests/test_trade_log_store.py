@@ -0,0 +1,150 @@
+"""
+Tests for the segmented trade log behind ProfitAnalytics.
+"""
+
+import copy
+import json
+import os
+
+import pytest
+
+from src.crypto_mvp.analytics.profit_analytics import ProfitAnalytics
+from src.crypto_mvp.analytics.trade_log_store import SegmentedTradeLog
+
+
+def make_trade(i):
+    return {
+        "symbol": "BTC/USDT" if i % 2 else "ETH/USDT",
+        "strategy": "momentum" if i % 3 else "breakout",
+        "side": "buy" if i % 4 else "sell",
+        "quantity": 0.1 + i * 0.01,
+        "entry_price": 100.0,
+        "exit_price": 100.0 + ((i * 7) % 11 - 5),
+        "fees": 0.05,
+        "timestamp": f"2024-01-{1 + i // 10:02d}T{i % 24:02d}:00:00",
+    }
+
+
+def make_analytics(tmp_path, **trade_log):
+    analytics = ProfitAnalytics(
+        {
+            "initial_capital": 10000.0,
+            "log_file": str(tmp_path / "profit_logs.json"),
+            "trade_log": trade_log,
+        }
+    )
+    analytics.initialize()
+    return analytics
+
+
+def metrics(analytics):
+    return {
+        "trade_count": analytics._trade_count,
+        "winning_trades": analytics.winning_trades,
+        "losing_trades": analytics.losing_trades,
+        "total_pnl": analytics.total_pnl,
+        "current_equity": analytics.current_equity,
+        "peak_equity": analytics.peak_equity,
+        "max_drawdown": analytics.max_drawdown,
+        "daily_pnl": dict(analytics.daily_pnl),
+        "strategy_performance": copy.deepcopy(analytics.strategy_performance),
+    }
+
+
+class TestSegmentedTradeLog:
+    """Test the append-only segment files."""
+
+    def test_appends_roll_segments_and_read_back(self, tmp_path):
+        log = SegmentedTradeLog(str(tmp_path / "log"), segment_max_bytes=200)
+        for i in range(10):
+            log.append({"i": i, "pad": "x" * 40})
+
+        assert len(log._segments()) > 1
+        assert [record["i"] for record in log.read_all()] == list(range(10))
+
+        log.write_checkpoint({"seen": 10})
+        log.append({"i": 10})
+        log.close()
+
+        reopened = SegmentedTradeLog(str(tmp_path / "log"), segment_max_bytes=200)
+        state, tail = reopened.load()
+        assert state == {"seen": 10}
+        assert tail == [{"i": 10}]
+        assert reopened.records == 11
+
+    def test_torn_last_record_is_dropped(self, tmp_path):
+        log = SegmentedTradeLog(str(tmp_path / "log"))
+        log.append({"i": 0})
+        log.append({"i": 1})
+        log.close()
+        path = log._segment_path(1)
+        with open(path, "ab") as f:
+            f.write(b'{"i": 2, "trunc')
+
+        reopened = SegmentedTradeLog(str(tmp_path / "log"))
+        state, tail = reopened.load()
+        assert state is None
+        assert tail == [{"i": 0}, {"i": 1}]
+
+        reopened.append({"i": 3})
+        assert [record["i"] for record in reopened.read_all()] == [0, 1, 3]
+
+
+class TestProfitAnalyticsTradeLog:
+    """Test ProfitAnalytics persistence through the segmented log."""
+
+    def test_each_trade_appends_one_line(self, tmp_path):
+        analytics = make_analytics(tmp_path, checkpoint_every=1000)
+        analytics.log_trade(make_trade(1))
+        segment = analytics.trade_store._segment_path(1)
+        size = os.path.getsize(segment)
+
+        analytics.log_trade(make_trade(2))
+        with open(segment) as f:
+            lines = f.read().splitlines()
+
+        assert len(lines) == 2
+        assert os.path.getsize(segment) == size + len(lines[1]) + 1
+        assert json.loads(lines[1])["id"].startswith("trade_2_")
+        assert not os.path.exists(tmp_path / "profit_logs.json")
+
+    def test_restart_from_checkpoint_matches_full_replay(self, tmp_path):
+        analytics = make_analytics(tmp_path, checkpoint_every=7, segment_max_bytes=2000)
+        for i in range(40):
+            analytics.log_trade(make_trade(i))
+        expected = metrics(analytics)
+        expected_log = analytics.get_trade_log()
+
+        restarted = make_analytics(tmp_path, checkpoint_every=7, segment_max_bytes=2000)
+        # Metrics come from the checkpoint plus the 5 trades after it
+        assert restarted._trade_log is None
+        assert metrics(restarted) == expected
+
+        restarted.log_trade(make_trade(40))
+        assert restarted.get_trade_log()[:40] == expected_log
+        assert restarted.get_trade_log()[-1]["id"].startswith("trade_41_")
+
+        analytics.log_trade(make_trade(40))
+        assert metrics(restarted) == metrics(analytics)
+        assert restarted._analyze_strategy_performance() == analytics._analyze_strategy_performance()
+        assert restarted._calculate_max_drawdown() == pytest.approx(analytics._calculate_max_drawdown())
+        assert restarted.get_strategy_summary("momentum")["trades"] == [
+            trade for trade in restarted.get_trade_log() if trade["strategy"] == "momentum"
+        ]
+
+    def test_legacy_json_log_is_imported(self, tmp_path):
+        legacy = make_analytics(tmp_path)
+        for i in range(5):
+            legacy.log_trade(make_trade(i))
+        expected = metrics(legacy)
+        records = legacy.get_trade_log()
+        legacy.clear_data()
+        with open(tmp_path / "profit_logs.json", "w") as f:
+            json.dump(records, f, indent=2)
+
+        imported = make_analytics(tmp_path)
+        assert imported.get_trade_log() == records
+        assert metrics(imported) == expected
+
+        again = make_analytics(tmp_path)
+        assert again.get_trade_log() == records
@@ -0,0 +1,105 @@
+"""
+Tests for the vectorized momentum backtest and its event-driven reference.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# The backtest package pulls in execution, which imports crypto_mvp absolutely
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from crypto_mvp.backtest.replay import (
+    CLOSE,
+    HIGH,
+    LOW,
+    VOLUME,
+    ReplayDataEngine,
+    ReplayFixture,
+    replay_symbols,
+)
+from crypto_mvp.backtest.vectorized import BacktestRules, VectorizedBacktester
+from crypto_mvp.strategies.momentum import MomentumStrategy
+
+TRADE_KEYS = ["symbol", "entry_index", "exit_index", "exit_reason", "entry_time", "exit_time"]
+
+
+@pytest.fixture
+def fixture():
+    return ReplayFixture.generate(replay_symbols(4), num_candles=400, seed=3)
+
+
+class TestAnalyzeBatch:
+    """Test batch momentum scores against the per-candle path."""
+
+    def test_matches_analyze_at_every_candle(self, fixture):
+        strategy = MomentumStrategy()
+        candles = fixture.candles
+        batch = strategy.analyze_batch(
+            candles[..., HIGH], candles[..., LOW], candles[..., CLOSE], candles[..., VOLUME], 100
+        )
+        assert batch["score"].shape == (4, 400)
+        assert np.isnan(batch["score"][:, :99]).all()
+
+        strategy.data_engine = ReplayDataEngine(fixture, start=99)
+        for t in range(99, 400, 37):
+            strategy.data_engine.cursor = t
+            for row, symbol in enumerate(fixture.symbols):
+                single = strategy.analyze(symbol, "1h")
+                assert batch["score"][row, t] == pytest.approx(single["score"], abs=1e-9)
+                if single["stop_loss"] is None:
+                    assert np.isnan(batch["stop_loss"][row, t])
+                else:
+                    assert batch["stop_loss"][row, t] == pytest.approx(single["stop_loss"])
+                    assert batch["take_profit"][row, t] == pytest.approx(single["take_profit"])
+
+
+class TestVectorizedBacktester:
+    """Test the vectorized backtest."""
+
+    def test_same_trades_as_event_driven_path(self, fixture):
+        backtester = VectorizedBacktester()
+        vectorized = backtester.run(fixture, 10000.0)
+        event = backtester.run_event_driven(fixture, 10000.0)
+
+        assert vectorized["trades"]
+        assert [[t[k] for k in TRADE_KEYS] for t in vectorized["trades"]] == [
+            [t[k] for k in TRADE_KEYS] for t in event["trades"]
+        ]
+        for ours, reference in zip(vectorized["trades"], event["trades"]):
+            assert ours["entry_price"] == pytest.approx(reference["entry_price"])
+            assert ours["exit_price"] == pytest.approx(reference["exit_price"])
+            assert ours["pnl"] == pytest.approx(reference["pnl"])
+            assert ours["fees"] > 0
+
+        assert [p["equity"] for p in vectorized["equity_curve"]] == pytest.approx(
+            [p["equity"] for p in event["equity_curve"]]
+        )
+        for key, value in event["performance_metrics"].items():
+            assert vectorized["performance_metrics"][key] == pytest.approx(value)
+
+    def test_fills_include_fees_and_slippage(self, fixture):
+        result = VectorizedBacktester().run(fixture, 10000.0)
+        trade = result["trades"][0]
+        row = fixture.symbols.index(trade["symbol"])
+
+        assert trade["entry_price"] > fixture.candles[row, trade["entry_index"], CLOSE]
+        assert trade["exit_price"] < fixture.candles[row, trade["exit_index"], CLOSE]
+        metrics = result["performance_metrics"]
+        assert metrics["final_equity"] == pytest.approx(10000.0 + metrics["total_pnl"])
+
+    def test_rules_from_config(self, fixture):
+        backtester = VectorizedBacktester(
+            {"backtest": {"vectorized": {"entry_threshold": 2.0, "window": 60}}}
+        )
+        assert backtester.rules == BacktestRules(entry_threshold=2.0, window=60)
+
+        result = backtester.run(fixture, 10000.0)
+        assert result["trades"] == []
+        assert len(result["equity_curve"]) == 400 - 59
+        assert result["performance_metrics"]["final_equity"] == pytest.approx(10000.0)
+
+        with pytest.raises(ValueError):
+            VectorizedBacktester().run(ReplayFixture.generate(replay_symbols(2), num_candles=50), 1000.0)
@@ -0,0 +1,146 @@
+"""
+Tests for StateStore write-behind mode (group commit on a writer thread).
+"""
+
+import os
+import signal
+import sqlite3
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.crypto_mvp.state.store import StateStore
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+WRITE_BEHIND = {"enabled": True, "interval_ms": 20, "max_batch": 100}
+
+
+def _count(db_path, table, where="1=1"):
+    connection = sqlite3.connect(db_path)
+    try:
+        return connection.execute(f"SELECT COUNT(*) FROM {table} WHERE {where}").fetchone()[0]
+    finally:
+        connection.close()
+
+
+class TestWriteBehind:
+    """Test group commit semantics and flush barriers."""
+
+    def test_reads_see_pending_writes_and_flush_commits_them(self, tmp_path):
+        db_path = str(tmp_path / "wb.db")
+        store = StateStore(db_path, {**WRITE_BEHIND, "interval_ms": 10_000})
+        store.initialize()
+
+        store.new_session("s1", 1000.0)
+        assert store.debit_cash("s1", 100.0, fees=1.0)
+        # Same connection: the uncommitted debit is visible immediately
+        assert store.get_latest_cash_equity("s1")["cash_balance"] == pytest.approx(899.0)
+        # Another connection does not see it until the group commits
+        assert _count(db_path, "cash_equity", "session_id = 's1'") == 0
+
+        assert store.flush()
+        assert _count(db_path, "cash_equity", "session_id = 's1'") == 2
+        assert store.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        store.close()
+
+    def test_mutations_are_grouped_into_few_commits(self, tmp_path):
+        store = StateStore(str(tmp_path / "group.db"), WRITE_BEHIND)
+        store.initialize()
+
+        for i in range(300):
+            store.save_trade("BTC/USDT", "buy", 0.01, 100.0 + i, 0.1, 0.0, "momentum", "s1", f"t{i}")
+        store.flush()
+
+        stats = store.writer.get_stats()
+        assert stats["mutations_committed"] == 300
+        assert stats["commits"] < 300
+        store.close()
+        assert _count(str(tmp_path / "group.db"), "trades") == 300
+
+    def test_close_flushes_and_disabled_mode_commits_synchronously(self, tmp_path):
+        db_path = str(tmp_path / "close.db")
+        store = StateStore(db_path, {**WRITE_BEHIND, "interval_ms": 10_000})
+        store.initialize()
+        store.set_session_metadata("s1", "risk_on", True)
+        store.close()
+        assert _count(db_path, "session_metadata") == 1
+
+        sync_path = str(tmp_path / "sync.db")
+        sync_store = StateStore(sync_path)
+        sync_store.initialize()
+        assert sync_store.writer is None
+        sync_store.set_session_metadata("s1", "risk_on", True)
+        assert _count(sync_path, "session_metadata") == 1
+        sync_store.close()
+
+
+CRASH_SCRIPT = textwrap.dedent(
+    """
+    import sys
+    from datetime import datetime
+    from src.crypto_mvp.state.store import StateStore
+
+    store = StateStore(sys.argv[1], {"enabled": True, "interval_ms": 60000, "max_batch": 100000})
+    store.initialize()
+
+    # Batch 1: committed behind a flush barrier
+    for i in range(50):
+        store.save_lot("BTC/USDT", f"committed-{i}", 0.1, 100.0, 0.01, datetime.now(), "s1")
+    store.flush()
+
+    # Batch 2: still pending when the process is killed
+    lots = [{"lot_id": f"pending-{i}", "quantity": 0.2, "cost_price": 101.0} for i in range(500)]
+    store.set_lotbook("ETH/USDT", lots, "s1")
+    for i in range(50):
+        store.save_trade("ETH/USDT", "buy", 0.1, 101.0, 0.01, 0.0, "momentum", "s1", f"t{i}")
+
+    print("READY", flush=True)
+    sys.stdin.read()
+    """
+)
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGKILL"), reason="requires SIGKILL")
+class TestWriteBehindCrashRecovery:
+    """Kill the process mid-batch and check the database recovers cleanly."""
+
+    def test_sigkill_mid_batch_keeps_committed_groups_only(self, tmp_path):
+        db_path = str(tmp_path / "crash.db")
+        process = subprocess.Popen(
+            [sys.executable, "-c", CRASH_SCRIPT, db_path],
+            cwd=PROJECT_ROOT,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        try:
+            assert process.stdout.readline().strip() == "READY"
+            os.kill(process.pid, signal.SIGKILL)
+            process.wait(timeout=10)
+        finally:
+            if process.poll() is None:
+                process.kill()
+
+        connection = sqlite3.connect(db_path)
+        try:
+            # Opening the database replays the WAL; it must be consistent
+            assert connection.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+            committed = connection.execute(
+                "SELECT COUNT(*) FROM lotbook WHERE lot_id LIKE 'committed-%'"
+            ).fetchone()[0]
+            pending_lots = connection.execute(
+                "SELECT COUNT(*) FROM lotbook WHERE symbol = 'ETH/USDT'"
+            ).fetchone()[0]
+            pending_trades = connection.execute("SELECT COUNT(*) FROM trades").fetchone()[0]
+        finally:
+            connection.close()
+
+        assert committed == 50
+        # The uncommitted group is lost as a whole, never partially applied
+        assert pending_lots == 0
+        assert pending_trades == 0